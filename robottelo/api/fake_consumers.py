@@ -0,0 +1,293 @@
+# -*- encoding: utf-8 -*-
+"""Mass registration of fake content hosts
+
+Registering a content host with ``subscription-manager`` needs a VM per
+host, see :meth:`robottelo.vm.VirtualMachine.register_contenthost`.
+:class:`FakeConsumerRegistrar` registers fake consumers straight to the
+RHSM (Red Hat Subscription Management) endpoints of the Satellite instead,
+with the facts of :func:`robottelo.system_facts.generate_system_facts_batch`,
+so thousands of content hosts can be made for scale tests::
+
+    with FakeConsumerRegistrar('Default_Organization', ['ak']) as registrar:
+        report = registrar.register_many(1000)
+        print(report.summary())
+        registrar.unregister(report.consumers)
+
+The subscriptions of the activation keys are attached by the Satellite at
+registration. The requests are sent by at most ``max_workers`` threads
+sharing a pool of connections.
+"""
+import logging
+import math
+import threading
+import time
+
+import requests
+
+from concurrent.futures import ThreadPoolExecutor
+from six.moves.urllib.parse import quote
+
+from robottelo.api.http_session import PooledHTTPAdapter
+from robottelo.config import settings
+from robottelo.system_facts import generate_system_facts_batch
+
+LOGGER = logging.getLogger(__name__)
+
+#: Number of registrations sent at the same time by default
+REGISTRATION_MAX_WORKERS = 20
+
+#: Latency percentiles of :meth:`RegistrationReport.summary`
+REPORT_PERCENTILES = (50, 90, 95, 99)
+
+
+class RegistrationError(Exception):
+    """Indicates that the registration of a fake consumer failed."""
+
+
+def percentile(values, percent):
+    """Return the ``percent`` percentile of ``values`` with the nearest-rank
+    method.
+
+    :param values: The values, sorted in ascending order.
+    :param percent: A number between 0 and 100.
+    :return: The percentile or ``None`` if there are no values.
+    """
+    if not values:
+        return None
+    rank = int(math.ceil(len(values) * percent / 100.0))
+    return values[min(max(rank, 1), len(values)) - 1]
+
+
+class RegistrationReport(object):
+    """Outcome of the registration or unregistration of many consumers.
+
+    :param int count: The number of consumers.
+    """
+
+    def __init__(self, count):
+        self.count = count
+        #: UUID of the consumers registered or unregistered
+        self.consumers = []
+        #: ``(name, error)`` of the consumers which failed
+        self.failures = []
+        #: Seconds taken by each request, in ascending order
+        self.latencies = []
+        #: Seconds taken by all the requests
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, consumer, latency, error=None):
+        """Record the outcome of a consumer request.
+
+        :param consumer: The consumer UUID, or its name when ``error`` is
+            given.
+        :param float latency: The seconds the request took.
+        :param error: The error of a failed request.
+        """
+        with self._lock:
+            self.latencies.append(latency)
+            if error is None:
+                self.consumers.append(consumer)
+            else:
+                self.failures.append((consumer, error))
+
+    @property
+    def rate(self):
+        """Successful requests per second."""
+        if not self.elapsed:
+            return 0.0
+        return len(self.consumers) / self.elapsed
+
+    def percentiles(self, percents=REPORT_PERCENTILES):
+        """Return a dict of the latency percentiles, in seconds.
+
+        :param percents: The percentiles to return.
+        """
+        return {
+            percent: percentile(self.latencies, percent)
+            for percent in percents
+        }
+
+    def summary(self):
+        """Return a line summarizing the report."""
+        summary = (
+            u'{0}/{1} succeeded, {2} failed in {3:.1f} s, {4:.1f}/s'.format(
+                len(self.consumers), self.count, len(self.failures),
+                self.elapsed, self.rate)
+        )
+        if self.latencies:
+            summary += u', latency ' + u' '.join(
+                u'p{0}={1:.0f}ms'.format(percent, value * 1000)
+                for percent, value in sorted(self.percentiles().items())
+            )
+        return summary
+
+
+class FakeConsumerRegistrar(object):
+    """Register fake consumers to the RHSM endpoints of a Satellite with
+    activation keys.
+
+    :param str org_label: The label of the organization of the consumers.
+    :param activation_keys: The names of the activation keys the consumers
+        are registered with.
+    :param int max_workers: The number of registrations sent at the same
+        time, which is the size of the connection pool too.
+    :param str server_url: The base URL of the Satellite. Defaults to
+        ``settings.server.get_url()``.
+    :param credentials: The username-password pair to unregister the
+        consumers with. Defaults to ``settings.server.get_credentials()``.
+    :param bool verify: Whether to verify the server TLS certificate.
+    """
+
+    def __init__(self, org_label, activation_keys,
+                 max_workers=REGISTRATION_MAX_WORKERS, server_url=None,
+                 credentials=None, verify=False):
+        if not activation_keys:
+            raise ValueError('At least one activation key must be provided')
+        if server_url is None:
+            server_url = settings.server.get_url()
+        if credentials is None:
+            credentials = settings.server.get_credentials()
+        self.org_label = org_label
+        self.activation_keys = list(activation_keys)
+        self.max_workers = max_workers
+        self.url = u'{0}/rhsm/consumers'.format(server_url.rstrip('/'))
+        self.credentials = credentials
+        self.session = requests.Session()
+        self.session.verify = verify
+        adapter = PooledHTTPAdapter(
+            keep_alive=settings.http_client.keep_alive,
+            pool_connections=1,
+            pool_maxsize=max_workers,
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the connections to the server."""
+        self.session.close()
+
+    def register(self, facts):
+        """Register a fake consumer.
+
+        :param facts: The facts of the consumer, see
+            :func:`robottelo.system_facts.generate_system_facts`.
+        :return: The consumer, with its ``uuid`` and identity certificate.
+        :rtype: dict
+        :raises RegistrationError: If the server refuses the registration.
+        """
+        name = facts[u'network.hostname']
+        response = self.session.post(
+            self.url,
+            params={
+                'owner': self.org_label,
+                'activation_keys': u','.join(self.activation_keys),
+            },
+            json={
+                u'type': u'system',
+                u'name': name,
+                u'facts': dict(facts),
+                u'installedProducts': [],
+                u'contentTags': [],
+            },
+        )
+        if not response.ok:
+            raise RegistrationError(
+                u'Registration of {0} failed with HTTP {1}: {2}'.format(
+                    name, response.status_code, _error_message(response)))
+        return response.json()
+
+    def unregister_one(self, uuid):
+        """Unregister a consumer, which deletes its content host.
+
+        :param str uuid: The UUID of the consumer.
+        :raises RegistrationError: If the server refuses the
+            unregistration.
+        """
+        response = self.session.delete(
+            u'{0}/{1}'.format(self.url, quote(uuid)), auth=self.credentials)
+        if not response.ok and response.status_code != 410:
+            raise RegistrationError(
+                u'Unregistration of {0} failed with HTTP {1}: {2}'.format(
+                    uuid, response.status_code, _error_message(response)))
+
+    def _run(self, function, items, key):
+        """Call ``function`` on all the ``items`` with at most
+        ``max_workers`` calls at the same time.
+
+        :param key: A function returning the item identifier recorded when
+            the call fails.
+        :return: A :class:`RegistrationReport` of the calls, which records
+            what ``function`` returns when it succeeds.
+        """
+        report = RegistrationReport(len(items))
+
+        def call(item):
+            start = time.time()
+            try:
+                result = function(item)
+            except (RegistrationError, requests.RequestException) as err:
+                LOGGER.warning(u'%s', err)
+                report.add(key(item), time.time() - start, err)
+            else:
+                report.add(result, time.time() - start)
+
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for future in [executor.submit(call, item) for item in items]:
+                future.result()
+        report.elapsed = time.time() - start
+        report.latencies.sort()
+        return report
+
+    def register_many(self, count, names=None):
+        """Register ``count`` fake consumers with random facts, see
+        :func:`robottelo.system_facts.generate_system_facts_batch`.
+
+        The registrations go on after the failed ones.
+
+        :param int count: The number of consumers.
+        :param list names: The FQDNs of the consumers. If not provided,
+            random ones are generated.
+        :return: A :class:`RegistrationReport` of the registrations, whose
+            ``consumers`` are the UUIDs of the registered consumers.
+        """
+        LOGGER.info(
+            u'Registering %s fake consumers to %s with %s workers',
+            count, self.org_label, self.max_workers)
+        report = self._run(
+            lambda facts: self.register(facts)[u'uuid'],
+            generate_system_facts_batch(count, names),
+            key=lambda facts: facts[u'network.hostname'],
+        )
+        LOGGER.info(u'Fake consumers registration: %s', report.summary())
+        return report
+
+    def unregister(self, uuids):
+        """Unregister consumers, the unregistrations go on after the failed
+        ones.
+
+        :param uuids: The UUIDs of the consumers.
+        :return: A :class:`RegistrationReport` of the unregistrations.
+        """
+        def unregister_one(uuid):
+            self.unregister_one(uuid)
+            return uuid
+
+        report = self._run(unregister_one, list(uuids), key=lambda uuid: uuid)
+        LOGGER.info(u'Fake consumers unregistration: %s', report.summary())
+        return report
+
+
+def _error_message(response):
+    """Return the error message of a RHSM error response."""
+    try:
+        return response.json()[u'displayMessage']
+    except (ValueError, KeyError, TypeError):
+        return response.text
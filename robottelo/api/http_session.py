@@ -0,0 +1,218 @@
+# -*- encoding: utf-8 -*-
+"""Shared HTTP session of the NailGun requests
+
+NailGun sends its requests with the ``requests`` module functions, each one
+with a new session and so a new connection and TLS handshake to the server.
+:func:`install` makes ``nailgun.client`` send them with a single
+``requests.Session`` per process instead, whose connection pool keeps the
+connections to the server open between requests::
+
+    install(settings.http_client)
+    entities.Organization().search()
+    get_stats()  # {'opened': 1, 'requests': 1, 'reused': 0}
+
+It is installed by :meth:`robottelo.config.base.Settings.configure` unless
+the ``[http_client]`` ``enabled`` setting is false. The session doesn't keep
+the cookies of the responses, as the requests are sent on behalf of
+different users.
+"""
+import logging
+import os
+import socket
+import threading
+
+import requests
+
+from nailgun import client
+from requests.adapters import HTTPAdapter
+from six.moves.http_cookiejar import DefaultCookiePolicy
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+LOGGER = logging.getLogger(__name__)
+
+# the session of the process and the settings it is made with
+_lock = threading.Lock()
+_session = None
+_session_pid = None
+_http_settings = None
+
+# connections opened and requests sent by the session of the process
+_stats_lock = threading.Lock()
+_stats = {'opened': 0, 'requests': 0}
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    """Connection pool counting the connections opened and requests sent."""
+
+    def _new_conn(self):
+        _count('opened')
+        return super(_CountingHTTPConnectionPool, self)._new_conn()
+
+    def _make_request(self, *args, **kwargs):
+        _count('requests')
+        return super(_CountingHTTPConnectionPool, self)._make_request(
+            *args, **kwargs)
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    """HTTPS connection pool counting the connections opened and requests
+    sent.
+    """
+
+    def _new_conn(self):
+        _count('opened')
+        return super(_CountingHTTPSConnectionPool, self)._new_conn()
+
+    def _make_request(self, *args, **kwargs):
+        _count('requests')
+        return super(_CountingHTTPSConnectionPool, self)._make_request(
+            *args, **kwargs)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter counting its connections, with TCP keep-alive probes on
+    them so the idle pooled connections are not dropped by firewalls.
+
+    :param bool keep_alive: Whether to enable the TCP keep-alive probes.
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ['keep_alive']
+
+    def __init__(self, keep_alive=True, **kwargs):
+        self.keep_alive = keep_alive
+        super(PooledHTTPAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.keep_alive:
+            kwargs['socket_options'] = (
+                HTTPConnection.default_socket_options +
+                [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+            )
+        super(PooledHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CountingHTTPConnectionPool,
+            'https': _CountingHTTPSConnectionPool,
+        }
+
+
+def _new_session(http_settings):
+    """Return a session tuned with the ``[http_client]`` settings."""
+    session = requests.Session()
+    adapter = PooledHTTPAdapter(
+        keep_alive=http_settings.keep_alive,
+        pool_connections=http_settings.pool_connections,
+        pool_maxsize=http_settings.pool_size,
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    # NailGun authenticates each request, a session cookie of a user would
+    # be sent with the requests of the other users.
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    if not http_settings.compression:
+        session.headers['Accept-Encoding'] = 'identity'
+    return session
+
+
+def get_session():
+    """Return the shared session of the process.
+
+    A forked process gets a new session, its parent connections are not
+    shared.
+    """
+    global _session, _session_pid
+    with _lock:
+        if _session is None or _session_pid != os.getpid():
+            if _session_pid != os.getpid():
+                reset_stats()
+            _session = _new_session(_http_settings)
+            _session_pid = os.getpid()
+        return _session
+
+
+class _SessionRequests(object):
+    """Stand-in of the ``requests`` module in ``nailgun.client`` sending the
+    requests with the shared session.
+    """
+
+    def request(self, method, url, **kwargs):
+        return get_session().request(method, url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return get_session().head(url, **kwargs)
+
+    def get(self, url, params=None, **kwargs):
+        return get_session().get(url, params=params, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return get_session().post(url, data=data, json=json, **kwargs)
+
+    def put(self, url, data=None, **kwargs):
+        return get_session().put(url, data=data, **kwargs)
+
+    def patch(self, url, data=None, **kwargs):
+        return get_session().patch(url, data=data, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return get_session().delete(url, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+def install(http_settings):
+    """Make NailGun send its requests with the shared session.
+
+    :param http_settings: The ``[http_client]`` settings, see
+        :class:`robottelo.config.base.HTTPClientSettings`.
+    """
+    global _session, _http_settings
+    with _lock:
+        _http_settings = http_settings
+        _session = None
+    client.requests = _SessionRequests()
+    LOGGER.debug(
+        'NailGun requests sent with a shared session of %s connections',
+        http_settings.pool_size
+    )
+
+
+def uninstall():
+    """Make NailGun send its requests with the ``requests`` module again and
+    close the shared session.
+    """
+    global _session
+    client.requests = requests
+    with _lock:
+        if _session is not None and _session_pid == os.getpid():
+            _session.close()
+        _session = None
+
+
+def get_stats():
+    """Return the connections opened and the requests sent by the shared
+    session of the process.
+
+    :return: A dict with the number of connections ``opened``, of
+        ``requests`` and of requests which ``reused`` an open connection.
+    """
+    with _stats_lock:
+        opened = _stats['opened']
+        sent = _stats['requests']
+    return {
+        'opened': opened,
+        'requests': sent,
+        'reused': max(sent - opened, 0),
+    }
+
+
+def reset_stats():
+    """Set the counters of :func:`get_stats` to zero."""
+    with _stats_lock:
+        _stats['opened'] = 0
+        _stats['requests'] = 0
@@ -20,6 +20,8 @@ from robottelo.constants import (
     RHEL_7_MAJOR_VERSION,
 )
 from robottelo.decorators import bz_bug_is_open
+from robottelo.recipe import Recipe
+from robottelo.tasks import api_tracker, run_task, task_timeout
 
 
 def call_entity_method_with_timeout(entity_callable, timeout=300, **kwargs):
@@ -32,13 +34,11 @@ def call_entity_method_with_timeout(entity_callable, timeout=300, **kwargs):
         Usage:
             call_entity_method_with_timeout(
                 entities.Repository(id=repo_id).sync, timeout=1500)
+
+        The timeout only applies to this call, so it is safe to use from
+        several threads at the same time.
     """
-    original_task_timeout = entity_mixins.TASK_TIMEOUT
-    entity_mixins.TASK_TIMEOUT = timeout
-    try:
-        entity_callable(**kwargs)
-    finally:
-        entity_mixins.TASK_TIMEOUT = original_task_timeout
+    return run_task(entity_callable, timeout=timeout, **kwargs)
 
 
 def enable_rhrepo_and_fetchid(basearch, org_id, product, repo,
@@ -91,7 +91,7 @@ def promote(content_view_version, environment_id, force=False):
         u'environment_id': environment_id,
         u'force': True if force else False,
     }
-    return content_view_version.promote(data=data)
+    return run_task(content_view_version.promote, data=data)
 
 
 def upload_manifest(organization_id, manifest):
@@ -132,7 +132,7 @@ def publish_puppet_module(puppet_modules, repo_url, organization_id=None):
         url=repo_url
     ).create()
     # Synchronize repo via provided URL
-    repo.sync()
+    run_task(repo.sync)
     # Add selected module to Content View
     cv = entities.ContentView(organization=organization_id).create()
     for module in puppet_modules:
@@ -143,7 +143,7 @@ def publish_puppet_module(puppet_modules, repo_url, organization_id=None):
         ).create()
     # CV publishing will automatically create Environment and
     # Puppet Class entities
-    cv.publish()
+    run_task(cv.publish)
     return cv.read()
 
 
@@ -216,7 +216,7 @@ def create_sync_custom_repo(org_id=None, product_name=None, repo_name=None,
         docker_upstream_name=docker_upstream_name,
     ).create()
     # Sync repository
-    entities.Repository(id=repo.id).sync()
+    run_task(entities.Repository(id=repo.id).sync)
     return repo.id
 
 
@@ -239,29 +239,43 @@ def enable_sync_redhat_repo(rh_repo, org_id):
 
 def cv_publish_promote(name=None, env_name=None, repo_id=None, org_id=None):
     """Create, publish and promote CV to selected environment"""
-    if org_id is None:
-        org_id = entities.Organization().create().id
+    recipe = Recipe('cv_publish_promote')
+    recipe.add('org', lambda: entities.Organization().create().id)
     # Create Life-Cycle content environment
     kwargs = {'name': env_name} if env_name is not None else {}
-    lce = entities.LifecycleEnvironment(
-        organization=org_id,
-        **kwargs
-    ).create()
-    # Create content view(CV)
-    kwargs = {'name': name} if name is not None else {}
-    content_view = entities.ContentView(
-        organization=org_id,
-        **kwargs
-    ).create()
-    # Associate YUM repo to created CV
-    if repo_id is not None:
-        content_view.repository = [entities.Repository(id=repo_id)]
-        content_view = content_view.update(['repository'])
-    # Publish content view
-    content_view.publish()
+    recipe.add(
+        'lce',
+        lambda org_id: entities.LifecycleEnvironment(
+            organization=org_id,
+            **kwargs
+        ).create(),
+        requires=('org',)
+    )
+
+    def create_content_view(org_id):
+        # Create content view(CV)
+        kwargs = {'name': name} if name is not None else {}
+        content_view = entities.ContentView(
+            organization=org_id,
+            **kwargs
+        ).create()
+        # Associate YUM repo to created CV
+        if repo_id is not None:
+            content_view.repository = [entities.Repository(id=repo_id)]
+            content_view = content_view.update(['repository'])
+        # Publish content view
+        run_task(content_view.publish)
+        return content_view.read()
+
+    recipe.add('cv', create_content_view, requires=('org',))
     # Promote the content view version.
-    promote(content_view.read().version[0], lce.id)
-    return content_view.read()
+    recipe.add(
+        'promote',
+        lambda content_view, lce: promote(content_view.version[0], lce.id),
+        requires=('cv', 'lce')
+    )
+    results = recipe.run(provided={'org': org_id})
+    return results['cv'].read()
 
 
 def one_to_one_names(name):
@@ -328,19 +342,15 @@ def configure_provisioning(org=None, loc=None, compute=False, os=None):
     ).create()
 
     # Increased timeout value for repo sync and CV publishing and promotion
-    try:
-        old_task_timeout = entity_mixins.TASK_TIMEOUT
-        entity_mixins.TASK_TIMEOUT = 3600
-        repo.sync()
+    with task_timeout(3600):
+        run_task(repo.sync)
         # Create, Publish and promote CV
         content_view = entities.ContentView(organization=org).create()
         content_view.repository = [repo]
         content_view = content_view.update(['repository'])
-        content_view.publish()
+        run_task(content_view.publish)
         content_view = content_view.read()
         promote(content_view.version[0], lc_env.id)
-    finally:
-        entity_mixins.TASK_TIMEOUT = old_task_timeout
     # Search for existing organization puppet environment, otherwise create a
     # new one, associate organization and location where it is appropriate.
     environments = entities.Environment().search(
@@ -674,19 +684,24 @@ def wait_for_tasks(search_query, search_rate=1, max_tries=10, poll_rate=None,
     :param search_query: Search query that will be passed to API call.
     :param search_rate: Delay between searches.
     :param max_tries: How many times search should be executed.
-    :param poll_rate: Delay between the end of one task check-up and
-            the start of the next check-up. Parameter for
-            ``nailgun.entities.ForemanTask.poll()`` method.
+    :param poll_rate: Kept for compatibility, the tasks are polled together by
+        :data:`robottelo.tasks.api_tracker`.
     :param poll_timeout: Maximum number of seconds to wait until timing out.
-            Parameter for ``nailgun.entities.ForemanTask.poll()`` method.
+        Defaults to ``nailgun.entity_mixins.TASK_TIMEOUT``.
     :return: List of ``nailgun.entities.ForemanTasks`` entities.
     :raises: ``AssertionError``. If not tasks were found until timeout.
+    :raises robottelo.tasks.TaskFailedError: If a task finished without
+        success.
+    :raises robottelo.tasks.TaskTimeoutError: If a task did not finish in
+        time.
     """
     for _ in range(max_tries):
         tasks = entities.ForemanTask().search(query={'search': search_query})
         if len(tasks) > 0:
-            for task in tasks:
-                task.poll(poll_rate=poll_rate, timeout=poll_timeout)
+            api_tracker.wait(
+                [task.id for task in tasks],
+                timeout=poll_timeout or entity_mixins.TASK_TIMEOUT,
+            )
             break
         else:
             time.sleep(search_rate)
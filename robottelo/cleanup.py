@@ -2,15 +2,24 @@
 """Cleanup module for different entities"""
 import logging
 from collections import deque, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from nailgun import entities, signals
 from robottelo.cli.base import CLIReturnCodeError
+from robottelo.cleanup_journal import is_journaled
 from robottelo.cli.proxy import Proxy
 from robottelo.constants import DEFAULT_ORG_ID
 from robottelo.decorators import bz_bug_is_open
+from robottelo.tasks import api_tracker, is_task
 
 
 LOGGER = logging.getLogger(__name__)
 
+#: Number of entities updated or deleted at the same time by the cleaner
+CLEANUP_MAX_WORKERS = 8
+
+# maximum number of hosts returned by the search of the organizations hosts
+HOSTS_PER_PAGE = 10000
+
 
 def capsule_cleanup(proxy_id=None):
     """Deletes the capsule with the given id"""
@@ -61,12 +70,31 @@ def vm_cleanup(vm):
 
 
 class EntitiesCleaner(object):
-    """Register and clean entities for cleanup using signals"""
+    """Register and clean entities for cleanup using signals
+
+    The entities are updated and deleted :data:`CLEANUP_MAX_WORKERS` at a
+    time and the organizations deletion tasks are waited on by
+    :data:`robottelo.tasks.api_tracker`. The organizations which can't be
+    deleted are skipped and reported in :attr:`undeleted_entities`.
+
+    With a ``journal``, the entities are recorded in it instead and
+    :meth:`clean` only releases them, the reaper of the journal deletes them,
+    see :mod:`robottelo.cleanup_journal`.
+
+    :param types_to_cleanup: The entity types to clean.
+    :param int max_workers: The number of entities updated or deleted at the
+        same time, :data:`CLEANUP_MAX_WORKERS` if not set.
+    :param journal: The :class:`robottelo.cleanup_journal.CleanupJournal` to
+        record the entities in.
+    """
 
-    def __init__(self, *types_to_cleanup):
+    def __init__(self, *types_to_cleanup, **kwargs):
         self.cleanup_queue = defaultdict(deque)
         self.deleted_entities = defaultdict(set)
+        self.undeleted_entities = defaultdict(dict)
         self.types_to_cleanup = types_to_cleanup
+        self.max_workers = kwargs.get('max_workers', CLEANUP_MAX_WORKERS)
+        self.journal = kwargs.get('journal')
         self.logger = logging.getLogger('robottelo')
         self.connect_cleanup_signals()
 
@@ -79,12 +107,26 @@ class EntitiesCleaner(object):
 
     def register_entity_for_cleanup(self, sender, entity, **kwargs):
         """Put a new entity in the queue to be cleaned"""
+        if self.journal is not None:
+            if is_journaled():
+                self.journal.add(
+                    u'api', entity.__class__.__name__, entity.id)
+            return
         self.logger.info(
             'Adding {0}:{1} for cleanup_queue'.format(sender, entity.id))
         self.cleanup_queue[entity.__class__.__name__].appendleft(entity)
 
     def clean(self):
-        """This method is called in TearDownClass only when cleanup=true"""
+        """This method is called in TearDownClass only when cleanup=true
+
+        :return: The entities which could not be deleted, see
+            :attr:`undeleted_entities`.
+        """
+        if self.journal is not None:
+            self.logger.debug(
+                'Cleanup released the entities of %s', self.journal.scope)
+            self.journal.release()
+            return self.undeleted_entities
         default_org = entities.Organization(id=DEFAULT_ORG_ID)
         # reassign created hosts to default org
         self.update_entities(
@@ -107,40 +149,106 @@ class EntitiesCleaner(object):
         )
 
         self.logger.debug(
-            'Cleanup deleted %s entities', len(self.deleted_entities))
+            'Cleanup deleted %s entities',
+            sum(len(ids) for ids in self.deleted_entities.values())
+        )
+        for entity_type, reasons in self.undeleted_entities.items():
+            for entity_id, reason in reasons.items():
+                self.logger.warn(
+                    'Cleanup could not delete %s %s: %s',
+                    entity_type, entity_id, reason
+                )
+        return self.undeleted_entities
+
+    def _run_concurrently(self, func, entity_list):
+        """Call ``func`` with every entity, :attr:`max_workers` at a time.
+
+        :return: The list of the results.
+        """
+        if not entity_list:
+            return []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(func, entity_list))
+
+    def _count_organizations_hosts(self, org_ids):
+        """Return a dict mapping the organizations ids to their number of
+        hosts, with a single search of the hosts of all the organizations.
+        """
+        hosts_count = defaultdict(int)
+        if not org_ids:
+            return hosts_count
+        query = {
+            'search': 'organization_id ^ ({0})'.format(
+                ', '.join(str(org_id) for org_id in org_ids)),
+            'per_page': HOSTS_PER_PAGE,
+        }
+        try:
+            hosts = entities.Host().search_json(query=query)['results']
+        except Exception as e:
+            # the organizations with hosts fail to be deleted
+            self.logger.warn('Error searching organizations hosts %s', str(e))
+            return hosts_count
+        for host in hosts:
+            hosts_count[host.get('organization_id')] += 1
+        return hosts_count
+
+    def _delete_entity(self, entity, **kwargs):
+        """Delete an entity and track its deletion task if any.
+
+        :return: ``None`` if the entity was deleted, the future of the
+            deletion task if it is running, the error otherwise.
+        """
+        try:
+            response = entity.delete(**kwargs)
+        except Exception as e:
+            return e
+        if is_task(response):
+            return api_tracker.track(response['id'])
+        return None
 
     def delete_entities(self, entity_list, **kwargs):
         self.logger.debug(
             'Cleanup got %s entities to delete', len(entity_list))
+        to_delete = {}
         for entity in entity_list:
             entity_type = entity.__class__.__name__
-            if entity.id in self.deleted_entities[entity_type]:
-                # skip already deleted entities
-                continue
-            try:
-                if isinstance(entity, entities.Organization):
-                    query = {'search': 'organization_id={0}'.format(entity.id)}
-                    org_hosts = entities.Host().search(query=query)
-                    if org_hosts:  # Do not delete organizations with hosts
-                        self.logger.debug(
-                            'Org %s can\'t be deleted as it has %s hosts',
-                            entity.id,
-                            len(org_hosts)
-                        )
-                        return
-                entity.delete(**kwargs)
-            except Exception as e:
-                self.logger.warn('Error deleting entity %s', str(e))
+            # skip already deleted entities
+            if entity.id not in self.deleted_entities[entity_type]:
+                to_delete[(entity_type, entity.id)] = entity
+        hosts_count = self._count_organizations_hosts([
+            entity_id for entity_type, entity_id in to_delete
+            if entity_type == entities.Organization.__name__
+        ])
+        for (entity_type, entity_id), entity in list(to_delete.items()):
+            if (isinstance(entity, entities.Organization) and
+                    hosts_count.get(entity_id)):
+                # Do not delete organizations with hosts
+                self.undeleted_entities[entity_type][entity_id] = (
+                    'it has {0} hosts'.format(hosts_count[entity_id]))
+                del to_delete[(entity_type, entity_id)]
+        keys = list(to_delete)
+        results = self._run_concurrently(
+            lambda key: self._delete_entity(to_delete[key], **kwargs), keys)
+        for (entity_type, entity_id), result in zip(keys, results):
+            if isinstance(result, Future):
+                result = result.exception()
+            if result is None:
+                self.deleted_entities[entity_type].add(entity_id)
+                self.undeleted_entities[entity_type].pop(entity_id, None)
             else:
-                self.deleted_entities[entity_type].add(entity.id)
+                self.logger.debug('Error deleting entity %s', str(result))
+                self.undeleted_entities[entity_type][entity_id] = str(result)
 
     def update_entities(self, entity_list, **kwargs):
         self.logger.debug(
             'Cleanup got %s entities to update', len(entity_list))
-        for entity in entity_list:
+
+        def update_entity(entity):
             try:
                 for key, value in kwargs.items():
                     setattr(entity, key, value)
                 entity.update(fields=kwargs.keys())
             except Exception as e:
                 self.logger.warn('Error updating entity %s', str(e))
+
+        self._run_concurrently(update_entity, list(entity_list))
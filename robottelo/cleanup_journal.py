@@ -0,0 +1,492 @@
+# -*- encoding: utf-8 -*-
+"""Journal of the entities created by the tests, deleted by a reaper process
+
+Instead of deleting the entities created by a test module in its teardown,
+:class:`robottelo.cleanup.EntitiesCleaner` and
+:func:`robottelo.cli.factory.create_object` can append them to a per worker
+append-only :class:`CleanupJournal`. The module teardown only marks its
+entities as released and a background :class:`Reaper` process deletes the
+released entities in batches, the heaviest types first, while the next
+modules run::
+
+    journal = open_journal('/var/tmp/robottelo-cleanup', 'gw0')
+    start_reaper(journal.path)
+    journal.scope = 'tests.foreman.api.test_organization'
+    ...  # create entities
+    journal.release()
+    ...
+    journal.close()  # the reaper deletes what is left and exits
+
+The entities cached for the whole session, by
+:func:`robottelo.cli.default_entities.resolve`, the shared functions and the
+``cached=True`` factories of :func:`robottelo.decorators.cacheable`, are
+created in a :func:`not_journaled` block as the next modules and workers
+still use them. The reaper started by :func:`start_reaper` deletes all the
+entities and exits when the process writing the journal is gone without
+closing it.
+
+A journal of a run which crashed can be cleaned afterwards, deleting all its
+entities whether they were released or not::
+
+    $ python -m robottelo.cleanup_journal --all /var/tmp/robottelo-cleanup
+
+Each journal line is a JSON object with an ``event``:
+
+* ``created``: an entity was created, with its ``source`` (``api`` for a
+  NailGun entity, ``cli`` for a hammer one), ``type`` (the NailGun entity
+  class name or the CLI class path), ``id``, hammer delete ``options`` and
+  ``scope``;
+* ``released``: the entities of a ``scope`` can be deleted;
+* ``deleted`` and ``failed``: written by the reaper for an entity;
+* ``closed``: the session ended, all the entities can be deleted.
+"""
+import argparse
+import errno
+import glob
+import importlib
+import io
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from nailgun import entities
+from requests.exceptions import HTTPError
+from robottelo.cli.base import CLIReturnCodeError
+from robottelo.config.base import get_project_root
+from robottelo.tasks import api_tracker, is_task
+
+LOGGER = logging.getLogger(__name__)
+
+#: Suffix of the journal files
+JOURNAL_SUFFIX = '.journal'
+
+#: Names of the entity types deleted first, in this order, the other ones
+#: after them. The hosts go first as the organizations with hosts can't be
+#: deleted and deleting an organization deletes its content.
+REAP_PRIORITY = (('Host',), ('Organization', 'Org'))
+
+#: Number of times the reaper tries to delete an entity
+MAX_ATTEMPTS = 3
+
+# the journal the entities are recorded in, see open_journal
+_journal = None
+
+# whether the entities created by the current thread are journaled, see
+# not_journaled
+_context = threading.local()
+
+
+class CleanupJournal(object):
+    """Append-only journal of created entities.
+
+    :param str path: The journal file path.
+    :param str scope: The scope of the entities created, released together by
+        :meth:`release`. The entities created without a scope are released
+        when the journal is closed.
+    """
+
+    def __init__(self, path, scope=None):
+        self.path = path
+        self.scope = scope
+        self._lock = threading.Lock()
+
+    def _append(self, **record):
+        line = json.dumps(record, sort_keys=True) + u'\n'
+        with self._lock:
+            # a single write, the reaper appends to the same file
+            with io.open(self.path, 'a', encoding='utf-8') as handler:
+                handler.write(line)
+
+    def add(self, source, entity_type, entity_id, options=None):
+        """Record a created entity in the current scope.
+
+        :param str source: ``api`` or ``cli``.
+        :param str entity_type: The NailGun entity class name or the CLI
+            class path, e.g. ``robottelo.cli.org.Org``.
+        :param entity_id: The entity id.
+        :param dict options: The hammer delete options, besides ``id``.
+        """
+        self._append(
+            event=u'created',
+            source=source,
+            type=entity_type,
+            id=entity_id,
+            options=options or {},
+            scope=self.scope,
+        )
+
+    def release(self, scope=None):
+        """Let the reaper delete the entities of a scope.
+
+        :param str scope: The scope, the current one if ``None``.
+        """
+        self._append(event=u'released', scope=scope or self.scope)
+
+    def mark_deleted(self, key):
+        """Record that an entity was deleted, see :func:`read_journal`."""
+        source, entity_type, entity_id = key
+        self._append(
+            event=u'deleted', source=source, type=entity_type, id=entity_id)
+
+    def mark_failed(self, key, reason):
+        """Record that an entity failed to be deleted."""
+        source, entity_type, entity_id = key
+        self._append(
+            event=u'failed', source=source, type=entity_type, id=entity_id,
+            reason=reason)
+
+    def close(self):
+        """Let the reaper delete all the entities and exit."""
+        self._append(event=u'closed')
+
+
+def read_journal(path):
+    """Read a journal.
+
+    :param str path: The journal file path.
+    :return: A tuple with an ordered dict mapping the ``(source, type, id)``
+        keys of the entities not deleted yet to their ``created`` records,
+        updated with their ``released`` state and failed ``attempts``, and
+        whether the journal is closed.
+    """
+    pending = OrderedDict()
+    released = set()
+    closed = False
+    with io.open(path, encoding='utf-8') as handler:
+        for line in handler:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # a line partially written when a process crashed
+                continue
+            event = record.get('event')
+            if event == u'closed':
+                closed = True
+            elif event == u'released':
+                released.add(record['scope'])
+            elif event in (u'created', u'deleted', u'failed'):
+                key = (record['source'], record['type'], record['id'])
+                if event == u'created':
+                    record.update(attempts=0, reason=None)
+                    pending[key] = record
+                elif event == u'deleted':
+                    pending.pop(key, None)
+                elif key in pending:
+                    pending[key]['attempts'] += 1
+                    pending[key]['reason'] = record.get('reason')
+    for record in pending.values():
+        record['released'] = closed or record['scope'] in released
+    return pending, closed
+
+
+def _priority(key):
+    """Return the deletion rank of an entity key, see
+    :data:`REAP_PRIORITY`.
+    """
+    name = key[1].rpartition('.')[2]
+    for rank, names in enumerate(REAP_PRIORITY):
+        if name in names:
+            return rank
+    return len(REAP_PRIORITY)
+
+
+def _delete(record):
+    """Delete a journal entity.
+
+    :return: ``None`` if the entity is deleted or was already, the future of
+        its deletion task if it is running, the error otherwise.
+    """
+    try:
+        if record['source'] == u'api':
+            response = getattr(entities, record['type'])(
+                id=record['id']).delete(synchronous=False)
+            if is_task(response):
+                return api_tracker.track(response['id'])
+        else:
+            module_name, _, class_name = record['type'].rpartition('.')
+            cli_object = getattr(
+                importlib.import_module(module_name), class_name)
+            options = dict(record['options'])
+            options['id'] = record['id']
+            cli_object.delete(options)
+    except HTTPError as err:
+        # deleted with its organization
+        if err.response is None or err.response.status_code != 404:
+            return err
+    except CLIReturnCodeError as err:
+        if 'not found' not in (err.msg or u'').lower():
+            return err
+    except Exception as err:
+        return err
+    return None
+
+
+class Reaper(object):
+    """Delete the released entities of journals.
+
+    :param paths: The journal files.
+    :param int batch_size: The maximum number of entities deleted per round.
+    :param int max_workers: The number of entities deleted at the same time.
+    :param bool release_all: Whether to delete the entities not released,
+        e.g. the ones of a crashed run.
+    :param int owner_pid: The id of the process writing the journals. When
+        it is gone without closing them, their entities are all deleted
+        and the reaper exits.
+    """
+
+    def __init__(self, paths, batch_size=100, max_workers=8,
+                 release_all=False, owner_pid=None):
+        self.paths = list(paths)
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.release_all = release_all
+        self.owner_pid = owner_pid
+        self.deleted = 0
+        self.failed = 0
+
+    def reap_once(self):
+        """Delete a batch of the released entities of the journals.
+
+        :return: A tuple with the number of entities tried and whether all
+            the journals are done, closed with nothing left to try.
+        """
+        batch = []
+        done = True
+        for path in self.paths:
+            if not os.path.exists(path):
+                continue
+            pending, closed = read_journal(path)
+            left = [
+                (key, record) for key, record in pending.items()
+                if record['attempts'] < MAX_ATTEMPTS
+            ]
+            done = done and closed and not left
+            journal = CleanupJournal(path)
+            batch.extend(
+                (journal, key, record) for key, record in left
+                if record['released'] or self.release_all
+            )
+        batch.sort(key=lambda item: _priority(item[1]))
+        batch = batch[:self.batch_size]
+        if not batch:
+            return 0, done
+        # delete a priority rank after the other, e.g. the hosts before
+        # their organizations
+        rank = _priority(batch[0][1])
+        batch = [item for item in batch if _priority(item[1]) == rank]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(
+                lambda item: _delete(item[2]), batch))
+        for (journal, key, record), result in zip(batch, results):
+            if isinstance(result, Future):
+                result = result.exception()
+            if result is None:
+                journal.mark_deleted(key)
+                self.deleted += 1
+            else:
+                LOGGER.warning('Reaper could not delete %s: %s', key, result)
+                journal.mark_failed(key, str(result))
+                self.failed += 1
+        return len(batch), False
+
+    def run(self, poll_interval=5, until_done=True):
+        """Reap the journals.
+
+        :param poll_interval: Number of seconds to wait when there is
+            nothing to delete.
+        :param bool until_done: Whether to wait for the journals to be
+            closed, see :meth:`reap_once`. Stop when there is nothing left to
+            delete otherwise.
+        """
+        while True:
+            if (until_done and self.owner_pid is not None and
+                    not _process_exists(self.owner_pid)):
+                LOGGER.warning(
+                    'Process %s exited without closing the journals, '
+                    'deleting all their entities', self.owner_pid)
+                self.release_all = True
+                until_done = False
+            deleted = self.deleted
+            tried, done = self.reap_once()
+            if done or not (tried or until_done):
+                break
+            if self.deleted == deleted:
+                # nothing to delete or only failures, give them some time
+                time.sleep(poll_interval)
+        for path in self.paths:
+            if os.path.exists(path):
+                pending, closed = read_journal(path)
+                if not pending and (closed or self.release_all):
+                    os.remove(path)
+        LOGGER.info('Reaper deleted %s entities, %s failures',
+                    self.deleted, self.failed)
+
+
+def _process_exists(pid):
+    """Tell whether the process ``pid`` is running."""
+    try:
+        os.kill(pid, 0)
+    except OSError as err:
+        return err.errno == errno.EPERM
+    return True
+
+
+def open_journal(directory, name):
+    """Open the journal the entities are recorded in by
+    :func:`record_created`.
+
+    :param str directory: The journals directory.
+    :param str name: The journal name, e.g. the xdist worker id.
+    :return: The :class:`CleanupJournal`.
+    """
+    global _journal
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    path = os.path.join(directory, u'{0}-{1}-{2}{3}'.format(
+        time.strftime('%Y%m%d%H%M%S'), name, os.getpid(), JOURNAL_SUFFIX))
+    # created now so a reaper started before any entity finds it
+    io.open(path, 'a', encoding='utf-8').close()
+    _journal = CleanupJournal(path)
+    return _journal
+
+
+def close_journal():
+    """Close the journal opened by :func:`open_journal`."""
+    global _journal
+    if _journal is not None:
+        _journal.close()
+        _journal = None
+
+
+def get_journal():
+    """Return the journal opened by :func:`open_journal`, ``None`` if
+    there is none.
+    """
+    return _journal
+
+
+@contextmanager
+def not_journaled():
+    """Do not journal the entities the current thread creates in the
+    ``with`` block.
+
+    The entities cached for the whole session, like the default entities of
+    :mod:`robottelo.cli.default_entities`, the results of the shared
+    functions or the objects of :data:`robottelo.decorators.OBJECT_CACHE`,
+    are used by other modules and workers after the module which
+    created them is released, so they must not be reaped.
+    """
+    previous = getattr(_context, 'disabled', False)
+    _context.disabled = True
+    try:
+        yield
+    finally:
+        _context.disabled = previous
+
+
+def is_journaled():
+    """Tell whether the entities created by the current thread may be
+    journaled, see :func:`not_journaled`.
+    """
+    return not getattr(_context, 'disabled', False)
+
+
+def record_created(cli_object, result, options=None):
+    """Record an entity created by hammer in the opened journal, if any.
+
+    :param cli_object: The CLI class, e.g. :class:`robottelo.cli.org.Org`.
+    :param dict result: The created entity.
+    :param dict options: The create options.
+    """
+    journal = _journal
+    if (journal is None or not is_journaled() or
+            not isinstance(result, dict) or not result.get('id')):
+        return
+    delete_options = {}
+    if cli_object.command_requires_org and options:
+        if options.get('organization-id'):
+            delete_options['organization-id'] = options['organization-id']
+    journal.add(
+        u'cli',
+        u'{0}.{1}'.format(cli_object.__module__, cli_object.__name__),
+        result['id'],
+        delete_options,
+    )
+
+
+def start_reaper(path, log_path=None, owner_pid=None):
+    """Start a reaper process deleting the entities of a journal until it is
+    closed or the process writing it exits.
+
+    :param str path: The journal file.
+    :param str log_path: The file the reaper logs to, the journal path with
+        a ``.log`` suffix if ``None``.
+    :param int owner_pid: The id of the process writing the journal, the
+        current one if ``None``.
+    :return: The ``subprocess.Popen`` of the reaper.
+    """
+    if log_path is None:
+        log_path = u'{0}.log'.format(path)
+    if owner_pid is None:
+        owner_pid = os.getpid()
+    with open(log_path, 'a') as log_file:
+        return subprocess.Popen(
+            [sys.executable, '-m', 'robottelo.cleanup_journal',
+             '--owner-pid', str(owner_pid), path],
+            cwd=get_project_root(),
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+        )
+
+
+def main(args=None):
+    """Reap the journals given in the command line."""
+    parser = argparse.ArgumentParser(
+        description=u'Delete the entities recorded in cleanup journals.')
+    parser.add_argument(
+        'paths', nargs='+',
+        help=u'journal files or directories of journal files')
+    parser.add_argument(
+        '--all', action='store_true',
+        help=u'delete all the entities, released or not, and exit when '
+             u'nothing is left instead of waiting for the journals to be '
+             u'closed')
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--max-workers', type=int, default=8)
+    parser.add_argument(
+        '--owner-pid', type=int,
+        help=u'id of the process writing the journals, delete all the '
+             u'entities and exit when it is gone')
+    args = parser.parse_args(args)
+    paths = []
+    for path in args.paths:
+        if os.path.isdir(path):
+            paths.extend(sorted(glob.glob(
+                os.path.join(path, u'*{0}'.format(JOURNAL_SUFFIX)))))
+        else:
+            paths.append(path)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    # imported here as the settings are only needed by the reaper process
+    from robottelo.config import settings
+    if not settings.configured:
+        settings.configure()
+    Reaper(
+        paths,
+        batch_size=args.batch_size,
+        max_workers=args.max_workers,
+        release_all=args.all,
+        owner_pid=args.owner_pid,
+    ).run(until_done=not args.all)
+
+
+if __name__ == '__main__':
+    main()
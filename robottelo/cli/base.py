@@ -1,10 +1,13 @@
 # -*- encoding: utf-8 -*-
 """Generic base class for cli hammer commands."""
+import copy
 import logging
 import re
+import threading
 
+from contextlib import contextmanager
 from robottelo import ssh
-from robottelo.cli import hammer
+from robottelo.cli import command_tree, default_entities, hammer
 from robottelo.config import settings
 
 
@@ -61,6 +64,129 @@ class CLIDataBaseError(CLIBaseError):
     """
 
 
+class CLIReadCache(object):
+    """Cache of the output of the hammer ``info`` and ``list`` commands.
+
+    When enabled, see :func:`cli_read_cache`, :meth:`Base.execute` returns
+    the cached output of a read command run before with the same options and
+    user instead of running hammer again. Any other command forgets the
+    cached output of the commands of the same entity type and of the
+    commands with an option referencing this entity type, e.g. a
+    ``content-view publish`` forgets the ``content-view info`` and
+    ``content-view version list --content-view-id`` outputs.
+
+    Changes made through the API, the UI or as a side effect of a command on
+    another entity type are not tracked, enable the cache only around code
+    which doesn't rely on them.
+    """
+
+    #: Hammer sub commands whose output is cached, matched against the last
+    #: word of the sub command, e.g. ``version info``
+    read_subcommands = ('info', 'list')
+
+    _option_regex = re.compile(r'--[\w-]+(?:="[^"]*")?')
+
+    def __init__(self):
+        self.enabled = False
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def is_read(self, command_sub):
+        """Whether the output of the hammer sub command can be cached."""
+        return bool(command_sub) and (
+            command_sub.split()[-1] in self.read_subcommands)
+
+    def get_key(self, command_base, command_sub, command, user=None,
+                output_format=None):
+        """Return the cache key of a hammer command.
+
+        The options are sorted so their order doesn't matter.
+
+        :param str command_base: The hammer command, e.g. ``organization``.
+        :param str command_sub: The hammer sub command, e.g. ``info``.
+        :param str command: The whole hammer command with its options.
+        :param str user: The user running the command.
+        :param str output_format: The hammer output format.
+        """
+        options = self._option_regex.findall(command)
+        if len(u' '.join(options)) < len(command.partition(u' --')[2]):
+            # not only options, keep the command as is
+            options = [command]
+        return (
+            command_base,
+            command_sub,
+            tuple(sorted(options)),
+            user,
+            output_format,
+        )
+
+    def get(self, key):
+        """Return a copy of the cached output of ``key`` and count the hit or
+        miss.
+
+        :return: A tuple with whether the output was cached and the output.
+        """
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return True, copy.deepcopy(self._entries[key])
+            self.misses += 1
+            return False, None
+
+    def set(self, key, output):
+        """Cache a copy of the output of ``key``."""
+        with self._lock:
+            self._entries[key] = copy.deepcopy(output)
+
+    def invalidate(self, command_base):
+        """Forget the cached output of the ``command_base`` commands and of
+        the commands with an option referencing ``command_base``.
+        """
+        option = u'--{0}'.format(command_base)
+        with self._lock:
+            for key in list(self._entries):
+                if key[0] == command_base or any(
+                        key_option.startswith(option)
+                        for key_option in key[2]):
+                    del self._entries[key]
+
+    def clear(self):
+        """Forget the cached outputs and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+#: The cache of the hammer ``info`` and ``list`` commands outputs
+read_cache = CLIReadCache()
+
+
+@contextmanager
+def cli_read_cache():
+    """Context manager caching the hammer ``info`` and ``list`` commands
+    outputs in its block, see :class:`CLIReadCache`::
+
+        with cli_read_cache() as cache:
+            Org.info({'id': org_id})
+            Org.info({'id': org_id})  # not run
+        print(cache.hits, cache.misses)
+
+    The cache is cleared when the block is entered and left, the counters
+    when it is entered.
+    """
+    read_cache.clear()
+    read_cache.enabled = True
+    try:
+        yield read_cache
+    finally:
+        read_cache.enabled = False
+        with read_cache._lock:
+            read_cache._entries.clear()
+
+
 class Base(object):
     """
     @param command_base: base command of hammer.
@@ -216,12 +342,18 @@ class Base(object):
 
     @classmethod
     def delete(cls, options=None):
-        """Deletes existing record."""
+        """Deletes existing record.
+
+        The default entities cached by the CLI factories for this command are
+        forgotten, see :mod:`robottelo.cli.default_entities`.
+        """
         cls.command_sub = 'delete'
-        return cls.execute(
+        result = cls.execute(
             cls._construct_command(options),
             ignore_stderr=True,
         )
+        default_entities.invalidate(cls)
+        return result
 
     @classmethod
     def delete_parameter(cls, options=None):
@@ -277,8 +409,26 @@ class Base(object):
     def execute(cls, command, user=None, password=None, output_format=None,
                 timeout=None, ignore_stderr=None, return_raw_response=None,
                 connection_timeout=None):
-        """Executes the cli ``command`` on the server via ssh"""
+        """Executes the cli ``command`` on the server via ssh
+
+        The output of ``info`` and ``list`` commands is cached when
+        :data:`read_cache` is enabled, see :func:`cli_read_cache`.
+        """
         user, password = cls._get_username_password(user, password)
+        cache_key = None
+        invalidate = False
+        if read_cache.enabled and not return_raw_response:
+            if read_cache.is_read(cls.command_sub):
+                cache_key = read_cache.get_key(
+                    cls.command_base, cls.command_sub, command, user,
+                    output_format
+                )
+                cached, output = read_cache.get(cache_key)
+                if cached:
+                    return output
+            else:
+                invalidate = True
+                read_cache.invalidate(cls.command_base)
         time_hammer = False
         if settings.performance:
             time_hammer = settings.performance.time_hammer
@@ -299,13 +449,18 @@ class Base(object):
             timeout=timeout,
             connection_timeout=connection_timeout,
         )
+        if invalidate:
+            # outputs cached by other threads while the command ran
+            read_cache.invalidate(cls.command_base)
         if return_raw_response:
             return response
-        else:
-            return cls._handle_response(
-                response,
-                ignore_stderr=ignore_stderr,
-            )
+        output = cls._handle_response(
+            response,
+            ignore_stderr=ignore_stderr,
+        )
+        if cache_key is not None:
+            read_cache.set(cache_key, output)
+        return output
 
     @classmethod
     def exists(cls, options=None, search=None):
@@ -466,12 +621,29 @@ class Base(object):
 
     @classmethod
     def _construct_command(cls, options=None):
-        """Build a hammer cli command based on the options passed"""
+        """Build a hammer cli command based on the options passed
+
+        When the ``validate_hammer_options`` setting is set, the option names
+        are checked against the hammer command tree of the server, see
+        :mod:`robottelo.cli.command_tree`.
+
+        :raises robottelo.cli.base.CLIError: If the hammer command doesn't
+            accept an option.
+        """
         tail = u''
 
         if options is None:
             options = {}
 
+        if settings.validate_hammer_options:
+            validation_errors = command_tree.validate_options(
+                u'{0} {1}'.format(cls.command_base, cls.command_sub),
+                [key for key, val in options.items()
+                 if val is not None and val is not False],
+            )
+            if validation_errors:
+                raise CLIError(u'\n'.join(validation_errors))
+
         for key, val in options.items():
             if val is None:
                 continue
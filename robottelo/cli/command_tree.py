@@ -0,0 +1,254 @@
+# -*- encoding: utf-8 -*-
+"""Tree of the hammer commands and their options, generated from the server
+
+The tree is built from the help of every hammer command and subcommand, each
+level of the tree with a single SSH command running the help of its commands
+in parallel. It is cached in :data:`COMMAND_TREE_DATA_DIR` per Satellite and
+hammer plugins versions, so it is only generated again when the server is
+upgraded::
+
+    tree = get_command_tree()
+    tree['subcommands']  # [{'name': 'activation-key', 'options': [...]}, ...]
+
+When the ``validate_hammer_options`` setting is set,
+:meth:`robottelo.cli.base.Base._construct_command` checks the option names
+with :func:`validate_options` so a typo or an option the installed hammer
+doesn't support fails immediately instead of after a hammer round-trip.
+"""
+import difflib
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import threading
+
+from pytest_services.locks import file_lock
+from robottelo import ssh
+from robottelo.cli import hammer
+from robottelo.config.base import USER_CACHE_DIR
+from six.moves import shlex_quote
+
+LOGGER = logging.getLogger(__name__)
+
+#: Directory storing the generated command trees and their lock files
+COMMAND_TREE_DATA_DIR = os.path.join(USER_CACHE_DIR, 'hammer')
+
+#: Number of hammer help commands run at the same time on the server
+HELP_CONCURRENCY = 8
+
+#: Number of seconds to wait for another process generating a command tree
+GENERATE_LOCK_TIMEOUT = 1800
+
+# an option line of a hammer help, with its short name and other names, e.g.
+# ' -p, --password PASSWORD' or ' --name, --deprecated-name VALUE'
+_OPTION_NAMES_REGEX = re.compile(r'^ (?:-\w, )?--([\w-]+)((?:, --[\w-]+)*)')
+_HELP_SEPARATOR = u'#### robottelo hammer help {0}'
+
+# maps hostnames to their command tree and option names index
+_trees = {}
+_lock = threading.Lock()
+
+
+def _parse_command_help(output):
+    """Parse the help of a hammer command, see
+    :func:`robottelo.cli.hammer.parse_help`.
+
+    The options alternative names are listed in ``option_names`` with the
+    options names.
+    """
+    contents = hammer.parse_help(output)
+    option_names = set(option['name'] for option in contents['options'])
+    for line in output:
+        match = _OPTION_NAMES_REGEX.match(line)
+        if match is not None and match.group(2):
+            option_names.update(re.findall(r'--([\w-]+)', match.group(2)))
+    contents['option_names'] = sorted(option_names)
+    return contents
+
+
+def _fetch_help(commands, hostname=None):
+    """Return the parsed help of several hammer commands, fetched with a
+    single SSH command running :data:`HELP_CONCURRENCY` hammer at a time.
+
+    :param commands: The commands, e.g. ``['hammer', 'hammer host']``.
+    :param str hostname: The server, ``server.hostname`` if ``None``.
+    :return: A dict mapping the commands to their parsed help.
+    """
+    script = []
+    for index, command in enumerate(commands):
+        script.append(
+            u'({command} --help > "$d/{index}" 2>/dev/null) &'.format(
+                command=u' '.join(
+                    shlex_quote(part) for part in command.split()),
+                index=index,
+            )
+        )
+        if (index + 1) % HELP_CONCURRENCY == 0:
+            script.append(u'wait;')
+    script.append(u'wait;')
+    for index in range(len(commands)):
+        script.append(u'echo {0}; cat "$d/{1}";'.format(
+            shlex_quote(_HELP_SEPARATOR.format(index)), index))
+    result = ssh.command(
+        u'd=$(mktemp -d) && {{ {0} }}; rm -rf "$d"'.format(u' '.join(script)),
+        hostname=hostname,
+        output_format='plain',
+    )
+    if result.return_code != 0:
+        raise IOError(u'Could not fetch the hammer help: {0}'.format(
+            result.stderr))
+    helps = {}
+    index = None
+    for line in (result.stdout or u'').splitlines():
+        if line.startswith(_HELP_SEPARATOR.format(u'')):
+            index = int(line.rpartition(u' ')[2])
+            helps[commands[index]] = []
+        elif index is not None:
+            helps[commands[index]].append(line)
+    return {
+        command: _parse_command_help(output)
+        for command, output in helps.items()
+    }
+
+
+def generate_command_tree(hostname=None):
+    """Generate the tree of the hammer commands from their help, a level of
+    the tree at a time.
+
+    :param str hostname: The server, ``server.hostname`` if ``None``.
+    :return: The help of ``hammer``, see
+        :func:`robottelo.cli.hammer.parse_help`. Each subcommand is updated
+        with its own help.
+    """
+    tree = _fetch_help(['hammer'], hostname)['hammer']
+    level = [(u'hammer', tree)]
+    while level:
+        children = [
+            (u'{0} {1}'.format(command, subcommand['name']), subcommand)
+            for command, node in level
+            for subcommand in node['subcommands']
+        ]
+        if not children:
+            break
+        helps = _fetch_help([command for command, _ in children], hostname)
+        for command, subcommand in children:
+            subcommand.update(helps.get(command, {
+                'options': [], 'option_names': [], 'subcommands': []}))
+        level = children
+    return tree
+
+
+def _get_version_key(hostname=None):
+    """Return a key of the Satellite and hammer versions of the server."""
+    # imported here as robottelo.server_facts imports robottelo.cli.base
+    from robottelo.server_facts import get_server_facts
+    facts = get_server_facts(hostname)
+    hammer_plugins = sorted(
+        (name, version)
+        for name, version in facts['plugins'].items()
+        if 'hammer' in name
+    )
+    digest = hashlib.sha1(
+        json.dumps(hammer_plugins).encode('utf-8')).hexdigest()[:12]
+    return u'{0}-{1}'.format(facts['satellite'] or u'upstream', digest)
+
+
+def _index_options(tree):
+    """Return a dict mapping the commands, as tuples of their names without
+    ``hammer``, to the frozenset of their option names.
+    """
+    index = {}
+    nodes = [((), tree)]
+    while nodes:
+        path, node = nodes.pop()
+        index[path] = frozenset(node.get('option_names') or [
+            option['name'] for option in node['options']])
+        for subcommand in node['subcommands']:
+            nodes.append((path + (subcommand['name'],), subcommand))
+    return index
+
+
+def get_command_tree(hostname=None, generate=True):
+    """Return the tree of the hammer commands of a server.
+
+    The tree is read from the cache of the server Satellite and hammer
+    versions, generated and cached if there is none.
+
+    :param str hostname: The server, ``server.hostname`` if ``None``.
+    :param bool generate: Whether to generate the tree if it isn't cached.
+    :return: The tree, see :func:`generate_command_tree`, ``None`` if it
+        isn't cached and ``generate`` is ``False``.
+    """
+    return _get_tree_and_index(hostname, generate)[0]
+
+
+def _get_tree_and_index(hostname=None, generate=True):
+    """Return the command tree of a server and its options index."""
+    with _lock:
+        if hostname not in _trees:
+            path = os.path.join(
+                COMMAND_TREE_DATA_DIR,
+                u'hammer_commands-{0}.json'.format(_get_version_key(hostname))
+            )
+            if not os.path.isdir(COMMAND_TREE_DATA_DIR):
+                try:
+                    os.makedirs(COMMAND_TREE_DATA_DIR)
+                except OSError:
+                    # created by another process
+                    if not os.path.isdir(COMMAND_TREE_DATA_DIR):
+                        raise
+            # one process generates the tree, the other ones wait for it
+            with file_lock(u'{0}.lock'.format(path), remove=False,
+                           timeout=GENERATE_LOCK_TIMEOUT):
+                tree = None
+                if os.path.exists(path):
+                    with io.open(path, encoding='utf-8') as handler:
+                        tree = json.load(handler)
+                elif generate:
+                    LOGGER.info(u'Generating the hammer command tree %s', path)
+                    tree = generate_command_tree(hostname)
+                    with io.open(path, 'w', encoding='utf-8') as handler:
+                        handler.write(json.dumps(
+                            tree, indent=2, sort_keys=True,
+                            ensure_ascii=False))
+            if tree is None:
+                return None, None
+            _trees[hostname] = (tree, _index_options(tree))
+        return _trees[hostname]
+
+
+def validate_options(command, options, hostname=None):
+    """Check that a hammer command accepts the options.
+
+    Commands missing from the tree are not checked.
+
+    :param str command: The command without ``hammer``, e.g.
+        ``content-view version promote``.
+    :param options: The option names.
+    :param str hostname: The server, ``server.hostname`` if ``None``.
+    :return: The list of validation errors, one per option not accepted,
+        with the close option names.
+    """
+    index = _get_tree_and_index(hostname)[1]
+    accepted = index.get(tuple(command.split()))
+    validation_errors = []
+    if accepted is None:
+        return validation_errors
+    for option in options:
+        if option in accepted:
+            continue
+        error = u'hammer {0} does not accept --{1}'.format(command, option)
+        matches = difflib.get_close_matches(option, accepted)
+        if matches:
+            error += u', did you mean {0}?'.format(
+                u', '.join(u'--{0}'.format(match) for match in matches))
+        validation_errors.append(error)
+    return validation_errors
+
+
+def clear_command_trees():
+    """Forget the command trees loaded by this process."""
+    with _lock:
+        _trees.clear()
@@ -0,0 +1,110 @@
+# -*- encoding: utf-8 -*-
+"""Session cache of the entities the CLI factories use by default
+
+Factories like :func:`robottelo.cli.factory.make_fake_host` look up the same
+default organization, location, architecture, operating system and partition
+table on every call, each lookup being a hammer process. :func:`resolve`
+runs the lookup once per session and returns the cached entity id next
+times::
+
+    org_id = resolve(
+        Org, DEFAULT_ORG, lambda: Org.info({'name': DEFAULT_ORG})['id'])
+
+When the shared function is enabled, see
+:func:`robottelo.decorators.func_shared.shared.shared`, the ids are kept in
+the shared function storage so all the processes and pytest-xdist workers of
+a session use the lookups of the first one. Otherwise they are kept in
+memory.
+
+Deleting an entity through :meth:`robottelo.cli.base.Base.delete` forgets
+the cached entities of its hammer command. Entities deleted through the API
+or the UI are not tracked.
+"""
+import logging
+import threading
+
+LOGGER = logging.getLogger(__name__)
+
+# maps hammer commands to dicts mapping entity names to ids
+_entities = {}
+_lock = threading.Lock()
+
+
+def _get_storage_key(command):
+    """Return the shared storage key of the entities of a hammer command."""
+    # imported here as robottelo.decorators imports robottelo.cli.base
+    from robottelo.decorators.func_shared.shared import get_shared_key
+    return get_shared_key('default_entities.{0}'.format(command))
+
+
+def _get_storage():
+    """Return the shared storage, ``None`` when the shared data is
+    disabled.
+    """
+    from robottelo.decorators.func_shared.shared import get_shared_storage
+    return get_shared_storage()
+
+
+def resolve(cli_object, name, lookup):
+    """Return the id of an entity, calling ``lookup`` only the first time in
+    a session.
+
+    :param cli_object: The CLI class of the entity, its hammer command
+        groups the cached entities.
+    :param str name: The name of the entity in the cache. It must identify
+        what ``lookup`` returns, include the options ``lookup`` depends on.
+    :param lookup: A callable returning the entity id. Errors it raises are
+        propagated and nothing is cached. The entities it creates are not
+        journaled for cleanup, see
+        :func:`robottelo.cleanup_journal.not_journaled`.
+    :return: The entity id.
+    """
+    # imported here as robottelo.cleanup_journal imports robottelo.cli.base
+    from robottelo.cleanup_journal import not_journaled
+    command = cli_object.command_base
+    storage = _get_storage()
+    if storage is None:
+        with _lock:
+            entities = _entities.setdefault(command, {})
+            if name not in entities:
+                with not_journaled():
+                    entities[name] = lookup()
+                LOGGER.debug(
+                    u'Resolved default %s %s: %s',
+                    command, name, entities[name]
+                )
+            return entities[name]
+    key = _get_storage_key(command)
+    with storage.lock(key) as handler:
+        storage.when_lock_acquired(handler)
+        entities = storage.get(key) or {}
+        if name not in entities:
+            with not_journaled():
+                entities[name] = lookup()
+            LOGGER.debug(
+                u'Resolved default %s %s: %s', command, name, entities[name])
+            storage.set(key, entities)
+        return entities[name]
+
+
+def invalidate(cli_object):
+    """Forget the cached entities of the hammer command of ``cli_object``.
+
+    :param cli_object: The CLI class of the entities.
+    """
+    command = cli_object.command_base
+    with _lock:
+        _entities.pop(command, None)
+    storage = _get_storage()
+    if storage is not None:
+        key = _get_storage_key(command)
+        with storage.lock(key) as handler:
+            storage.when_lock_acquired(handler)
+            if storage.get(key):
+                storage.set(key, {})
+
+
+def clear():
+    """Forget the entities cached in memory by this process."""
+    with _lock:
+        _entities.clear()
@@ -10,6 +10,7 @@ import os
 import random
 import time
 
+from concurrent.futures import FIRST_COMPLETED, wait as futures_wait
 from fauxfactory import (
     gen_alphanumeric,
     gen_integer,
@@ -19,7 +20,8 @@ from fauxfactory import (
     gen_string,
 )
 from os import chmod
-from robottelo import manifests, ssh
+from robottelo import cleanup_journal, manifests, ssh
+from robottelo.cli import default_entities
 from robottelo.cli.activationkey import ActivationKey
 from robottelo.cli.architecture import Architecture
 from robottelo.cli.base import CLIReturnCodeError
@@ -92,7 +94,9 @@ from robottelo.decorators import bz_bug_is_open, cacheable
 from robottelo.helpers import (
     update_dictionary, default_url_on_new_port, get_available_capsule_port
 )
+from robottelo.recipe import Recipe
 from robottelo.ssh import download_file, upload_file
+from robottelo.tasks import cli_tracker
 from tempfile import mkstemp
 from time import sleep
 
@@ -146,6 +150,7 @@ def create_object(cli_object, options, values):
     if type(result) is list and len(result) > 0:
         result = result[0]
 
+    cleanup_journal.record_created(cli_object, result, options)
     return result
 
 
@@ -1547,10 +1552,40 @@ def make_host(options=None):
     return create_object(Host, args, options)
 
 
+def _options_name(options, keys):
+    """Return a name identifying the values of ``keys`` in ``options``, to
+    cache what depends on them with :func:`default_entities.resolve`.
+    """
+    return u','.join(
+        u'{0}={1}'.format(key, options[key])
+        for key in keys
+        if options.get(key)
+    )
+
+
+def _info_or_make(cli_object, name, make):
+    """Return the id of the entity named ``name``, created with ``make`` if
+    it doesn't exist, to cache it with :func:`default_entities.resolve`.
+    """
+    try:
+        return cli_object.info({'name': name})['id']
+    except CLIReturnCodeError:
+        return make()['id']
+
+
 @cacheable
-def make_fake_host(options=None):
+def make_fake_host(options=None, reuse_entities=False):
     """Wrapper function for make_host to pass all required options for creation
     of a fake host
+
+    The default Satellite entities are looked up, or created if they don't
+    exist, once per session, see :mod:`robottelo.cli.default_entities`.
+
+    :param options: The options of the host, the missing required ones are
+        filled in.
+    :param bool reuse_entities: Whether to reuse the domain and the medium
+        created for a previous fake host of the same organization and
+        location, instead of creating new ones.
     """
     if options is None:
         options = {}
@@ -1558,38 +1593,55 @@ def make_fake_host(options=None):
     # Try to use default Satellite entities, otherwise create them if they were
     # not passed or defined previously
     if not options.get('organization') and not options.get('organization-id'):
-        try:
-            options['organization-id'] = Org.info({'name': DEFAULT_ORG})['id']
-        except CLIReturnCodeError:
-            options['organization-id'] = make_org()['id']
+        options['organization-id'] = default_entities.resolve(
+            Org,
+            DEFAULT_ORG,
+            lambda: _info_or_make(Org, DEFAULT_ORG, make_org),
+        )
     if not options.get('location') and not options.get('location-id'):
-        try:
-            options['location-id'] = Location.info({'name': DEFAULT_LOC})['id']
-        except CLIReturnCodeError:
-            options['location-id'] = make_location()['id']
+        options['location-id'] = default_entities.resolve(
+            Location,
+            DEFAULT_LOC,
+            lambda: _info_or_make(Location, DEFAULT_LOC, make_location),
+        )
+    taxonomy_keys = (
+        'location', 'location-id', 'organization', 'organization-id')
     if not options.get('domain') and not options.get('domain-id'):
-        options['domain-id'] = make_domain({
-            'location-ids': options.get('location-id'),
-            'locations': options.get('location'),
-            'organization-ids': options.get('organization-id'),
-            'organizations': options.get('organization'),
-        })['id']
+        def create_domain():
+            """Create a domain in the host taxonomies."""
+            return make_domain({
+                'location-ids': options.get('location-id'),
+                'locations': options.get('location'),
+                'organization-ids': options.get('organization-id'),
+                'organizations': options.get('organization'),
+            })['id']
+        if reuse_entities:
+            options['domain-id'] = default_entities.resolve(
+                Domain,
+                _options_name(options, taxonomy_keys),
+                create_domain,
+            )
+        else:
+            options['domain-id'] = create_domain()
     if not options.get('architecture') and not options.get('architecture-id'):
-        try:
-            options['architecture-id'] = Architecture.info({
-                'name': DEFAULT_ARCHITECTURE})['id']
-        except CLIReturnCodeError:
-            options['architecture-id'] = make_architecture()['id']
+        options['architecture-id'] = default_entities.resolve(
+            Architecture,
+            DEFAULT_ARCHITECTURE,
+            lambda: _info_or_make(
+                Architecture, DEFAULT_ARCHITECTURE, make_architecture),
+        )
     if (not options.get('operatingsystem') and
             not options.get('operatingsystem-id')):
+        search = 'name="RedHat" AND major="{0}" OR major="{1}"'.format(
+            RHEL_6_MAJOR_VERSION,
+            RHEL_7_MAJOR_VERSION
+        )
         try:
-            options['operatingsystem-id'] = OperatingSys.list({
-                    'search': 'name="RedHat" AND major="{0}" OR major="{1}"'
-                              .format(
-                                   RHEL_6_MAJOR_VERSION,
-                                   RHEL_7_MAJOR_VERSION
-                              )
-            })[0]['id']
+            options['operatingsystem-id'] = default_entities.resolve(
+                OperatingSys,
+                search,
+                lambda: OperatingSys.list({'search': search})[0]['id'],
+            )
         except IndexError:
             options['operatingsystem-id'] = make_os({
                 'architecture-ids': options.get('architecture-id'),
@@ -1600,10 +1652,15 @@ def make_fake_host(options=None):
     if (not options.get('partition-table') and
             not options.get('partition-table-id')):
         try:
-            options['partition-table-id'] = PartitionTable.list({
-                'operatingsystem': options.get('operatingsystem'),
-                'operatingsystem-id': options.get('operatingsystem-id'),
-            })[0]['id']
+            options['partition-table-id'] = default_entities.resolve(
+                PartitionTable,
+                _options_name(
+                    options, ('operatingsystem', 'operatingsystem-id')),
+                lambda: PartitionTable.list({
+                    'operatingsystem': options.get('operatingsystem'),
+                    'operatingsystem-id': options.get('operatingsystem-id'),
+                })[0]['id'],
+            )
         except IndexError:
             options['partition-table-id'] = make_partition_table({
                 'location-ids': options.get('location-id'),
@@ -1615,14 +1672,29 @@ def make_fake_host(options=None):
 
     # Finally, create a new medium (if none was passed)
     if not options.get('medium') and not options.get('medium-id'):
-        options['medium-id'] = make_medium({
-            'location-ids': options.get('location-id'),
-            'locations': options.get('location'),
-            'operatingsystems': options.get('operatingsystem'),
-            'operatingsystem-ids': options.get('operatingsystem-id'),
-            'organization-ids': options.get('organization-id'),
-            'organizations': options.get('organization'),
-        })['id']
+        def create_medium():
+            """Create a medium in the host taxonomies and operating
+            system.
+            """
+            return make_medium({
+                'location-ids': options.get('location-id'),
+                'locations': options.get('location'),
+                'operatingsystems': options.get('operatingsystem'),
+                'operatingsystem-ids': options.get('operatingsystem-id'),
+                'organization-ids': options.get('organization-id'),
+                'organizations': options.get('organization'),
+            })['id']
+        if reuse_entities:
+            options['medium-id'] = default_entities.resolve(
+                Medium,
+                _options_name(
+                    options,
+                    taxonomy_keys + ('operatingsystem', 'operatingsystem-id')
+                ),
+                create_medium,
+            )
+        else:
+            options['medium-id'] = create_medium()
 
     return make_host(options)
 
@@ -2984,79 +3056,185 @@ def setup_org_for_a_custom_repo(options=None):
             not options or
             not options.get('url')):
         raise CLIFactoryError('Please provide valid custom repo URL.')
-    # Create new organization and lifecycle environment if needed
-    if options.get('organization-id') is None:
-        org_id = make_org()['id']
-    else:
-        org_id = options['organization-id']
-    if options.get('lifecycle-environment-id') is None:
-        env_id = make_lifecycle_environment({u'organization-id': org_id})['id']
-    else:
-        env_id = options['lifecycle-environment-id']
+    recipe = Recipe('setup_org_for_a_custom_repo')
+    recipe.add('org', lambda: make_org()['id'], uses=(Org,))
+    recipe.add(
+        'lce',
+        _make_lifecycle_environment_id,
+        requires=('org',),
+        uses=(LifecycleEnvironment,)
+    )
     # Create custom product and repository
-    custom_product = make_product({u'organization-id': org_id})
-    custom_repo = make_repository({
-        u'content-type': 'yum',
-        u'product-id': custom_product['id'],
-        u'url': options.get('url'),
-    })
-    # Synchronize custom repository
+    recipe.add(
+        'product',
+        lambda org_id: make_product({u'organization-id': org_id}),
+        requires=('org',),
+        uses=(Product,)
+    )
+    recipe.add(
+        'repo',
+        lambda product: make_repository({
+            u'content-type': 'yum',
+            u'product-id': product['id'],
+            u'url': options.get('url'),
+        }),
+        requires=('product',),
+        uses=(Repository,)
+    )
+    recipe.add(
+        'sync',
+        lambda repo: _synchronize_repository({'id': repo['id']}),
+        requires=('repo',),
+        uses=(Repository,)
+    )
+    _add_content_view_steps(recipe, options)
+    # Add subscription to activation-key
+    recipe.add(
+        'subscription',
+        lambda org_id, ak_id, product: activationkey_add_subscription_to_repo({
+            u'activationkey-id': ak_id,
+            u'organization-id': org_id,
+            u'subscription': product['name'],
+        }),
+        requires=('org', 'ak', 'product'),
+        uses=(ActivationKey, Subscription)
+    )
+    results = _run_setup_recipe(recipe, options)
+    return {
+        u'activationkey-id': results['ak'],
+        u'content-view-id': results['cv'],
+        u'lifecycle-environment-id': results['lce'],
+        u'organization-id': results['org'],
+        u'product-id': results['product']['id'],
+        u'repository-id': results['repo']['id'],
+    }
+
+
+def _make_lifecycle_environment_id(org_id):
+    """Create a lifecycle environment and return its id."""
+    return make_lifecycle_environment({u'organization-id': org_id})['id']
+
+
+def _synchronize_repository(options):
+    """Synchronize a repository raising ``CLIFactoryError`` on failure."""
     try:
-        Repository.synchronize({'id': custom_repo['id']})
+        Repository.synchronize(options)
     except CLIReturnCodeError as err:
         raise CLIFactoryError(
             u'Failed to synchronize repository\n{0}'.format(err.msg))
+
+
+def _run_setup_recipe(recipe, options):
+    """Run a setup recipe using the organization, lifecycle environment and
+    content view ids given in ``options``, if any.
+    """
+    return recipe.run(provided={
+        'org': options.get('organization-id'),
+        'lce': options.get('lifecycle-environment-id'),
+        'cv': options.get('content-view-id'),
+    })
+
+
+def _add_content_view_steps(recipe, options):
+    """Add the steps common to the setup recipes.
+
+    Needs the ``org``, ``lce``, ``repo`` and ``sync`` steps and adds:
+
+    * ``cv``: creates a content view, returns its id
+    * ``cv_repo``: adds the repository to the content view
+    * ``publish``: publishes the content view once the repository is
+      synchronized, returns the new version
+    * ``promote``: promotes the version to the lifecycle environment
+    * ``ak``: creates an activation key for the content view or associates
+      the content view with the ``activationkey-id`` option one, returns the
+      activation key id
+    """
     # Create CV if needed and associate repo with it
-    if options.get('content-view-id') is None:
-        cv_id = make_content_view({u'organization-id': org_id})['id']
-    else:
-        cv_id = options['content-view-id']
-    try:
-        ContentView.add_repository({
-            u'id': cv_id,
-            u'organization-id': org_id,
-            u'repository-id': custom_repo['id'],
-        })
-    except CLIReturnCodeError as err:
-        raise CLIFactoryError(
-            u'Failed to add repository to content view\n{0}'.format(err.msg))
-    # Publish a new version of CV
-    try:
-        ContentView.publish({u'id': cv_id})
-    except CLIReturnCodeError as err:
-        raise CLIFactoryError(
-            u'Failed to publish new version of content view\n{0}'
-            .format(err.msg)
-        )
-    # Get the version id
-    cvv = ContentView.info({u'id': cv_id})['versions'][-1]
-    # Promote version to next env
-    try:
-        ContentView.version_promote({
-            u'id': cvv['id'],
-            u'organization-id': org_id,
-            u'to-lifecycle-environment-id': env_id,
-        })
-    except CLIReturnCodeError as err:
-        raise CLIFactoryError(
-            u'Failed to promote version to next environment\n{0}'
-            .format(err.msg)
-        )
-    # Create activation key if needed and associate content view with it
-    if options.get('activationkey-id') is None:
-        activationkey_id = make_activation_key({
-            u'content-view-id': cv_id,
-            u'lifecycle-environment-id': env_id,
-            u'organization-id': org_id,
-        })['id']
-    else:
-        activationkey_id = options['activationkey-id']
+    recipe.add(
+        'cv',
+        lambda org_id: make_content_view({u'organization-id': org_id})['id'],
+        requires=('org',),
+        uses=(ContentView,)
+    )
+
+    def add_repository(org_id, cv_id, repo):
+        try:
+            ContentView.add_repository({
+                u'id': cv_id,
+                u'organization-id': org_id,
+                u'repository-id': repo['id'],
+            })
+        except CLIReturnCodeError as err:
+            raise CLIFactoryError(
+                u'Failed to add repository to content view\n{0}'
+                .format(err.msg)
+            )
+
+    recipe.add(
+        'cv_repo',
+        add_repository,
+        requires=('org', 'cv', 'repo'),
+        uses=(ContentView,)
+    )
+
+    def publish(cv_id, cv_repo, sync):
+        # Publish a new version of CV
+        try:
+            ContentView.publish({u'id': cv_id})
+        except CLIReturnCodeError as err:
+            raise CLIFactoryError(
+                u'Failed to publish new version of content view\n{0}'
+                .format(err.msg)
+            )
+        # Get the version id
+        try:
+            return ContentView.info({u'id': cv_id})['versions'][-1]
+        except CLIReturnCodeError as err:
+            raise CLIFactoryError(
+                u'Failed to fetch content view info\n{0}'.format(err.msg))
+
+    recipe.add(
+        'publish',
+        publish,
+        requires=('cv', 'cv_repo', 'sync'),
+        uses=(ContentView,)
+    )
+
+    def promote(org_id, lce_id, cvv):
+        # Promote version to next env
+        try:
+            ContentView.version_promote({
+                u'id': cvv['id'],
+                u'organization-id': org_id,
+                u'to-lifecycle-environment-id': lce_id,
+            })
+        except CLIReturnCodeError as err:
+            raise CLIFactoryError(
+                u'Failed to promote version to next environment\n{0}'
+                .format(err.msg)
+            )
+
+    recipe.add(
+        'promote',
+        promote,
+        requires=('org', 'lce', 'publish'),
+        uses=(ContentView,)
+    )
+
+    def activation_key(org_id, lce_id, cv_id, promoted):
+        # Create activation key if needed and associate content view with it
+        if options.get('activationkey-id') is None:
+            return make_activation_key({
+                u'content-view-id': cv_id,
+                u'lifecycle-environment-id': lce_id,
+                u'organization-id': org_id,
+            })['id']
         # Given activation key may have no (or different) CV associated.
         # Associate activation key with CV just to be sure
         try:
             ActivationKey.update({
                 u'content-view-id': cv_id,
-                u'id': activationkey_id,
+                u'id': options['activationkey-id'],
                 u'organization-id': org_id,
             })
         except CLIReturnCodeError as err:
@@ -3064,20 +3242,14 @@ def setup_org_for_a_custom_repo(options=None):
                 u'Failed to associate activation-key with CV\n{0}'
                 .format(err.msg)
             )
-    # Add subscription to activation-key
-    activationkey_add_subscription_to_repo({
-        u'activationkey-id': activationkey_id,
-        u'organization-id': org_id,
-        u'subscription': custom_product['name'],
-    })
-    return {
-        u'activationkey-id': activationkey_id,
-        u'content-view-id': cv_id,
-        u'lifecycle-environment-id': env_id,
-        u'organization-id': org_id,
-        u'product-id': custom_product['id'],
-        u'repository-id': custom_repo['id'],
-    }
+        return options['activationkey-id']
+
+    recipe.add(
+        'ak',
+        activation_key,
+        requires=('org', 'lce', 'cv', 'promote'),
+        uses=(ActivationKey,)
+    )
 
 
 def _setup_org_for_a_rh_repo(options=None):
@@ -3127,133 +3299,92 @@ def _setup_org_for_a_rh_repo(options=None):
             not options.get('repository')):
         raise CLIFactoryError(
             'Please provide valid product, repository-set and repo.')
-    # Create new organization and lifecycle environment if needed
-    if options.get('organization-id') is None:
-        org_id = make_org()['id']
-    else:
-        org_id = options['organization-id']
-    if options.get('lifecycle-environment-id') is None:
-        env_id = make_lifecycle_environment({u'organization-id': org_id})['id']
-    else:
-        env_id = options['lifecycle-environment-id']
-    # Clone manifest and upload it
-    with manifests.clone() as manifest:
-        upload_file(manifest.content, manifest.filename)
-    try:
-        Subscription.upload({
-            u'file': manifest.filename,
-            u'organization-id': org_id,
-        })
-    except CLIReturnCodeError as err:
-        raise CLIFactoryError(
-            u'Failed to upload manifest\n{0}'.format(err.msg))
-    # Enable repo from Repository Set
-    try:
-        RepositorySet.enable({
-            u'basearch': 'x86_64',
-            u'name': options['repository-set'],
-            u'organization-id': org_id,
-            u'product': options['product'],
-            u'releasever': options.get('releasever'),
-        })
-    except CLIReturnCodeError as err:
-        raise CLIFactoryError(
-            u'Failed to enable repository set\n{0}'.format(err.msg))
-    # Fetch repository info
-    try:
-        rhel_repo = Repository.info({
-            u'name': options['repository'],
-            u'organization-id': org_id,
-            u'product': options['product'],
-        })
-    except CLIReturnCodeError as err:
-        raise CLIFactoryError(
-            u'Failed to fetch repository info\n{0}'.format(err.msg))
-    # Synchronize the RH repository
-    try:
-        Repository.synchronize({
-            u'name': options['repository'],
-            u'organization-id': org_id,
-            u'product': options['product'],
-        })
-    except CLIReturnCodeError as err:
-        raise CLIFactoryError(
-            u'Failed to synchronize repository\n{0}'.format(err.msg))
-    # Create CV if needed and associate repo with it
-    if options.get('content-view-id') is None:
-        cv_id = make_content_view({u'organization-id': org_id})['id']
-    else:
-        cv_id = options['content-view-id']
-    try:
-        ContentView.add_repository({
-            u'id': cv_id,
-            u'organization-id': org_id,
-            u'repository-id': rhel_repo['id'],
-        })
-    except CLIReturnCodeError as err:
-        raise CLIFactoryError(
-            u'Failed to add repository to content view\n{0}'.format(err.msg))
-    # Publish a new version of CV
-    try:
-        ContentView.publish({u'id': cv_id})
-    except CLIReturnCodeError as err:
-        raise CLIFactoryError(
-            u'Failed to publish new version of content view\n{0}'
-            .format(err.msg)
-        )
-    # Get the version id
-    try:
-        cvv = ContentView.info({u'id': cv_id})['versions'][-1]
-    except CLIReturnCodeError as err:
-        raise CLIFactoryError(
-            u'Failed to fetch content view info\n{0}'.format(err.msg))
-    # Promote version1 to next env
-    try:
-        ContentView.version_promote({
-            u'id': cvv['id'],
-            u'organization-id': org_id,
-            u'to-lifecycle-environment-id': env_id,
-        })
-    except CLIReturnCodeError as err:
-        raise CLIFactoryError(
-            u'Failed to promote version to next environment\n{0}'
-            .format(err.msg)
-        )
-    # Create activation key if needed and associate content view with it
-    if options.get('activationkey-id') is None:
-        activationkey_id = make_activation_key({
-            u'content-view-id': cv_id,
-            u'lifecycle-environment-id': env_id,
-            u'organization-id': org_id,
-        })['id']
-    else:
-        activationkey_id = options['activationkey-id']
-        # Given activation key may have no (or different) CV associated.
-        # Associate activation key with CV just to be sure
+    recipe = Recipe('setup_org_for_a_rh_repo')
+    recipe.add('org', lambda: make_org()['id'], uses=(Org,))
+    recipe.add(
+        'lce',
+        _make_lifecycle_environment_id,
+        requires=('org',),
+        uses=(LifecycleEnvironment,)
+    )
+
+    def upload_manifest(org_id):
+        # Clone manifest and upload it
+        with manifests.clone() as manifest:
+            upload_file(manifest.content, manifest.filename)
         try:
-            ActivationKey.update({
-                u'id': activationkey_id,
+            Subscription.upload({
+                u'file': manifest.filename,
                 u'organization-id': org_id,
-                u'content-view-id': cv_id,
             })
         except CLIReturnCodeError as err:
             raise CLIFactoryError(
-                u'Failed to associate activation-key with CV\n{0}'
-                .format(err.msg)
-            )
+                u'Failed to upload manifest\n{0}'.format(err.msg))
+
+    recipe.add(
+        'manifest', upload_manifest, requires=('org',), uses=(Subscription,))
+
+    def enable_repository(org_id, manifest):
+        # Enable repo from Repository Set
+        try:
+            RepositorySet.enable({
+                u'basearch': 'x86_64',
+                u'name': options['repository-set'],
+                u'organization-id': org_id,
+                u'product': options['product'],
+                u'releasever': options.get('releasever'),
+            })
+        except CLIReturnCodeError as err:
+            raise CLIFactoryError(
+                u'Failed to enable repository set\n{0}'.format(err.msg))
+        # Fetch repository info
+        try:
+            return Repository.info({
+                u'name': options['repository'],
+                u'organization-id': org_id,
+                u'product': options['product'],
+            })
+        except CLIReturnCodeError as err:
+            raise CLIFactoryError(
+                u'Failed to fetch repository info\n{0}'.format(err.msg))
+
+    recipe.add(
+        'repo',
+        enable_repository,
+        requires=('org', 'manifest'),
+        uses=(RepositorySet, Repository)
+    )
+    # Synchronize the RH repository
+    recipe.add(
+        'sync',
+        lambda org_id, repo: _synchronize_repository({
+            u'name': options['repository'],
+            u'organization-id': org_id,
+            u'product': options['product'],
+        }),
+        requires=('org', 'repo'),
+        uses=(Repository,)
+    )
+    _add_content_view_steps(recipe, options)
     # Add subscription to activation-key
-    activationkey_add_subscription_to_repo({
-        u'organization-id': org_id,
-        u'activationkey-id': activationkey_id,
-        u'subscription': options.get(
-            u'subscription', DEFAULT_SUBSCRIPTION_NAME),
-    })
+    recipe.add(
+        'subscription',
+        lambda org_id, ak_id: activationkey_add_subscription_to_repo({
+            u'organization-id': org_id,
+            u'activationkey-id': ak_id,
+            u'subscription': options.get(
+                u'subscription', DEFAULT_SUBSCRIPTION_NAME),
+        }),
+        requires=('org', 'ak'),
+        uses=(ActivationKey, Subscription)
+    )
+    results = _run_setup_recipe(recipe, options)
     return {
-        u'activationkey-id': activationkey_id,
-        u'content-view-id': cv_id,
-        u'lifecycle-environment-id': env_id,
-        u'organization-id': org_id,
-        u'repository-id': rhel_repo['id'],
+        u'activationkey-id': results['ak'],
+        u'content-view-id': results['cv'],
+        u'lifecycle-environment-id': results['lce'],
+        u'organization-id': results['org'],
+        u'repository-id': results['repo']['id'],
     }
 
 
@@ -3880,6 +4011,59 @@ def add_role_permissions(role_id, resource_permissions):
         make_filter(options=options)
 
 
+def synchronize_repositories(repos_ids, timeout=3600, max_concurrent=None):
+    """Synchronize repositories concurrently.
+
+    Every synchronization is submitted with ``--async`` and the resulting
+    foreman tasks are waited on by :data:`robottelo.tasks.cli_tracker`, which
+    polls all of them with a single ``hammer task list`` call. At most
+    ``max_concurrent`` tasks are running at the same time, the next
+    repository is submitted as soon as a running task finishes.
+
+    :param list repos_ids: The ids of the repositories to synchronize.
+    :param int timeout: Maximum number of seconds to wait for each repository
+        synchronization, counted from its submission.
+    :param int max_concurrent: Maximum number of synchronizations running at
+        the same time. Defaults to ``settings.repos_sync_concurrency``.
+    :raises robottelo.cli.factory.CLIFactoryError: After every repository
+        synchronization finished, if any of them could not be submitted,
+        failed or timed out. The message lists each failed repository.
+    """
+    if max_concurrent is None:
+        max_concurrent = settings.repos_sync_concurrency
+    max_concurrent = max(1, max_concurrent)
+    pending = list(repos_ids)
+    # maps task futures to repository ids
+    running = {}
+    failures = []
+    while pending or running:
+        while pending and len(running) < max_concurrent:
+            repo_id = pending.pop(0)
+            try:
+                result = Repository.synchronize(
+                    {u'id': repo_id, u'async': True})
+                task_id = result[0]['id']
+            except (CLIReturnCodeError, IndexError, KeyError) as err:
+                failures.append((repo_id, u'submission failed: {0}'.format(
+                    getattr(err, 'msg', err))))
+                continue
+            running[cli_tracker.track(task_id, timeout)] = repo_id
+        if not running:
+            break
+        done, _ = futures_wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            repo_id = running.pop(future)
+            if future.exception() is not None:
+                failures.append((repo_id, u'{0}'.format(future.exception())))
+    if failures:
+        raise CLIFactoryError(
+            u'Failed to synchronize repositories:\n{0}'.format(u'\n'.join(
+                u'  repository {0}: {1}'.format(repo_id, reason)
+                for repo_id, reason in failures
+            ))
+        )
+
+
 def setup_cdn_and_custom_repositories(
         org_id, repos, download_policy='on_demand'):
     """Setup cdn and custom repositories
@@ -3928,8 +4112,8 @@ def setup_cdn_and_custom_repositories(
             })
         repos_info.append(repo_info)
     # Synchronize the repositories
-    for repo_info in repos_info:
-        Repository.synchronize({'id': repo_info['id']}, timeout=4800)
+    synchronize_repositories(
+        [repo_info['id'] for repo_info in repos_info], timeout=4800)
     return custom_product, repos_info
 
 
@@ -3951,77 +4135,124 @@ def setup_cdn_and_custom_repos_content(
     if rh_subscriptions is None:
         rh_subscriptions = []
 
-    if upload_manifest:
+    recipe = Recipe('setup_cdn_and_custom_repos_content')
+
+    def upload_organization_manifest():
         # Upload the organization manifest
+        if not upload_manifest:
+            return False
         try:
             manifests.upload_manifest_locked(org_id, manifests.clone(),
                                              interface=manifests.INTERFACE_CLI)
         except CLIReturnCodeError as err:
             raise CLIFactoryError(
                 u'Failed to upload manifest\n{0}'.format(err.msg))
-
-    custom_product, repos_info = setup_cdn_and_custom_repositories(
-        org_id=org_id,
-        repos=repos,
-        download_policy=download_policy
+        return True
+
+    recipe.add(
+        'manifest', upload_organization_manifest, uses=(Subscription,))
+    recipe.add(
+        'repos',
+        lambda manifest: setup_cdn_and_custom_repositories(
+            org_id=org_id,
+            repos=repos,
+            download_policy=download_policy
+        ),
+        requires=('manifest',),
+        uses=(Product, Repository, RepositorySet)
     )
     # Create a content view
-    content_view_id = make_content_view({u'organization-id': org_id})['id']
-    # Add repositories to content view
-    for repo_info in repos_info:
-        ContentView.add_repository({
-            u'id': content_view_id,
+    recipe.add(
+        'cv',
+        lambda: make_content_view({u'organization-id': org_id})['id'],
+        uses=(ContentView,)
+    )
+
+    def publish_promote(content_view_id, repos_setup):
+        # Add repositories to content view
+        for repo_info in repos_setup[1]:
+            ContentView.add_repository({
+                u'id': content_view_id,
+                u'organization-id': org_id,
+                u'repository-id': repo_info['id'],
+            })
+        # Publish the content view
+        ContentView.publish({u'id': content_view_id})
+        # Get the latest content view version id
+        content_view_version = ContentView.info({
+                u'id': content_view_id
+            })['versions'][-1]
+        # Promote content view version to lifecycle environment
+        ContentView.version_promote({
+            u'id': content_view_version['id'],
             u'organization-id': org_id,
-            u'repository-id': repo_info['id'],
+            u'to-lifecycle-environment-id': lce_id,
         })
-    # Publish the content view
-    ContentView.publish({u'id': content_view_id})
-    # Get the latest content view version id
-    content_view_version = ContentView.info({
-            u'id': content_view_id
-        })['versions'][-1]
-    # Promote content view version to lifecycle environment
-    ContentView.version_promote({
-        u'id': content_view_version['id'],
-        u'organization-id': org_id,
-        u'to-lifecycle-environment-id': lce_id,
-    })
-    content_view = ContentView.info({u'id': content_view_id})
-    activation_key = make_activation_key({
-        u'organization-id': org_id,
-        u'lifecycle-environment-id': lce_id,
-        u'content-view-id': content_view_id,
-    })
+        return ContentView.info({u'id': content_view_id})
+
+    recipe.add(
+        'content_view',
+        publish_promote,
+        requires=('cv', 'repos'),
+        uses=(ContentView,)
+    )
+    recipe.add(
+        'ak',
+        lambda content_view: make_activation_key({
+            u'organization-id': org_id,
+            u'lifecycle-environment-id': lce_id,
+            u'content-view-id': content_view['id'],
+        }),
+        requires=('content_view',),
+        uses=(ActivationKey,)
+    )
     # Get organization subscriptions
-    subscriptions = Subscription.list({
-        u'organization-id': org_id},
-        per_page=False
+    recipe.add(
+        'subscriptions',
+        lambda repos_setup: Subscription.list({
+            u'organization-id': org_id},
+            per_page=False
+        ),
+        requires=('repos',),
+        uses=(Subscription,)
     )
-    # Add subscriptions to activation-key
-    needed_subscription_names = list(rh_subscriptions)
-    if custom_product:
-        needed_subscription_names.append(custom_product['name'])
-    added_subscription_names = []
-    for subscription in subscriptions:
-        if subscription['name'] in needed_subscription_names:
-            ActivationKey.add_subscription({
-                u'id': activation_key['id'],
-                u'subscription-id': subscription['id'],
-                u'quantity': 1,
-            })
-            added_subscription_names.append(subscription['name'])
-            if (len(added_subscription_names)
-                    == len(needed_subscription_names)):
-                break
-    missing_subscription_names = set(
-        needed_subscription_names).difference(set(added_subscription_names))
-    if missing_subscription_names:
-        raise CLIFactoryError(
-            u'Missing subscriptions: {0}'.format(missing_subscription_names))
 
+    def add_subscriptions(activation_key, repos_setup, subscriptions):
+        # Add subscriptions to activation-key
+        custom_product = repos_setup[0]
+        needed_subscription_names = list(rh_subscriptions)
+        if custom_product:
+            needed_subscription_names.append(custom_product['name'])
+        added_subscription_names = []
+        for subscription in subscriptions:
+            if subscription['name'] in needed_subscription_names:
+                ActivationKey.add_subscription({
+                    u'id': activation_key['id'],
+                    u'subscription-id': subscription['id'],
+                    u'quantity': 1,
+                })
+                added_subscription_names.append(subscription['name'])
+                if (len(added_subscription_names)
+                        == len(needed_subscription_names)):
+                    break
+        missing_subscription_names = set(
+            needed_subscription_names).difference(
+                set(added_subscription_names))
+        if missing_subscription_names:
+            raise CLIFactoryError(u'Missing subscriptions: {0}'.format(
+                missing_subscription_names))
+
+    recipe.add(
+        'ak_subscriptions',
+        add_subscriptions,
+        requires=('ak', 'repos', 'subscriptions'),
+        uses=(ActivationKey,)
+    )
+    results = recipe.run()
+    custom_product, repos_info = results['repos']
     return dict(
-        activation_key=activation_key,
-        content_view=content_view,
+        activation_key=results['ak'],
+        content_view=results['content_view'],
         product=custom_product,
         repos=repos_info,
     )
@@ -186,107 +186,114 @@ def get_line_indentation_level(line, tab_spaces=4, indentation_spaces=4):
 
 
 def parse_info(output):
-    """Parse the info output and returns a dict mapping the values."""
-    # info dictionary
+    """Parse the info output and returns a dict mapping the values.
+
+    Lines are nested by indentation, at any depth, in a single pass::
+
+        Name:         value          {'name': 'value',
+        Group:                        'group': {
+            Key:      value               'key': 'value',
+            Sub Group:                    'sub-group': {'id': '1'},
+                ID:   1               },
+        Items:                        'items': ['item1', 'item2'],
+         1) item1                     'content': [
+         2) item2                         {'repo-name': 'repo1', 'url': 'u1'},
+        Content:                      ],
+         1) Repo Name: repo1          }
+            URL:       u1
+
+    An unindented key without value is always a dict, an indented one is an
+    empty string unless it has indented lines.
+    """
     contents = {}
-    sub_prop = None  # stores name of the last group of sub-properties
-    sub_num = None  # is not None when list of properties
-    second_level_key = None  # is set when a possible second level is detected
+    # containers being filled, from the outermost: (indentation of the line
+    # opening the container, its owner, its key in the owner)
+    stack = [(-1, [contents], 0)]
+    # normalized keys, hammer repeats the same keys many times
+    keys = {}
 
     for line in output:
+        text = line.lstrip(' \t')
         # skip empty lines
-        if line == '':
+        if not text:
+            continue
+        indent = len(line) - len(text)
+
+        if indent == 0:
+            del stack[1:]
+            key, value = text.split(':', 1)
+            key = keys.get(key) or keys.setdefault(key, _normalize(key))
+            value = value.lstrip()
+            if value:  # 'key: value' line
+                contents[key] = value
+            else:  # 'key:' no value, new sub-property
+                contents[key] = {}
+                stack.append((0, contents, key))
             continue
-        current_indent_level = get_line_indentation_level(line)
-        if current_indent_level <= 1:
-            # we are entering or leaving a second level from lower/upper levels
-            # clear the second level key
-            second_level_key = None
-        if line.startswith(' '):  # sub-properties are indented
-            # values are separated by ':' or '=>', but not by '::' which can be
-            # entity name like 'test::params::keys'
-            if line.find(':') != -1 and not line.find('::') != -1:
-                key, value = line.lstrip().split(":", 1)
-            elif line.find('=>') != -1 and len(
-                    line.lstrip().split(" =>", 1)) == 2:
-                key, value = line.lstrip().split(" =>", 1)
-            else:
-                key = value = None
-
-            if key is None and value is None:
-                # Parse single attribute collection properties
-                # Template
-                #  1) template1
-                #  2) template2
-                #
-                # or
-                # Template
-                #  template1
-                #  template2
-                match = re.match(r'\d+\)\s+(.+)$', line.lstrip())
-
-                if match is None:
-                    match = re.match(r'(.*)$', line.lstrip())
-
-                value = match.group(1)
 
-                if isinstance(contents[sub_prop], dict):
-                    contents[sub_prop] = []
+        while stack[-1][0] >= indent:
+            stack.pop()
+        _, owner, owner_key = stack[-1]
+        container = owner[owner_key]
+
+        # values are separated by ':' or '=>', but not by '::' which can be
+        # entity name like 'test::params::keys'
+        if ':' in text and '::' not in text:
+            key, value = text.split(':', 1)
+        elif ' =>' in text:
+            key, value = text.split(' =>', 1)
+        else:
+            # Parse single attribute collection properties
+            # Template
+            #  1) template1
+            #  2) template2
+            #
+            # or
+            # Template
+            #  template1
+            #  template2
+            if text[0].isdigit():
+                number, sep, value = text.partition(')')
+                if sep and number.isdigit() and value[:1].isspace():
+                    text = value.lstrip() or value[1:]
+            if container.__class__ is not list:
+                container = owner[owner_key] = []
+            container.append(text)
+            continue
 
-                contents[sub_prop].append(value)
+        # some properties have many numbered values
+        # Example:
+        # Content:
+        #  1) Repo Name: repo1
+        #     URL:       /custom/4f84fc90-9ffa-...
+        #  2) Repo Name: puppet1
+        #     URL:       /custom/4f84fc90-9ffa-...
+        number = sep = None
+        if key[0].isdigit():
+            number, sep, item_key = key.partition(')')
+        if sep and number.isdigit():
+            if container.__class__ is not list:
+                container = owner[owner_key] = []
+            container.append({})
+            stack.append((indent, container, len(container) - 1))
+            # the item keys are indented after the number
+            key = item_key.lstrip()
+            indent += len(number) + 1 + len(item_key) - len(key)
+            container = container[-1]
+        elif container.__class__ is list:
+            # the following lines of a numbered item indented like it
+            if container and container[-1].__class__ is dict:
+                container = container[-1]
             else:
-                # some properties have many numbered values
-                # Example:
-                # Content:
-                #  1) Repo Name: repo1
-                #     URL:       /custom/4f84fc90-9ffa-...
-                #  2) Repo Name: puppet1
-                #     URL:       /custom/4f84fc90-9ffa-...
-                starts_with_number = re.match(r'(\d+)\)', key)
-                if starts_with_number:
-                    sub_num = int(starts_with_number.group(1))
-                    # no. 1) we need to change dict() to list()
-                    if sub_num == 1:
-                        contents[sub_prop] = []
-                    # remove number from key
-                    key = re.sub(r'\d+\)', '', key)
-                    # append empty dict to array
-                    contents[sub_prop].append({})
-
-                key = key.lstrip().replace(' ', '-').lower()
-                value = value.lstrip()
-                # add value to dictionary
-                if sub_num is not None:
-                    contents[sub_prop][-1][key] = value
-                else:
-                    # a third level is always represented as a dictionary and
-                    # we need to detect if we are at third level
-                    # example:
-                    # Content Information:
-                    #     Content View:
-                    #         ID:   10
-                    #         Name: Default Organization View
-                    # the "ID" and "Name" are located at third indent level
-                    # "content view" is located at second indent level
-                    if current_indent_level == 2 and second_level_key:
-                        # we are at third level indentation
-                        if not contents[sub_prop][second_level_key]:
-                            contents[sub_prop][second_level_key] = {}
-                        contents[sub_prop][second_level_key][key] = value
-                    else:
-                        contents[sub_prop][key] = value
-                    if current_indent_level == 1 and not value:
-                        # always set the last possible second level key
-                        # that can form a third level
-                        second_level_key = key
-        else:
-            sub_num = None  # new property implies no sub property
-            key, value = line.lstrip().split(":", 1)
-            key = key.lstrip().replace(' ', '-').lower()
-            if value.lstrip() == '':  # 'key:' no value, new sub-property
-                sub_prop = key
-                contents[sub_prop] = {}
-            else:  # 'key: value' line
-                contents[key] = value.lstrip()
+                container = owner[owner_key] = {}
+        elif container.__class__ is not dict:
+            # the first indented line of a key without value
+            container = owner[owner_key] = {}
+
+        key = keys.get(key) or keys.setdefault(key, _normalize(key.lstrip()))
+        value = value.lstrip()
+        container[key] = value
+        if not value:
+            stack.append((indent, container, key))
 
     return contents
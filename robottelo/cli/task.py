@@ -17,6 +17,7 @@ Subcommands::
 """
 
 from robottelo.cli.base import Base
+from robottelo.tasks import task_search_chunks
 
 
 class Task(Base):
@@ -54,3 +55,22 @@ class Task(Base):
         """
         cls.command_sub = 'resume'
         return cls.execute(cls._construct_command(options))
+
+    @classmethod
+    def states(cls, task_ids):
+        """Return the state and result of several tasks using a ``hammer task
+        list`` call per chunk of tasks, see
+        :func:`robottelo.tasks.task_search_chunks`.
+
+        :param task_ids: The UUIDs of the tasks to look up.
+        :return: A dict mapping each found task UUID to a ``(state, result)``
+            tuple, e.g. ``('stopped', 'success')``.
+        """
+        states = {}
+        for search, count in task_search_chunks(task_ids):
+            tasks = cls.list({u'search': search, u'per-page': count})
+            states.update(
+                (task['id'], (task.get('state'), task.get('result')))
+                for task in tasks
+            )
+        return states
@@ -1,29 +1,43 @@
 """Define and instantiate the configuration class for Robottelo."""
+import hashlib
 import importlib
+import io
+import json
 import logging
 import logging.config
 
 import os
+import six
 import sys
 
 from functools import partial
 
 from six.moves.urllib.parse import urlunsplit, urljoin
-from six.moves.configparser import (
-    NoOptionError,
-    NoSectionError,
-    ConfigParser
-)
+from six.moves.configparser import ConfigParser, InterpolationError
 
 import airgun.settings
 
 from nailgun import entities, entity_mixins
 from nailgun.config import ServerConfig
+from robottelo.api import http_session
 from robottelo.config import casts
 
 LOGGER = logging.getLogger(__name__)
 SETTINGS_FILE_NAME = 'robottelo.properties'
 
+#: Directory of the files Robottelo caches between sessions, out of the
+#: source tree
+USER_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache'),
+    'robottelo',
+)
+
+#: Directory storing the parsed settings files, see :class:`INIReader`. The
+#: cached settings include credentials, so the directory is private to the
+#: user running the tests.
+SETTINGS_CACHE_DIR = os.path.join(USER_CACHE_DIR, 'settings')
+
 
 class ImproperlyConfigured(Exception):
     """Indicates that Robottelo somehow is improperly configured.
@@ -47,7 +61,14 @@ def get_project_root():
 
 
 class INIReader(object):
-    """ConfigParser wrapper able to cast value when reading INI options."""
+    """ConfigParser wrapper able to cast value when reading INI options.
+
+    :param path: The path of the INI file.
+    :param cache_dir: A directory where the parsed file is cached. The cache
+        is used as long as the file content doesn't change, which saves the
+        file parsing in the next processes. Only the user can read the cache
+        and only the cache of the current file content is kept.
+    """
     # Helper casters
     cast_boolean = casts.Boolean()
     cast_dict = casts.Dict()
@@ -56,16 +77,95 @@ class INIReader(object):
     cast_tuple = casts.Tuple()
     cast_webdriver_desired_capabilities = casts.WebdriverDesiredCapabilities()
 
-    def __init__(self, path):
-        self.config_parser = ConfigParser()
+    def __init__(self, path, cache_dir=None):
         with open(path) as handler:
-            self.config_parser.readfp(handler)
-            if sys.version_info[0] < 3:
-                # ConfigParser.readfp is deprecated on Python3, read_file
-                # replaces it
-                self.config_parser.readfp(handler)
-            else:
-                self.config_parser.read_file(handler)
+            content = handler.read()
+        self.sections = None
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = self._get_cache_path(path, content, cache_dir)
+            self.sections = self._read_cache(cache_path)
+        if self.sections is None:
+            self.sections = self._parse(content)
+            if cache_path is not None:
+                self._write_cache(cache_path)
+
+    @staticmethod
+    def _parse(content):
+        """Parse the content of an INI file.
+
+        :return: A dict mapping the sections to dicts mapping their options to
+            their interpolated value.
+        """
+        config_parser = ConfigParser()
+        if sys.version_info[0] < 3:
+            config_parser.readfp(six.StringIO(content))
+        else:
+            # ConfigParser.readfp is deprecated on Python3, read_file
+            # replaces it
+            config_parser.read_file(six.StringIO(content))
+        sections = {}
+        for section in config_parser.sections():
+            sections[section] = {}
+            for option in config_parser.options(section):
+                try:
+                    value = config_parser.get(section, option)
+                except InterpolationError:
+                    value = config_parser.get(section, option, raw=True)
+                sections[section][option] = value
+        return sections
+
+    @staticmethod
+    def _get_cache_path(path, content, cache_dir):
+        """Return the path of the parsed file cache, which depends on the
+        file path and content.
+
+        The cache file name starts with the hash of the file path, so the
+        caches of the previous contents of the file can be found.
+        """
+        path_key = hashlib.sha1(os.path.realpath(path).encode('utf-8'))
+        if isinstance(content, six.text_type):
+            content = content.encode('utf-8')
+        return os.path.join(cache_dir, '{0}-{1}.json'.format(
+            path_key.hexdigest(), hashlib.sha1(content).hexdigest()))
+
+    @staticmethod
+    def _read_cache(cache_path):
+        """Return the cached sections or ``None`` when there is no cache."""
+        try:
+            with io.open(cache_path, encoding='utf-8') as handler:
+                return json.load(handler)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def _write_cache(self, cache_path):
+        """Store the sections in the cache and remove the caches of the
+        previous contents of the file.
+
+        The cache directory is created with mode 0700 and the cache file with
+        mode 0600. A process reading the cache while it is written still
+        reads a complete cache file.
+        """
+        cache_dir, name = os.path.split(cache_path)
+        tmp_path = '{0}.{1}'.format(cache_path, os.getpid())
+        try:
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir, 0o700)
+            os.chmod(cache_dir, 0o700)
+            if os.path.exists(tmp_path):
+                # left by a process which had the same PID
+                os.remove(tmp_path)
+            handle = os.open(
+                tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with io.open(handle, 'w', encoding='utf-8') as handler:
+                handler.write(six.text_type(json.dumps(self.sections)))
+            os.rename(tmp_path, cache_path)
+            prefix = name.split('-', 1)[0] + '-'
+            for entry in os.listdir(cache_dir):
+                if entry.startswith(prefix) and entry != name:
+                    os.remove(os.path.join(cache_dir, entry))
+        except (IOError, OSError) as err:
+            LOGGER.debug('Could not cache the settings: %s', err)
 
     def get(self, section, option, default=None, cast=None):
         """Read an option from a section of a INI file.
@@ -83,25 +183,25 @@ class INIReader(object):
 
         """
         try:
-            value = self.config_parser.get(section, option)
-            if cast is not None:
-                if cast is bool:
-                    value = self.cast_boolean(value)
-                elif cast is dict:
-                    value = self.cast_dict(value)
-                elif cast is list:
-                    value = self.cast_list(value)
-                elif cast is tuple:
-                    value = self.cast_tuple(value)
-                else:
-                    value = cast(value)
-        except (NoSectionError, NoOptionError):
-            value = default
+            value = self.sections[section][option.lower()]
+        except KeyError:
+            return default
+        if cast is not None:
+            if cast is bool:
+                value = self.cast_boolean(value)
+            elif cast is dict:
+                value = self.cast_dict(value)
+            elif cast is list:
+                value = self.cast_list(value)
+            elif cast is tuple:
+                value = self.cast_tuple(value)
+            else:
+                value = cast(value)
         return value
 
     def has_section(self, section):
         """Check if section is available."""
-        return self.config_parser.has_section(section)
+        return section in self.sections
 
 
 class FeatureSettings(object):
@@ -923,6 +1023,38 @@ class SSHClientSettings(FeatureSettings):
         return []
 
 
+class HTTPClientSettings(FeatureSettings):
+    """HTTP client settings definitions, see
+    :mod:`robottelo.api.http_session`.
+    """
+    def __init__(self, *args, **kwargs):
+        super(HTTPClientSettings, self).__init__(*args, **kwargs)
+        self.enabled = True
+        self.pool_connections = 4
+        self.pool_size = 10
+        self.keep_alive = True
+        self.compression = True
+
+    def read(self, reader):
+        """Read HTTP client settings."""
+        self.enabled = reader.get('http_client', 'enabled', True, bool)
+        self.pool_connections = reader.get(
+            'http_client', 'pool_connections', 4, int)
+        self.pool_size = reader.get('http_client', 'pool_size', 10, int)
+        self.keep_alive = reader.get('http_client', 'keep_alive', True, bool)
+        self.compression = reader.get(
+            'http_client', 'compression', True, bool)
+
+    def validate(self):
+        """Validate HTTP client settings."""
+        validation_errors = []
+        for option in ('pool_connections', 'pool_size'):
+            if getattr(self, option) < 1:
+                validation_errors.append(
+                    '[http_client] {0} must be at least 1.'.format(option))
+        return validation_errors
+
+
 class TransitionSettings(FeatureSettings):
     """Transition settings definitions."""
     def __init__(self, *args, **kwargs):
@@ -985,6 +1117,45 @@ class UpgradeSettings(FeatureSettings):
         return validation_errors
 
 
+class SavepointSettings(FeatureSettings):
+    """Savepoint settings definitions."""
+    def __init__(self, *args, **kwargs):
+        super(SavepointSettings, self).__init__(*args, **kwargs)
+        self.enabled = None
+        self.directory = None
+        self.backup_command = None
+        self.restore_command = None
+        self.restore = None
+        self.timeout = None
+
+    def read(self, reader):
+        """Read savepoint settings."""
+        self.enabled = reader.get('savepoint', 'enabled', False, bool)
+        self.directory = reader.get(
+            'savepoint', 'directory', '/var/lib/robottelo/savepoints')
+        self.backup_command = reader.get(
+            'savepoint',
+            'backup_command',
+            'foreman-maintain backup offline --assumeyes {path}'
+        )
+        self.restore_command = reader.get(
+            'savepoint',
+            'restore_command',
+            'foreman-maintain restore --assumeyes {path}'
+        )
+        self.restore = reader.get('savepoint', 'restore')
+        self.timeout = reader.get('savepoint', 'timeout', 7200, int)
+
+    def validate(self):
+        """Validate savepoint settings."""
+        validation_errors = []
+        for option in ('backup_command', 'restore_command'):
+            if '{path}' not in getattr(self, option):
+                validation_errors.append(
+                    '[savepoint] {0} must contain {{path}}.'.format(option))
+        return validation_errors
+
+
 class SharedFunctionSettings(FeatureSettings):
     """Shared function settings definitions."""
 
@@ -1050,18 +1221,91 @@ class SharedFunctionSettings(FeatureSettings):
         return validation_errors
 
 
+class _LazyFeatureSettings(object):
+    """Settings attribute holding a feature settings section which is only
+    read and validated on first access.
+
+    :param str name: The attribute and section name.
+    :param cls: The :class:`FeatureSettings` subclass of the section.
+    """
+
+    def __init__(self, name, cls):
+        self.name = name
+        self.cls = cls
+
+    def __get__(self, settings, owner=None):
+        if settings is None:
+            return self
+        feature = self.cls()
+        if settings.reader is not None:
+            validation_errors = settings._read_feature(self.name, feature)
+            if validation_errors:
+                raise ImproperlyConfigured(
+                    'Failed to validate the configuration, check the '
+                    'message(s):\n{}'.format('\n'.join(validation_errors))
+                )
+        # next accesses get the instance attribute
+        settings.__dict__[self.name] = feature
+        return feature
+
+
 class Settings(object):
-    """Robottelo's settings representation."""
+    """Robottelo's settings representation.
+
+    Feature settings sections are read and validated on first access, except
+    the ones already accessed when :meth:`configure` is called and the
+    ``server`` one which are read by :meth:`configure`.
+    """
+
+    server = _LazyFeatureSettings('server', ServerSettings)
+    bugzilla = _LazyFeatureSettings('bugzilla', BugzillaSettings)
+    # Features
+    capsule = _LazyFeatureSettings('capsule', CapsuleSettings)
+    certs = _LazyFeatureSettings('certs', CertsSettings)
+    clients = _LazyFeatureSettings('clients', ClientsSettings)
+    compute_resources = _LazyFeatureSettings(
+        'compute_resources', LibvirtHostSettings)
+    discovery = _LazyFeatureSettings('discovery', DiscoveryISOSettings)
+    distro = _LazyFeatureSettings('distro', DistroSettings)
+    docker = _LazyFeatureSettings('docker', DockerSettings)
+    ec2 = _LazyFeatureSettings('ec2', EC2Settings)
+    fake_capsules = _LazyFeatureSettings('fake_capsules', FakeCapsuleSettings)
+    fake_manifest = _LazyFeatureSettings('fake_manifest', FakeManifestSettings)
+    http_client = _LazyFeatureSettings('http_client', HTTPClientSettings)
+    ldap = _LazyFeatureSettings('ldap', LDAPSettings)
+    ipa = _LazyFeatureSettings('ipa', LDAPIPASettings)
+    oscap = _LazyFeatureSettings('oscap', OscapSettings)
+    ostree = _LazyFeatureSettings('ostree', OstreeSettings)
+    osp = _LazyFeatureSettings('osp', OSPSettings)
+    performance = _LazyFeatureSettings('performance', PerformanceSettings)
+    rhai = _LazyFeatureSettings('rhai', RHAISettings)
+    rhev = _LazyFeatureSettings('rhev', RHEVSettings)
+    ssh_client = _LazyFeatureSettings('ssh_client', SSHClientSettings)
+    savepoint = _LazyFeatureSettings('savepoint', SavepointSettings)
+    shared_function = _LazyFeatureSettings(
+        'shared_function', SharedFunctionSettings)
+    transition = _LazyFeatureSettings('transition', TransitionSettings)
+    vlan_networking = _LazyFeatureSettings(
+        'vlan_networking', VlanNetworkSettings)
+    upgrade = _LazyFeatureSettings('upgrade', UpgradeSettings)
+    vmware = _LazyFeatureSettings('vmware', VmWareSettings)
 
     def __init__(self):
         self._all_features = None
         self._configured = False
         self._validation_errors = []
         self.browser = None
+        self.browser_pool = False
+        self.browser_pool_size = 2
+        self.capture_server_logs = False
+        self.captured_server_logs = None
         self.cdn = None
+        self.cleanup = False
+        self.cleanup_journal = None
         self.locale = None
         self.project = None
         self.reader = None
+        self.repos_sync_concurrency = 4
         self.rhel6_repo = None
         self.rhel7_repo = None
         self.rhel6_os = None
@@ -1072,41 +1316,14 @@ class Settings(object):
         self.tmp_dir = None
         self.saucelabs_key = None
         self.saucelabs_user = None
-        self.server = ServerSettings()
         self.run_one_datapoint = None
         self.upstream = None
+        self.validate_hammer_options = False
         self.verbosity = None
         self.webdriver = None
         self.webdriver_binary = None
         self.webdriver_desired_capabilities = None
 
-        self.bugzilla = BugzillaSettings()
-        # Features
-        self.capsule = CapsuleSettings()
-        self.certs = CertsSettings()
-        self.clients = ClientsSettings()
-        self.compute_resources = LibvirtHostSettings()
-        self.discovery = DiscoveryISOSettings()
-        self.distro = DistroSettings()
-        self.docker = DockerSettings()
-        self.ec2 = EC2Settings()
-        self.fake_capsules = FakeCapsuleSettings()
-        self.fake_manifest = FakeManifestSettings()
-        self.ldap = LDAPSettings()
-        self.ipa = LDAPIPASettings()
-        self.oscap = OscapSettings()
-        self.ostree = OstreeSettings()
-        self.osp = OSPSettings()
-        self.performance = PerformanceSettings()
-        self.rhai = RHAISettings()
-        self.rhev = RHEVSettings()
-        self.ssh_client = SSHClientSettings()
-        self.shared_function = SharedFunctionSettings()
-        self.transition = TransitionSettings()
-        self.vlan_networking = VlanNetworkSettings()
-        self.upgrade = UpgradeSettings()
-        self.vmware = VmWareSettings()
-
     def configure(self):
         """Read the settings file and parse the configuration.
 
@@ -1123,23 +1340,19 @@ class Settings(object):
             raise ImproperlyConfigured(
                 'Not able to find settings file at {}'.format(settings_path))
 
-        self.reader = INIReader(settings_path)
+        self.reader = INIReader(settings_path, SETTINGS_CACHE_DIR)
         self._read_robottelo_settings()
         self._validation_errors.extend(
             self._validate_robottelo_settings())
 
-        attrs = map(
-            lambda attr_name: (attr_name, getattr(self, attr_name)),
-            dir(self)
-        )
-        feature_settings = filter(
-            lambda tpl: isinstance(tpl[1], FeatureSettings),
-            attrs
-        )
-        for name, settings in feature_settings:
-            if self.reader.has_section(name) or name == 'server':
-                settings.read(self.reader)
-                self._validation_errors.extend(settings.validate())
+        # feature settings accessed before are read now, the other ones when
+        # first accessed
+        for name in self.all_features:
+            if name == 'server' or name in vars(self):
+                feature = vars(self).setdefault(
+                    name, getattr(type(self), name).cls())
+                self._validation_errors.extend(
+                    self._read_feature(name, feature))
 
         if self._validation_errors:
             raise ImproperlyConfigured(
@@ -1153,6 +1366,18 @@ class Settings(object):
         self._configure_airgun()
         self._configured = True
 
+    def _read_feature(self, name, feature):
+        """Read a feature settings section if it is in the settings file.
+
+        :param str name: The feature settings attribute and section name.
+        :param feature: The :class:`FeatureSettings` to read.
+        :return: The list of validation errors.
+        """
+        if self.reader.has_section(name) or name == 'server':
+            feature.read(self.reader)
+            return feature.validate()
+        return []
+
     def _read_robottelo_settings(self):
         """Read Robottelo's general settings."""
         self.log_driver_commands = self.reader.get(
@@ -1169,6 +1394,16 @@ class Settings(object):
         )
         self.browser = self.reader.get(
             'robottelo', 'browser', 'selenium')
+        self.browser_pool = self.reader.get(
+            'robottelo', 'browser_pool', False, bool)
+        self.browser_pool_size = self.reader.get(
+            'robottelo', 'browser_pool_size', 2, int)
+        self.repos_sync_concurrency = self.reader.get(
+            'robottelo', 'repos_sync_concurrency', 4, int)
+        self.capture_server_logs = self.reader.get(
+            'robottelo', 'capture_server_logs', False, bool)
+        self.captured_server_logs = self.reader.get(
+            'robottelo', 'captured_server_logs', None, list)
         self.cdn = self.reader.get('robottelo', 'cdn', True, bool)
         self.locale = self.reader.get('robottelo', 'locale', 'en_US.UTF-8')
         self.project = self.reader.get('robottelo', 'project', 'sat')
@@ -1185,7 +1420,11 @@ class Settings(object):
         self.run_one_datapoint = self.reader.get(
             'robottelo', 'run_one_datapoint', False, bool)
         self.cleanup = self.reader.get('robottelo', 'cleanup', False, bool)
+        self.cleanup_journal = self.reader.get(
+            'robottelo', 'cleanup_journal', None)
         self.upstream = self.reader.get('robottelo', 'upstream', True, bool)
+        self.validate_hammer_options = self.reader.get(
+            'robottelo', 'validate_hammer_options', False, bool)
         self.verbosity = self.reader.get(
             'robottelo',
             'verbosity',
@@ -1247,8 +1486,8 @@ class Settings(object):
         """List all expected feature settings sections."""
         if self._all_features is None:
             self._all_features = [
-                name for name, value in vars(self).items()
-                if isinstance(value, FeatureSettings)
+                name for name, value in vars(type(self)).items()
+                if isinstance(value, _LazyFeatureSettings)
             ]
         return self._all_features
 
@@ -1264,6 +1503,9 @@ class Settings(object):
         returned by :meth:`robottelo.helpers.get_nailgun_config`. See
         ``robottelo.entity_mixins.Entity`` for more information on the effects
         of this.
+        * Make NailGun send its requests with a shared session, see
+          :mod:`robottelo.api.http_session`, unless ``http_client.enabled``
+          is false.
         * Set a default value for ``nailgun.entities.GPGKey.content``.
         * Set the default value for
           ``nailgun.entities.DockerComputeResource.url``
@@ -1276,6 +1518,8 @@ class Settings(object):
             self.server.get_credentials(),
             verify=False,
         )
+        if self.http_client.enabled:
+            http_session.install(self.http_client)
 
         gpgkey_init = entities.GPGKey.__init__
 
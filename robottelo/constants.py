@@ -613,6 +613,10 @@ PULP_PUBLISHED_ISO_REPOS_PATH = '/var/lib/pulp/published/http/isos'
 PULP_PUBLISHED_PUPPET_REPOS_PATH = '/var/lib/pulp/published/puppet/https/repos'
 PULP_PUBLISHED_YUM_REPOS_PATH = '/var/lib/pulp/published/yum/http/repos'
 
+#: Server directory caching the packages fetched by helpers, keyed by URL. On
+#: the same filesystem as the published repos so they can be hard linked.
+PACKAGE_CACHE_PATH = '/var/lib/pulp/robottelo/package_cache'
+
 #: All permissions exposed by the server.
 #: :mod:`tests.foreman.api.test_permission` makes use of this.
 PERMISSIONS = {
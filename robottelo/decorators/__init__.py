@@ -176,20 +176,29 @@ def stubbed(reason=None):
 
 
 def cacheable(func):
-    """Decorator that makes an optional object cache available"""
+    """Decorator that makes an optional object cache available
+
+    The cached objects are used by the next modules of the process, so they
+    are not journaled for cleanup, see
+    :func:`robottelo.cleanup_journal.not_journaled`.
+    """
 
     @wraps(func)
-    def cacheable_function(options=None, cached=False):
+    def cacheable_function(options=None, cached=False, **kwargs):
         """
         This is the function being returned.
         Requires input function's name start with 'make_'
         """
         object_key = func.__name__.replace('make_', '')
-        if cached is True and object_key in OBJECT_CACHE:
+        if cached is not True:
+            return func(options, **kwargs)
+        if object_key in OBJECT_CACHE:
             return OBJECT_CACHE[object_key]
-        new_object = func(options)
-        if cached is True:
-            OBJECT_CACHE[object_key] = new_object
+        # imported here as robottelo.cleanup_journal imports robottelo.cli
+        from robottelo.cleanup_journal import not_journaled
+        with not_journaled():
+            new_object = func(options, **kwargs)
+        OBJECT_CACHE[object_key] = new_object
         return new_object
 
     return cacheable_function
@@ -197,6 +197,24 @@ def _get_default_storage_handler():
     return _storage_handlers.get(DEFAULT_STORAGE_HANDLER)()
 
 
+def get_shared_storage():
+    """Return the default storage handler instance when the shared data is
+    enabled, ``None`` otherwise.
+
+    Lets other modules share plain json compatible values between processes,
+    stored under keys returned by :func:`get_shared_key`.
+    """
+    _check_config()
+    if not ENABLED:
+        return None
+    return _get_default_storage_handler()
+
+
+def get_shared_key(name):
+    """Return the storage key of ``name`` in the default namespace scope."""
+    return _get_function_name_key(name)
+
+
 class SharedFunctionError(Exception):
     """Shared function related exception"""
 
@@ -261,6 +279,8 @@ class _SharedFunction(object):
         return kwargs
 
     def _call_function(self):
+        # imported here as robottelo.cleanup_journal imports robottelo.cli
+        from robottelo.cleanup_journal import not_journaled
 
         retries = self._max_retries
         if not retries:
@@ -277,10 +297,13 @@ class _SharedFunction(object):
                     'calling shared function: {0} - retry index: {1}'.format(
                         self._function_key, retry_index)
                 )
-                result = self._function(
-                    *self._function_args,
-                    **self._function_kwargs
-                )
+                # the results are used by other modules and processes, their
+                # entities must outlive the module journal scope
+                with not_journaled():
+                    result = self._function(
+                        *self._function_args,
+                        **self._function_kwargs
+                    )
                 break
             except Exception as err:
                 exp = err
@@ -301,6 +324,7 @@ class _SharedFunction(object):
         return False
 
     def __call__(self):
+        from robottelo.cleanup_journal import not_journaled
         # this lock prevent any other process to run the function,
         # and if an other process is running the function, I should wait it
         # to finish
@@ -411,7 +435,8 @@ class _SharedFunction(object):
                 result[self._injected_kw] = True
             # recall the function with result as kwargs
             # the function may modify the result
-            result = self._function(*self._function_args, **result)
+            with not_journaled():
+                result = self._function(*self._function_args, **result)
 
         return result
 
@@ -0,0 +1,373 @@
+# -*- encoding: utf-8 -*-
+"""Local stand-in of a Satellite server for the SSH and CLI layers
+
+:class:`FakeSSHServer` is an in-process SSH server, made with paramiko server
+mode, which answers the commands with a :class:`FakeHammer`. The fake hammer
+replays recorded outputs, optionally after some latency, so the whole
+:mod:`robottelo.ssh` → :meth:`robottelo.cli.base.Base.execute` →
+:mod:`robottelo.cli.hammer` → :mod:`robottelo.cli.factory` stack runs without
+a network nor a real server::
+
+    hammer = FakeHammer(latency=0.05)
+    hammer.add(r'organization create', u'Message,Id,Name\\n,1,org\\n',
+               output_format='csv')
+    hammer.add(r'organization info', u'Id: 1\\nName: org\\n')
+    with fake_satellite(hammer) as server:
+        make_org()
+        server.connections  # 2
+
+The recorded outputs can be read from a JSON file, see
+:meth:`FakeHammer.load`.
+"""
+import io
+import json
+import logging
+import random
+import re
+import shlex
+import socket
+import threading
+import time
+
+import paramiko
+import six
+
+from contextlib import contextmanager
+from robottelo import ssh
+from robottelo.config import settings
+
+LOGGER = logging.getLogger(__name__)
+
+#: Return code of the commands the fake hammer has no recorded output for
+UNKNOWN_COMMAND_RETURN_CODE = 127
+
+# hammer global options followed by a value
+_GLOBAL_OPTIONS_WITH_VALUE = (
+    '-u', '--username', '-p', '--password', '--interactive', '-c',
+    '--config', '-r', '--reload-cache', '--output',
+)
+
+
+def parse_hammer_command(command):
+    """Split a command run by :meth:`robottelo.cli.base.Base.execute` in its
+    hammer subcommand and output format.
+
+    :param str command: The command, e.g. ``LANG=en_US.UTF-8 hammer -v -u
+        admin -p changeme --output=csv organization list``.
+    :return: A tuple with the subcommand and its options, without quotes,
+        e.g. ``organization list --per-page=10000``, and the output format.
+        ``(None, None)`` if it is not a hammer command.
+    """
+    try:
+        tokens = shlex.split(command)
+    except ValueError:
+        tokens = command.split()
+    if 'hammer' not in tokens:
+        return None, None
+    tokens = tokens[tokens.index('hammer') + 1:]
+    output_format = None
+    while tokens and tokens[0].startswith('-'):
+        option = tokens.pop(0)
+        name, _, value = option.partition('=')
+        if name in _GLOBAL_OPTIONS_WITH_VALUE and not value and tokens:
+            value = tokens.pop(0)
+        if name == '--output':
+            output_format = value
+    return u' '.join(tokens), output_format
+
+
+class FakeHammer(object):
+    """Hammer replaying recorded outputs.
+
+    The commands are matched against the recordings in the order they were
+    added, see :meth:`add`.
+
+    :param latency: The number of seconds each command takes, or a ``(min,
+        max)`` tuple for a random number of seconds between them.
+    """
+
+    def __init__(self, latency=None):
+        self.latency = latency
+        self.recordings = []
+        self.calls = []
+
+    def add(self, pattern, stdout=u'', stderr=u'', return_code=0,
+            output_format=None, latency=None):
+        """Record the output of the commands matching a pattern.
+
+        :param str pattern: A regular expression matching the beginning of
+            the hammer subcommand, as returned by
+            :func:`parse_hammer_command`, e.g. ``organization create``.
+        :param stdout: The output, or a function of the pattern match object
+            returning it.
+        :param str stderr: The error output.
+        :param int return_code: The return code.
+        :param str output_format: Only match the commands with this output
+            format. Match the commands with any output format if ``None``.
+        :param latency: The latency of these commands, see
+            :class:`FakeHammer`. The hammer one if ``None``.
+        """
+        self.recordings.append({
+            'pattern': re.compile(pattern),
+            'stdout': stdout,
+            'stderr': stderr,
+            'return_code': return_code,
+            'output_format': output_format,
+            'latency': latency,
+        })
+
+    def load(self, path):
+        """Add the recordings of a JSON file.
+
+        The file holds a list of objects with a ``command`` pattern and the
+        other arguments of :meth:`add`, e.g. ``[{"command": "organization
+        create", "stdout": "Message,Id,Name\\n,1,org\\n", "output_format":
+        "csv"}]``.
+        """
+        with io.open(path, encoding='utf-8') as handler:
+            recordings = json.load(handler)
+        for recording in recordings:
+            recording = dict(recording)
+            self.add(recording.pop('command'), **recording)
+
+    def _sleep(self, latency):
+        if isinstance(latency, (tuple, list)):
+            latency = random.uniform(*latency)
+        if latency:
+            time.sleep(latency)
+
+    def run(self, command):
+        """Run a command.
+
+        :param str command: The command received by the server.
+        :return: A tuple with the output, the error output and the return
+            code.
+        """
+        self.calls.append(command)
+        subcommand, output_format = parse_hammer_command(command)
+        if subcommand is not None:
+            for recording in self.recordings:
+                if (recording['output_format'] is not None and
+                        recording['output_format'] != output_format):
+                    continue
+                match = recording['pattern'].match(subcommand)
+                if match is None:
+                    continue
+                latency = recording['latency']
+                self._sleep(self.latency if latency is None else latency)
+                stdout = recording['stdout']
+                if callable(stdout):
+                    stdout = stdout(match)
+                return stdout, recording['stderr'], recording['return_code']
+        self._sleep(self.latency)
+        return (
+            u'',
+            u'fake hammer has no recorded output for: {0}\n'.format(command),
+            UNKNOWN_COMMAND_RETURN_CODE,
+        )
+
+
+class _ServerInterface(paramiko.ServerInterface):
+    """Accept any user and run the exec requests with the fake hammer."""
+
+    def __init__(self, server):
+        self.server = server
+
+    def get_allowed_auths(self, username):
+        return 'password,publickey'
+
+    def check_auth_password(self, username, password):
+        return paramiko.AUTH_SUCCESSFUL
+
+    def check_auth_publickey(self, username, key):
+        return paramiko.AUTH_SUCCESSFUL
+
+    def check_channel_request(self, kind, chanid):
+        if kind == 'session':
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_exec_request(self, channel, command):
+        thread = threading.Thread(
+            target=self.server._exec, args=(channel, command))
+        thread.daemon = True
+        thread.start()
+        return True
+
+
+class FakeServerSSHClient(ssh.SSHClient):
+    """SSH client connecting to a :class:`FakeSSHServer` whatever the
+    hostname.
+    """
+
+    def __init__(self, address, port):
+        super(FakeServerSSHClient, self).__init__()
+        self.fake_server_address = address
+        self.fake_server_port = port
+
+    def connect(self, hostname, port=None, **kwargs):
+        kwargs.update(allow_agent=False, look_for_keys=False)
+        return super(FakeServerSSHClient, self).connect(
+            self.fake_server_address, port=self.fake_server_port, **kwargs)
+
+
+class FakeSSHServer(object):
+    """In-process SSH server answering the commands with a
+    :class:`FakeHammer`.
+
+    :param hammer: The fake hammer, one without recordings if ``None``.
+    :param host_key: The ``paramiko.PKey`` of the server, a new RSA key if
+        ``None``.
+    :param str address: The address to listen on, on a free port.
+    """
+
+    def __init__(self, hammer=None, host_key=None, address='127.0.0.1'):
+        self.hammer = hammer if hammer is not None else FakeHammer()
+        self.host_key = host_key
+        self.address = address
+        self.port = None
+        self.connections = 0
+        self.commands = 0
+        self._lock = threading.Lock()
+        self._socket = None
+        self._stopped = threading.Event()
+        self._thread = None
+        self._transports = set()
+
+    def start(self):
+        """Listen and serve the connections in a thread."""
+        if self.host_key is None:
+            self.host_key = paramiko.RSAKey.generate(2048)
+        self._stopped.clear()
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((self.address, 0))
+        self._socket.listen(128)
+        self._socket.settimeout(0.2)
+        self.port = self._socket.getsockname()[1]
+        self._thread = threading.Thread(target=self._accept)
+        self._thread.daemon = True
+        self._thread.start()
+        LOGGER.debug('Fake SSH server listening on %s:%s',
+                     self.address, self.port)
+
+    def stop(self):
+        """Stop listening and close the open connections."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        with self._lock:
+            transports = list(self._transports)
+        for transport in transports:
+            transport.close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def client(self):
+        """Return a SSH client connecting to this server."""
+        return FakeServerSSHClient(self.address, self.port)
+
+    def _accept(self):
+        while not self._stopped.is_set():
+            try:
+                sock, _ = self._socket.accept()
+            except socket.timeout:
+                continue
+            except socket.error:
+                if self._stopped.is_set():
+                    break
+                raise
+            sock.settimeout(None)
+            thread = threading.Thread(target=self._serve, args=(sock,))
+            thread.daemon = True
+            thread.start()
+
+    def _serve(self, sock):
+        transport = paramiko.Transport(sock)
+        transport.add_server_key(self.host_key)
+        with self._lock:
+            self._transports.add(transport)
+        try:
+            transport.start_server(server=_ServerInterface(self))
+            with self._lock:
+                self.connections += 1
+            # the transport only keeps weak references to the channels, keep
+            # them until the client closes them
+            channels = []
+            while transport.is_active():
+                channel = transport.accept(1)
+                channels = [
+                    channel for channel in channels + [channel]
+                    if channel is not None and not channel.closed
+                ]
+        except (paramiko.SSHException, EOFError, socket.error) as err:
+            LOGGER.debug('Fake SSH server connection failed: %s', err)
+        finally:
+            transport.close()
+            with self._lock:
+                self._transports.discard(transport)
+
+    def _exec(self, channel, command):
+        with self._lock:
+            self.commands += 1
+        try:
+            if isinstance(command, six.binary_type):
+                command = command.decode('utf-8')
+            stdout, stderr, return_code = self.hammer.run(command)
+            if stdout:
+                channel.sendall(stdout.encode('utf-8'))
+            if stderr:
+                channel.sendall_stderr(stderr.encode('utf-8'))
+            channel.send_exit_status(return_code)
+        except Exception:
+            LOGGER.exception('Fake SSH server failed to run %s', command)
+            channel.send_exit_status(255)
+        finally:
+            # the exec request reply may not be sent yet, closing the channel
+            # would fail the request, the client closes it after the EOF
+            channel.shutdown_write()
+
+
+@contextmanager
+def fake_satellite(hammer=None, host_key=None):
+    """Run a :class:`FakeSSHServer` and make :mod:`robottelo.ssh` connect to
+    it, whatever the hostname.
+
+    The ``server`` settings used by the CLI are set when they are missing, so
+    the settings don't need to be configured.
+
+    :param hammer: The fake hammer, see :class:`FakeSSHServer`.
+    :param host_key: The server key, see :class:`FakeSSHServer`.
+    :return: The running server.
+    """
+    server = FakeSSHServer(hammer, host_key)
+    defaults = {
+        'hostname': server.address,
+        'ssh_username': 'root',
+        'ssh_password': 'fake',
+        'admin_username': 'admin',
+        'admin_password': 'changeme',
+    }
+    previous = {
+        name: getattr(settings.server, name) for name in defaults}
+    for name, value in defaults.items():
+        if previous[name] is None:
+            setattr(settings.server, name, value)
+    call_sshclient = ssh._call_paramiko_sshclient
+    ssh._call_paramiko_sshclient = server.client
+    try:
+        with server:
+            yield server
+    finally:
+        ssh._call_paramiko_sshclient = call_sshclient
+        for name, value in previous.items():
+            setattr(settings.server, name, value)
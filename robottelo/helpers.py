@@ -1,6 +1,7 @@
 # -*- encoding: utf-8 -*-
 """Several helper methods and functions."""
 import contextlib
+import hashlib
 import logging
 import os
 import random
@@ -10,15 +11,18 @@ import six
 
 from tempfile import mkstemp
 from nailgun.config import ServerConfig
+from six.moves import shlex_quote
 from robottelo import ssh
 from robottelo.cli.base import CLIReturnCodeError
 from robottelo.cli.proxy import CapsuleTunnelError
 from robottelo.config import settings
 from robottelo.constants import (
+    PACKAGE_CACHE_PATH,
     PULP_PUBLISHED_YUM_REPOS_PATH,
     RHEL_6_MAJOR_VERSION,
     RHEL_7_MAJOR_VERSION,
 )
+from robottelo.server_facts import get_server_facts
 
 # This conditional is here to centralize use of lru_cache and urljoin
 if six.PY3:  # pragma: no cover
@@ -30,6 +34,14 @@ else:  # pragma: no cover
 
 LOGGER = logging.getLogger(__name__)
 
+#: Number of packages downloaded at the same time by :func:`fetch_packages`
+PACKAGE_FETCH_CONCURRENCY = 8
+
+#: File of a repository created by :func:`create_repo` holding the checksum
+#: of its package names, sizes and modification times when its metadata was
+#: last generated
+REPO_PACKAGES_CHECKSUM_FILE = '.robottelo_packages'
+
 
 class DataFileError(Exception):
     """Indicates any issue when reading a data file."""
@@ -92,7 +104,7 @@ def get_server_software():
     :rtype: str
 
     """
-    if ssh.command('rpm -q satellite &>/dev/null').return_code == 0:
+    if get_server_facts()['satellite']:
         return 'downstream'
     return 'upstream'
 
@@ -101,42 +113,41 @@ def get_server_version():
     """Read Satellite version.
 
     Inspect server /usr/share/foreman/lib/satellite/version.rb in
-    order to get the installed Satellite version.
+    order to get the installed Satellite version. The file is read once per
+    server facts snapshot, see
+    :func:`robottelo.server_facts.get_server_facts`.
 
     :return: Either a string containing the Satellite version or
         ``None`` if the version.rb file is not present.
     """
-    result = ''.join(ssh.command(
-        "cat /usr/share/foreman/lib/satellite/version.rb | grep VERSION | "
-        "awk '{print $3}'"
-    ).stdout)
-    result = result.replace('"', '').strip()
-    if len(result) == 0:
+    version_rb = get_server_facts()['version_rb']
+    if not version_rb or len(version_rb.split()) < 3:
         return None
-    return result
+    return version_rb.split()[2].replace('"', '').strip()
 
 
 def get_host_info(hostname=None):
     """Get remote host's distribution information
 
+    The release is read once per server facts snapshot, see
+    :func:`robottelo.server_facts.get_server_facts`.
+
     :param str hostname: Hostname or IP address of the remote host. If ``None``
         the hostname will be get from ``main.server.hostname`` config.
     :returns: A tuple in the form ``(distro, major, minor)``. ``major`` and
         ``minor`` are integers. ``minor`` can be ``None`` if not available.
 
     """
-    result = ssh.command('cat /etc/redhat-release', hostname)
-    if result.return_code != 0:
-        raise HostInfoError('Not able to cat /etc/redhat-release "{0}"'.format(
-            result.stderr
-        ))
+    os_release = get_server_facts(hostname)['os_release']
+    if os_release is None:
+        raise HostInfoError('Not able to read /etc/redhat-release')
     match = re.match(
         r'(?P<distro>.+) release (?P<major>\d+)(.(?P<minor>\d+))?',
-        result.stdout[0],
+        os_release,
     )
     if match is None:
         raise HostInfoError(
-            u'Not able to parse release string "{0}"'.format(result.stdout[0]))
+            u'Not able to parse release string "{0}"'.format(os_release))
     groups = match.groupdict()
     return (
         groups['distro'],
@@ -277,6 +288,10 @@ def md5_by_url(url, hostname=None):
     to calculate checksum but don't want to deal with storing a file and
     removing it afterwards.
 
+    The file is fetched into the server package cache, see
+    :func:`fetch_packages`, and its checksum is computed at download time so
+    next calls for the same URL only check that the file didn't change.
+
     :param str url: URL of a file.
     :param str hostname: Hostname or IP address of the remote host. If
          ``None`` the hostname will be get from ``main.server.hostname`` config
@@ -286,14 +301,95 @@ def md5_by_url(url, hostname=None):
     """
     filename = url.split('/')[-1]
     result = ssh.command(
-        'wget -qO - {} | tee {} | md5sum | awk \'{{print $1}}\''.format(
-            url, filename),
+        u'{0} && readlink {1}'.format(
+            _fetch_packages_command([url]),
+            shlex_quote(_package_cache_path(url)),
+        ),
         hostname=hostname
     )
-    if result.return_code != 0:
+    if result.return_code != 0 or not result.stdout:
         raise AssertionError(
             'Failed to calculate md5 checksum of {}'.format(filename))
-    return result.stdout[0]
+    # the cache entry links to the file named after its checksum
+    return result.stdout[0].rsplit('.', 1)[-1]
+
+
+def _package_cache_path(url):
+    """Return the path of the server package cache entry of ``url``."""
+    return u'{0}/{1}'.format(
+        PACKAGE_CACHE_PATH, hashlib.sha1(url.encode('utf-8')).hexdigest())
+
+
+def _fetch_packages_command(urls):
+    """Return a shell command downloading the ``urls`` missing from the
+    server package cache or changed since they were cached,
+    :data:`PACKAGE_FETCH_CONCURRENCY` at a time.
+
+    The cache is content addressed: each URL is downloaded to a file named
+    after its :func:`_package_cache_path` and its md5 checksum, and the
+    :func:`_package_cache_path` entry is a symbolic link to it, replaced in
+    one step so a file is never paired with the checksum of another. Cached
+    URLs are downloaded again only when the server answers that they were
+    modified since, with an ``If-Modified-Since`` request. Partial downloads
+    are never left in the cache.
+    """
+    # xargs runs "sh -c script _ path url" for each pair of arguments. curl
+    # doesn't write "$t" when the file isn't modified, and gives the file the
+    # server modification time for the next If-Modified-Since request.
+    script = (
+        u't="$1.$$"; e="${1##*/}"; old=$(readlink "$1" 2>/dev/null); '
+        u'if [ -n "$old" ]; then curl -sfLR -z "$1" -o "$t" "$2"; '
+        u'else curl -sfLR -o "$t" "$2"; fi && '
+        u'if [ -s "$t" ]; then '
+        u'm=$(md5sum < "$t" | cut -d" " -f1) && mv -f "$t" "$1.$m" && '
+        u'ln -sfn "$e.$m" "$t" && mv -Tf "$t" "$1" && '
+        u'{ [ -z "$old" ] || [ "$old" = "$e.$m" ] || '
+        u'rm -f "${1%/*}/$old"; }; '
+        u'else test -n "$old"; fi || { rm -f "$t"; exit 1; }'
+    )
+    pairs = u' '.join(
+        u'{0} {1}'.format(shlex_quote(_package_cache_path(url)),
+                          shlex_quote(url))
+        for url in urls
+    )
+    return (
+        u'mkdir -p {cache} && '
+        u'printf "%s %s\\n" {pairs} | '
+        u'xargs -n 2 -P {concurrency} sh -c {script} _'
+    ).format(
+        cache=PACKAGE_CACHE_PATH,
+        pairs=pairs,
+        concurrency=PACKAGE_FETCH_CONCURRENCY,
+        script=shlex_quote(script),
+    )
+
+
+def fetch_packages(urls, destination, hostname=None):
+    """Fetch packages into a directory of the server.
+
+    Packages are downloaded in parallel with a single SSH command into a cache
+    keyed by URL and checksum, then hard linked (or copied when the cache is
+    on another filesystem) into ``destination``. Packages fetched before, by
+    this or an other process, are not downloaded again unless they changed.
+
+    :param urls: URLs of the packages to fetch.
+    :param str destination: The server directory to put the packages in.
+    :param str optional hostname: hostname or IP address of the remote host.
+        If ``None`` the hostname will be get from ``main.server.hostname``
+        config.
+    :return: The SSH command result.
+    """
+    links = u' && '.join(
+        u'{{ ln -fL {0} {1} || cp -f {0} {1}; }}'.format(
+            shlex_quote(_package_cache_path(url)),
+            shlex_quote(u'{0}/{1}'.format(destination, url.split('/')[-1])),
+        )
+        for url in urls
+    )
+    return ssh.command(
+        u'{0} && {1}'.format(_fetch_packages_command(urls), links),
+        hostname=hostname,
+    )
 
 
 def add_remote_execution_ssh_key(hostname, key_path=None, **kwargs):
@@ -534,18 +630,17 @@ def create_repo(name, repo_fetch_url=None, packages=None, wipe_repodata=False,
         # Add trailing slash if it's not there already
         if not repo_fetch_url.endswith('/'):
             repo_fetch_url += '/'
-        for package in packages:
-            result = ssh.command(
-                'wget -P {} {}'
-                .format(repo_path, urljoin(repo_fetch_url, package)),
-                hostname=hostname,
+        result = fetch_packages(
+            [urljoin(repo_fetch_url, package) for package in packages],
+            repo_path,
+            hostname=hostname,
+        )
+        if result.return_code != 0:
+            raise CLIReturnCodeError(
+                result.return_code,
+                result.stderr,
+                'Unable to download packages {}'.format(', '.join(packages)),
             )
-            if result.return_code != 0:
-                raise CLIReturnCodeError(
-                    result.return_code,
-                    result.stderr,
-                    'Unable to download package {}'.format(package),
-                )
     if wipe_repodata:
         result = ssh.command(
             'rm -rf {}/{}'.format(repo_path, 'repodata/'),
@@ -557,7 +652,19 @@ def create_repo(name, repo_fetch_url=None, packages=None, wipe_repodata=False,
                 result.stderr,
                 'Unable to delete repodata folder',
             )
-    result = ssh.command('createrepo {}'.format(repo_path), hostname=hostname)
+    # Only update the repository metadata when the packages changed since the
+    # last call, reusing the existing metadata of unchanged packages. A package
+    # fetched again has the same name but not the same size or modification
+    # time. ls -l isn't used as the hard link counts change with other repos.
+    result = ssh.command(
+        u'cd {0} && '
+        u'find . -maxdepth 1 -name "*.rpm" -printf "%f %s %T@\\n" | sort | '
+        u'md5sum > {1}.new; '
+        u'if [ -d repodata ] && cmp -s {1}.new {1}; then rm -f {1}.new; '
+        u'else createrepo --update . && mv -f {1}.new {1}; fi'
+        .format(repo_path, REPO_PACKAGES_CHECKSUM_FILE),
+        hostname=hostname,
+    )
     if result.return_code != 0:
         raise CLIReturnCodeError(
             result.return_code,
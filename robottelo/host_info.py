@@ -3,80 +3,73 @@ import logging
 
 import re
 from robottelo.cli.base import CLIReturnCodeError
-from robottelo.helpers import lru_cache
+from robottelo.server_facts import get_server_facts
 
 from robottelo import ssh
 LOGGER = logging.getLogger(__name__)
 
 
-@lru_cache(maxsize=1)
 def get_host_os_version():
-    """Fetches host's OS version through SSH
+    """Fetches host's OS version from the server facts snapshot, see
+    :func:`robottelo.server_facts.get_server_facts`.
+
     :return: str with version
     """
-    cmd = ssh.command('cat /etc/redhat-release')
-    if cmd.stdout:
-        version_description = cmd.stdout[0]
+    os_release = get_server_facts()['os_release']
+    if os_release:
         version_re = (
             r'Red Hat Enterprise Linux Server release (?P<version>\d(\.\d)*)'
         )
-        result = re.search(version_re, version_description)
+        result = re.search(version_re, os_release)
         if result:
             host_os_version = 'RHEL{}'.format(result.group('version'))
             LOGGER.debug('Host version: {}'.format(host_os_version))
             return host_os_version
 
-    LOGGER.warning('Host version not available: {!r}'.format(cmd))
+    LOGGER.warning('Host version not available: {!r}'.format(os_release))
     return 'Not Available'
 
 
-_SAT_6_2_VERSION_COMMAND = u'rpm -q satellite'
-
-_SAT_6_1_VERSION_COMMAND = (
-    u'grep "VERSION" /usr/share/foreman/lib/satellite/version.rb'
-)
-
-
-@lru_cache(maxsize=1)
 def get_host_sat_version():
-    """Fetches host's Satellite version through SSH
+    """Fetches host's Satellite version from the server facts snapshot, see
+    :func:`robottelo.server_facts.get_server_facts`. The version of the
+    satellite package is used, falling back to the one of the version.rb file
+    for Satellite 6.1.
+
     :return: Satellite version
     :rtype: version
     """
-    commands = (
-        _extract_sat_version(c) for c in
-        (_SAT_6_2_VERSION_COMMAND, _SAT_6_1_VERSION_COMMAND)
-    )
-    for version, ssh_result in commands:
+    facts = get_server_facts()
+    for description in (facts['satellite'], facts['version_rb']):
+        version = _extract_sat_version(description)
         if version != 'Not Available':
             LOGGER.debug('Host Satellite version: {}'.format(version))
             return version
 
     LOGGER.warning(
-        'Host Satellite version not available: {!r}'.format(ssh_result)
+        'Host Satellite version not available: {!r}'.format(
+            facts['version_rb'])
     )
     return version
 
 
-def _extract_sat_version(ssh_cmd):
+def _extract_sat_version(version_description):
     """Extracts Satellite version if possible or 'Not Available' otherwise
 
-    :param ssh_cmd: str ssh command
+    :param version_description: str describing the version, e.g. the version
+        of the satellite package
     :return: Satellite version
     :rtype: str
     """
-    ssh_result = ssh.command(ssh_cmd)
-    if ssh_result.stdout:
-        version_description = ssh_result.stdout[0]
+    if version_description:
         version_re = (
             r'[^\d]*(?P<version>\d(\.\d){1})'
         )
         result = re.search(version_re, version_description)
         if result:
-            host_sat_version = result.group('version')
-            return host_sat_version, ssh_result
+            return result.group('version')
 
-    return 'Not Available', ssh_result
+    return 'Not Available'
 
 
 def get_repo_files(repo_path, extension='rpm', hostname=None):
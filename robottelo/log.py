@@ -1,30 +1,172 @@
 """Utilities to help work with log files"""
+import base64
+import io
 import os
 import re
+import tarfile
+import tempfile
+
+from collections import OrderedDict
 
 from robottelo import ssh
 from robottelo.config.base import get_project_root
+from six.moves import shlex_quote
 
 LOGS_DATA_DIR = os.path.join(get_project_root(), 'data', 'logs')
 
+#: The server logs captured by default by :class:`LogCapture`. Pulp logs to
+#: syslog.
+SERVER_LOGS = (
+    '/var/log/foreman/production.log',
+    '/var/log/candlepin/candlepin.log',
+    '/var/log/candlepin/error.log',
+    '/var/log/messages',
+)
+
+
+def get_log_size(remote_path, hostname=None):
+    """Return the size in bytes of a remote log file.
+
+    Record it at the start of a test and give it as the ``offset`` of a
+    :class:`LogFile` to only read what the test logged.
+
+    :param str remote_path: The path of the log file on the remote host.
+    :param str hostname: The remote host, the server if ``None``.
+    :raises IOError: If the log file can't be found.
+    """
+    result = ssh.command(
+        u'stat -c %s {0}'.format(shlex_quote(remote_path)),
+        hostname=hostname,
+        output_format='plain',
+    )
+    if result.return_code != 0:
+        raise IOError(u'Could not stat {0}: {1}'.format(
+            remote_path, result.stderr))
+    return int(result.stdout.strip())
+
 
 class LogFile(object):
     """
-    References a remote log file. The log file will be downloaded to allow
-    operate on it using python
+    References a remote log file, or the part of it written after ``offset``.
+
+    The lines are downloaded on first use, only the bytes of the window
+    between ``offset`` and the file size when the object was created or last
+    refreshed, and are read lazily from the local copy. :meth:`filter` results
+    are cached and only the new lines are scanned after a :meth:`refresh`.
+    :meth:`grep` filters the window on the remote host without downloading
+    it. The local copy is a temporary file removed by :meth:`close`::
+
+        offset = get_log_size('/var/log/foreman/production.log')
+        # ... run the test ...
+        with LogFile('/var/log/foreman/production.log',
+                     offset=offset) as log:
+            errors = log.grep(' ERROR ')
+
+    :param str remote_path: The path of the log file on the remote host.
+    :param str pattern: The default pattern of :meth:`filter` and
+        :meth:`grep`.
+    :param int offset: The position of the first byte to read.
+    :param str hostname: The remote host, the server if ``None``.
+    :raises IOError: If the log file can't be found.
     """
 
-    def __init__(self, remote_path, pattern=None):
+    def __init__(self, remote_path, pattern=None, offset=0, hostname=None):
         self.remote_path = remote_path
         self.pattern = pattern
+        self.offset = offset
+        self.hostname = hostname
+        self.end = offset
+        self.local_path = None
+        # number of bytes of the window downloaded to local_path
+        self._downloaded = 0
+        # maps patterns to [local_path position scanned to, matching lines]
+        self._filters = {}
+        self.refresh()
+
+    @classmethod
+    def follow(cls, remote_path, pattern=None, hostname=None):
+        """Return a :class:`LogFile` starting at the current end of the
+        remote log file. Call :meth:`refresh` to read what was logged since.
+        """
+        return cls(
+            remote_path,
+            pattern=pattern,
+            offset=get_log_size(remote_path, hostname),
+            hostname=hostname,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Remove the local copy of the window. It is downloaded again if the
+        lines are read afterwards.
+        """
+        if self.local_path is not None:
+            if os.path.exists(self.local_path):
+                os.remove(self.local_path)
+            self.local_path = None
+            self._downloaded = 0
+
+    def refresh(self):
+        """Extend the window to the current end of the remote log file.
+
+        If the file was rotated or truncated, the window restarts at its
+        beginning.
+        """
+        size = get_log_size(self.remote_path, self.hostname)
+        if size < self.end:
+            self.offset = 0
+            self._downloaded = 0
+            self._filters = {}
+            if self.local_path is not None:
+                io.open(self.local_path, 'wb').close()
+        self.end = size
+
+    def _download(self):
+        """Download the bytes of the window not downloaded yet."""
+        if self.local_path is None:
+            handle, self.local_path = tempfile.mkstemp(
+                prefix=u'robottelo-{0}.'.format(
+                    os.path.basename(self.remote_path)),
+                dir=tempfile.gettempdir(),
+            )
+            os.close(handle)
+        missing = self.end - self.offset - self._downloaded
+        if missing <= 0:
+            return
+        with io.open(self.local_path, 'ab') as local_file:
+            self._downloaded += ssh.download_file_range(
+                self.remote_path,
+                local_file,
+                offset=self.offset + self._downloaded,
+                length=missing,
+                hostname=self.hostname,
+            )
+
+    def _lines(self, start=0):
+        """Yield ``(position after the line, line)`` for the local lines
+        starting at ``start``.
+        """
+        self._download()
+        with io.open(self.local_path, 'rb') as local_file:
+            local_file.seek(start)
+            for line in local_file:
+                start += len(line)
+                yield start, line.decode('utf-8', 'replace')
+
+    def lines(self):
+        """Lazily yield the lines of the window."""
+        for _, line in self._lines():
+            yield line
 
-        if not os.path.isdir(LOGS_DATA_DIR):
-            os.makedirs(LOGS_DATA_DIR)
-        self.local_path = os.path.join(LOGS_DATA_DIR,
-                                       os.path.basename(remote_path))
-        ssh.download_file(remote_path, self.local_path)
-        with open(self.local_path) as file_:
-            self.data = file_.readlines()
+    @property
+    def data(self):
+        """The list of the lines of the window."""
+        return list(self.lines())
 
     def filter(self, pattern=None):
         """
@@ -35,11 +177,156 @@ class LogFile(object):
             pattern = self.pattern
 
         compiled = re.compile(pattern)
+        scanned, result = self._filters.setdefault(pattern, [0, []])
+        tail = []
 
-        result = []
-
-        for line in self.data:
+        for position, line in self._lines(scanned):
+            if not line.endswith(u'\n'):
+                # a line still being written, matched but not cached
+                if compiled.search(line) is not None:
+                    tail.append(line)
+                break
             if compiled.search(line) is not None:
                 result.append(line)
+            scanned = position
+
+        self._filters[pattern][0] = scanned
+        return result + tail
+
+    def grep(self, pattern=None):
+        """Filter the window on the remote host with ``grep -P`` using the
+        pattern argument or object's pattern. Perl regular expressions are
+        close to python ones but not identical.
+
+        :return: The list of the matching lines.
+        :raises IOError: If grep fails.
+        """
+        if pattern is None:
+            pattern = self.pattern
+        result = ssh.command(
+            u'tail -c +{start} {path} | head -c {length} | '
+            u'grep -P -e {pattern}'.format(
+                start=self.offset + 1,
+                path=shlex_quote(self.remote_path),
+                length=self.end - self.offset,
+                pattern=shlex_quote(pattern),
+            ),
+            hostname=self.hostname,
+            output_format='plain',
+        )
+        # grep exits with 1 when no line matches
+        if result.return_code == 1:
+            return []
+        if result.return_code != 0:
+            raise IOError(u'Could not grep {0}: {1}'.format(
+                self.remote_path, result.stderr))
+        return (result.stdout or u'').splitlines(True)
+
+
+class LogCapture(object):
+    """Capture what several remote log files got while a test ran.
+
+    :meth:`mark` records the size of all the log files and :meth:`diff`
+    fetches what was appended since, each with a single SSH command. The
+    appended regions are transferred as a compressed archive::
+
+        capture = LogCapture()
+        capture.mark()
+        # ... run the test ...
+        for path, text in capture.diff().items():
+            print(path, text)
 
-        return result
+    :param remote_paths: The paths of the log files on the remote host.
+    :param str hostname: The remote host, the server if ``None``.
+    :param int max_bytes: Maximum number of bytes fetched per log file. Only
+        the last ``max_bytes`` of bigger regions are fetched.
+    """
+
+    def __init__(self, remote_paths=SERVER_LOGS, hostname=None,
+                 max_bytes=10 * 1024 * 1024):
+        self.remote_paths = tuple(remote_paths)
+        self.hostname = hostname
+        self.max_bytes = max_bytes
+        self.offsets = {}
+
+    def mark(self):
+        """Record the size of the log files. Missing log files are ignored.
+
+        :return: A dict mapping the found log files to their size.
+        """
+        # stat fails when some files are missing but reports the others
+        result = ssh.command(
+            u'stat -c "%s %n" -- {0} 2>/dev/null'.format(
+                u' '.join(shlex_quote(path) for path in self.remote_paths)),
+            hostname=self.hostname,
+            output_format='plain',
+        )
+        self.offsets = {}
+        for line in (result.stdout or u'').splitlines():
+            size, _, path = line.partition(u' ')
+            if path in self.remote_paths:
+                self.offsets[path] = int(size)
+        return self.offsets
+
+    def log_file(self, remote_path, pattern=None):
+        """Return a :class:`LogFile` of what ``remote_path`` got since the
+        last :meth:`mark`.
+        """
+        return LogFile(
+            remote_path,
+            pattern=pattern,
+            offset=self.offsets.get(remote_path, 0),
+            hostname=self.hostname,
+        )
+
+    def diff(self):
+        """Fetch what the log files got since the last :meth:`mark`.
+
+        Log files which were rotated or truncated are fetched from their
+        beginning and log files created since the mark are fetched whole.
+
+        :return: An ordered dict mapping the log files which got new lines to
+            these lines.
+        """
+        regions = []
+        for index, path in enumerate(self.remote_paths):
+            regions.append(
+                u'if [ -f {path} ]; then '
+                u'if [ $(stat -c %s {path}) -lt {offset} ]; then o=1; '
+                u'else o={start}; fi; '
+                u'tail -c +$o {path} | tail -c {max_bytes} > {index}; '
+                u'fi'.format(
+                    path=shlex_quote(path),
+                    offset=self.offsets.get(path, 0),
+                    start=self.offsets.get(path, 0) + 1,
+                    max_bytes=self.max_bytes,
+                    index=index,
+                )
+            )
+        result = ssh.command(
+            u'd=$(mktemp -d) && cd $d && {{ {0}; '
+            u'tar czf - . | base64; }}; '
+            u'cd / && rm -rf $d'.format(u'; '.join(regions)),
+            hostname=self.hostname,
+            output_format='plain',
+        )
+        if result.return_code != 0:
+            raise IOError(u'Could not fetch the logs {0}: {1}'.format(
+                u', '.join(self.remote_paths), result.stderr))
+        appended = {}
+        archive = tarfile.open(
+            fileobj=io.BytesIO(base64.b64decode(result.stdout or u'')),
+            mode='r:gz',
+        )
+        with archive:
+            for member in archive.getmembers():
+                if not member.isfile() or member.size == 0:
+                    continue
+                path = self.remote_paths[int(os.path.basename(member.name))]
+                appended[path] = archive.extractfile(member).read().decode(
+                    'utf-8', 'replace')
+        return OrderedDict(
+            (path, appended[path])
+            for path in self.remote_paths
+            if path in appended
+        )
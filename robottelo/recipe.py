@@ -0,0 +1,241 @@
+# -*- encoding: utf-8 -*-
+"""Run setup recipes as a graph of dependent steps
+
+Content setup helpers chain many steps (create organization, lifecycle
+environment, product, repository, sync, content view, publish, promote,
+activation key...) where a lot of them don't depend on each other. A
+:class:`Recipe` declares each step with the steps it requires and runs
+independent steps concurrently::
+
+    recipe = Recipe('custom repo')
+    recipe.add('org', make_org)
+    recipe.add('lce', make_lce, requires=('org',))
+    recipe.add('cv', make_cv, requires=('org',))
+    recipe.add('promote', promote, requires=('cv', 'lce'))
+    results = recipe.run(provided={'org': org_id})
+    results['cv']
+
+Each step function is called with the results of its required steps, in the
+order they are listed, and runs only once per :meth:`Recipe.run`. Values
+given through ``provided`` are used instead of running their steps, which is
+how "use the given entity or create a new one" options are handled. A
+timeline of every step is logged and available as ``results.timeline``.
+
+:class:`robottelo.cli.base.Base` keeps the sub command on the hammer command
+class, so two threads running commands of the same class may run the wrong
+sub command. Steps declare the hammer command classes they use and the steps
+using the same class never run at the same time::
+
+    recipe.add('cv_repo', add_repository, requires=('cv', 'repo'),
+               uses=(ContentView,))
+
+The steps run with the task timeout of the thread calling :meth:`Recipe.run`,
+see :func:`robottelo.tasks.task_timeout`.
+"""
+import logging
+import threading
+import time
+
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+
+from robottelo.tasks import current_task_timeout, task_timeout
+
+LOGGER = logging.getLogger(__name__)
+
+#: A recipe step. ``func`` is called with the results of ``requires``, while
+#: no other step using one of the ``uses`` hammer command classes runs.
+Step = namedtuple('Step', 'name func requires uses')
+
+#: Timing of a step. ``started`` and ``finished`` are seconds since the start
+#: of the recipe, both are ``None`` for the steps provided, not run or
+#: cancelled.
+StepRecord = namedtuple('StepRecord', 'name started finished thread status')
+
+# maps hammer command classes to the lock of the steps using them
+_class_locks = {}
+_class_locks_lock = threading.Lock()
+
+
+@contextmanager
+def _using(classes):
+    """Hold the locks of the hammer command classes for the duration of the
+    ``with`` block. They are taken in the same order by all the steps so two
+    steps can't wait for each other.
+    """
+    with _class_locks_lock:
+        locks = [
+            _class_locks.setdefault(cls, threading.Lock())
+            for cls in sorted(set(classes), key=id)
+        ]
+    for lock in locks:
+        lock.acquire()
+    try:
+        yield
+    finally:
+        for lock in reversed(locks):
+            lock.release()
+
+
+class RecipeError(Exception):
+    """Indicates that a recipe is not valid."""
+
+
+class RecipeResult(dict):
+    """The results of a recipe run, mapping step names to their results.
+
+    :param timeline: The list of :class:`StepRecord` of the run, ordered by
+        start time.
+    """
+
+    def __init__(self, results, timeline):
+        super(RecipeResult, self).__init__(results)
+        self.timeline = timeline
+
+    def format_timeline(self):
+        """Return the timeline as a human readable table."""
+        lines = []
+        for record in self.timeline:
+            if record.started is None:
+                lines.append(u'{0:<24} {1}'.format(
+                    record.name, record.status))
+            else:
+                lines.append(u'{0:<24} {1:>8.2f}s -> {2:>8.2f}s  {3}'.format(
+                    record.name,
+                    record.started,
+                    record.finished,
+                    record.status,
+                ))
+        return u'\n'.join(lines)
+
+
+class Recipe(object):
+    """A graph of setup steps.
+
+    :param str name: The recipe name, used when logging its timeline.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._steps = {}
+        self._order = []
+
+    def add(self, name, func, requires=(), uses=()):
+        """Add a step to the recipe.
+
+        :param str name: The step name, also the key of its result.
+        :param func: The callable run by the step, receiving the results of
+            ``requires`` as positional arguments.
+        :param requires: The names of the steps which must be run before.
+        :param uses: The hammer command classes, e.g.
+            :class:`robottelo.cli.org.Org`, whose commands the step runs.
+        :raises robottelo.recipe.RecipeError: If a step with the same name was
+            already added or a required step is unknown.
+        """
+        if name in self._steps:
+            raise RecipeError(u'Step {0} already added'.format(name))
+        for required in requires:
+            if required not in self._steps:
+                raise RecipeError(u'Step {0} requires unknown step {1}'.format(
+                    name, required))
+        self._steps[name] = Step(name, func, tuple(requires), tuple(uses))
+        self._order.append(name)
+
+    def run(self, provided=None, max_workers=4):
+        """Run the recipe steps, each as soon as its required steps finished.
+
+        :param dict provided: Maps step names to results to use instead of
+            running the step. ``None`` values are ignored.
+        :param int max_workers: Maximum number of steps running at the same
+            time.
+        :return: A :class:`RecipeResult` with the results of all the steps.
+        :raises: The exception of the first failed step. The steps not
+            started yet are cancelled and the exception is raised once the
+            running ones, which can't be interrupted, finished.
+        """
+        results = dict(
+            (name, value) for name, value in (provided or {}).items()
+            if value is not None and name in self._steps
+        )
+        remaining = [name for name in self._order if name not in results]
+        records = {}
+        start = time.time()
+        error = None
+        running = {}
+        # the task timeout is per thread, the steps run in the executor ones
+        timeout = current_task_timeout()
+
+        def call(step, args):
+            started = time.time() - start
+            try:
+                with task_timeout(timeout), _using(step.uses):
+                    return step.func(*args)
+            finally:
+                records[step.name] = StepRecord(
+                    step.name,
+                    started,
+                    time.time() - start,
+                    threading.current_thread().name,
+                    u'done',
+                )
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            while error is None and (remaining or running):
+                for name in list(remaining):
+                    step = self._steps[name]
+                    if all(req in results for req in step.requires):
+                        remaining.remove(name)
+                        args = [results[req] for req in step.requires]
+                        running[executor.submit(call, step, args)] = name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    if future.exception() is None:
+                        results[name] = future.result()
+                    else:
+                        records[name] = records[name]._replace(
+                            status=u'failed')
+                        if error is None:
+                            error = future.exception()
+        finally:
+            # on failure, don't start the queued steps but wait for the
+            # running ones, so nothing runs behind the caller's back
+            cancelled = [
+                name for future, name in running.items() if future.cancel()]
+            executor.shutdown(wait=True)
+        for future, name in running.items():
+            if future.cancelled():
+                continue
+            if future.exception() is None:
+                results[name] = future.result()
+            else:
+                records[name] = records[name]._replace(status=u'failed')
+                LOGGER.warning(
+                    u'Recipe %s step %s failed too: %s',
+                    self.name, name, future.exception()
+                )
+        timeline = sorted(
+            records.values(), key=lambda record: record.started)
+        timeline.extend(
+            StepRecord(name, None, None, None, u'cancelled')
+            for name in cancelled
+        )
+        timeline.extend(
+            StepRecord(name, None, None, None, u'provided')
+            for name in self._order
+            if name in results and name not in records
+        )
+        timeline.extend(
+            StepRecord(name, None, None, None, u'not run')
+            for name in remaining
+        )
+        result = RecipeResult(results, timeline)
+        LOGGER.debug(
+            u'Recipe %s timeline:\n%s', self.name, result.format_timeline())
+        if error is not None:
+            raise error
+        return result
@@ -0,0 +1,252 @@
+# -*- encoding: utf-8 -*-
+"""Restore expensive content fixtures from server savepoints
+
+Building some shared states through hammer or the API takes a long time: an
+organization with a manifest, a synced RHEL repository, a published and
+promoted content view... A savepoint is an offline backup of the Satellite
+database and pulp content taken right after such a state was built, together
+with the fixture result (the ids of the created entities). Next sessions
+restore the savepoint instead of rebuilding the state::
+
+    from robottelo.savepoint import savepoint
+
+    @savepoint('org_with_rhel7_repo')
+    def org_with_rhel7_repo():
+        return setup_org_for_a_rh_repo({...})
+
+    class SomeTestCase(CLITestCase):
+
+        @classmethod
+        def setUpClass(cls):
+            super(SomeTestCase, cls).setUpClass()
+            cls.setup = org_with_rhel7_repo()
+
+The decorated function is also a shared function, see
+:func:`robottelo.decorators.func_shared.shared.shared`, so the build happens
+once and every test reuses its result.
+
+Savepoints are only used when ``[savepoint] enabled`` is set, otherwise the
+function is simply called. Backups and restores stop the Satellite services
+and a restore replaces all the server data, so they must only be enabled when
+the server is a sandbox dedicated to the test session. For the same reason a
+savepoint is never restored in the middle of a session, it would delete the
+entities the tests, the pytest-xdist workers, the shared functions and
+:mod:`robottelo.cli.default_entities` already created. The ``[savepoint]
+restore`` savepoint is restored by :func:`restore_session_savepoint` when
+the session starts, before any test runs, and its fixture returns the saved
+result. The other savepoint fixtures are built on top of it, and saved if
+their savepoint doesn't exist yet. The savepoint fixtures of all the
+processes of a session are serialized through the shared function storage
+when it is enabled.
+
+Existing backups, like the ``[performance]`` ``fresh_install_savepoint`` and
+``enabled_repos_savepoint`` ones, can be restored by giving their absolute
+path to :func:`restore_savepoint`.
+"""
+import datetime
+import functools
+import io
+import json
+import logging
+import os
+import posixpath
+import threading
+
+from contextlib import contextmanager
+from six.moves import shlex_quote
+
+from robottelo import ssh
+from robottelo.config import settings
+from robottelo.decorators import setting_is_set
+from robottelo.decorators.func_shared.shared import (
+    get_shared_key,
+    get_shared_storage,
+    shared,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+#: Name of the file storing a savepoint metadata in its directory
+METADATA_FILE = 'robottelo.json'
+
+#: Environment variable holding the savepoint restored when the session
+#: started, inherited by the pytest-xdist workers
+RESTORED_SAVEPOINT_ENV = 'ROBOTTELO_RESTORED_SAVEPOINT'
+
+# serializes the savepoint fixtures of the process without shared storage
+_lock = threading.Lock()
+# shared storage key of the lock serializing the savepoint fixtures
+_LOCK_KEY = 'savepoint.lock'
+
+
+class SavepointError(Exception):
+    """Indicates that a savepoint could not be created or restored."""
+
+
+def savepoints_enabled():
+    """Whether savepoints are configured and enabled."""
+    return setting_is_set('savepoint') and settings.savepoint.enabled
+
+
+def savepoint_path(name):
+    """Return the directory on the server storing the savepoint ``name``."""
+    if posixpath.isabs(name):
+        return name
+    return posixpath.join(settings.savepoint.directory, name)
+
+
+def _run(cmd, timeout=None):
+    """Run a command on the server raising ``SavepointError`` on failure."""
+    result = ssh.command(cmd, timeout=timeout)
+    if result.return_code != 0:
+        raise SavepointError(u'Command "{0}" failed:\n{1}'.format(
+            cmd, u'\n'.join(result.stderr or result.stdout or [])))
+    return result.stdout
+
+
+def get_savepoint(name):
+    """Return the metadata of the savepoint ``name`` or ``None`` if it doesn't
+    exist.
+
+    :return: A dict with the ``backup`` directory to restore, the ``result``
+        of the fixture and the ``created`` UTC date.
+    """
+    path = savepoint_path(name)
+    result = ssh.command(
+        u'cat {0}'.format(shlex_quote(posixpath.join(path, METADATA_FILE))))
+    if result.return_code == 0:
+        return json.loads(u'\n'.join(result.stdout))
+    if posixpath.isabs(name) and ssh.command(
+            u'test -d {0}'.format(shlex_quote(path))).return_code == 0:
+        # a backup not created by create_savepoint
+        return {'backup': path, 'result': None, 'created': None}
+    return None
+
+
+def create_savepoint(name, result=None):
+    """Take an offline backup of the server state as the savepoint ``name``.
+
+    :param str name: The savepoint name.
+    :param result: The JSON compatible fixture result stored with the
+        savepoint and returned when restoring it.
+    :return: The savepoint metadata.
+    """
+    path = savepoint_path(name)
+    _run(u'rm -rf {0} && mkdir -p {0} && chmod 0777 {0}'.format(
+        shlex_quote(path)))
+    _run(
+        settings.savepoint.backup_command.format(path=shlex_quote(path)),
+        timeout=settings.savepoint.timeout,
+    )
+    # backup tools store the backup in a timestamped sub directory
+    backup = _run(
+        u'find {0} -mindepth 1 -maxdepth 1 -type d | sort | tail -n 1'
+        .format(shlex_quote(path))
+    )
+    metadata = {
+        'backup': backup[0] if backup and backup[0] else path,
+        'result': result,
+        'created': datetime.datetime.utcnow().isoformat(),
+    }
+    ssh.upload_file(
+        io.BytesIO(json.dumps(metadata).encode('utf-8')),
+        posixpath.join(path, METADATA_FILE),
+    )
+    LOGGER.info(u'Created savepoint %s in %s', name, metadata['backup'])
+    return metadata
+
+
+def restore_savepoint(name):
+    """Restore the server state from the savepoint ``name``.
+
+    :return: The fixture result stored with the savepoint.
+    :raises robottelo.savepoint.SavepointError: If the savepoint doesn't
+        exist or could not be restored.
+    """
+    metadata = get_savepoint(name)
+    if metadata is None:
+        raise SavepointError(u'Savepoint {0} not found'.format(name))
+    _run(
+        settings.savepoint.restore_command.format(
+            path=shlex_quote(metadata['backup'])),
+        timeout=settings.savepoint.timeout,
+    )
+    LOGGER.info(u'Restored savepoint %s from %s', name, metadata['backup'])
+    return metadata['result']
+
+
+def restore_session_savepoint():
+    """Restore the ``[savepoint] restore`` savepoint.
+
+    It must be called when the test session starts, before any test created
+    entities and before the pytest-xdist workers are started, as the restore
+    replaces all the server data.
+
+    :return: The name of the restored savepoint, ``None`` if no savepoint was
+        restored.
+    """
+    name = settings.savepoint.restore if savepoints_enabled() else None
+    if not name:
+        return None
+    if get_savepoint(name) is None:
+        LOGGER.warning(
+            u'Savepoint %s not found, its fixture will build it', name)
+        return None
+    restore_savepoint(name)
+    os.environ[RESTORED_SAVEPOINT_ENV] = name
+    return name
+
+
+@contextmanager
+def _savepoint_lock():
+    """Hold a lock shared by the processes of the session, or by the threads
+    of the process when the shared function is disabled.
+    """
+    storage = get_shared_storage()
+    if storage is None:
+        with _lock:
+            yield
+        return
+    with storage.lock(get_shared_key(_LOCK_KEY)) as handler:
+        storage.when_lock_acquired(handler)
+        yield
+
+
+def savepoint(name, **shared_kwargs):
+    """Decorate a fixture function building an expensive server state so the
+    state is saved as the savepoint ``name`` when it is built.
+
+    When the savepoint ``name`` was restored at the start of the session,
+    see :func:`restore_session_savepoint`, the saved result is returned
+    instead of building the state again.
+
+    The fixture result must be JSON compatible.
+
+    :param str name: The savepoint name.
+    :param shared_kwargs: Extra arguments for
+        :func:`robottelo.decorators.func_shared.shared.shared`.
+    """
+    def decorator(func):
+
+        @shared(**shared_kwargs)
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not savepoints_enabled():
+                return func(*args, **kwargs)
+            with _savepoint_lock():
+                metadata = get_savepoint(name)
+                if metadata is None:
+                    result = func(*args, **kwargs)
+                    create_savepoint(name, result)
+                    return result
+                if os.environ.get(RESTORED_SAVEPOINT_ENV) == name:
+                    return metadata['result']
+                LOGGER.info(
+                    u'Building %s as its savepoint can only be restored when '
+                    u'the session starts, see [savepoint] restore', name
+                )
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,159 @@
+# -*- encoding: utf-8 -*-
+"""Snapshot of the facts about a server which don't change during a session
+
+The OS release, the installed Satellite version and plugins, the service list
+and the hostname of a server are gathered by a single SSH command::
+
+    from robottelo.server_facts import get_server_facts
+
+    facts = get_server_facts()
+    facts['os_release']  # 'Red Hat Enterprise Linux Server release 7.5'
+    facts['satellite']  # '6.4.0' or None for an upstream install
+
+A snapshot is kept in memory for :data:`SERVER_FACTS_TTL` seconds. When the
+shared function is enabled it is also stored in the shared function storage,
+see :func:`robottelo.decorators.func_shared.shared.shared`, so all the
+processes and pytest-xdist workers of a session use the snapshot of the first
+one gathering it.
+
+:mod:`robottelo.host_info` and :mod:`robottelo.helpers` introspection
+functions are served from the snapshot.
+"""
+import logging
+import threading
+import time
+
+from robottelo import ssh
+from robottelo.config import settings
+
+LOGGER = logging.getLogger(__name__)
+
+#: Number of seconds a server facts snapshot is used before gathering it again
+SERVER_FACTS_TTL = 3600
+
+#: Packages of the installed plugins, as rpm query patterns
+PLUGIN_PACKAGES = (
+    'tfm-rubygem-foreman*',
+    'tfm-rubygem-katello*',
+    'tfm-rubygem-hammer_cli*',
+    'rubygem-foreman*',
+    'rubygem-katello*',
+    'rubygem-smart_proxy*',
+)
+
+_GATHER_FACTS_COMMAND = u'; '.join((
+    u'echo "hostname=$(hostname -f 2>/dev/null || hostname)"',
+    u'echo "os_release=$(head -n 1 /etc/redhat-release 2>/dev/null)"',
+    u'echo "satellite=$(rpm -q satellite >/dev/null 2>&1 && '
+    u'rpm -q --qf "%{VERSION}" satellite)"',
+    u'echo "version_rb=$(grep -m 1 VERSION '
+    u'/usr/share/foreman/lib/satellite/version.rb 2>/dev/null)"',
+    u'rpm -qa --qf "plugin=%{{NAME}} %{{VERSION}}\\n" {0} 2>/dev/null'.format(
+        u' '.join(u"'{0}'".format(package) for package in PLUGIN_PACKAGES)),
+    u'{ systemctl list-unit-files --type=service --no-legend 2>/dev/null || '
+    u'chkconfig --list 2>/dev/null; } | '
+    u'awk \'{sub(/\\.service$/, "", $1); print "service=" $1}\'',
+))
+
+# maps hostnames to (gathering time, facts)
+_snapshots = {}
+_lock = threading.Lock()
+_shared_gather_server_facts = None
+
+
+def parse_server_facts(lines):
+    """Parse the output of the server facts gathering command.
+
+    :param lines: The lines of the command output.
+    :return: A dict with the ``hostname``, ``os_release``, ``satellite``
+        version, ``version_rb`` line, ``plugins`` dict mapping the plugin
+        packages to their version and ``services`` list. Empty values are
+        ``None``.
+    """
+    facts = {
+        'hostname': None,
+        'os_release': None,
+        'satellite': None,
+        'version_rb': None,
+        'plugins': {},
+        'services': [],
+    }
+    for line in lines:
+        key, _, value = line.partition(u'=')
+        value = value.strip()
+        if not value:
+            continue
+        if key == u'plugin':
+            name, _, version = value.partition(u' ')
+            facts['plugins'][name] = version
+        elif key == u'service':
+            if value not in facts['services']:
+                facts['services'].append(value)
+        elif key in facts:
+            facts[key] = value
+    return facts
+
+
+def gather_server_facts(hostname=None):
+    """Gather the facts of a server with a single SSH command, bypassing the
+    snapshots.
+
+    :param str hostname: The server hostname, ``server.hostname`` from the
+        configuration if ``None``.
+    :return: The facts, see :func:`parse_server_facts`.
+    """
+    result = ssh.command(
+        _GATHER_FACTS_COMMAND, hostname=hostname, output_format='plain')
+    facts = parse_server_facts((result.stdout or u'').splitlines())
+    LOGGER.debug(u'Gathered server facts of %s: %s', hostname, facts)
+    return facts
+
+
+def _get_shared_gather_server_facts():
+    """Return :func:`gather_server_facts` decorated as a shared function.
+
+    The decoration is deferred to the first use as configuring the shared
+    function reads the settings. It must only be called by
+    :func:`get_server_facts` as the shared function key includes the names
+    of the calling functions.
+    """
+    global _shared_gather_server_facts
+    if _shared_gather_server_facts is None:
+        # imported here as robottelo.decorators imports robottelo.host_info
+        from robottelo.decorators.func_shared.shared import shared
+        _shared_gather_server_facts = shared(
+            timeout=SERVER_FACTS_TTL,
+            function_kw=['hostname'],
+        )(gather_server_facts)
+    return _shared_gather_server_facts
+
+
+def get_server_facts(hostname=None, refresh=False):
+    """Return the snapshot of the facts of a server, gathering it when there
+    is none or it is older than :data:`SERVER_FACTS_TTL`.
+
+    :param str hostname: The server hostname, ``server.hostname`` from the
+        configuration if ``None``.
+    :param bool refresh: Whether to gather the facts again in this process
+        even if the snapshot is still valid.
+    :return: The facts, see :func:`parse_server_facts`.
+    """
+    if hostname is None:
+        hostname = settings.server.hostname
+    with _lock:
+        snapshot = _snapshots.get(hostname)
+        if (not refresh and snapshot is not None and
+                time.time() - snapshot[0] < SERVER_FACTS_TTL):
+            return snapshot[1]
+        if refresh:
+            facts = gather_server_facts(hostname=hostname)
+        else:
+            facts = _get_shared_gather_server_facts()(hostname=hostname)
+        _snapshots[hostname] = (time.time(), facts)
+        return facts
+
+
+def clear_server_facts():
+    """Forget the server facts snapshots of this process."""
+    with _lock:
+        _snapshots.clear()
@@ -254,6 +254,44 @@ def download_file(remote_file, local_file=None, hostname=None):
             sftp.close()
 
 
+def download_file_range(remote_file, local_file, offset=0, length=None,
+                        hostname=None, chunk_size=1024 * 1024, pipeline=4):
+    """Download a byte range of a remote file, streaming it to a local file.
+    At most ``pipeline`` chunks are held in memory. If ``hostname`` is not
+    provided will be used the server.
+
+    :param remote_file: the remote file path.
+    :param local_file: a writable file-like object receiving the bytes.
+    :param int offset: the position of the first byte to download.
+    :param int length: the number of bytes to download. Everything from
+        ``offset`` to the end of the file if ``None``.
+    :param int chunk_size: the number of bytes read at once.
+    :param int pipeline: the number of chunks requested at once. paramiko
+        prefetches all the chunks of a ``readv`` call, so the range is read
+        ``pipeline`` chunks after the other.
+    :return: the number of bytes downloaded.
+    """
+    with get_connection(hostname=hostname) as connection:  # pragma: no cover
+        try:
+            sftp = connection.open_sftp()
+            with sftp.open(remote_file, 'rb') as remote:
+                if length is None:
+                    length = max(remote.stat().st_size - offset, 0)
+                chunks = [
+                    (start, min(chunk_size, offset + length - start))
+                    for start in range(offset, offset + length, chunk_size)
+                ]
+                downloaded = 0
+                for index in range(0, len(chunks), pipeline):
+                    for data in remote.readv(
+                            chunks[index:index + pipeline]):
+                        local_file.write(data)
+                        downloaded += len(data)
+                return downloaded
+        finally:
+            sftp.close()
+
+
 def command(cmd, hostname=None, output_format=None, username=None,
             password=None, key_filename=None, timeout=None,
             connection_timeout=None):
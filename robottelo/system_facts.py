@@ -1,12 +1,22 @@
 """JSON representation for a RHEL server."""
 
-import copy
+import binascii
 import datetime
+import json
+import os
+import random
+import string
 
 from fauxfactory import (
     gen_alpha, gen_choice, gen_date,
     gen_integer, gen_ipaddr, gen_mac, gen_uuid
 )
+from six.moves import range
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:  # Python 2
+    from collections import MutableMapping
 
 
 def _bios_date():
@@ -189,8 +199,8 @@ def generate_system_facts(name=None):
         name = u'{0}.example.net'.format(
             gen_alpha().lower())
 
-    # Make a copy of the system facts 'template'
-    new_facts = copy.deepcopy(SYSTEM_FACTS)
+    # Make a copy of the system facts 'template', its values are strings
+    new_facts = dict(SYSTEM_FACTS)
     # Select a random RHEL version...
     distro = gen_choice(DISTRO_IDS)
 
@@ -214,3 +224,294 @@ def generate_system_facts(name=None):
     new_facts['virt.uuid'] = new_facts['dmi.system.uuid']
 
     return new_facts
+
+
+#: The facts which differ from a system to another, see
+#: :func:`generate_system_facts_batch`.
+GENERATED_FACTS = frozenset((
+    u'distribution.id',
+    u'distribution.version',
+    u'dmi.bios.relase_date',
+    u'dmi.memory.maximum_capacity',
+    u'dmi.memory.size',
+    u'dmi.system.uuid',
+    u'lscpu.architecture',
+    u'net.interface.eth1.hwaddr',
+    u'net.interface.eth1.ipaddr',
+    u'network.hostname',
+    u'network.ipaddr',
+    u'uname.machine',
+    u'uname.nodename',
+    u'uname.release',
+    u'virt.uuid',
+))
+
+# The facts shared by all the systems of the batches, never modified, and
+# their JSON without the enclosing braces.
+_SHARED_FACTS = dict(SYSTEM_FACTS)
+_SHARED_FACTS[u'dmi.system.version'] = u'RHEL'
+_SHARED_FACTS_JSON = json.dumps({
+    key: value for key, value in _SHARED_FACTS.items()
+    if key not in GENERATED_FACTS
+})[1:-1]
+
+# Map each random byte to a lowercase letter of a host name
+_NAME_LETTERS = bytes(bytearray(
+    ord(string.ascii_lowercase[index % 26]) for index in range(256)))
+_NAME_LENGTH = 10
+
+# Map the random hex digit of a UUID variant to a RFC 4122 one
+_UUID_VARIANTS = {digit: u'89ab'[int(digit, 16) & 3]
+                  for digit in u'0123456789abcdef'}
+
+
+class SystemFacts(MutableMapping):
+    """Facts of a system generated by :func:`generate_system_facts_batch`.
+
+    Only the facts of :data:`GENERATED_FACTS` are stored by each system,
+    the others are read from facts shared by all the systems which are
+    never modified: setting or deleting a fact only changes the facts of
+    this system. Use :meth:`to_dict` to get a plain ``dict``.
+
+    :param dict facts: The facts of this system.
+    :param dict shared_facts: The facts shared with the other systems.
+    """
+
+    def __init__(self, facts, shared_facts=None):
+        self._facts = facts
+        self._shared_facts = (
+            _SHARED_FACTS if shared_facts is None else shared_facts)
+
+    def __getitem__(self, key):
+        try:
+            return self._facts[key]
+        except KeyError:
+            return self._shared_facts[key]
+
+    def __setitem__(self, key, value):
+        self._facts[key] = value
+
+    def __delitem__(self, key):
+        # copy the shared facts so they are not deleted for all the systems
+        facts = self.to_dict()
+        del facts[key]
+        self._facts = facts
+        self._shared_facts = {}
+
+    def __iter__(self):
+        for key in self._facts:
+            yield key
+        for key in self._shared_facts:
+            if key not in self._facts:
+                yield key
+
+    def __len__(self):
+        return len(self._shared_facts) + sum(
+            1 for key in self._facts if key not in self._shared_facts)
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(type(self).__name__, self.to_dict())
+
+    def to_dict(self):
+        """Return the facts as a new ``dict``."""
+        facts = dict(self._shared_facts)
+        facts.update(self._facts)
+        return facts
+
+    def to_json(self):
+        """Return the facts as a JSON object on a single line."""
+        if (self._shared_facts is _SHARED_FACTS and
+                len(self._facts) == len(GENERATED_FACTS)):
+            # only the generated facts were set, the JSON of the shared
+            # ones can be reused as is
+            return u'{{{0}, {1}}}'.format(
+                _SHARED_FACTS_JSON, json.dumps(self._facts)[1:-1])
+        return json.dumps(self.to_dict())
+
+
+class _UniqueValues(object):
+    """Generate random values different from all the ones generated before.
+
+    :param generate: A function returning a list of ``count`` random values.
+    """
+
+    def __init__(self, generate):
+        self.generate = generate
+        self.seen = set()
+
+    def __call__(self, count):
+        values = []
+        while len(values) < count:
+            for value in self.generate(count - len(values)):
+                if value not in self.seen:
+                    self.seen.add(value)
+                    values.append(value)
+        return values
+
+
+def _gen_names(count):
+    """Return ``count`` random host names of the ``example.net`` domain."""
+    letters = os.urandom(count * _NAME_LENGTH).translate(
+        _NAME_LETTERS).decode('ascii')
+    return [
+        u'{0}.example.net'.format(letters[start:start + _NAME_LENGTH])
+        for start in range(0, len(letters), _NAME_LENGTH)
+    ]
+
+
+def _gen_macs(count):
+    """Return ``count`` random unicast MAC addresses."""
+    octets = bytearray(os.urandom(count * 6))
+    macs = []
+    for start in range(0, len(octets), 6):
+        octets[start] &= 0xfe
+        macs.append(
+            u'{0:02x}:{1:02x}:{2:02x}:{3:02x}:{4:02x}:{5:02x}'.format(
+                *octets[start:start + 6]))
+    return macs
+
+
+def _gen_ipaddrs(count):
+    """Return ``count`` random IPv4 addresses of the ``10.0.0.0/8``
+    network.
+    """
+    randint = random.randint
+    addresses = []
+    for _ in range(count):
+        host = randint(1, 0xfffffe)
+        addresses.append(u'10.{0}.{1}.{2}'.format(
+            host >> 16, (host >> 8) & 0xff, host & 0xff))
+    return addresses
+
+
+def _gen_uuids(count):
+    """Return ``count`` random version 4 UUIDs."""
+    digits = binascii.hexlify(os.urandom(count * 16)).decode('ascii')
+    uuids = []
+    for start in range(0, len(digits), 32):
+        uuid = digits[start:start + 32]
+        uuids.append(u'{0}-{1}-4{2}-{3}{4}-{5}'.format(
+            uuid[:8], uuid[8:12], uuid[13:16], _UUID_VARIANTS[uuid[16]],
+            uuid[17:20], uuid[20:]
+        ))
+    return uuids
+
+
+def _gen_bios_dates(count):
+    """Return ``count`` random BIOS dates, see :func:`_bios_date`."""
+    today = datetime.date.today()
+    dates = [
+        (today - datetime.timedelta(days)).strftime('%m/%d/%Y')
+        for days in range(3651)
+    ]
+    choice = random.choice
+    return [choice(dates) for _ in range(count)]
+
+
+class _SystemFactsGenerator(object):
+    """Generate batches of system facts whose host names, MAC addresses,
+    IP addresses and UUIDs are unique across all the batches.
+    """
+
+    def __init__(self):
+        self.gen_names = _UniqueValues(_gen_names)
+        self.gen_macs = _UniqueValues(_gen_macs)
+        self.gen_ipaddrs = _UniqueValues(_gen_ipaddrs)
+        self.gen_uuids = _UniqueValues(_gen_uuids)
+
+    def batch(self, count, names=None):
+        if names is None:
+            names = self.gen_names(count)
+        choice = random.choice
+        batch = []
+        for name, mac, ipaddr, uuid, bios_date in zip(
+                names, self.gen_macs(count), self.gen_ipaddrs(count),
+                self.gen_uuids(count), _gen_bios_dates(count)):
+            distro = choice(DISTRO_IDS)
+            batch.append(SystemFacts({
+                u'distribution.id': distro['id'],
+                u'distribution.version': distro['version'],
+                u'dmi.bios.relase_date': bios_date,
+                u'dmi.memory.maximum_capacity': choice(MEMORY_CAPACITY),
+                u'dmi.memory.size': choice(MEMORY_SIZE),
+                u'dmi.system.uuid': uuid,
+                u'lscpu.architecture': distro['architecture'],
+                u'net.interface.eth1.hwaddr': mac,
+                u'net.interface.eth1.ipaddr': ipaddr,
+                u'network.hostname': name,
+                u'network.ipaddr': ipaddr,
+                u'uname.machine': distro['architecture'],
+                u'uname.nodename': name,
+                u'uname.release': distro['kernel'],
+                u'virt.uuid': uuid,
+            }))
+        return batch
+
+
+def generate_system_facts_batch(count, names=None):
+    """Generate random system facts for the registration of ``count``
+    systems.
+
+    The facts are the ones of :func:`generate_system_facts` but cheaper to
+    generate in bulk: the facts common to all the systems are shared, see
+    :class:`SystemFacts`, and the random values are generated for the whole
+    batch at once. The host names, MAC addresses, IP addresses (of the
+    ``10.0.0.0/8`` network) and UUIDs are unique within the batch.
+
+    :param int count: The number of systems.
+    :param list names: The FQDNs of the systems. If not provided, random
+        ones are generated.
+    :return: A list of ``count`` :class:`SystemFacts`.
+    :rtype: list
+    """
+    if names is not None and len(names) != count:
+        raise ValueError(
+            '{0} names given for {1} systems'.format(len(names), count))
+    return _SystemFactsGenerator().batch(count, names)
+
+
+def iter_system_facts_json(count, names=None, batch_size=1000):
+    """Generate random system facts for ``count`` systems and yield them as
+    JSON, one line per system.
+
+    Only ``batch_size`` systems are in memory at once, the values unique
+    within a batch of :func:`generate_system_facts_batch` are unique across
+    all the lines.
+
+    :param int count: The number of systems.
+    :param list names: The FQDNs of the systems. If not provided, random
+        ones are generated.
+    :param int batch_size: The number of systems generated at once.
+    :return: An iterator of newline-terminated JSON objects.
+    """
+    if names is not None and len(names) != count:
+        raise ValueError(
+            '{0} names given for {1} systems'.format(len(names), count))
+    generator = _SystemFactsGenerator()
+    for start in range(0, count, batch_size):
+        size = min(batch_size, count - start)
+        batch_names = None
+        if names is not None:
+            batch_names = names[start:start + size]
+        for facts in generator.batch(size, batch_names):
+            yield facts.to_json() + u'\n'
+
+
+def write_system_facts_ndjson(stream, count, names=None, batch_size=1000):
+    """Write random system facts for ``count`` systems to ``stream`` as
+    newline-delimited JSON, for feeding registration tools.
+
+    :param stream: A text stream, for example a file opened with
+        ``io.open(path, 'w')``.
+    :param int count: The number of systems.
+    :param list names: The FQDNs of the systems. If not provided, random
+        ones are generated.
+    :param int batch_size: The number of systems generated at once.
+    :return: The number of systems written.
+    :rtype: int
+    """
+    written = 0
+    for line in iter_system_facts_json(count, names, batch_size):
+        stream.write(line)
+        written += 1
+    return written
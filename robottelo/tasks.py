@@ -0,0 +1,370 @@
+# -*- encoding: utf-8 -*-
+"""Track foreman tasks from both the CLI and the API helpers
+
+Long operations (repository syncs, content view publishes and promotes...)
+return a foreman task which used to be waited on with one blocking hammer
+process or one ``ForemanTask.poll`` loop per task. :class:`TaskTracker`
+waits on any number of tasks with a single background poll loop which looks
+up every pending task UUID with one bulk search per interval::
+
+    from robottelo.tasks import api_tracker
+
+    task_ids = [
+        entities.Repository(id=repo_id).sync(synchronous=False)['id']
+        for repo_id in repos_ids
+    ]
+    api_tracker.wait(task_ids, timeout=1500)
+
+:meth:`TaskTracker.track` returns a :class:`concurrent.futures.Future` per
+task and :meth:`TaskTracker.wait_async` an awaitable for asyncio code. The
+poll interval starts at ``poll_rate`` and backs off up to ``max_poll_rate``
+while nothing finishes.
+
+Entity methods starting a task (``sync``, ``publish``, ``promote``...) are
+called through :func:`run_task`, which waits on the task with the timeout of
+the current thread set by :func:`task_timeout` instead of the process wide
+``nailgun.entity_mixins.TASK_TIMEOUT``, so parallel setups don't clobber each
+other's timeouts::
+
+    with task_timeout(3600):
+        run_task(repo.sync)
+        run_task(content_view.publish)
+"""
+import logging
+import threading
+import time
+
+from contextlib import contextmanager
+from nailgun import entities, entity_mixins
+
+try:
+    from concurrent.futures import Future
+except ImportError:  # pragma: no cover
+    Future = None
+try:
+    import asyncio
+except ImportError:  # pragma: no cover
+    asyncio = None
+
+LOGGER = logging.getLogger(__name__)
+
+#: Default number of seconds a task is waited for
+TASK_TIMEOUT = 300
+
+#: States of a task which won't change anymore: Dynflow pauses the tasks
+#: whose execution failed
+TASK_FINISHED_STATES = (u'paused', u'stopped')
+
+#: Maximum number of tasks looked up by a single search. Each task adds about
+#: 45 characters to the search query, which must fit the URL length limits.
+TASK_SEARCH_CHUNK_SIZE = 100
+
+_context = threading.local()
+
+
+class TaskTrackerError(Exception):
+    """Indicates that tasks can't be tracked."""
+
+
+class TaskFailedError(entity_mixins.TaskFailedError):
+    """Indicates that a foreman task finished without success.
+
+    :param str task_id: The UUID of the task.
+    :param str result: The result of the task.
+    :param str state: The state of the task, ``stopped`` or ``paused``.
+    """
+
+    def __init__(self, task_id, result, state=u'stopped'):
+        self.task_id = task_id
+        self.result = result
+        self.state = state
+        if state == u'paused':
+            message = u'Task {0} paused with result {1}'
+        else:
+            message = u'Task {0} finished with result {1}'
+        super(TaskFailedError, self).__init__(message.format(task_id, result))
+
+
+class TaskTimeoutError(entity_mixins.TaskTimedOutError):
+    """Indicates that a foreman task did not finish in time.
+
+    :param str task_id: The UUID of the task.
+    :param str state: The last known state of the task.
+    """
+
+    def __init__(self, task_id, state):
+        self.task_id = task_id
+        self.state = state
+        super(TaskTimeoutError, self).__init__(
+            u'Task {0} timed out in state {1}'.format(task_id, state))
+
+
+@contextmanager
+def task_timeout(timeout):
+    """Set the task timeout of the current thread for the duration of the
+    ``with`` block. Blocks can be nested.
+
+    :param timeout: Maximum number of seconds to wait for each task started by
+        :func:`run_task`.
+    """
+    previous = getattr(_context, 'timeout', None)
+    _context.timeout = timeout
+    try:
+        yield
+    finally:
+        _context.timeout = previous
+
+
+def current_task_timeout():
+    """Return the task timeout of the current thread, set by
+    :func:`task_timeout`. Defaults to ``nailgun.entity_mixins.TASK_TIMEOUT``.
+    """
+    timeout = getattr(_context, 'timeout', None)
+    if timeout is None:
+        timeout = entity_mixins.TASK_TIMEOUT
+    return timeout
+
+
+def run_task(entity_callable, timeout=None, **kwargs):
+    """Call an entity method starting a foreman task and wait for the task.
+
+    The method is called with ``synchronous=False`` and the returned task is
+    waited on by :data:`api_tracker`, which is safe to use from several
+    threads unlike the nailgun polling.
+
+    :param entity_callable: The entity method to call, e.g.
+        ``entities.Repository(id=repo_id).sync``.
+    :param timeout: Maximum number of seconds to wait for the task. Defaults
+        to :func:`current_task_timeout`.
+    :param kwargs: The kwargs to pass to the entity callable.
+    :return: The finished task information, or the server's response if no
+        task was started.
+    :raises robottelo.tasks.TaskFailedError: If the task finished without
+        success.
+    :raises robottelo.tasks.TaskTimeoutError: If the task did not finish in
+        time.
+    """
+    if timeout is None:
+        timeout = current_task_timeout()
+    response = entity_callable(synchronous=False, **kwargs)
+    if not is_task(response):
+        return response
+    api_tracker.wait([response['id']], timeout=timeout)
+    return entities.ForemanTask(id=response['id']).read_json()
+
+
+def is_task(response):
+    """Tell whether an entity method response is a foreman task."""
+    return (
+        isinstance(response, dict) and
+        'id' in response and
+        'state' in response and
+        'pending' in response
+    )
+
+
+def task_search_chunks(task_ids):
+    """Split tasks in chunks of :data:`TASK_SEARCH_CHUNK_SIZE` looked up with
+    a single search.
+
+    :param task_ids: The UUIDs of the tasks to look up.
+    :return: A generator of ``(search, count)`` tuples, the search query of a
+        chunk of tasks and the number of tasks it matches.
+    """
+    task_ids = list(task_ids)
+    for start in range(0, len(task_ids), TASK_SEARCH_CHUNK_SIZE):
+        chunk = task_ids[start:start + TASK_SEARCH_CHUNK_SIZE]
+        yield (
+            u' or '.join(u'id = {0}'.format(task_id) for task_id in chunk),
+            len(chunk),
+        )
+
+
+def api_task_states(task_ids):
+    """Return the state and result of several tasks with an API search per
+    chunk of tasks, see :func:`task_search_chunks`.
+
+    :param task_ids: The UUIDs of the tasks to look up.
+    :return: A dict mapping each found task UUID to a ``(state, result)``
+        tuple.
+    """
+    states = {}
+    for search, count in task_search_chunks(task_ids):
+        results = entities.ForemanTask().search_json(query={
+            'search': search,
+            'per_page': count,
+        })['results']
+        states.update(
+            (task['id'], (task.get('state'), task.get('result')))
+            for task in results
+        )
+    return states
+
+
+def cli_task_states(task_ids):
+    """Return the state and result of several tasks with a ``hammer task
+    list`` call per chunk of tasks, see :func:`task_search_chunks`.
+
+    :param task_ids: The UUIDs of the tasks to look up.
+    :return: A dict mapping each found task UUID to a ``(state, result)``
+        tuple.
+    """
+    # imported here as robottelo.cli.factory imports this module
+    from robottelo.cli.task import Task
+    return Task.states(task_ids)
+
+
+class TaskTracker(object):
+    """Wait on many foreman tasks with a single poll loop.
+
+    :param task_states: A callable receiving a list of task UUIDs and
+        returning a dict mapping the found ones to ``(state, result)``
+        tuples, e.g. :func:`api_task_states` or :func:`cli_task_states`.
+    :param poll_rate: Initial number of seconds between two polls.
+    :param max_poll_rate: Maximum number of seconds between two polls.
+    :param backoff: Factor applied to the poll interval after each poll where
+        no task finished.
+    """
+
+    def __init__(self, task_states, poll_rate=1, max_poll_rate=15,
+                 backoff=1.5):
+        self.task_states = task_states
+        self.poll_rate = poll_rate
+        self.max_poll_rate = max_poll_rate
+        self.backoff = backoff
+        # maps task UUIDs to [futures, deadline, last known state]
+        self._pending = {}
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def track(self, task_id, timeout=None):
+        """Start tracking a task.
+
+        :param str task_id: The UUID of the task.
+        :param timeout: Maximum number of seconds to wait for the task.
+            Defaults to :data:`TASK_TIMEOUT`.
+        :return: A :class:`concurrent.futures.Future` resolved to a dict with
+            the task ``id``, ``state`` and ``result`` once the task finished
+            successfully. Its exception is a :class:`TaskFailedError` or a
+            :class:`TaskTimeoutError` otherwise.
+        """
+        if Future is None:
+            raise TaskTrackerError(
+                'Package futures is not installed. Install it in order to '
+                'track tasks.'
+            )
+        if timeout is None:
+            timeout = TASK_TIMEOUT
+        future = Future()
+        deadline = time.time() + timeout
+        with self._condition:
+            if task_id in self._pending:
+                entry = self._pending[task_id]
+                entry[0].append(future)
+                entry[1] = max(entry[1], deadline)
+            else:
+                self._pending[task_id] = [[future], deadline, None]
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._poll_loop, name='robottelo-task-tracker')
+                self._thread.daemon = True
+                self._thread.start()
+            else:
+                # poll soon so the new task doesn't wait a backed off interval
+                self._condition.notify()
+        return future
+
+    def wait(self, task_ids, timeout=None):
+        """Wait for several tasks.
+
+        :param task_ids: The UUIDs of the tasks.
+        :param timeout: Maximum number of seconds to wait for each task.
+        :return: The list of the finished tasks dicts, in the order of
+            ``task_ids``.
+        :raises robottelo.tasks.TaskFailedError: If a task finished without
+            success, after all the tasks finished.
+        :raises robottelo.tasks.TaskTimeoutError: If a task did not finish in
+            time, after all the tasks finished.
+        """
+        futures = [self.track(task_id, timeout) for task_id in task_ids]
+        for future in futures:
+            future.exception()
+        return [future.result() for future in futures]
+
+    def wait_async(self, task_ids, timeout=None):
+        """Same as :meth:`wait` but return an awaitable to be used from a
+        coroutine running on an asyncio event loop.
+        """
+        if asyncio is None:
+            raise TaskTrackerError('asyncio is not available.')
+        return asyncio.gather(*[
+            asyncio.wrap_future(self.track(task_id, timeout))
+            for task_id in task_ids
+        ])
+
+    def poll(self):
+        """Look up all the pending tasks once and resolve the finished ones.
+
+        :return: The number of tasks resolved.
+        """
+        with self._condition:
+            task_ids = list(self._pending)
+        if not task_ids:
+            return 0
+        try:
+            states = self.task_states(task_ids)
+        except Exception as err:
+            LOGGER.warning('Failed to poll tasks %s: %s', task_ids, err)
+            states = {}
+        resolved = []
+        now = time.time()
+        with self._condition:
+            for task_id in task_ids:
+                futures, deadline, last_state = self._pending[task_id]
+                state, result = states.get(task_id, (last_state, None))
+                if state in TASK_FINISHED_STATES:
+                    if state == u'stopped' and result == u'success':
+                        value = {
+                            'id': task_id, 'state': state, 'result': result}
+                        error = None
+                    else:
+                        value = None
+                        error = TaskFailedError(task_id, result, state)
+                elif now > deadline:
+                    value, error = None, TaskTimeoutError(task_id, state)
+                else:
+                    self._pending[task_id][2] = state
+                    continue
+                del self._pending[task_id]
+                resolved.append((futures, value, error))
+        # resolve outside of the lock as it runs the futures callbacks
+        for futures, value, error in resolved:
+            for future in futures:
+                if error is None:
+                    future.set_result(value)
+                else:
+                    future.set_exception(error)
+        return len(resolved)
+
+    def _poll_loop(self):
+        """Poll the pending tasks until there are none left."""
+        interval = self.poll_rate
+        while True:
+            with self._condition:
+                if not self._pending:
+                    self._thread = None
+                    return
+                notified = self._condition.wait(interval)
+            if notified:
+                interval = self.poll_rate
+            if self.poll():
+                interval = self.poll_rate
+            else:
+                interval = min(interval * self.backoff, self.max_poll_rate)
+
+
+#: Tracker for tasks searched through the API
+api_tracker = TaskTracker(api_task_states)
+
+#: Tracker for tasks searched through hammer
+cli_tracker = TaskTracker(cli_task_states)
@@ -167,10 +167,7 @@ class ActivationKey(Base):
         self.click(self.search(name))
         self.click(tab_locators['ak.associations'])
         self.click(locators['ak.content_hosts'])
-        return [
-            chost.text for chost
-            in self.find_elements(locators['ak.content_host_name'])
-        ]
+        return self.find_elements_text(locators['ak.content_host_name'])
 
     def search_content_host(self, name, content_host_name):
         """Search for associated content host for activation key."""
@@ -187,10 +184,7 @@ class ActivationKey(Base):
         """Fetch associated repository sets from selected activation key."""
         self.search_and_click(name)
         self.click(tab_locators['ak.tab_repository_sets'])
-        return [
-            el.text for el
-            in self.find_elements(locators['ak.repository_sets'])
-        ]
+        return self.find_elements_text(locators['ak.repository_sets'])
 
     def copy(self, name, new_name=None):
         """Copies an existing activation key"""
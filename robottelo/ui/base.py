@@ -15,6 +15,7 @@ from selenium.common.exceptions import NoSuchElementException
 from selenium.common.exceptions import TimeoutException
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions
 from selenium.webdriver.support.select import Select
@@ -23,6 +24,134 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 LOGGER = logging.getLogger(__name__)
 
+# Installs a tracker counting pending XHR and fetch requests in
+# ``window.__robottelo_idle.pending``. It lives in the page, so it is installed
+# once per page load and re-installed by the next wait after navigation.
+PAGE_IDLE_TRACKER_JS = u"""
+if (!window.__robottelo_idle) {
+    var tracker = window.__robottelo_idle = {pending: 0};
+    tracker.busy = function () {
+        if (tracker.pending > 0) {
+            return true;
+        }
+        // Requests started before the tracker was installed are only
+        // known by jQuery and angular
+        if (window.jQuery && window.jQuery.active > 0) {
+            return true;
+        }
+        try {
+            return angular.element(document).injector().get('$http')
+                .pendingRequests.length > 0;
+        } catch (err) {
+            return false;
+        }
+    };
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        var finished = false;
+        var finish = function () {
+            if (!finished) {
+                finished = true;
+                tracker.pending--;
+            }
+        };
+        tracker.pending++;
+        this.addEventListener('loadend', finish);
+        try {
+            return send.apply(this, arguments);
+        } catch (err) {
+            finish();
+            throw err;
+        }
+    };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            tracker.pending++;
+            return fetch.apply(this, arguments).then(
+                function (response) {
+                    tracker.pending--;
+                    return response;
+                },
+                function (err) {
+                    tracker.pending--;
+                    throw err;
+                }
+            );
+        };
+    }
+}
+"""
+
+# Asynchronous script which calls back with ``true`` as soon as the page is
+# idle or with ``false`` once ``arguments[0]`` milliseconds have passed. The
+# polling happens inside the browser, so only one WebDriver round-trip is made.
+PAGE_IDLE_WAIT_JS = PAGE_IDLE_TRACKER_JS + u"""
+var timeout = arguments[0];
+var interval = arguments[1];
+var callback = arguments[arguments.length - 1];
+var deadline = Date.now() + timeout;
+(function check() {
+    if (!window.__robottelo_idle.busy()) {
+        callback(true);
+    } else if (Date.now() >= deadline) {
+        callback(false);
+    } else {
+        setTimeout(check, interval);
+    }
+})();
+"""
+
+# How frequently, in milliseconds, the page idle state is checked in-browser
+PAGE_IDLE_POLL_INTERVAL = 50
+
+# Returns the state of all the elements matched by an XPath or CSS selector, or
+# of the elements passed as ``arguments[3]``, within a single script call.
+ELEMENTS_STATE_JS = u"""
+var strategy = arguments[0];
+var value = arguments[1];
+var attributes = arguments[2];
+var elements = arguments[3];
+if (elements === null) {
+    elements = [];
+    if (strategy === 'xpath') {
+        var snapshot = document.evaluate(
+            value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE,
+            null);
+        for (var i = 0; i < snapshot.snapshotLength; i++) {
+            elements.push(snapshot.snapshotItem(i));
+        }
+    } else {
+        elements = Array.prototype.slice.call(
+            document.querySelectorAll(value));
+    }
+}
+var states = [];
+for (var j = 0; j < elements.length; j++) {
+    var element = elements[j];
+    if (element.nodeType !== Node.ELEMENT_NODE) {
+        continue;
+    }
+    var style = window.getComputedStyle(element);
+    var state = {
+        element: element,
+        displayed: (
+            style.display !== 'none' && style.visibility !== 'hidden' &&
+            element.getClientRects().length > 0
+        ),
+        text: (element.innerText || element.textContent || '').trim(),
+        value: element.value === undefined ? null : element.value,
+        selected: !!(element.checked || element.selected),
+        attributes: {}
+    };
+    for (var k = 0; k < attributes.length; k++) {
+        state.attributes[attributes[k]] = element.getAttribute(attributes[k]);
+    }
+    states.push(state);
+}
+return states;
+"""
+
 
 class UIError(Exception):
     """Indicates that a UI action could not be done."""
@@ -85,29 +214,64 @@ class Base(object):
         elements in the web page.
 
         """
+        states = self.find_elements_state(locator)
+        if states is None:
+            return None
+        return [state['element'] for state in states]
+
+    def find_elements_state(self, locator, attributes=(), wait_for_ajax=True):
+        """Fetch the state of all the visible elements matched by ``locator``
+        using a single script call instead of one WebDriver call per element
+        and property.
+
+        :param tuple || Locator locator: The locator of the elements.
+        :param attributes: Names of the element attributes to be returned.
+        :param wait_for_ajax: Flag that indicates if should wait for AJAX
+            before looking for the elements.
+        :return: A list of dicts with ``element``, ``displayed``, ``text``,
+            ``value``, ``selected`` and ``attributes`` keys, in document order
+            or None if the page did not finish loading.
+
+        """
+        strategy, value = locator
         try:
-            _webelements = self.browser.find_elements(*locator)
-            self.wait_for_ajax()
-            webelements = []
-            for _webelement in _webelements:
-                if _webelement.is_displayed():
-                    webelements.append(_webelement)
-            return webelements
-        except NoSuchElementException as err:
-            self.logger.debug(
-                u'%s: Could not locate the elements of %s: %s',
-                type(err).__name__,
-                locator[1],
-                err
-            )
+            if wait_for_ajax:
+                self.wait_for_ajax()
+            if strategy in (By.XPATH, By.CSS_SELECTOR):
+                states = self.browser.execute_script(
+                    ELEMENTS_STATE_JS, strategy, value, list(attributes), None)
+            else:
+                elements = self.browser.find_elements(strategy, value)
+                states = []
+                if elements:
+                    states = self.browser.execute_script(
+                        ELEMENTS_STATE_JS,
+                        strategy,
+                        value,
+                        list(attributes),
+                        elements,
+                    )
         except TimeoutException as err:
             self.logger.debug(
                 u'%s: Waiting for locator "%s": "%s"',
                 type(err).__name__,
-                locator[1],
+                value,
                 err
             )
-        return None
+            return None
+        return [state for state in states if state['displayed']]
+
+    def find_elements_text(self, locator):
+        """Return the text of all the visible elements matched by ``locator``
+        fetched through :meth:`find_elements_state`.
+
+        :param tuple || Locator locator: The locator of the elements.
+        :return: A list of texts, empty if the page did not finish loading.
+
+        """
+        return [
+            state['text'] for state in self.find_elements_state(locator) or []
+        ]
 
     def _search_locator(self):
         """Specify element name locator which should be used in search
@@ -186,13 +350,23 @@ class Base(object):
         # its own locator or common one (locator can transform depending on
         # element name length)
         for _ in range(self.result_timeout):
-            for strategy, value in (
-                    element_locator,
-                    common_locators['select_filtered_entity']
-            ):
-                result = self.find_element((strategy, value % element))
-                if result is not None:
-                    return result
+            try:
+                self.wait_for_ajax()
+            except TimeoutException as err:
+                self.logger.debug(
+                    u'%s: Waiting for search results: %s',
+                    type(err).__name__,
+                    err
+                )
+            else:
+                for strategy, value in (
+                        element_locator,
+                        common_locators['select_filtered_entity']
+                ):
+                    states = self.find_elements_state(
+                        (strategy, value % element), wait_for_ajax=False)
+                    if states:
+                        return states[0]['element']
             time.sleep(1)
         return None
 
@@ -305,12 +479,26 @@ class Base(object):
         Arch from selection list or by selecting relevant checkbox.
 
         """
+        # Fetch all the visible items of the list at once, so the filter has
+        # to be used only for the entities that are not displayed
+        _, list_value = common_locators['multiselect'] % filter_key
+        strategy, option_value = loc % ''
+        options = self.find_elements_state(
+            (strategy, list_value + option_value)) or []
         for entity in entity_list:
+            self.logger.debug(u'Toggling entity %s select state', entity)
+            option = next(
+                (option for option in options if entity in option['text']),
+                None
+            )
+            if option is not None:
+                options.remove(option)
+                self.click(option['element'])
+                continue
             # Scroll to top
             self.browser.execute_script('window.scroll(0, 0)')
             txt_field = self.wait_until_element(
                 common_locators['filter'] % filter_key)
-            self.logger.debug(u'Toggling entity %s select state', entity)
             if txt_field:
                 txt_field.clear()
                 txt_field.send_keys(entity)
@@ -468,10 +656,47 @@ class Base(object):
 
         return not (jquery_active or angular_active)
 
+    def _ensure_script_timeout(self, timeout):
+        """Make sure the browser allows asynchronous scripts to run for at
+        least ``timeout`` seconds. The applied value is remembered on the
+        browser so the timeout is only sent to the driver when it grows.
+        """
+        if getattr(self.browser, 'robottelo_script_timeout', 0) < timeout:
+            self.browser.set_script_timeout(timeout)
+            self.browser.robottelo_script_timeout = timeout
+
     def wait_for_ajax(self, timeout=30, poll_frequency=0.5):
-        """Waits for an ajax call to complete until timeout."""
+        """Waits for an ajax call to complete until timeout.
+
+        The wait is done by a single asynchronous script which injects the
+        page idle tracker if needed and returns once there are no pending
+        requests. Falls back to polling :meth:`ajax_complete` when the
+        asynchronous script can't be run, e.g. when the page navigates away
+        while waiting.
+
+        :raise: TimeoutException if the page is still busy after timeout.
+        """
+        deadline = time.time() + timeout
+        try:
+            # Give the driver some room so the in-page timeout fires first
+            self._ensure_script_timeout(timeout + 5)
+            idle = self.browser.execute_async_script(
+                PAGE_IDLE_WAIT_JS,
+                int(timeout * 1000),
+                PAGE_IDLE_POLL_INTERVAL,
+            )
+        except WebDriverException as err:
+            self.logger.debug(
+                u'%s: Page idle probe failed, polling for ajax: %s',
+                type(err).__name__,
+                err
+            )
+        else:
+            if idle:
+                return
+            raise TimeoutException('Timeout waiting for page to load')
         WebDriverWait(
-            self.browser, timeout, poll_frequency
+            self.browser, max(deadline - time.time(), 0), poll_frequency
         ).until(
             self.ajax_complete, 'Timeout waiting for page to load'
         )
@@ -598,7 +823,7 @@ class Base(object):
         :return: Returns whether the element is checked/selected or not.
         :rtype: bool
         :raises robottelo.ui.base.UINoSuchElementError: If the entity is not
-            found via search.
+            found via search or the checkbox is not displayed.
 
         """
         go_to_page()
@@ -607,9 +832,11 @@ class Base(object):
             raise UINoSuchElementError('Entity not found via search.')
         searched.click()
         self.click(tab_locator)
-        selected = self.find_element(
-            common_locators['all_values'] % context).is_selected()
-        return selected
+        states = self.find_elements_state(
+            common_locators['all_values'] % context)
+        if not states:
+            raise UINoSuchElementError('All values checkbox not found.')
+        return states[0]['selected']
 
     def is_element_enabled(self, locator):
         """Check whether UI element is enabled or disabled
@@ -876,11 +1103,8 @@ class Base(object):
         self.click(common_locators['table_column_title'] % column_name)
         self.wait_until_element_is_not_visible(menu_locators['navbar.spinner'])
         self.wait_for_ajax()
-        cell_values = [
-            element.text for element in self.find_elements(
-                common_locators['table_column_values'] % column_name)
-        ]
-        return cell_values
+        return self.find_elements_text(
+            common_locators['table_column_values'] % column_name)
 
     def perform_action_send_keys_to_browser(self, keys):
         """Send some key(s) to browser.
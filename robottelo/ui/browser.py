@@ -209,6 +209,20 @@ class DockerBrowser(object):
         self._client = None
         self._started = False
 
+    def reset_webdriver(self):
+        """Quit the current webdriver and connect a new one to the already
+        running container. Much faster than a :meth:`stop` and :meth:`start`
+        cycle as the container is reused.
+        """
+        if not self._started:
+            raise DockerBrowserError('DockerBrowser is not started.')
+        try:
+            self._quit_webdriver()
+        except Exception as err:
+            LOGGER.warning('Failed to quit the webdriver: %s', err)
+        self.webdriver = None
+        self._init_webdriver()
+
     def _init_webdriver(self):
         """Init the selenium Remote webdriver."""
         if self.webdriver or not self.container:
@@ -231,7 +231,7 @@ class ResourceProfileFormVMware(ResourceProfileFormBase):
         "resource.compute_profile.vmware_cdrom_drive"]
     annotation_notes_locator = locators[
         "resource.compute_profile.vmware_annotation_notes"]
-    image_locator = locators["resource.compute_profile.rhev_image"]
+    image_locator = locators["resource.compute_profile.vmware_image"]
     pool_locator = locators[
         "resource.compute_profile.vmware_resource_pool"]
     group_fields_locators = dict(
@@ -417,8 +417,7 @@ class ComputeResource(Base):
         """
         self.search_and_click(res_name)
         self.click(tab_locators['resource.tab_virtual_machines'])
-        vm_elements = self.find_elements(locators['resource.vm_list'])
-        return [vm.text for vm in vm_elements]
+        return self.find_elements_text(locators['resource.vm_list'])
 
     def add_image(self, res_name, parameter_list):
         """Adds an image to a compute resource."""
@@ -440,8 +439,7 @@ class ComputeResource(Base):
         """
         self.search_and_click(res_name)
         self.click(tab_locators['resource.tab_images'])
-        image_elements = self.find_elements(locators['resource.image_list'])
-        return [image.text for image in image_elements]
+        return self.find_elements_text(locators['resource.image_list'])
 
     def vm_action_toggle(self, res_name, vm_name, really):
         """Toggle power status of a vm on the compute resource."""
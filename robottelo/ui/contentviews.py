@@ -364,11 +364,12 @@ class ContentViews(Base):
         # there's no @value attribute). This makes impossible to form xpath for
         # specific package and the only remaining option is to locate all the
         # packages and select only the one whose input contains desired value
-        packages = self.find_elements(locators['contentviews.packages'])
+        packages = self.find_elements_state(locators['contentviews.packages'])
         checkboxes = [
-            package.find_element(*locators['contentviews.package_checkbox'])
+            package['element'].find_element(
+                *locators['contentviews.package_checkbox'])
             for package in packages
-            if package.get_attribute('value') in package_names
+            if package['value'] in package_names
         ]
         for checkbox in checkboxes:
             self.click(checkbox)
@@ -389,11 +390,11 @@ class ContentViews(Base):
         self.go_to_filter_page(cv_name, filter_name)
         # As it's impossible to obtain specific filter directly,
         # getting all the package filters first
-        packages = self.find_elements(locators['contentviews.packages'])
+        packages = self.find_elements_state(locators['contentviews.packages'])
         # Then selecting the filters with the same package as passed
         packages = [
-            package for package in packages
-            if package.get_attribute('value') == package_name
+            package['element'] for package in packages
+            if package['value'] == package_name
         ]
         # As there can be multiple filters for the same package, user may want
         # to specify version type and version of package filter
@@ -716,18 +717,15 @@ class ContentViews(Base):
             return packages
         self.click(tab_locators['contentviews.tab_version_packages'])
         while True:
-            names = self.find_elements(
+            names = self.find_elements_text(
                 locators['contentviews.version.package_name'] % '')
-            versions = self.find_elements(
+            versions = self.find_elements_text(
                 locators['contentviews.version.package_version'] % '')
-            releases = self.find_elements(
+            releases = self.find_elements_text(
                 locators['contentviews.version.package_release'] % '')
-            archs = self.find_elements(
+            archs = self.find_elements_text(
                 locators['contentviews.version.package_arch'] % '')
-            for name, version, release, arch in zip(
-                    names, versions, releases, archs):
-                packages.append(
-                    (name.text, version.text, release.text, arch.text))
+            packages.extend(zip(names, versions, releases, archs))
             next_ = self.find_element(
                 locators['contentviews.version.content_next_page'])
             if next_ is None:
@@ -746,14 +744,13 @@ class ContentViews(Base):
             return errata
         self.click(tab_locators['contentviews.tab_version_errata'])
         while True:
-            ids = self.find_elements(
+            ids = self.find_elements_text(
                 locators['contentviews.version.errata_id'] % '')
-            titles = self.find_elements(
+            titles = self.find_elements_text(
                 locators['contentviews.version.errata_title'] % '')
-            types = self.find_elements(
+            types = self.find_elements_text(
                 locators['contentviews.version.errata_type'] % '')
-            for id_, title, type_ in zip(ids, titles, types):
-                errata.append((id_.text, title.text, type_.text))
+            errata.extend(zip(ids, titles, types))
             next_ = self.find_element(
                 locators['contentviews.version.content_next_page'])
             if next_ is None:
@@ -786,12 +783,8 @@ class ContentViews(Base):
             False
         )
         # get all the available lifecycle environments
-        all_environments_elements = self.find_elements(
+        all_environments = self.find_elements_text(
             locators.contentviews.delete_version_environments)
-        all_environments = [
-            env_element.text
-            for env_element in all_environments_elements
-        ]
         # select the needed ones that are in the environments arg
         # and unselected the ones not in environments arg
         for environment in all_environments:
@@ -212,10 +212,8 @@ class Dashboard(Base):
         Content View History widget
         """
         self.navigate_to_entity()
-        elements_list = [
-            element.text for element in self.find_elements(
-                locators['dashboard.cvh.tasks_statuses'] % cv_name)
-        ]
+        elements_list = self.find_elements_text(
+            locators['dashboard.cvh.tasks_statuses'] % cv_name)
         # return list of task-status pairs
         return [
             elements_list[i:i + 2] for i in range(0, len(elements_list), 2)]
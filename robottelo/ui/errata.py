@@ -134,11 +134,8 @@ class Errata(Base):
             if isinstance(parameter_value, set):
                 actual_text_set = set()
                 if self.wait_until_element_exists(locators[param_locator]):
-                    actual_text_set = {
-                        element.text.strip()
-                        for element in self.find_elements(
-                            locators[param_locator])
-                        }
+                    actual_text_set = set(
+                        self.find_elements_text(locators[param_locator]))
                 if parameter_value != actual_text_set:
                     raise UIError(
                         'Actual text set for "{0}" parameter is "{1}", but it'
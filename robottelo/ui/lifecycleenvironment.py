@@ -90,5 +90,5 @@ class LifecycleEnvironment(Base):
                 locators['content_env.package.select_cv'], cv_name)
         self.assign_value(common_locators['kt_search'], search_string)
         self.click(common_locators['kt_search_button'])
-        return [element.text for element in
-                self.find_elements(locators['content_env.package.get_names'])]
+        return self.find_elements_text(
+            locators['content_env.package.get_names'])
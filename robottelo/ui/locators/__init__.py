@@ -3,6 +3,11 @@
 
 from selenium.webdriver.common.by import By  # noqa
 from .model import Locator, LocatorDict  # noqa
+from .registry import (  # noqa
+    CompiledLocator,
+    LocatorRegistry,
+    UnknownLocatorError,
+)
 from .menu import menu_locators  # noqa
 from .tab import tab_locators  # noqa
 from .common import common_locators  # noqa
@@ -2,10 +2,10 @@
 """Implements different locators for UI"""
 
 from selenium.webdriver.common.by import By
-from .model import LocatorDict
+from .registry import LocatorRegistry
 
 
-common_locators = LocatorDict({
+common_locators = LocatorRegistry({
 
     # common locators
 
@@ -103,6 +103,7 @@ common_locators = LocatorDict({
         "//a[contains(@data-confirm, '%s') and @data-method='delete']"),
     "copy_name_input": (By.XPATH, "//input[@ng-model='copyName']"),
     "copy_create_button": (By.XPATH, "//button[@ng-click='copy(copyName)']"),
+    "multiselect": (By.XPATH, "//div[@id='ms-%s_ids']"),
     "filter": (By.XPATH,
                ("//div[@id='ms-%s_ids']"
                 "//input[@class='ms-filter']")),
@@ -2,7 +2,7 @@
 """Implements different locators for UI"""
 
 from selenium.webdriver.common.by import By
-from .model import LocatorDict
+from .registry import LocatorRegistry
 
 NAVBAR_PATH = (
     '//div[contains(@class,"navbar-inner") and '
@@ -13,7 +13,7 @@ MENU_CONTAINER_PATH = NAVBAR_PATH + '//ul[@id="menu"]'
 ADM_MENU_CONTAINER_PATH = NAVBAR_PATH + '//ul[@id="menu2"]'
 
 
-menu_locators = LocatorDict({
+menu_locators = LocatorRegistry({
     # Menus
     # Navbar
     "navbar.spinner": (By.XPATH, ("//div[@id='turbolinks-progress']")),
@@ -0,0 +1,223 @@
+# -*- encoding: utf-8 -*-
+"""Compiled, immutable registry for UI locators
+
+The locator dictionaries are flat mappings of dotted names to ``(strategy,
+value)`` pairs. :class:`LocatorRegistry` compiles such a dictionary once into a
+frozen flat mapping, so every lookup is a single dict access no matter how it
+is spelled::
+
+    locators = LocatorRegistry({
+        'menu.home': (By.XPATH, "//a[@class='home']"),
+        'menu.item': (By.XPATH, "//a[contains(., '%s')]"),
+    })
+    locators['menu.home']
+    locators.menu.home
+    locators['menu']['home']
+    ('xpath', "//a[@class='home']")
+
+Unlike :class:`robottelo.ui.locators.model.Locator` nothing is created on the
+fly, a typo raises :class:`UnknownLocatorError` instead of returning an empty
+node::
+
+    locators.menu.hoem
+    UnknownLocatorError: 'menu.hoem'
+
+The ``%`` interpolated locators are cached, so repeated interpolations with
+the same value return the same object::
+
+    locators.menu.item % 'Hosts' is locators.menu.item % 'Hosts'
+    True
+
+"""
+import six
+
+from operator import itemgetter
+
+if six.PY3:  # pragma: no cover
+    from functools import lru_cache
+else:  # pragma: no cover
+    from cachetools.func import lru_cache
+
+
+class UnknownLocatorError(KeyError, AttributeError):
+    """Indicates that a locator or locator namespace is not registered."""
+
+
+class CompiledLocator(tuple):
+    """An immutable ``(strategy, value)`` pair.
+
+    Being a tuple it can be unpacked and passed directly to Selenium's
+    ``find_element(*locator)``.
+    """
+    __slots__ = ()
+
+    def __new__(cls, strategy, value):
+        return tuple.__new__(cls, (strategy, value))
+
+    _strategy = property(itemgetter(0), doc='Selenium locator strategy')
+    _value = property(itemgetter(1), doc='Selenium locator value')
+
+    def __mod__(self, other):
+        """Return a new locator with the value interpolated. The result is
+        cached when ``other`` is hashable.
+        """
+        # typed=True doesn't type the elements of a tuple argument
+        types = (tuple(type(value) for value in other)
+                 if isinstance(other, tuple) else None)
+        try:
+            return _interpolate(self, other, types)
+        except TypeError:
+            # unhashable interpolation values can't be cached
+            return CompiledLocator(self[0], self[1] % other)
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _interpolate(locator, other, types):
+    """Cached ``%`` interpolation of compiled locators.
+
+    The cache is typed as equal values of different types, like ``1`` and
+    ``1.0``, don't interpolate the same. ``types`` holds the types of the
+    values of a tuple ``other`` for the same reason.
+    """
+    return CompiledLocator(locator[0], locator[1] % other)
+
+
+class LocatorNamespace(object):
+    """A read only view over all the locators sharing a dotted prefix."""
+    __slots__ = ('_registry', '_prefix')
+
+    def __init__(self, registry, prefix):
+        self._registry = registry
+        self._prefix = prefix
+
+    def __getitem__(self, key):
+        return self._registry[self._prefix + key]
+
+    def __getattr__(self, attr):
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        return self._registry[self._prefix + attr]
+
+    def __contains__(self, key):
+        return (self._prefix + key) in self._registry
+
+    def __dir__(self):
+        return self._registry._children(self._prefix)
+
+    def __repr__(self):
+        return '<LocatorNamespace {0!r} contains={1}>'.format(
+            self._prefix[:-1], self._registry._children(self._prefix))
+
+
+class LocatorNode(CompiledLocator):
+    """A compiled locator which is also the prefix of other locators, e.g.
+    ``tab_locators['contenthost.tab_packages']`` and
+    ``tab_locators['contenthost.tab_packages.installed']``.
+    """
+
+    def __new__(cls, strategy, value, registry, prefix):
+        node = CompiledLocator.__new__(cls, strategy, value)
+        node._namespace = LocatorNamespace(registry, prefix)
+        return node
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, slice)):
+            return tuple.__getitem__(self, key)
+        return self._namespace[key]
+
+    def __getattr__(self, attr):
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        return getattr(self._namespace, attr)
+
+    def __contains__(self, key):
+        return key in self._namespace
+
+    def __dir__(self):
+        return dir(self._namespace)
+
+    def __reduce__(self):
+        return CompiledLocator, tuple(self)
+
+
+class LocatorRegistry(object):
+    """Frozen flat mapping of dotted names to :class:`CompiledLocator`.
+
+    :param dict locators: Maps dotted locator names to ``(strategy, value)``
+        pairs or :class:`robottelo.ui.locators.model.Locator` instances.
+    """
+
+    def __init__(self, locators):
+        prefixes = set()
+        for key in locators:
+            parts = key.split('.')
+            for index in range(1, len(parts)):
+                prefixes.add('.'.join(parts[:index]))
+        entries = {}
+        for key, (strategy, value) in locators.items():
+            if key in prefixes:
+                entries[key] = LocatorNode(strategy, value, self, key + '.')
+            else:
+                entries[key] = CompiledLocator(strategy, value)
+        for prefix in prefixes.difference(entries):
+            entries[prefix] = LocatorNamespace(self, prefix + '.')
+        self._entries = entries
+        self._names = frozenset(locators)
+
+    def __getitem__(self, key):
+        try:
+            return self._entries[key]
+        except KeyError:
+            raise UnknownLocatorError(key)
+
+    def __getattr__(self, attr):
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        return self[attr]
+
+    def __setattr__(self, attr, value):
+        if not attr.startswith('_') or attr in self.__dict__:
+            raise TypeError('Locator registries are read only')
+        object.__setattr__(self, attr, value)
+
+    def __setitem__(self, key, value):
+        raise TypeError('Locator registries are read only')
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def get(self, key, default=None):
+        """Return the locator or namespace ``key`` or ``default`` if not
+        registered.
+        """
+        return self._entries.get(key, default)
+
+    def keys(self):
+        """Return the names of all the registered locators."""
+        return list(self._names)
+
+    def items(self):
+        """Return ``(name, locator)`` pairs of all the registered locators."""
+        return [(key, self._entries[key]) for key in self._names]
+
+    def _children(self, prefix):
+        """Return the names directly under ``prefix``."""
+        return sorted({
+            key[len(prefix):].split('.', 1)[0]
+            for key in self._entries if key.startswith(prefix)
+        })
+
+    def __dir__(self):
+        return self._children('')
+
+    def __repr__(self):
+        return '<LocatorRegistry contains={0}>'.format(self._children(''))
@@ -112,17 +112,14 @@ class Role(Base):
         self.click(locators['roles.filters_button'] % role_name)
         # make sure The role filter page is loaded
         self.wait_until_element(locators['role_filters.title'])
-        resources = [
-            resource.text for resource in
-            self.find_elements(locators['role_filters.resources'])
-        ]
+        resources = self.find_elements_text(
+            locators['role_filters.resources'])
         next_ = self.find_element(locators['role_filters.pagination_next'])
         while next_:
             self.click(next_)
             self.wait_until_element(locators["role_filters.results_ready"])
             resources.extend(
-                [resource.text for resource in
-                 self.find_elements(locators['role_filters.resources'])])
+                self.find_elements_text(locators['role_filters.resources']))
             next_ = self.find_element(locators['role_filters.pagination_next'])
         # return only unique values
         return list(set(resources))
@@ -139,20 +136,18 @@ class Role(Base):
         Note: The resource is removed from resource_types when found
         """
         self.wait_until_element(locators["role_filters.results_ready"])
-        resources = {
-            resource.text for resource in
-            self.find_elements(locators['role_filters.resources'])
-            }
+        resources = set(
+            self.find_elements_text(locators['role_filters.resources']))
         for res_type in resources:
             if res_type in resource_types:
-                perm_elements = self.find_elements(
+                perm_texts = self.find_elements_text(
                     locators['role_filters.permissions'] % res_type)
-                for perm_element in perm_elements:
+                for perm_text in perm_texts:
                     if res_type not in permissions:
                         permissions[res_type] = []
                     perms = [
                         perm
-                        for perm in perm_element.text.split(', ')
+                        for perm in perm_text.split(', ')
                         if perm and perm not in permissions[res_type]
                     ]
                     permissions[res_type].extend(perms)
@@ -198,14 +193,9 @@ class Role(Base):
         self.click(tab_locators['roles.tab_filters'])
         dict_permissions = {}
         while True:
-            resources = [
-                resource.text for resource in
-                self.find_elements(locators['roles.resources'])
-            ]
-            permissions = [
-                filter_.text for filter_ in
-                self.find_elements(locators['roles.permissions'] % '')
-            ]
+            resources = self.find_elements_text(locators['roles.resources'])
+            permissions = self.find_elements_text(
+                locators['roles.permissions'] % '')
             for res_type, perms in zip(resources, permissions):
                 if res_type not in dict_permissions:
                     dict_permissions[res_type] = []
@@ -1,80 +1,306 @@
 # -*- encoding: utf-8 -*-
+import atexit
 import logging
+import import_string
 import os
 
 from datetime import datetime
 from fauxfactory import gen_string
 
 from robottelo.config import settings
-from robottelo.ui.factory import make_org
 from robottelo.ui.browser import browser, DockerBrowser
-from robottelo.ui.activationkey import ActivationKey
-from robottelo.ui.architecture import Architecture
-from robottelo.ui.audit import Audit
-from robottelo.ui.bookmark import Bookmark
-from robottelo.ui.computeprofile import ComputeProfile
-from robottelo.ui.computeresource import ComputeResource
-from robottelo.ui.configgroups import ConfigGroups
-from robottelo.ui.container import Container
-from robottelo.ui.contenthost import ContentHost
-from robottelo.ui.contentviews import ContentViews
-from robottelo.ui.dashboard import Dashboard
-from robottelo.ui.discoveredhosts import DiscoveredHosts
-from robottelo.ui.discoveryrules import DiscoveryRules
-from robottelo.ui.dockertag import DockerTag
-from robottelo.ui.domain import Domain
-from robottelo.ui.environment import Environment
-from robottelo.ui.errata import Errata
-from robottelo.ui.globalparameters import GlobalParameters
-from robottelo.ui.gpgkey import GPGKey
-from robottelo.ui.hardwaremodel import HardwareModel
-from robottelo.ui.hostcollection import HostCollection
-from robottelo.ui.hostgroup import Hostgroup
-from robottelo.ui.hosts import Hosts
-from robottelo.ui.job import Job
-from robottelo.ui.job_template import JobTemplate
-from robottelo.ui.ldapauthsource import LdapAuthSource
-from robottelo.ui.lifecycleenvironment import LifecycleEnvironment
-from robottelo.ui.location import Location
-from robottelo.ui.login import Login
-from robottelo.ui.medium import Medium
-from robottelo.ui.my_account import MyAccount
-from robottelo.ui.navigator import Navigator
-from robottelo.ui.operatingsys import OperatingSys
-from robottelo.ui.org import Org
-from robottelo.ui.oscapcontent import OpenScapContent
-from robottelo.ui.oscappolicy import OpenScapPolicy
-from robottelo.ui.oscapreports import OpenScapReports
-from robottelo.ui.oscap_tailoringfile import OpenScapTailoringfile
-from robottelo.ui.packages import Package
-from robottelo.ui.partitiontable import PartitionTable
-from robottelo.ui.products import Products
-from robottelo.ui.puppetclasses import PuppetClasses
-from robottelo.ui.puppetmodule import PuppetModule
-from robottelo.ui.registry import Registry
-from robottelo.ui.repository import Repos
-from robottelo.ui.rhai import RHAIInventory, RHAIOverview
-from robottelo.ui.role import Role
-from robottelo.ui.settings import Settings
-from robottelo.ui.scparams import SmartClassParameter
-from robottelo.ui.smart_variable import SmartVariable
-from robottelo.ui.statistic import Statistic
-from robottelo.ui.subnet import Subnet
-from robottelo.ui.subscription import Subscriptions
-from robottelo.ui.sync import Sync
-from robottelo.ui.syncplan import Syncplan
-from robottelo.ui.task import Task
-from robottelo.ui.template import Template
-from robottelo.ui.trend import Trend
-from robottelo.ui.usergroup import UserGroup
-from robottelo.ui.user import User
 
 _org_cache = {}
 LOGGER = logging.getLogger(__name__)
 
+# Name of the Foreman session cookie, which is kept when resetting a pooled
+# browser so it stays logged in
+SESSION_COOKIE = '_session_id'
+
+# Clears the web storage and every cookie visible to javascript except the
+# session one
+RESET_BROWSER_JS = u"""
+var keep = arguments[0];
+try {
+    window.localStorage.clear();
+    window.sessionStorage.clear();
+} catch (err) {}
+document.cookie.split(';').forEach(function (cookie) {
+    var name = cookie.split('=')[0].trim();
+    if (name && name !== keep) {
+        document.cookie = (
+            name + '=; expires=Thu, 01 Jan 1970 00:00:00 GMT; path=/');
+    }
+});
+"""
+
+
+class PageObject(object):
+    """Descriptor which creates a UI page object the first time it is
+    accessed on a session and caches it there.
+
+    The module of the page object is only imported at that moment, so a
+    session pays only for the pages it actually uses.
+
+    :param str path: Dotted path of the page object class, e.g.
+        ``robottelo.ui.org.Org``.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __get__(self, session, owner):
+        if session is None:
+            return self
+        pages = session.__dict__.setdefault('_pages', {})
+        if self not in pages:
+            pages[self] = import_string(self.path)(session.browser)
+        return pages[self]
+
+
+class SessionPage(object):
+    """Stands for a session page object on the test object, the page object
+    is only created when one of its attributes is accessed.
+    """
+    __slots__ = ('_session', '_name')
+
+    def __init__(self, session, name):
+        self._session = session
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(getattr(self._session, self._name), attr)
+
+    def __repr__(self):
+        return '<SessionPage {0}>'.format(self._name)
+
+
+class PooledBrowser(object):
+    """A browser kept logged in by :class:`BrowserPool`.
+
+    :param webdriver: The logged in webdriver.
+    :param str user: The user logged in.
+    :param str password: The password of the logged in user.
+    :param docker_browser: The :class:`robottelo.ui.browser.DockerBrowser`
+        running ``webdriver`` if any.
+    """
+
+    def __init__(self, webdriver, user, password, docker_browser=None):
+        self.webdriver = webdriver
+        self.user = user
+        self.password = password
+        self.docker_browser = docker_browser
+
+    def reset(self):
+        """Clear the browser state left by the previous test, except for the
+        session cookie, and navigate to the server home page.
+
+        :raises robottelo.ui.session.BrowserPoolError: If the browser is not
+            logged in anymore.
+        """
+        self.webdriver.execute_script(RESET_BROWSER_JS, SESSION_COOKIE)
+        self.webdriver.get(settings.server.get_url())
+        if 'Login' in self.webdriver.title:
+            raise BrowserPoolError(
+                'Pooled browser for {0} is not logged in'.format(self.user))
+
+    def quit(self):
+        """Quit the browser."""
+        self.webdriver.quit()
+
+
+class BrowserPoolError(Exception):
+    """Indicates that a pooled browser can't be reused."""
+
+
+class BrowserPool(object):
+    """Per process pool of logged in browsers keyed by user.
+
+    Enabled by the ``browser_pool`` setting for the ``selenium`` and
+    ``docker`` browsers. :class:`Session` acquires a logged in browser from
+    it instead of starting a new one and logging in, and releases the browser
+    back on success instead of logging out and quitting. Docker containers
+    are kept running while their browser is discarded so the next browser
+    starts in a warm container.
+    """
+
+    def __init__(self):
+        self._browsers = []
+        self._containers = []
+
+    @property
+    def enabled(self):
+        """Whether :class:`Session` should use the pool."""
+        return (
+            settings.browser_pool and
+            settings.browser in ('selenium', 'docker')
+        )
+
+    @property
+    def size(self):
+        """The maximum number of idle browsers and of warm containers."""
+        return settings.browser_pool_size
+
+    def acquire(self, user, password):
+        """Return an idle browser logged in as ``user`` after resetting it,
+        or ``None`` if none is available.
+        """
+        for pooled in reversed(self._browsers):
+            if pooled.user == user and pooled.password == password:
+                self._browsers.remove(pooled)
+                try:
+                    pooled.reset()
+                except Exception as err:
+                    LOGGER.warning(
+                        'Starting a new browser, pooled one failed to reset: '
+                        '%s', err
+                    )
+                    self.discard(pooled)
+                    return None
+                LOGGER.debug('Reusing pooled browser for %s', user)
+                return pooled
+        return None
+
+    def release(self, pooled):
+        """Put back a logged in browser, discarding the least recently used
+        ones above :attr:`size`.
+        """
+        self._browsers.append(pooled)
+        while len(self._browsers) > self.size:
+            self.discard(self._browsers.pop(0))
+
+    def discard(self, pooled):
+        """Quit a browser. Its docker container, if any, is kept running for
+        a later :meth:`docker_browser` call.
+        """
+        if pooled.docker_browser is None:
+            try:
+                pooled.quit()
+            except Exception as err:
+                LOGGER.exception(err)
+        else:
+            self._keep_container(pooled.docker_browser)
+
+    def docker_browser(self, name):
+        """Return a started :class:`robottelo.ui.browser.DockerBrowser`,
+        reusing a warm container if there is one.
+        """
+        while self._containers:
+            docker_browser = self._containers.pop()
+            try:
+                docker_browser.reset_webdriver()
+            except Exception as err:
+                LOGGER.warning('Discarding warm container: %s', err)
+                docker_browser.stop()
+            else:
+                return docker_browser
+        docker_browser = DockerBrowser(name=name)
+        docker_browser.start()
+        return docker_browser
+
+    def _keep_container(self, docker_browser):
+        """Keep a docker container warm or stop it when there are enough."""
+        if len(self._containers) < self.size:
+            self._containers.append(docker_browser)
+        else:
+            docker_browser.stop()
+
+    def close(self):
+        """Quit all the pooled browsers and stop all the containers."""
+        while self._browsers:
+            pooled = self._browsers.pop()
+            try:
+                if pooled.docker_browser is None:
+                    pooled.quit()
+                else:
+                    pooled.docker_browser.stop()
+            except Exception as err:
+                LOGGER.exception(err)
+        while self._containers:
+            try:
+                self._containers.pop().stop()
+            except Exception as err:
+                LOGGER.exception(err)
+
+
+browser_pool = BrowserPool()
+atexit.register(browser_pool.close)
+
 
 class Session(object):
-    """A session context manager that manages login and logout"""
+    """A session context manager that manages login and logout
+
+    UI page objects are available as attributes, e.g. ``session.org``, and
+    are created on first access.
+    """
+
+    activationkey = PageObject('robottelo.ui.activationkey.ActivationKey')
+    architecture = PageObject('robottelo.ui.architecture.Architecture')
+    audit = PageObject('robottelo.ui.audit.Audit')
+    bookmark = PageObject('robottelo.ui.bookmark.Bookmark')
+    container = PageObject('robottelo.ui.container.Container')
+    compute_profile = PageObject('robottelo.ui.computeprofile.ComputeProfile')
+    compute_resource = PageObject(
+        'robottelo.ui.computeresource.ComputeResource')
+    contenthost = PageObject('robottelo.ui.contenthost.ContentHost')
+    configgroups = PageObject('robottelo.ui.configgroups.ConfigGroups')
+    content_views = PageObject('robottelo.ui.contentviews.ContentViews')
+    dashboard = PageObject('robottelo.ui.dashboard.Dashboard')
+    dockertag = PageObject('robottelo.ui.dockertag.DockerTag')
+    domain = PageObject('robottelo.ui.domain.Domain')
+    errata = PageObject('robottelo.ui.errata.Errata')
+    discoveredhosts = PageObject(
+        'robottelo.ui.discoveredhosts.DiscoveredHosts')
+    discoveryrules = PageObject('robottelo.ui.discoveryrules.DiscoveryRules')
+    environment = PageObject('robottelo.ui.environment.Environment')
+    globalparameters = PageObject(
+        'robottelo.ui.globalparameters.GlobalParameters')
+    gpgkey = PageObject('robottelo.ui.gpgkey.GPGKey')
+    hardwaremodel = PageObject('robottelo.ui.hardwaremodel.HardwareModel')
+    hostcollection = PageObject('robottelo.ui.hostcollection.HostCollection')
+    hostgroup = PageObject('robottelo.ui.hostgroup.Hostgroup')
+    hosts = PageObject('robottelo.ui.hosts.Hosts')
+    job = PageObject('robottelo.ui.job.Job')
+    jobtemplate = PageObject('robottelo.ui.job_template.JobTemplate')
+    ldapauthsource = PageObject('robottelo.ui.ldapauthsource.LdapAuthSource')
+    lifecycleenvironment = PageObject(
+        'robottelo.ui.lifecycleenvironment.LifecycleEnvironment')
+    location = PageObject('robottelo.ui.location.Location')
+    login = PageObject('robottelo.ui.login.Login')
+    medium = PageObject('robottelo.ui.medium.Medium')
+    my_account = PageObject('robottelo.ui.my_account.MyAccount')
+    navigator = PageObject('robottelo.ui.navigator.Navigator')
+    nav = navigator  # for compatibility purposes
+    user = PageObject('robottelo.ui.user.User')
+    operatingsys = PageObject('robottelo.ui.operatingsys.OperatingSys')
+    org = PageObject('robottelo.ui.org.Org')
+    oscapcontent = PageObject('robottelo.ui.oscapcontent.OpenScapContent')
+    oscappolicy = PageObject('robottelo.ui.oscappolicy.OpenScapPolicy')
+    oscapreports = PageObject('robottelo.ui.oscapreports.OpenScapReports')
+    oscaptailoringfile = PageObject(
+        'robottelo.ui.oscap_tailoringfile.OpenScapTailoringfile')
+    package = PageObject('robottelo.ui.packages.Package')
+    partitiontable = PageObject('robottelo.ui.partitiontable.PartitionTable')
+    puppetclasses = PageObject('robottelo.ui.puppetclasses.PuppetClasses')
+    puppetmodule = PageObject('robottelo.ui.puppetmodule.PuppetModule')
+    products = PageObject('robottelo.ui.products.Products')
+    registry = PageObject('robottelo.ui.registry.Registry')
+    repository = PageObject('robottelo.ui.repository.Repos')
+    rhai_inventory = PageObject('robottelo.ui.rhai.RHAIInventory')
+    rhai_overview = PageObject('robottelo.ui.rhai.RHAIOverview')
+    role = PageObject('robottelo.ui.role.Role')
+    settings = PageObject('robottelo.ui.settings.Settings')
+    sc_parameters = PageObject('robottelo.ui.scparams.SmartClassParameter')
+    smart_variable = PageObject('robottelo.ui.smart_variable.SmartVariable')
+    statistic = PageObject('robottelo.ui.statistic.Statistic')
+    subnet = PageObject('robottelo.ui.subnet.Subnet')
+    subscriptions = PageObject('robottelo.ui.subscription.Subscriptions')
+    sync = PageObject('robottelo.ui.sync.Sync')
+    syncplan = PageObject('robottelo.ui.syncplan.Syncplan')
+    task = PageObject('robottelo.ui.task.Task')
+    template = PageObject('robottelo.ui.template.Template')
+    trend = PageObject('robottelo.ui.trend.Trend')
+    usergroup = PageObject('robottelo.ui.usergroup.UserGroup')
 
     def __init__(self, test, user=None, password=None):
         self.test = test
@@ -82,12 +308,24 @@ class Session(object):
         self._user = user
 
     def __enter__(self):
-        if settings.browser == 'docker':
-            self._docker_browser = DockerBrowser(name=self.test.id())
-            self._docker_browser.start()
-            self.browser = self._docker_browser.webdriver
+        self._pooled = None
+        if self._user is None:
+            self._user = getattr(
+                self.test, 'foreman_user', settings.server.admin_username)
+        if self._password is None:
+            self._password = getattr(
+                self.test,
+                'foreman_password',
+                settings.server.admin_password
+            )
+
+        if browser_pool.enabled:
+            self._pooled = browser_pool.acquire(self._user, self._password)
+        if self._pooled is not None:
+            self.browser = self._pooled.webdriver
+            self._docker_browser = self._pooled.docker_browser
         else:
-            self.browser = browser()
+            self._start_browser()
 
         # for compatibility purposes
         self.test.browser = self.browser
@@ -95,17 +333,30 @@ class Session(object):
         self.browser.foreman_user = self.test.foreman_user
         self.browser.foreman_password = self.test.foreman_password
 
-        if self._user is None:
-            self._user = getattr(
-                self.browser, 'foreman_user', settings.server.admin_username
-            )
+        self.test.addCleanup(
+            self.test._saucelabs_test_result, self.browser.session_id)
 
-        if self._password is None:
-            self._password = getattr(
-                self.browser,
-                'foreman_password',
-                settings.server.admin_password
-            )
+        # for compatibility purposes
+        for name in PAGE_NAMES:
+            setattr(self.test, name, SessionPage(self, name))
+
+        if self._pooled is None:
+            self.login.login(self._user, self._password)
+        return self
+
+    def _start_browser(self):
+        """Start a new browser and open the server URL on it."""
+        self._docker_browser = None
+        if settings.browser == 'docker':
+            if browser_pool.enabled:
+                self._docker_browser = browser_pool.docker_browser(
+                    self.test.id())
+            else:
+                self._docker_browser = DockerBrowser(name=self.test.id())
+                self._docker_browser.start()
+            self.browser = self._docker_browser.webdriver
+        else:
+            self.browser = browser()
 
         self.browser.maximize_window()
         self.browser.get(settings.server.get_url())
@@ -118,106 +369,29 @@ class Session(object):
                 ".click()"
             )
 
-        self.test.addCleanup(
-            self.test._saucelabs_test_result, self.browser.session_id)
-
-        # Library methods
-        self.activationkey = ActivationKey(self.browser)
-        self.architecture = Architecture(self.browser)
-        self.audit = Audit(self.browser)
-        self.bookmark = Bookmark(self.browser)
-        self.container = Container(self.browser)
-        self.compute_profile = ComputeProfile(self.browser)
-        self.compute_resource = ComputeResource(self.browser)
-        self.contenthost = ContentHost(self.browser)
-        self.configgroups = ConfigGroups(self.browser)
-        self.content_views = ContentViews(self.browser)
-        self.dashboard = Dashboard(self.browser)
-        self.dockertag = DockerTag(self.browser)
-        self.domain = Domain(self.browser)
-        self.errata = Errata(self.browser)
-        self.discoveredhosts = DiscoveredHosts(self.browser)
-        self.discoveryrules = DiscoveryRules(self.browser)
-        self.environment = Environment(self.browser)
-        self.globalparameters = GlobalParameters(self.browser)
-        self.gpgkey = GPGKey(self.browser)
-        self.hardwaremodel = HardwareModel(self.browser)
-        self.hostcollection = HostCollection(self.browser)
-        self.hostgroup = Hostgroup(self.browser)
-        self.hosts = Hosts(self.browser)
-        self.job = Job(self.browser)
-        self.jobtemplate = JobTemplate(self.browser)
-        self.ldapauthsource = LdapAuthSource(self.browser)
-        self.lifecycleenvironment = LifecycleEnvironment(self.browser)
-        self.location = Location(self.browser)
-        self.login = Login(self.browser)
-        self.medium = Medium(self.browser)
-        self.my_account = MyAccount(self.browser)
-        self.navigator = Navigator(self.browser)
-        self.nav = self.navigator  # for compatibility purposes
-        self.user = User(self.browser)
-        self.operatingsys = OperatingSys(self.browser)
-        self.org = Org(self.browser)
-        self.oscapcontent = OpenScapContent(self.browser)
-        self.oscappolicy = OpenScapPolicy(self.browser)
-        self.oscapreports = OpenScapReports(self.browser)
-        self.oscaptailoringfile = OpenScapTailoringfile(self.browser)
-        self.package = Package(self.browser)
-        self.partitiontable = PartitionTable(self.browser)
-        self.puppetclasses = PuppetClasses(self.browser)
-        self.puppetmodule = PuppetModule(self.browser)
-        self.products = Products(self.browser)
-        self.registry = Registry(self.browser)
-        self.repository = Repos(self.browser)
-        self.rhai_inventory = RHAIInventory(self.browser)
-        self.rhai_overview = RHAIOverview(self.browser)
-        self.role = Role(self.browser)
-        self.settings = Settings(self.browser)
-        self.sc_parameters = SmartClassParameter(self.browser)
-        self.smart_variable = SmartVariable(self.browser)
-        self.statistic = Statistic(self.browser)
-        self.subnet = Subnet(self.browser)
-        self.subscriptions = Subscriptions(self.browser)
-        self.sync = Sync(self.browser)
-        self.syncplan = Syncplan(self.browser)
-        self.task = Task(self.browser)
-        self.template = Template(self.browser)
-        self.trend = Trend(self.browser)
-        self.usergroup = UserGroup(self.browser)
-
-        # for compatibility purposes
-        for attr in (
-                'activationkey', 'architecture', 'audit', 'bookmark',
-                'container', 'compute_profile', 'compute_resource',
-                'contenthost', 'configgroups', 'content_views', 'dashboard',
-                'dockertag', 'domain', 'errata', 'discoveredhosts',
-                'discoveryrules', 'environment', 'gpgkey', 'hardwaremodel',
-                'hostcollection', 'hostgroup', 'hosts', 'job', 'jobtemplate',
-                'ldapauthsource', 'lifecycleenvironment', 'location', 'login',
-                'medium', 'my_account', 'navigator', 'nav', 'user',
-                'operatingsys', 'org', 'oscapcontent', 'oscappolicy',
-                'oscapreports', 'oscaptailoringfile', 'package',
-                'partitiontable', 'puppetclasses', 'puppetmodule',
-                'products', 'registry', 'repository', 'rhai_inventory',
-                'rhai_overview', 'role',
-                'settings', 'sc_parameters', 'smart_variable', 'statistic',
-                'subnet', 'subscriptions', 'sync', 'syncplan', 'task',
-                'template', 'trend', 'usergroup', 'globalparameters'):
-            setattr(self.test, attr, getattr(self, attr))
-
-        self.login.login(self._user, self._password)
-        return self
-
     def __exit__(self, exc_type, exc_value, traceback):
+        reusable = exc_type is None and browser_pool.enabled
         try:
             if exc_type is None:
-                self.login.logout()
+                if not reusable:
+                    self.login.logout()
             else:
                 self.take_screenshot()
         except Exception as err:
+            reusable = False
             LOGGER.exception(err)
         finally:
-            if settings.browser == 'docker':
+            pooled = self._pooled or PooledBrowser(
+                self.browser,
+                self._user,
+                self._password,
+                self._docker_browser,
+            )
+            if reusable:
+                browser_pool.release(pooled)
+            elif browser_pool.enabled:
+                browser_pool.discard(pooled)
+            elif settings.browser == 'docker':
                 self._docker_browser.stop()
             else:
                 self.browser.quit()
@@ -263,9 +437,16 @@ class Session(object):
 
         :return: str: Organization name
         """
+        from robottelo.ui.factory import make_org
         if 'org_name' in _org_cache:
             return _org_cache['org_name']
         org_name = gen_string('alpha')
         make_org(self, org_name=org_name)
         _org_cache['org_name'] = org_name
         return org_name
+
+
+PAGE_NAMES = tuple(sorted(
+    name for name, attr in vars(Session).items()
+    if isinstance(attr, PageObject)
+))
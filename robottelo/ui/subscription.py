@@ -29,7 +29,7 @@ class Subscriptions(Base):
         """
         self.navigate_to_entity()
         if not self.wait_until_element(locators.subs.upload, timeout=1):
-            self.click(locators.base.locators.subs.manage_manifest)
+            self.click(locators.subs.manage_manifest)
         if repo_url:
             self.click(locators['subs.repo_url_edit'])
             self.assign_value(locators['subs.repo_url_update'], repo_url)
@@ -84,17 +84,13 @@ class Subscriptions(Base):
         """Return a list of product names provided by the subscription name"""
         self.search_and_click(subscription_name)
         self.click(tab_locators['subs.sub.tab_details'])
-        return [element.text
-                for element in
-                self.find_elements(locators['subs.sub.provided_products'])]
+        return self.find_elements_text(locators['subs.sub.provided_products'])
 
     def get_content_products(self, subscription_name):
         """Return a list of product names consumed by the subscription name"""
         self.search_and_click(subscription_name)
         self.click(tab_locators['subs.sub.product_content'])
-        return [element.text
-                for element in
-                self.find_elements(locators['subs.sub.content_products'])]
+        return self.find_elements_text(locators['subs.sub.content_products'])
 
     def get_guests_provided_products(
             self, subscription_name, hypervisor_hostname):
@@ -104,9 +100,7 @@ class Subscriptions(Base):
         self.click(locators['subs.select_guests_of'] % (
             subscription_name, hypervisor_hostname))
         self.click(tab_locators['subs.sub.tab_details'])
-        return [element.text
-                for element in
-                self.find_elements(locators['subs.sub.provided_products'])]
+        return self.find_elements_text(locators['subs.sub.provided_products'])
 
     def get_guests_content_products(
             self, subscription_name, hypervisor_hostname):
@@ -116,6 +110,4 @@ class Subscriptions(Base):
         self.click(locators['subs.select_guests_of'] % (
             subscription_name, hypervisor_hostname))
         self.click(tab_locators['subs.sub.product_content'])
-        return [element.text
-                for element in
-                self.find_elements(locators['subs.sub.content_products'])]
+        return self.find_elements_text(locators['subs.sub.content_products'])
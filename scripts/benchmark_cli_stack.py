@@ -0,0 +1,138 @@
+"""Measure the SSH and CLI layers against a local fake Satellite.
+
+Runs :mod:`robottelo.ssh`, :meth:`robottelo.cli.base.Base.execute`, the
+hammer output parsers and :func:`robottelo.cli.factory.make_org` against a
+:class:`robottelo.fake_server.FakeSSHServer`, so it needs neither a network
+nor a configured server::
+
+    $ python scripts/benchmark_cli_stack.py [--number 100] [--latency 0.05]
+
+The latency is the number of seconds the fake hammer takes to answer each
+command.
+"""
+import argparse
+import time
+
+from robottelo import ssh
+from robottelo.cli.factory import make_org
+from robottelo.cli.org import Org
+from robottelo.fake_server import FakeHammer, fake_satellite
+
+LIST_ROWS = 2000
+INFO_LINES = 5000
+
+
+def organization_list(rows=LIST_ROWS):
+    """Return the csv output of an organization list with ``rows``
+    organizations.
+    """
+    lines = [u'Id,Name,Title,Label,Description']
+    lines.extend(
+        u'{0},org{0},org{0},org{0},organization {0}'.format(index)
+        for index in range(1, rows + 1)
+    )
+    return u'\n'.join(lines) + u'\n'
+
+
+def organization_info(lines=INFO_LINES):
+    """Return the output of an organization info with about ``lines``
+    lines.
+    """
+    output = [
+        u'Id:          1',
+        u'Name:        org',
+        u'Title:       org',
+        u'Label:       org',
+        u'Description:',
+        u'Subnets:',
+    ]
+    output.extend(
+        u'    subnet{0} (192.168.{1}.{2}/32)'.format(
+            index, index // 256 % 256, index % 256)
+        for index in range(1, lines // 2)
+    )
+    output.append(u'Parameters:')
+    output.extend(
+        u'    param{0} => value{0}'.format(index)
+        for index in range(1, lines // 2)
+    )
+    return u'\n'.join(output) + u'\n'
+
+
+def fake_hammer(latency):
+    """Return the fake hammer answering the benchmarked commands."""
+    hammer = FakeHammer(latency=latency)
+    hammer.add(r'ping', u'database:\n    Status: ok\n')
+    hammer.add(
+        r'organization create',
+        u'Message,Id,Name\nOrganization created,1,org\n',
+        output_format='csv',
+    )
+    hammer.add(r'organization info --id=1$', organization_info(20))
+    hammer.add(r'organization info', organization_info())
+    hammer.add(r'organization list', organization_list(), output_format='csv')
+    return hammer
+
+
+def timed(number, func, *args, **kwargs):
+    """Call a function ``number`` times and return the durations in
+    seconds.
+    """
+    durations = []
+    for _ in range(number):
+        start = time.time()
+        func(*args, **kwargs)
+        durations.append(time.time() - start)
+    return durations
+
+
+def report(name, durations, unit=u'calls', per_call=1):
+    """Print the rate and the latency percentiles of the calls."""
+    durations = sorted(durations)
+    print(u'{0}: {1:.1f} {2}/s, latency p50 {3:.1f} ms, p95 {4:.1f} ms, '
+          u'max {5:.1f} ms'.format(
+              name,
+              len(durations) * per_call / sum(durations),
+              unit,
+              durations[len(durations) // 2] * 1000,
+              durations[int(len(durations) * 0.95)] * 1000,
+              durations[-1] * 1000,
+          ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=100,
+                        help='number of calls of each benchmark')
+    parser.add_argument('--latency', type=float, default=0,
+                        help='seconds the fake hammer takes per command')
+    args = parser.parse_args()
+
+    def handshake():
+        with ssh.get_connection():
+            pass
+
+    def commands(connection, number=10):
+        for _ in range(number):
+            connection.run(u'hammer ping')
+
+    with fake_satellite(fake_hammer(args.latency)):
+        report(u'SSH handshakes', timed(args.number, handshake),
+               u'handshakes')
+        report(u'Commands, a connection each',
+               timed(args.number, ssh.command, u'hammer ping'), u'commands')
+        with ssh.get_connection() as connection:
+            report(u'Commands on a shared connection',
+                   timed(max(1, args.number // 10), commands, connection),
+                   u'commands', per_call=10)
+        number = max(1, args.number // 10)
+        report(u'Parse list ({0} rows)'.format(LIST_ROWS),
+               timed(number, Org.list), u'rows', per_call=LIST_ROWS)
+        report(u'Parse info ({0} lines)'.format(INFO_LINES),
+               timed(number, Org.info, {u'id': 2}), u'lines',
+               per_call=INFO_LINES)
+        report(u'make_org', timed(args.number, make_org))
+
+
+if __name__ == '__main__':
+    main()
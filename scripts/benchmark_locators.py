@@ -0,0 +1,73 @@
+"""Compare the autovivifying :class:`robottelo.ui.locators.model.Locator` tree
+with the compiled :class:`robottelo.ui.locators.registry.LocatorRegistry`.
+
+Measures how long building every UI locator dictionary takes (what is paid
+at import time) and the lookup throughput for item, dotted attribute and
+interpolated access::
+
+    $ python scripts/benchmark_locators.py
+
+"""
+import subprocess
+import sys
+import timeit
+
+from robottelo.ui.locators import (
+    common_locators,
+    locators,
+    menu_locators,
+    tab_locators,
+)
+from robottelo.ui.locators.model import LocatorDict
+from robottelo.ui.locators.registry import LocatorRegistry
+
+SOURCES = [
+    dict((key, tuple(value)) for key, value in registry.items())
+    for registry in (locators, common_locators, menu_locators, tab_locators)
+]
+
+LOOKUPS = {
+    'item': "loc['contentviews.version.package_name']",
+    'attribute': 'loc.contentviews.version.package_name',
+    'interpolation': "loc['contentviews.version.package_name'] % 'bash'",
+}
+
+
+def best_of(stmt, number, repeat=5, **namespace):
+    """Return the best time in seconds of ``number`` runs of ``stmt``."""
+    return min(timeit.repeat(
+        stmt, number=number, repeat=repeat, globals=namespace)) / number
+
+
+def import_time():
+    """Return the time to import the locators package in a fresh
+    interpreter.
+    """
+    return float(subprocess.check_output([
+        sys.executable, '-c',
+        'import time; start = time.time(); '
+        'import robottelo.ui.locators; print(time.time() - start)'
+    ]))
+
+
+def main():
+    print('Fresh import of robottelo.ui.locators: {0:.1f} ms'.format(
+        import_time() * 1000))
+    for name, cls in (('Locator', LocatorDict),
+                      ('LocatorRegistry', LocatorRegistry)):
+        build = best_of(
+            '[cls(source) for source in sources]',
+            number=10,
+            cls=cls,
+            sources=SOURCES,
+        )
+        print('{0}: build all locators {1:.2f} ms'.format(name, build * 1000))
+        loc = cls(SOURCES[0])
+        for lookup, stmt in sorted(LOOKUPS.items()):
+            seconds = best_of(stmt, number=100000, loc=loc)
+            print('{0}: {1} lookup {2:,.0f}/s'.format(
+                name, lookup, 1 / seconds))
+
+
+if __name__ == '__main__':
+    main()
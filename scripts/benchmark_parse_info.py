@@ -0,0 +1,146 @@
+"""Measure :func:`robottelo.cli.hammer.parse_info` on large info outputs.
+
+The outputs mimic what hammer prints for a content view version with
+thousands of packages and errata, a host with many interfaces and
+parameters, and a repository::
+
+    $ python scripts/benchmark_parse_info.py
+
+"""
+import timeit
+
+from robottelo.cli.hammer import parse_info
+
+
+def content_view_version_info(packages=5000, errata=1000):
+    """Return the lines of a content view version info with ``packages``
+    packages and ``errata`` errata.
+    """
+    lines = [
+        'ID:                  3',
+        'Name:                cv 1.0',
+        'Version:             1.0',
+        'Description:',
+        'Content View ID:     2',
+        'Content View Name:   cv',
+        'Content View Label:  cv',
+        'Lifecycle Environments:',
+        ' 1) ID:    1',
+        '    Name:  Library',
+        '    Label: Library',
+        'Repositories:',
+    ]
+    for index in range(1, 11):
+        lines.extend([
+            ' {0}) ID:    {0}'.format(index),
+            '    Name:  repo{0}'.format(index),
+            '    Label: repo{0}'.format(index),
+        ])
+    lines.append('Packages:')
+    lines.extend(
+        ' {0}) package-{0}-1.0-1.el7.x86_64'.format(index)
+        for index in range(1, packages + 1)
+    )
+    lines.append('Errata:')
+    for index in range(1, errata + 1):
+        lines.extend([
+            ' {0}) ID:       {0}'.format(index),
+            '    Errata ID: RHSA-2018:{0:04d}'.format(index),
+            '    Type:     security',
+            '    Title:    Important: package-{0} update'.format(index),
+        ])
+    return lines
+
+
+def host_info(interfaces=200, parameters=500):
+    """Return the lines of a host info with ``interfaces`` network
+    interfaces and ``parameters`` parameters.
+    """
+    lines = [
+        'Id:                       2',
+        'Name:                     host.example.com',
+        'Organization:             Default Organization',
+        'Location:                 Default Location',
+        'Network:',
+        '    IPv4 address: 192.168.100.1',
+        '    Domain:       example.com',
+        'Network interfaces:',
+    ]
+    for index in range(1, interfaces + 1):
+        lines.extend([
+            ' {0}) Id:           {0}'.format(index),
+            '    Identifier:   eth{0}'.format(index),
+            '    Type:         interface',
+            '    MAC address:  52:54:00:00:00:{0:02x}'.format(index % 256),
+        ])
+    lines.extend([
+        'Operating system:',
+        '    Architecture:           x86_64',
+        '    Operating System:       RedHat 7.5',
+        '    Custom partition table:',
+        'All parameters:',
+    ])
+    lines.extend(
+        '    param{0} => value{0}'.format(index)
+        for index in range(1, parameters + 1)
+    )
+    lines.extend([
+        'Content Information:',
+        '    Content View:',
+        '        ID:   1',
+        '        Name: Default Organization View',
+        '    Lifecycle Environment:',
+        '        ID:   1',
+        '        Name: Library',
+        '    Applicable Errata:',
+        '        Enhancement: 0',
+        '        Bug Fix:     0',
+        '        Security:    0',
+    ])
+    return lines
+
+
+def repository_info():
+    """Return the lines of a repository info."""
+    return [
+        'ID:                 1',
+        'Name:               repo',
+        'Label:              repo',
+        'Organization:       Default Organization',
+        'Red Hat Repository: no',
+        'Content Type:       yum',
+        'URL:                http://example.com/repo/',
+        'Product:',
+        '    ID:   1',
+        '    Name: product',
+        'GPG Key:',
+        'Sync:',
+        '    Status:         Success',
+        '    Last Sync Date: 2 minutes',
+        'Created:            2018/10/19 10:00:00',
+        'Updated:            2018/10/19 10:02:00',
+        'Content Counts:',
+        '    Packages:       32',
+        '    Package Groups: 2',
+        '    Errata:         4',
+    ]
+
+
+OUTPUTS = {
+    'content view version': content_view_version_info(),
+    'host': host_info(),
+    'repository': repository_info(),
+}
+
+
+def main():
+    for name, lines in sorted(OUTPUTS.items()):
+        number = max(1, 20000 // len(lines))
+        best = min(timeit.repeat(
+            lambda: parse_info(lines), number=number, repeat=5)) / number
+        print('{0} info ({1} lines): {2:.3f} ms, {3:.0f} lines/s'.format(
+            name, len(lines), best * 1000, len(lines) / best))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Compare rebuilding a content fixture through hammer with restoring it from
+a :mod:`robottelo.savepoint` savepoint.
+
+Builds an organization with a synced custom repository, published and
+promoted content view and activation key, saves it as a savepoint, then
+restores it. Every step replaces the server data so only run it against a
+sandbox server::
+
+    $ python scripts/benchmark_savepoint.py [REPO_URL]
+
+"""
+import sys
+import time
+
+from robottelo.cli.factory import setup_org_for_a_custom_repo
+from robottelo.config import settings
+from robottelo.constants import FAKE_0_YUM_REPO
+from robottelo.savepoint import create_savepoint, restore_savepoint
+
+SAVEPOINT = 'benchmark_custom_repo'
+
+
+def timed(func, *args, **kwargs):
+    """Return the result of the call and the time it took in seconds."""
+    start = time.time()
+    result = func(*args, **kwargs)
+    return result, time.time() - start
+
+
+def main():
+    settings.configure()
+    url = sys.argv[1] if len(sys.argv) > 1 else FAKE_0_YUM_REPO
+    result, rebuild = timed(setup_org_for_a_custom_repo, {'url': url})
+    print('Rebuild through hammer: {0:.1f} s'.format(rebuild))
+    _, backup = timed(create_savepoint, SAVEPOINT, result)
+    print('Create savepoint: {0:.1f} s'.format(backup))
+    restored, restore = timed(restore_savepoint, SAVEPOINT)
+    assert restored == result
+    print('Restore savepoint: {0:.1f} s ({1:.1f}x faster than rebuild)'
+          .format(restore, rebuild / restore))
+
+
+if __name__ == '__main__':
+    main()
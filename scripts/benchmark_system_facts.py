@@ -0,0 +1,58 @@
+"""Measure the generation of fake system facts for the registration of many
+content hosts, one system at a time with
+:func:`robottelo.system_facts.generate_system_facts`, in batch with
+:func:`robottelo.system_facts.generate_system_facts_batch` and as
+newline-delimited JSON::
+
+    $ python scripts/benchmark_system_facts.py --number 10000
+
+"""
+import argparse
+import io
+import json
+import os
+import timeit
+
+from robottelo.system_facts import (
+    generate_system_facts,
+    generate_system_facts_batch,
+    write_system_facts_ndjson,
+)
+
+
+def one_at_a_time(number):
+    return [generate_system_facts() for _ in range(number)]
+
+
+def one_at_a_time_ndjson(number):
+    with io.open(os.devnull, 'w') as stream:
+        for _ in range(number):
+            stream.write(json.dumps(generate_system_facts()) + u'\n')
+
+
+def batch_ndjson(number):
+    with io.open(os.devnull, 'w') as stream:
+        write_system_facts_ndjson(stream, number)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--number', type=int, default=10000,
+        help='number of systems to generate facts for')
+    args = parser.parse_args()
+    benchmarks = (
+        ('one at a time', one_at_a_time),
+        ('batch', generate_system_facts_batch),
+        ('one at a time, NDJSON', one_at_a_time_ndjson),
+        ('batch, NDJSON', batch_ndjson),
+    )
+    for name, function in benchmarks:
+        best = min(timeit.repeat(
+            lambda: function(args.number), number=1, repeat=3))
+        print('{0}: {1:.3f} s, {2:.0f} systems/s'.format(
+            name, best, args.number / best))
+
+
+if __name__ == '__main__':
+    main()
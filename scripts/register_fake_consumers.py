@@ -0,0 +1,48 @@
+"""Register fake content hosts to the Satellite of robottelo.properties with
+activation keys and report the registrations per second and latencies::
+
+    $ python scripts/register_fake_consumers.py Default_Organization ak \\
+        --count 5000 --workers 50 --unregister
+
+"""
+import argparse
+import logging
+
+from robottelo.api.fake_consumers import (
+    FakeConsumerRegistrar,
+    REGISTRATION_MAX_WORKERS,
+)
+from robottelo.config import settings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('org_label', help='label of the organization')
+    parser.add_argument(
+        'activation_keys', nargs='+', help='names of the activation keys')
+    parser.add_argument(
+        '--count', type=int, default=1000,
+        help='number of content hosts to register')
+    parser.add_argument(
+        '--workers', type=int, default=REGISTRATION_MAX_WORKERS,
+        help='number of registrations sent at the same time')
+    parser.add_argument(
+        '--unregister', action='store_true',
+        help='unregister the content hosts afterwards')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    settings.configure()
+    with FakeConsumerRegistrar(
+            args.org_label, args.activation_keys,
+            max_workers=args.workers) as registrar:
+        report = registrar.register_many(args.count)
+        print('registration: {0}'.format(report.summary()))
+        for name, error in report.failures[:10]:
+            print('  {0}: {1}'.format(name, error))
+        if args.unregister:
+            report = registrar.unregister(report.consumers)
+            print('unregistration: {0}'.format(report.summary()))
+
+
+if __name__ == '__main__':
+    main()
@@ -6,11 +6,16 @@ import logging
 import pytest
 from nailgun import entities
 
+from robottelo.api import http_session
 from robottelo.cleanup import EntitiesCleaner
+from robottelo.cleanup_journal import close_journal, open_journal, start_reaper
+from robottelo.cli.base import cli_read_cache
 from robottelo.config import settings
 from robottelo.decorators import setting_is_set
 from robottelo.bz_helpers import get_deselect_bug_ids, group_by_key
 from robottelo.helpers import get_func_name
+from robottelo.log import LogCapture, SERVER_LOGS
+from robottelo.savepoint import restore_session_savepoint
 
 
 def log(message, level="DEBUG"):
@@ -92,14 +97,39 @@ def robottelo_logger(worker_id):
     return logger
 
 
+@pytest.fixture(scope="session")
+def cleanup_journal(worker_id, configured_settings):
+    """Journal the entities created by the tests for a background reaper
+    process to delete them when ``cleanup`` and ``cleanup_journal`` are set,
+    see :mod:`robottelo.cleanup_journal`.
+
+    The session doesn't wait for the reaper, which exits once it deleted the
+    entities left when the journal is closed or when this worker process is
+    gone without closing it.
+    """
+    if not (configured_settings.cleanup and
+            configured_settings.cleanup_journal):
+        yield None
+        return
+    journal = open_journal(configured_settings.cleanup_journal, worker_id)
+    start_reaper(journal.path)
+    log('Cleanup journal {0}'.format(journal.path))
+    yield journal
+    close_journal()
+
+
 @pytest.fixture(scope="module", autouse=True)
-def entities_cleaner(robottelo_logger, configured_settings):
+def entities_cleaner(request, robottelo_logger, configured_settings,
+                     cleanup_journal):
     if configured_settings.cleanup:
         robottelo_logger.info('Entities cleaner enabled')
+        if cleanup_journal is not None:
+            cleanup_journal.scope = request.module.__name__
         cleaner = EntitiesCleaner(
             entities.Organization,
             entities.Host,
-            entities.HostGroup
+            entities.HostGroup,
+            journal=cleanup_journal
         )
         yield cleaner
         robottelo_logger.info('Cleaning entities')
@@ -119,6 +149,86 @@ def log_test_execution(robottelo_logger, request):
     robottelo_logger.debug('Finished Test: {}'.format(test_full_name))
 
 
+@pytest.fixture(autouse=True)
+def server_logs(request, configured_settings):
+    """Record the server logs size before each test when
+    ``capture_server_logs`` is set so :func:`pytest_runtest_makereport` can
+    attach what they got to the report of the test if it fails.
+    """
+    if not configured_settings.capture_server_logs:
+        yield None
+        return
+    capture = LogCapture(configured_settings.captured_server_logs or
+                         SERVER_LOGS)
+    try:
+        capture.mark()
+    except Exception as err:
+        log('Could not mark the server logs: {0}'.format(err), 'WARNING')
+        yield None
+        return
+    request.node.server_logs = capture
+    yield capture
+    del request.node.server_logs
+
+
+@pytest.fixture
+def cli_cache(robottelo_logger):
+    """Cache the hammer ``info`` and ``list`` commands outputs during the
+    test, see :class:`robottelo.cli.base.CLIReadCache`. Opt-in as changes not
+    made through hammer are not seen.
+    """
+    with cli_read_cache() as cache:
+        yield cache
+        robottelo_logger.debug(
+            'CLI read cache: {0} hits, {1} misses'.format(
+                cache.hits, cache.misses))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Attach what the server logs got while a test ran to the report of the
+    test when it fails, see :func:`server_logs`.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    capture = getattr(item, 'server_logs', None)
+    if capture is None or not report.failed or report.when == 'teardown':
+        return
+    try:
+        logs = capture.diff()
+    except Exception as err:
+        log('Could not fetch the server logs: {0}'.format(err), 'WARNING')
+        return
+    for path, text in logs.items():
+        report.sections.append(
+            ('Captured server log {0}'.format(path), text))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    """Restore the ``[savepoint] restore`` savepoint before any test runs,
+    in the process starting the pytest-xdist workers, see
+    :func:`robottelo.savepoint.restore_session_savepoint`.
+    """
+    if hasattr(session.config, 'slaveinput'):
+        return
+    if not settings.configured:
+        settings.configure()
+    name = restore_session_savepoint()
+    if name:
+        log('Restored savepoint {0}'.format(name), level='INFO')
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Log how many connections the shared NailGun HTTP session opened and
+    reused, see :mod:`robottelo.api.http_session`.
+    """
+    stats = http_session.get_stats()
+    if stats['requests']:
+        log('NailGun HTTP connections: {opened} opened, {reused} reused by '
+            '{requests} requests'.format(**stats))
+
+
 def pytest_namespace():
     """return dict of name->object to be made globally available in
     the pytest namespace.  This hook is called at plugin registration
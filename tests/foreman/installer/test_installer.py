@@ -1244,6 +1244,8 @@ class SELinuxTestCase(TestCase):
                 'Could not find log file on server\n{}'
                 .format(str(exception))
             )
+        for log in logs:
+            self.addCleanup(log.close)
         if len(logs[0].data) == 0:
             self.skipTest(
                 'Installer log is empty, impossible to distinguish installer '
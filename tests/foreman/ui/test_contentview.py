@@ -2443,7 +2443,8 @@ class ContentViewTestCase(UITestCase):
             try:
                 self.content_views.delete(cv_copy_name)
             except UINoSuchElementError as err:
-                if locators.contentviews.remove[1] in err.message:
+                remove_locator = common_locators['select_action'] % 'Remove'
+                if remove_locator[1] in err.message:
                     self.fail(
                         'content view admin user was not able to access'
                         ' the remove button: {0}'.format(err.message)
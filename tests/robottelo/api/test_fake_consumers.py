@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""Tests for module ``robottelo.api.fake_consumers``."""
+import json
+import threading
+import unittest2
+
+from six.moves import BaseHTTPServer, socketserver
+from six.moves.urllib.parse import parse_qs, urlsplit
+
+from robottelo.api.fake_consumers import (
+    FakeConsumerRegistrar,
+    RegistrationError,
+    RegistrationReport,
+    percentile,
+)
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Minimal RHSM consumers endpoint refusing the consumers named
+    ``bad.example.com``.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def _respond(self, status, body=None):
+        body = b'' if body is None else json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        consumer = json.loads(self.rfile.read(
+            int(self.headers['Content-Length'])).decode('utf-8'))
+        self.server.registered.append((parse_qs(url.query), consumer))
+        if consumer['name'] == 'bad.example.com':
+            self._respond(400, {'displayMessage': 'Invalid name'})
+        else:
+            self._respond(200, {
+                'uuid': 'uuid-{0}'.format(consumer['name']),
+                'idCert': {'cert': 'cert', 'key': 'key'},
+            })
+
+    def do_DELETE(self):
+        self.server.unregistered.append(
+            (self.path, self.headers.get('Authorization')))
+        if self.path.endswith('uuid-gone'):
+            self._respond(410)
+        elif self.path.endswith('uuid-locked'):
+            self._respond(403, {'displayMessage': 'Forbidden'})
+        else:
+            self._respond(204)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class FakeConsumerRegistrarTestCase(unittest2.TestCase):
+    """Tests for :class:`robottelo.api.fake_consumers.FakeConsumerRegistrar`.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = _Server(('127.0.0.1', 0), _Handler)
+        thread = threading.Thread(target=cls.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.registered = []
+        self.server.unregistered = []
+        self.registrar = FakeConsumerRegistrar(
+            'org', ['ak1', 'ak2'],
+            max_workers=4,
+            server_url='http://127.0.0.1:{0}/'.format(
+                self.server.server_address[1]),
+            credentials=('admin', 'changeme'),
+        )
+        self.addCleanup(self.registrar.close)
+
+    def test_register_many(self):
+        report = self.registrar.register_many(20)
+        self.assertEqual(len(report.consumers), 20)
+        self.assertEqual(report.failures, [])
+        self.assertEqual(len(report.latencies), 20)
+        self.assertEqual(report.latencies, sorted(report.latencies))
+        self.assertGreater(report.rate, 0)
+        params, consumer = self.server.registered[0]
+        self.assertEqual(
+            params, {'owner': ['org'], 'activation_keys': ['ak1,ak2']})
+        self.assertEqual(consumer['type'], 'system')
+        self.assertEqual(
+            consumer['name'], consumer['facts']['network.hostname'])
+        self.assertEqual(
+            len({consumer['facts']['dmi.system.uuid']
+                 for _, consumer in self.server.registered}),
+            20
+        )
+
+    def test_keep_going_after_failures(self):
+        report = self.registrar.register_many(
+            3, ['a.example.com', 'bad.example.com', 'b.example.com'])
+        self.assertEqual(
+            sorted(report.consumers),
+            ['uuid-a.example.com', 'uuid-b.example.com']
+        )
+        (name, error), = report.failures
+        self.assertEqual(name, 'bad.example.com')
+        self.assertIsInstance(error, RegistrationError)
+        self.assertIn('HTTP 400: Invalid name', str(error))
+        self.assertIn('2/3 succeeded, 1 failed', report.summary())
+
+    def test_unregister(self):
+        report = self.registrar.unregister(
+            ['uuid-1', 'uuid-gone', 'uuid-locked'])
+        self.assertEqual(sorted(report.consumers), ['uuid-1', 'uuid-gone'])
+        self.assertEqual(
+            [uuid for uuid, _ in report.failures], ['uuid-locked'])
+        path, authorization = sorted(self.server.unregistered)[0]
+        self.assertEqual(path, '/rhsm/consumers/uuid-1')
+        self.assertTrue(authorization.startswith('Basic '))
+
+    def test_activation_key_required(self):
+        with self.assertRaises(ValueError):
+            FakeConsumerRegistrar('org', [], server_url='http://localhost')
+
+
+class RegistrationReportTestCase(unittest2.TestCase):
+    """Tests for :class:`robottelo.api.fake_consumers.RegistrationReport`."""
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile(values, 100), 100)
+        self.assertEqual(percentile([3], 0), 3)
+        self.assertIsNone(percentile([], 50))
+
+    def test_summary(self):
+        report = RegistrationReport(4)
+        for latency in (0.1, 0.2, 0.3):
+            report.add('uuid', latency)
+        report.add('name', 0.4, RegistrationError('error'))
+        report.latencies.sort()
+        report.elapsed = 1.5
+        self.assertEqual(report.rate, 2)
+        self.assertEqual(
+            report.summary(),
+            u'3/4 succeeded, 1 failed in 1.5 s, 2.0/s, '
+            u'latency p50=200ms p90=400ms p95=400ms p99=400ms'
+        )
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Tests for module ``robottelo.api.http_session``."""
+import json
+import requests
+import six
+import threading
+import unittest2
+
+from nailgun import client
+from six.moves import BaseHTTPServer, socketserver
+
+from robottelo.api import http_session
+from robottelo.config.base import HTTPClientSettings
+
+if six.PY2:
+    import mock
+else:
+    from unittest import mock
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Answer the requests with their Accept-Encoding and Cookie headers,
+    setting a session cookie and keeping the connections open.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = json.dumps({
+            'accept_encoding': self.headers.get('Accept-Encoding'),
+            'cookie': self.headers.get('Cookie'),
+        }).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Set-Cookie', '_session_id=user1; Path=/')
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_POST = do_GET
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class HTTPSessionTestCase(unittest2.TestCase):
+    """Tests for the shared NailGun HTTP session."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = _Server(('127.0.0.1', 0), _Handler)
+        cls.url = 'http://127.0.0.1:{0}/api/v2/status'.format(
+            cls.server.server_address[1])
+        thread = threading.Thread(target=cls.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.http_settings = HTTPClientSettings()
+        http_session.install(self.http_settings)
+        self.addCleanup(http_session.uninstall)
+        http_session.reset_stats()
+
+    def test_reuse_connections(self):
+        for _ in range(5):
+            self.assertEqual(client.get(self.url).status_code, 200)
+        client.post(self.url, {'name': 'org'})
+        self.assertEqual(
+            http_session.get_stats(),
+            {'opened': 1, 'requests': 6, 'reused': 5}
+        )
+
+    def test_compression(self):
+        self.assertEqual(
+            client.get(self.url).json()['accept_encoding'], 'gzip, deflate')
+        self.http_settings.compression = False
+        http_session.install(self.http_settings)
+        self.assertEqual(
+            client.get(self.url).json()['accept_encoding'], 'identity')
+
+    def test_cookies_not_kept(self):
+        client.get(self.url, auth=('user1', 'password'))
+        response = client.get(self.url, auth=('user2', 'password'))
+        self.assertIsNone(response.json()['cookie'])
+        self.assertEqual(len(http_session.get_session().cookies), 0)
+
+    def test_new_session_after_fork(self):
+        session = http_session.get_session()
+        client.get(self.url)
+        self.assertIs(http_session.get_session(), session)
+        with mock.patch('robottelo.api.http_session.os.getpid',
+                        return_value=-1):
+            self.assertIsNot(http_session.get_session(), session)
+            self.assertEqual(http_session.get_stats()['requests'], 0)
+
+    def test_uninstall(self):
+        http_session.uninstall()
+        self.assertIs(client.requests, requests)
+        client.get(self.url)
+        self.assertEqual(http_session.get_stats()['requests'], 0)
+
+    def test_validate_settings(self):
+        self.assertEqual(self.http_settings.validate(), [])
+        self.http_settings.pool_size = 0
+        self.assertEqual(
+            self.http_settings.validate(),
+            ['[http_client] pool_size must be at least 1.']
+        )
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""Tests for module ``robottelo.cli.command_tree``."""
+import json
+import os
+import shutil
+import six
+import stat
+import subprocess
+import tempfile
+import unittest2
+
+from robottelo.cli import command_tree
+from robottelo.cli.base import Base, CLIError
+
+if six.PY2:
+    import mock
+else:
+    from unittest import mock
+
+HELPS = {
+    '': [
+        'Usage:',
+        '    hammer [OPTIONS] SUBCOMMAND [ARG] ...',
+        '',
+        'Subcommands:',
+        ' content-view                  Manipulate content views.',
+        ' ping                          Get the status of the server',
+        '',
+        'Options:',
+        ' -h, --help                    print help',
+    ],
+    'content-view': [
+        'Subcommands:',
+        ' version                       View and manage content view versions',
+        ' info                          Show a content view',
+        '',
+        'Options:',
+        ' -h, --help                    print help',
+    ],
+    'content-view version': [
+        'Subcommands:',
+        ' promote                       Promote a content view version',
+        '',
+        'Options:',
+        ' -h, --help                    print help',
+    ],
+    'content-view version promote': [
+        'Options:',
+        ' --async                       Do not wait for the task',
+        ' --content-view-id, --cv-id CONTENT_VIEW_ID  Content view numeric',
+        '                               identifier',
+        ' --to-lifecycle-environment-id TO_ENVIRONMENT_ID',
+        ' -h, --help                    print help',
+    ],
+    'content-view info': [
+        'Options:',
+        ' --id ID                       Content view numeric identifier',
+        ' --name NAME                   Content view name',
+        ' -h, --help                    print help',
+    ],
+    'ping': [
+        'Options:',
+        ' -h, --help                    print help',
+    ],
+}
+
+
+class FakeSSH(object):
+    """Run the commands on the local host with a fake hammer."""
+
+    def __init__(self, bin_dir):
+        self.bin_dir = bin_dir
+        self.calls = 0
+
+    def command(self, cmd, hostname=None, output_format=None):
+        self.calls += 1
+        env = dict(os.environ)
+        env['PATH'] = os.pathsep.join((self.bin_dir, env.get('PATH', '')))
+        process = subprocess.Popen(
+            cmd, shell=True, env=env,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        stdout, stderr = process.communicate()
+        return mock.Mock(
+            stdout=stdout.decode('utf-8'),
+            stderr=stderr.decode('utf-8'),
+            return_code=process.returncode,
+        )
+
+
+class CommandTreeTestCase(unittest2.TestCase):
+    """Tests for the hammer command tree generation and cache."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        bin_dir = os.path.join(self.tmpdir, 'bin')
+        helps_dir = os.path.join(self.tmpdir, 'helps')
+        os.makedirs(bin_dir)
+        os.makedirs(helps_dir)
+        for command, lines in HELPS.items():
+            path = os.path.join(helps_dir, command.replace(' ', '_') or '_')
+            with open(path, 'w') as handler:
+                handler.write('\n'.join(lines) + '\n')
+        hammer = os.path.join(bin_dir, 'hammer')
+        with open(hammer, 'w') as handler:
+            handler.write(
+                '#!/bin/sh\n'
+                'name=$(echo "$@" | sed "s/ *--help//; s/ /_/g")\n'
+                'cat "{0}/${{name:-_}}"\n'.format(helps_dir)
+            )
+        os.chmod(hammer, os.stat(hammer).st_mode | stat.S_IEXEC)
+        self.ssh = FakeSSH(bin_dir)
+        self.data_dir = os.path.join(self.tmpdir, 'data')
+        for target, new in (
+                ('robottelo.cli.command_tree.ssh', self.ssh),
+                ('robottelo.cli.command_tree.COMMAND_TREE_DATA_DIR',
+                 self.data_dir),
+                ('robottelo.cli.command_tree._get_version_key',
+                 lambda hostname=None: '6.4.0-abc')):
+            patcher = mock.patch(target, new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        command_tree.clear_command_trees()
+        self.addCleanup(command_tree.clear_command_trees)
+
+    def test_generate_a_level_at_a_time(self):
+        tree = command_tree.generate_command_tree()
+        content_view = tree['subcommands'][0]
+        self.assertEqual(content_view['name'], 'content-view')
+        version = content_view['subcommands'][0]
+        self.assertEqual(
+            version['subcommands'][0]['option_names'],
+            ['async', 'content-view-id', 'cv-id', 'help',
+             'to-lifecycle-environment-id']
+        )
+        # hammer and one call per level of subcommands
+        self.assertEqual(self.ssh.calls, 4)
+
+    def test_cached_per_version(self):
+        tree = command_tree.get_command_tree()
+        path = os.path.join(self.data_dir, 'hammer_commands-6.4.0-abc.json')
+        with open(path) as handler:
+            self.assertEqual(json.load(handler), tree)
+        calls = self.ssh.calls
+        # as if in a new process
+        command_tree.clear_command_trees()
+        self.assertEqual(command_tree.get_command_tree(), tree)
+        self.assertEqual(self.ssh.calls, calls)
+
+    def test_not_generated(self):
+        self.assertIsNone(command_tree.get_command_tree(generate=False))
+        self.assertEqual(self.ssh.calls, 0)
+
+    def test_validate_options(self):
+        self.assertEqual(command_tree.validate_options(
+            'content-view version promote',
+            ['cv-id', 'async', 'to-lifecycle-environment-id'],
+        ), [])
+        self.assertEqual(
+            command_tree.validate_options(
+                'content-view info', ['id', 'nmae', 'organization-xyz']),
+            [
+                'hammer content-view info does not accept --nmae, did you '
+                'mean --name?',
+                'hammer content-view info does not accept '
+                '--organization-xyz',
+            ]
+        )
+
+    def test_validate_unknown_command(self):
+        self.assertEqual(
+            command_tree.validate_options('host list', ['anything']), [])
+
+    @mock.patch('robottelo.cli.base.settings')
+    def test_construct_command(self, settings):
+        settings.validate_hammer_options = True
+
+        class ContentViewCLI(Base):
+            command_base = 'content-view'
+            command_sub = 'info'
+
+        self.assertEqual(
+            ContentViewCLI._construct_command({'id': 1, 'name': None}),
+            u'content-view info --id="1"'
+        )
+        with self.assertRaisesRegexp(CLIError, '--nmae, did you mean'):
+            ContentViewCLI._construct_command({'nmae': 'cv'})
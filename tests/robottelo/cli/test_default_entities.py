@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Tests for module ``robottelo.cli.default_entities``."""
+import importlib
+import six
+import unittest2
+
+from fauxfactory import gen_string
+
+from robottelo.cleanup_journal import is_journaled
+from robottelo.cli import default_entities
+from robottelo.cli.base import Base, CLIReturnCodeError
+from robottelo.cli.org import Org
+from robottelo.decorators.func_shared.shared import _set_configured
+
+if six.PY2:
+    import mock
+else:
+    from unittest import mock
+
+# do not read the shared function settings
+_set_configured(True)
+
+# the module, robottelo.decorators.func_shared.shared is the decorator
+shared_module = importlib.import_module(
+    'robottelo.decorators.func_shared.shared')
+
+
+class ResolveTestCase(unittest2.TestCase):
+    """Tests for :func:`robottelo.cli.default_entities.resolve`."""
+
+    def setUp(self):
+        patcher = mock.patch.object(shared_module, 'ENABLED', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        default_entities.clear()
+        self.addCleanup(default_entities.clear)
+        self.lookup = mock.Mock(return_value='1')
+
+    def test_lookup_once(self):
+        self.assertEqual(
+            default_entities.resolve(Org, 'Default', self.lookup), '1')
+        self.assertEqual(
+            default_entities.resolve(Org, 'Default', self.lookup), '1')
+        self.assertEqual(self.lookup.call_count, 1)
+
+    def test_per_command_and_name(self):
+        default_entities.resolve(Org, 'Default', self.lookup)
+        default_entities.resolve(Org, 'Other', self.lookup)
+        default_entities.resolve(Base, 'Default', self.lookup)
+        self.assertEqual(self.lookup.call_count, 3)
+
+    def test_lookup_not_journaled(self):
+        self.lookup.side_effect = lambda: is_journaled()
+        self.assertIs(
+            default_entities.resolve(Org, 'Default', self.lookup), False)
+        self.assertTrue(is_journaled())
+
+    def test_lookup_error_not_cached(self):
+        self.lookup.side_effect = [
+            CLIReturnCodeError(128, 'error', 'not found'), '2']
+        with self.assertRaises(CLIReturnCodeError):
+            default_entities.resolve(Org, 'Default', self.lookup)
+        self.assertEqual(
+            default_entities.resolve(Org, 'Default', self.lookup), '2')
+
+    def test_invalidate(self):
+        default_entities.resolve(Org, 'Default', self.lookup)
+        default_entities.resolve(Base, 'Default', self.lookup)
+        default_entities.invalidate(Org)
+        default_entities.resolve(Org, 'Default', self.lookup)
+        default_entities.resolve(Base, 'Default', self.lookup)
+        self.assertEqual(self.lookup.call_count, 3)
+
+    @mock.patch('robottelo.cli.base.Base.execute')
+    @mock.patch('robottelo.cli.base.Base._construct_command')
+    def test_delete_invalidates(self, construct, execute):
+        default_entities.resolve(Org, 'Default', self.lookup)
+        Org.delete({'id': '1'})
+        default_entities.resolve(Org, 'Default', self.lookup)
+        self.assertEqual(self.lookup.call_count, 2)
+
+    def test_shared_between_processes(self):
+        with mock.patch.object(shared_module, 'ENABLED', True), \
+                mock.patch.object(
+                    shared_module, 'NAMESPACE_SCOPE', gen_string('alpha')):
+            default_entities.resolve(Org, 'Default', self.lookup)
+            # as if in a new process
+            default_entities.clear()
+            self.assertEqual(
+                default_entities.resolve(Org, 'Default', self.lookup), '1')
+            self.assertEqual(self.lookup.call_count, 1)
+            default_entities.invalidate(Org)
+            default_entities.resolve(Org, 'Default', self.lookup)
+        self.assertEqual(self.lookup.call_count, 2)
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""Tests for module ``robottelo.cli.factory``."""
+import importlib
+import six
+import unittest2
+
+from robottelo.cli import default_entities
+from robottelo.cli.base import CLIReturnCodeError
+from robottelo.cli.factory import (
+    CLIFactoryError,
+    make_fake_host,
+    setup_org_for_a_custom_repo,
+    synchronize_repositories,
+)
+from robottelo.decorators.func_shared.shared import _set_configured
+from robottelo.tasks import TaskTracker
+
+if six.PY2:
+    import mock
+else:
+    from unittest import mock
+
+# do not read the shared function settings
+_set_configured(True)
+
+# the module, robottelo.decorators.func_shared.shared is the decorator
+shared_module = importlib.import_module(
+    'robottelo.decorators.func_shared.shared')
+
+
+class SynchronizeRepositoriesTestCase(unittest2.TestCase):
+    """Tests for :func:`robottelo.cli.factory.synchronize_repositories`."""
+
+    def setUp(self):
+        patcher = mock.patch('robottelo.cli.factory.Repository.synchronize')
+        self.synchronize = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.synchronize.side_effect = lambda options: [
+            {'id': 'task-{0}'.format(options['id'])}]
+        self.states = mock.Mock()
+        patcher = mock.patch(
+            'robottelo.cli.factory.cli_tracker',
+            TaskTracker(self.states, poll_rate=0.01, max_poll_rate=0.01)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_submit_async_and_poll_together(self):
+        self.states.return_value = {
+            'task-1': ('stopped', 'success'),
+            'task-2': ('stopped', 'success'),
+        }
+        synchronize_repositories(['1', '2'], max_concurrent=4)
+        self.synchronize.assert_has_calls([
+            mock.call({'id': '1', 'async': True}),
+            mock.call({'id': '2', 'async': True}),
+        ])
+        self.assertEqual(self.states.call_count, 1)
+
+    def test_concurrency_cap(self):
+        polled = []
+
+        def states(task_ids):
+            polled.append(sorted(task_ids))
+            return {task_id: ('stopped', 'success') for task_id in task_ids}
+
+        self.states.side_effect = states
+        synchronize_repositories(['1', '2', '3'], max_concurrent=2)
+        self.assertEqual(polled, [['task-1', 'task-2'], ['task-3']])
+
+    def test_wait_for_running_tasks(self):
+        self.states.side_effect = [
+            {'task-1': ('running', 'pending')},
+            {'task-1': ('stopped', 'success')},
+        ]
+        synchronize_repositories(['1'])
+        self.assertEqual(self.states.call_count, 2)
+
+    def test_failures_reported_per_repository(self):
+        def synchronize(options):
+            if options['id'] == '3':
+                raise CLIReturnCodeError(1, 'error', 'not found')
+            return [{'id': 'task-{0}'.format(options['id'])}]
+
+        self.synchronize.side_effect = synchronize
+        self.states.return_value = {
+            'task-1': ('stopped', 'success'),
+            'task-2': ('stopped', 'error'),
+        }
+        with self.assertRaises(CLIFactoryError) as context:
+            synchronize_repositories(['1', '2', '3'])
+        message = str(context.exception)
+        self.assertNotIn('repository 1:', message)
+        self.assertIn(
+            'repository 2: Task task-2 finished with result error', message)
+        self.assertIn('repository 3: submission failed: not found', message)
+
+    def test_timeout(self):
+        self.states.return_value = {'task-1': ('running', 'pending')}
+        with self.assertRaises(CLIFactoryError) as context:
+            synchronize_repositories(['1'], timeout=-1)
+        self.assertIn('timed out in state running', str(context.exception))
+
+
+class SetupOrgForACustomRepoTestCase(unittest2.TestCase):
+    """Tests for :func:`robottelo.cli.factory.setup_org_for_a_custom_repo`."""
+
+    def setUp(self):
+        self.patches = {}
+        for name, value in (
+                ('make_org', {'id': 'org'}),
+                ('make_lifecycle_environment', {'id': 'lce'}),
+                ('make_product', {'id': 'product', 'name': 'Product'}),
+                ('make_repository', {'id': 'repo'}),
+                ('make_content_view', {'id': 'cv'}),
+                ('make_activation_key', {'id': 'ak'}),
+                ('activationkey_add_subscription_to_repo', None),
+                ('Repository', None),
+                ('ContentView', None),
+                ('ActivationKey', None)):
+            patcher = mock.patch(
+                'robottelo.cli.factory.{0}'.format(name),
+                return_value=value
+            )
+            self.patches[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+        self.patches['ContentView'].info.return_value = {
+            'versions': [{'id': 'cvv'}]}
+
+    def test_create_all(self):
+        result = setup_org_for_a_custom_repo({'url': 'http://repo'})
+        self.assertEqual(result, {
+            'activationkey-id': 'ak',
+            'content-view-id': 'cv',
+            'lifecycle-environment-id': 'lce',
+            'organization-id': 'org',
+            'product-id': 'product',
+            'repository-id': 'repo',
+        })
+        self.patches['Repository'].synchronize.assert_called_once_with(
+            {'id': 'repo'})
+        self.patches['ContentView'].version_promote.assert_called_once_with({
+            'id': 'cvv',
+            'organization-id': 'org',
+            'to-lifecycle-environment-id': 'lce',
+        })
+        self.patches[
+            'activationkey_add_subscription_to_repo'
+        ].assert_called_once_with({
+            'activationkey-id': 'ak',
+            'organization-id': 'org',
+            'subscription': 'Product',
+        })
+
+    def test_given_entities(self):
+        result = setup_org_for_a_custom_repo({
+            'url': 'http://repo',
+            'organization-id': 'given-org',
+            'lifecycle-environment-id': 'given-lce',
+            'content-view-id': 'given-cv',
+            'activationkey-id': 'given-ak',
+        })
+        self.assertEqual(result['organization-id'], 'given-org')
+        self.assertEqual(result['activationkey-id'], 'given-ak')
+        for name in ('make_org', 'make_lifecycle_environment',
+                     'make_content_view', 'make_activation_key'):
+            self.patches[name].assert_not_called()
+        self.patches['ActivationKey'].update.assert_called_once_with({
+            'content-view-id': 'given-cv',
+            'id': 'given-ak',
+            'organization-id': 'given-org',
+        })
+
+    def test_sync_failure(self):
+        self.patches['Repository'].synchronize.side_effect = (
+            CLIReturnCodeError(1, 'error', 'sync failed'))
+        with self.assertRaisesRegex(CLIFactoryError, 'sync failed'):
+            setup_org_for_a_custom_repo({'url': 'http://repo'})
+        self.patches['ContentView'].publish.assert_not_called()
+
+
+class MakeFakeHostTestCase(unittest2.TestCase):
+    """Tests for :func:`robottelo.cli.factory.make_fake_host`."""
+
+    def setUp(self):
+        patcher = mock.patch.object(shared_module, 'ENABLED', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        default_entities.clear()
+        self.addCleanup(default_entities.clear)
+        self.mocks = {}
+        for name, return_value in (
+                ('Org.info', {'id': 'org'}),
+                ('Location.info', {'id': 'loc'}),
+                ('Architecture.info', {'id': 'arch'}),
+                ('OperatingSys.list', [{'id': 'os'}]),
+                ('PartitionTable.list', [{'id': 'ptable'}]),
+                ('make_domain', {'id': 'domain'}),
+                ('make_medium', {'id': 'medium'}),
+                ('make_host', {'id': 'host'})):
+            patcher = mock.patch(
+                'robottelo.cli.factory.{0}'.format(name),
+                return_value=return_value
+            )
+            self.mocks[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_default_entities_resolved_once(self):
+        for _ in range(3):
+            make_fake_host()
+        for name in ('Org.info', 'Location.info', 'Architecture.info',
+                     'OperatingSys.list', 'PartitionTable.list'):
+            self.assertEqual(self.mocks[name].call_count, 1, name)
+        self.assertEqual(self.mocks['make_domain'].call_count, 3)
+        self.assertEqual(self.mocks['make_medium'].call_count, 3)
+        self.mocks['make_host'].assert_called_with({
+            'organization-id': 'org',
+            'location-id': 'loc',
+            'domain-id': 'domain',
+            'architecture-id': 'arch',
+            'operatingsystem-id': 'os',
+            'partition-table-id': 'ptable',
+            'medium-id': 'medium',
+        })
+
+    def test_reuse_entities(self):
+        for _ in range(3):
+            make_fake_host(reuse_entities=True)
+        make_fake_host({'organization-id': 'other'}, reuse_entities=True)
+        self.assertEqual(self.mocks['make_domain'].call_count, 2)
+        self.assertEqual(self.mocks['make_medium'].call_count, 2)
+
+    def test_default_missing(self):
+        self.mocks['Org.info'].side_effect = CLIReturnCodeError(
+            128, 'error', 'not found')
+        with mock.patch(
+                'robottelo.cli.factory.make_org',
+                return_value={'id': 'new'}) as make_org:
+            make_fake_host()
+            make_fake_host()
+        # created once and reused like the default one
+        self.assertEqual(make_org.call_count, 1)
+        self.assertEqual(
+            self.mocks['make_host'].call_args[0][0]['organization-id'], 'new')
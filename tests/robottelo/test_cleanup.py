@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""Tests for module ``robottelo.cleanup``."""
+import six
+import unittest2
+
+from collections import deque
+from concurrent.futures import Future
+from nailgun import entities, entity_mixins
+from nailgun.config import ServerConfig
+
+from robottelo.cleanup import EntitiesCleaner
+from robottelo.cleanup_journal import not_journaled
+from robottelo.tasks import TaskFailedError
+
+if six.PY2:
+    import mock
+else:
+    from unittest import mock
+
+
+def _task(task_id):
+    return {'id': task_id, 'state': 'planned', 'pending': True}
+
+
+def _future(error=None):
+    future = Future()
+    if error is None:
+        future.set_result({'state': 'stopped', 'result': 'success'})
+    else:
+        future.set_exception(error)
+    return future
+
+
+class EntitiesCleanerTestCase(unittest2.TestCase):
+    """Tests for :class:`robottelo.cleanup.EntitiesCleaner`."""
+
+    def setUp(self):
+        server_config = ServerConfig('http://example.com')
+        for patcher in (
+                mock.patch.object(
+                    entity_mixins, 'DEFAULT_SERVER_CONFIG', server_config),
+                mock.patch.object(entities.Organization, 'delete',
+                                  autospec=True),
+                mock.patch.object(entities.Host, 'search_json',
+                                  autospec=True),
+                mock.patch.object(entities.Host, 'update', autospec=True),
+                mock.patch.object(entities.HostGroup, 'update',
+                                  autospec=True)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch('robottelo.cleanup.api_tracker')
+        self.api_tracker = patcher.start()
+        self.addCleanup(patcher.stop)
+        entities.Host.search_json.return_value = {'results': []}
+        self.cleaner = EntitiesCleaner(max_workers=2)
+        self.orgs = [entities.Organization(id=org_id) for org_id in (1, 2, 3)]
+        self.cleaner.cleanup_queue['Organization'].extend(self.orgs)
+
+    def test_clean(self):
+        host = entities.Host(id=10)
+        hostgroup = entities.HostGroup(id=20)
+        self.cleaner.cleanup_queue['Host'].append(host)
+        self.cleaner.cleanup_queue['HostGroup'].append(hostgroup)
+        entities.Host.search_json.return_value = {
+            'results': [{'id': 11, 'organization_id': 2}]}
+        entities.Organization.delete.side_effect = (
+            lambda org, **kwargs: _task('task{0}'.format(org.id)))
+        self.api_tracker.track.side_effect = lambda task_id: _future(
+            TaskFailedError(task_id, 'error') if task_id == 'task3' else None)
+
+        undeleted = self.cleaner.clean()
+
+        self.assertEqual(self.cleaner.deleted_entities['Organization'], {1})
+        self.assertEqual(undeleted['Organization'], {
+            2: 'it has 1 hosts',
+            3: 'Task task3 finished with result error',
+        })
+        # a single search of all the organizations hosts
+        entities.Host.search_json.assert_called_once_with(
+            mock.ANY, query={
+                'search': 'organization_id ^ (1, 2, 3)', 'per_page': 10000})
+        self.assertEqual(
+            sorted(call[0][0].id for call in
+                   entities.Organization.delete.call_args_list),
+            [1, 3]
+        )
+        entities.Host.update.assert_called_once_with(host, fields=mock.ANY)
+        self.assertEqual(host.organization.id, 1)
+        self.assertIsNone(host.hostgroup)
+        entities.HostGroup.update.assert_called_once_with(
+            hostgroup, fields=mock.ANY)
+
+    def test_keep_going_after_errors(self):
+        def delete(org, **kwargs):
+            if org.id == 1:
+                raise ValueError('cannot delete')
+        entities.Organization.delete.side_effect = delete
+        self.cleaner.delete_entities(self.orgs)
+        self.assertEqual(
+            self.cleaner.deleted_entities['Organization'], {2, 3})
+        self.assertEqual(
+            self.cleaner.undeleted_entities['Organization'],
+            {1: 'cannot delete'}
+        )
+
+    def test_skip_deleted_entities(self):
+        self.cleaner.delete_entities(self.orgs[:1])
+        self.cleaner.delete_entities(self.orgs)
+        self.assertEqual(entities.Organization.delete.call_count, 3)
+        self.assertEqual(
+            self.cleaner.deleted_entities['Organization'], {1, 2, 3})
+
+    def test_journal(self):
+        journal = mock.Mock(scope='tests.foreman.api.test_organization')
+        cleaner = EntitiesCleaner(journal=journal)
+        cleaner.register_entity_for_cleanup(
+            entities.Organization, self.orgs[0])
+        journal.add.assert_called_once_with(u'api', 'Organization', 1)
+        with not_journaled():
+            cleaner.register_entity_for_cleanup(
+                entities.Organization, self.orgs[1])
+        self.assertEqual(journal.add.call_count, 1)
+        self.assertEqual(cleaner.cleanup_queue['Organization'], deque())
+        cleaner.clean()
+        journal.release.assert_called_once_with()
+        self.assertFalse(entities.Organization.delete.called)
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""Tests for module ``robottelo.cleanup_journal``."""
+import io
+import os
+import shutil
+import six
+import subprocess
+import sys
+import tempfile
+import unittest2
+
+from requests.exceptions import HTTPError
+
+from robottelo import cleanup_journal
+from robottelo.cleanup_journal import (
+    CleanupJournal,
+    MAX_ATTEMPTS,
+    Reaper,
+    read_journal,
+)
+from robottelo.cli.base import Base, CLIReturnCodeError
+
+if six.PY2:
+    import mock
+else:
+    from unittest import mock
+
+
+class OrgCLI(Base):
+    command_base = 'organization'
+
+
+class ProductCLI(Base):
+    command_base = 'product'
+    command_requires_org = True
+
+
+class JournalTestCase(unittest2.TestCase):
+    """Base test case with a journal in a temporary directory."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.journal = CleanupJournal(
+            os.path.join(self.tmpdir, 'gw0.journal'), scope='module1')
+
+
+class CleanupJournalTestCase(JournalTestCase):
+    """Tests for :class:`robottelo.cleanup_journal.CleanupJournal`."""
+
+    def test_read(self):
+        self.journal.add(u'api', u'Organization', 1)
+        self.journal.add(u'api', u'Organization', 2)
+        self.journal.scope = 'module2'
+        self.journal.add(u'cli', u'robottelo.cli.org.Org', u'3')
+        self.journal.release('module1')
+        self.journal.mark_deleted((u'api', u'Organization', 1))
+        self.journal.mark_failed((u'api', u'Organization', 2), u'error')
+        # a line partially written by a crashed process
+        with io.open(self.journal.path, 'a', encoding='utf-8') as handler:
+            handler.write(u'{"event": "crea')
+        pending, closed = read_journal(self.journal.path)
+        self.assertFalse(closed)
+        self.assertEqual(list(pending), [
+            (u'api', u'Organization', 2),
+            (u'cli', u'robottelo.cli.org.Org', u'3'),
+        ])
+        organization = pending[(u'api', u'Organization', 2)]
+        self.assertTrue(organization['released'])
+        self.assertEqual(organization['attempts'], 1)
+        self.assertEqual(organization['reason'], u'error')
+        self.assertFalse(
+            pending[(u'cli', u'robottelo.cli.org.Org', u'3')]['released'])
+
+    def test_close_releases_all(self):
+        self.journal.scope = None
+        self.journal.add(u'api', u'Host', 1)
+        self.journal.close()
+        pending, closed = read_journal(self.journal.path)
+        self.assertTrue(closed)
+        self.assertTrue(pending[(u'api', u'Host', 1)]['released'])
+
+    def test_record_created(self):
+        journal = cleanup_journal.open_journal(self.tmpdir, 'gw1')
+        self.addCleanup(cleanup_journal.close_journal)
+        self.assertIs(cleanup_journal.get_journal(), journal)
+        cleanup_journal.record_created(OrgCLI, {'id': '1'}, {'name': 'org'})
+        cleanup_journal.record_created(
+            ProductCLI, {'id': '2'}, {'organization-id': '1'})
+        cleanup_journal.record_created(OrgCLI, [], {})
+        with cleanup_journal.not_journaled():
+            cleanup_journal.record_created(OrgCLI, {'id': '3'}, {})
+        pending, _ = read_journal(journal.path)
+        self.assertEqual(
+            [(key, record['options']) for key, record in pending.items()],
+            [
+                ((u'cli', u'{0}.OrgCLI'.format(__name__), u'1'), {}),
+                ((u'cli', u'{0}.ProductCLI'.format(__name__), u'2'),
+                 {u'organization-id': u'1'}),
+            ]
+        )
+
+
+class DeleteTestCase(unittest2.TestCase):
+    """Tests for the deletion of the journal entities."""
+
+    @mock.patch('robottelo.cleanup_journal.entities')
+    def test_api_already_deleted(self, entities):
+        response = mock.Mock(status_code=404)
+        entities.Organization.return_value.delete.side_effect = HTTPError(
+            response=response)
+        self.assertIsNone(cleanup_journal._delete(
+            {'source': u'api', 'type': u'Organization', 'id': 1}))
+        response.status_code = 500
+        self.assertIsInstance(
+            cleanup_journal._delete(
+                {'source': u'api', 'type': u'Organization', 'id': 1}),
+            HTTPError
+        )
+
+    @mock.patch('robottelo.cleanup_journal.api_tracker')
+    @mock.patch('robottelo.cleanup_journal.entities')
+    def test_api_task(self, entities, api_tracker):
+        entities.Organization.return_value.delete.return_value = {
+            'id': 'uuid', 'state': 'planned', 'pending': True}
+        self.assertIs(
+            cleanup_journal._delete(
+                {'source': u'api', 'type': u'Organization', 'id': 1}),
+            api_tracker.track.return_value
+        )
+        api_tracker.track.assert_called_once_with('uuid')
+
+    @mock.patch.object(OrgCLI, 'delete')
+    def test_cli(self, delete):
+        record = {
+            'source': u'cli',
+            'type': u'{0}.OrgCLI'.format(__name__),
+            'id': u'1',
+            'options': {u'organization-id': u'2'},
+        }
+        self.assertIsNone(cleanup_journal._delete(record))
+        delete.assert_called_once_with(
+            {u'id': u'1', u'organization-id': u'2'})
+        delete.side_effect = CLIReturnCodeError(
+            65, u'', u'Resource organization not found by id')
+        self.assertIsNone(cleanup_journal._delete(record))
+        delete.side_effect = CLIReturnCodeError(65, u'', u'In use')
+        self.assertIsInstance(
+            cleanup_journal._delete(record), CLIReturnCodeError)
+
+
+class ReaperTestCase(JournalTestCase):
+    """Tests for :class:`robottelo.cleanup_journal.Reaper`."""
+
+    def setUp(self):
+        super(ReaperTestCase, self).setUp()
+        patcher = mock.patch('robottelo.cleanup_journal._delete')
+        self.delete = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.delete.return_value = None
+        self.reaper = Reaper([self.journal.path], max_workers=1)
+
+    def deleted(self):
+        return [
+            (call[0][0]['type'], call[0][0]['id'])
+            for call in self.delete.call_args_list
+        ]
+
+    def test_released_only(self):
+        self.journal.add(u'api', u'Organization', 1)
+        self.journal.scope = 'module2'
+        self.journal.add(u'api', u'Organization', 2)
+        self.journal.release('module1')
+        self.assertEqual(self.reaper.reap_once(), (1, False))
+        self.assertEqual(self.reaper.reap_once(), (0, False))
+        self.assertEqual(self.deleted(), [(u'Organization', 1)])
+
+    def test_release_all(self):
+        self.journal.add(u'api', u'Organization', 1)
+        self.reaper.release_all = True
+        self.reaper.run(until_done=False)
+        self.assertEqual(self.deleted(), [(u'Organization', 1)])
+        self.assertFalse(os.path.exists(self.journal.path))
+
+    def test_owner_gone(self):
+        self.journal.add(u'api', u'Organization', 1)
+        self.reaper.owner_pid = 1234
+        with mock.patch(
+                'robottelo.cleanup_journal._process_exists',
+                return_value=False) as process_exists:
+            self.reaper.run(poll_interval=0)
+        process_exists.assert_called_with(1234)
+        self.assertEqual(self.deleted(), [(u'Organization', 1)])
+        self.assertFalse(os.path.exists(self.journal.path))
+
+    def test_process_exists(self):
+        self.assertTrue(cleanup_journal._process_exists(os.getpid()))
+        process = subprocess.Popen([sys.executable, '-c', ''])
+        process.wait()
+        self.assertFalse(cleanup_journal._process_exists(process.pid))
+
+    def test_heaviest_first(self):
+        self.journal.add(u'api', u'HostGroup', 1)
+        self.journal.add(u'cli', u'robottelo.cli.org.Org', u'2')
+        self.journal.add(u'api', u'Organization', 3)
+        self.journal.add(u'api', u'Host', 4)
+        self.journal.close()
+        self.reaper.run(poll_interval=0)
+        self.assertEqual(self.deleted(), [
+            (u'Host', 4),
+            (u'robottelo.cli.org.Org', u'2'),
+            (u'Organization', 3),
+            (u'HostGroup', 1),
+        ])
+        self.assertEqual(self.reaper.deleted, 4)
+        self.assertFalse(os.path.exists(self.journal.path))
+
+    def test_failures(self):
+        self.journal.add(u'api', u'Organization', 1)
+        self.journal.add(u'api', u'Organization', 2)
+        self.journal.close()
+        self.delete.side_effect = lambda record: (
+            ValueError('in use') if record['id'] == 1 else None)
+        self.reaper.run(poll_interval=0)
+        self.assertEqual(self.reaper.deleted, 1)
+        self.assertEqual(self.reaper.failed, MAX_ATTEMPTS)
+        # kept to be reaped later
+        pending, _ = read_journal(self.journal.path)
+        self.assertEqual(list(pending), [(u'api', u'Organization', 1)])
+        self.assertEqual(pending[(u'api', u'Organization', 1)]['reason'],
+                         u'in use')
@@ -7,8 +7,11 @@ from robottelo.cli.base import (
     CLIBaseError,
     CLIDataBaseError,
     CLIError,
-    CLIReturnCodeError
+    CLIReturnCodeError,
+    cli_read_cache,
+    read_cache,
 )
+from robottelo.ssh import SSHCommandResult
 
 if six.PY2:
     import mock
@@ -264,12 +267,14 @@ class BaseCliTestCase(unittest2.TestCase):
             construct.return_value, ignore_stderr=ignore_stderr
         )
 
+    @mock.patch('robottelo.cli.base.default_entities')
     @mock.patch('robottelo.cli.base.Base.execute')
     @mock.patch('robottelo.cli.base.Base._construct_command')
-    def test_delete(self, construct, execute):
+    def test_delete(self, construct, execute, default_entities):
         """Check delete method"""
         self.assert_cmd_execution(
             construct, execute, Base.delete, 'delete', True)
+        default_entities.invalidate.assert_called_once_with(Base)
 
     @mock.patch('robottelo.cli.base.Base.execute')
     @mock.patch('robottelo.cli.base.Base._construct_command')
@@ -473,6 +478,103 @@ class BaseCliTestCase(unittest2.TestCase):
         )
 
 
+class ContentViewCLI(Base):
+    """Class used for the read cache tests"""
+    command_base = 'content-view'
+    command_requires_org = False
+
+
+class CLIReadCacheTestCase(unittest2.TestCase):
+    """Tests for the hammer info and list commands read cache"""
+
+    def setUp(self):
+        patcher = mock.patch('robottelo.cli.base.settings')
+        settings = patcher.start()
+        self.addCleanup(patcher.stop)
+        settings.locale = 'en_US'
+        settings.performance = False
+        settings.server.admin_username = 'admin'
+        settings.server.admin_password = 'password'
+        settings.validate_hammer_options = False
+        patcher = mock.patch('robottelo.cli.base.ssh.command')
+        self.command = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch('robottelo.cli.base.default_entities')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.command.side_effect = lambda *args, **kwargs: SSHCommandResult(
+            stdout=[{'id': str(self.command.call_count)}], stderr='')
+
+    def test_disabled(self):
+        ContentViewCLI.list({'organization-id': 1})
+        ContentViewCLI.list({'organization-id': 1})
+        self.assertEqual(self.command.call_count, 2)
+
+    def test_read_cached(self):
+        with cli_read_cache() as cache:
+            first = ContentViewCLI.list({'organization-id': 1, 'search': 'a'})
+            # the options order doesn't matter
+            second = ContentViewCLI.list(
+                {'search': 'a', 'organization-id': 1})
+            self.assertEqual(first, second)
+            # a copy is returned
+            second[0]['id'] = 'changed'
+            self.assertEqual(
+                ContentViewCLI.list({'organization-id': 1, 'search': 'a'}),
+                first
+            )
+            self.assertEqual((cache.hits, cache.misses), (2, 1))
+        self.assertEqual(self.command.call_count, 1)
+        self.assertFalse(read_cache.enabled)
+
+    def test_key_includes_options_and_user(self):
+        with cli_read_cache() as cache:
+            ContentViewCLI.list({'organization-id': 1})
+            ContentViewCLI.list({'organization-id': 2})
+            ContentViewCLI.with_user('user', 'password').list(
+                {'organization-id': 1})
+            self.assertEqual((cache.hits, cache.misses), (0, 3))
+
+    def test_write_invalidates(self):
+        with cli_read_cache() as cache:
+            ContentViewCLI.list({'organization-id': 1})
+            ContentViewCLI.publish = classmethod(
+                lambda cls, options: cls.execute(
+                    cls._construct_command(options)))
+            self.addCleanup(delattr, ContentViewCLI, 'publish')
+            ContentViewCLI.command_sub = 'publish'
+            ContentViewCLI.publish({'id': 1})
+            ContentViewCLI.list({'organization-id': 1})
+            self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_write_invalidates_referencing_commands(self):
+        class VersionCLI(Base):
+            command_base = 'content-view version'
+            command_requires_org = False
+
+        class OrgCLI(Base):
+            command_base = 'organization'
+            command_requires_org = False
+
+        with cli_read_cache() as cache:
+            VersionCLI.list({'content-view-id': 1})
+            OrgCLI.list({'search': 'id=1'})
+            ContentViewCLI.delete({'id': 1})
+            VersionCLI.list({'content-view-id': 1})
+            OrgCLI.list({'search': 'id=1'})
+            self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+    def test_failure_not_cached(self):
+        self.command.side_effect = [
+            SSHCommandResult(return_code=1, stderr='error'),
+            SSHCommandResult(stdout=[], stderr=''),
+        ]
+        with cli_read_cache():
+            with self.assertRaises(CLIReturnCodeError):
+                ContentViewCLI.list({'organization-id': 1})
+            self.assertEqual(ContentViewCLI.list({'organization-id': 1}), [])
+
+
 class CLIErrorTests(unittest2.TestCase):
     """Tests for the CLIError cli class"""
 
@@ -1,5 +1,9 @@
 """Tests for module ``robottelo.config.settings``."""
+import os
+import shutil
 import six
+import stat
+import tempfile
 from robottelo.config.base import Settings, INIReader, ImproperlyConfigured
 from unittest2 import TestCase
 
@@ -13,6 +17,12 @@ else:
 
 class SettingsTestCase(TestCase):
 
+    def setUp(self):
+        # do not cache the fake settings files
+        patcher = mock.patch('robottelo.config.base.SETTINGS_CACHE_DIR', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     @mock.patch(builtin_open, new_callable=lambda: get_invalid_ini)
     def test_ini_reader(self, mock_open):
         ini_reader = INIReader(None)
@@ -51,9 +61,112 @@ class SettingsTestCase(TestCase):
             self.assertEqual(settings.server.hostname, 'example.com')
             self.assertEqual(settings.server.ssh_password, '1234')
 
+    @mock.patch(builtin_open, new_callable=lambda: get_valid_ini)
+    def test_configure_http_session(self, mock_open):
+        with mock.patch('os.path.isfile', return_value=True), \
+                mock.patch('robottelo.config.base.http_session') as session:
+            settings = Settings()
+            settings.configure()
+            session.install.assert_called_once_with(settings.http_client)
+
+    @mock.patch(builtin_open, new_callable=lambda: get_valid_ini)
+    def test_configure_features_read_lazily(self, mock_open):
+        with mock.patch('os.path.isfile', return_value=True), \
+                mock.patch.object(Settings, '_read_feature',
+                                  autospec=True, return_value=[]) as read:
+            settings = Settings()
+            settings.configure()
+            names = [call[0][1] for call in read.call_args_list]
+            self.assertEqual(names[0], 'server')
+            self.assertNotIn('clients', names)
+            settings.clients
+            settings.clients
+            names = [call[0][1] for call in read.call_args_list]
+            self.assertEqual(names.count('clients'), 1)
+
+    @mock.patch(builtin_open, new_callable=lambda: get_valid_ini)
+    def test_configure_feature_accessed_before(self, mock_open):
+        with mock.patch('os.path.isfile', return_value=True):
+            settings = Settings()
+            settings.server.hostname = 'overridden.example.com'
+            settings.configure()
+            self.assertEqual(settings.server.hostname, 'example.com')
+            self.assertIn('server', vars(settings))
+
+    @mock.patch(builtin_open, new_callable=lambda: get_invalid_feature_ini)
+    def test_lazy_feature_validation_error(self, mock_open):
+        with mock.patch('os.path.isfile', return_value=True):
+            settings = Settings()
+            settings.configure()
+            with self.assertRaises(ImproperlyConfigured):
+                settings.clients
+            self.assertNotIn('clients', vars(settings))
+
+
+class INIReaderCacheTestCase(TestCase):
+    """Tests for the parsed file cache of ``INIReader``."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.cache_dir = os.path.join(self.tmpdir, 'cache')
+        self.path = os.path.join(self.tmpdir, 'robottelo.properties')
+        self.write('[server]\nhostname=example.com\nurl=%(hostname)s/\n')
+
+    def write(self, content):
+        with open(self.path, 'w') as handler:
+            handler.write(content)
+
+    def test_cache_written(self):
+        reader = INIReader(self.path, self.cache_dir)
+        self.assertEqual(reader.get('server', 'url'), 'example.com/')
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_cache_private(self):
+        INIReader(self.path, self.cache_dir)
+        self.assertEqual(stat.S_IMODE(os.stat(self.cache_dir).st_mode), 0o700)
+        name, = os.listdir(self.cache_dir)
+        self.assertEqual(
+            stat.S_IMODE(os.stat(os.path.join(self.cache_dir, name)).st_mode),
+            0o600
+        )
+
+    def test_cache_used(self):
+        INIReader(self.path, self.cache_dir)
+        with mock.patch.object(INIReader, '_parse') as parse:
+            reader = INIReader(self.path, self.cache_dir)
+            parse.assert_not_called()
+        self.assertEqual(reader.get('server', 'hostname'), 'example.com')
+        self.assertTrue(reader.has_section('server'))
+
+    def test_cache_content_changed(self):
+        INIReader(self.path, self.cache_dir)
+        self.write('[server]\nhostname=other.example.com\n')
+        reader = INIReader(self.path, self.cache_dir)
+        self.assertEqual(
+            reader.get('server', 'hostname'), 'other.example.com')
+        self.assertIsNone(reader.get('server', 'url'))
+        # the cache of the previous content is removed
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_cache_other_file_kept(self):
+        INIReader(self.path, self.cache_dir)
+        other_path = os.path.join(self.tmpdir, 'other.properties')
+        with open(other_path, 'w') as handler:
+            handler.write('[server]\nhostname=other.example.com\n')
+        INIReader(other_path, self.cache_dir)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_cache_dir_not_writable(self):
+        with open(self.cache_dir, 'w'):
+            pass
+        reader = INIReader(self.path, self.cache_dir)
+        self.assertEqual(reader.get('server', 'hostname'), 'example.com')
+
 
 class FakeOpen(object):
     def __init__(self, lines, *args, **kwargs):
+        self.content = '\n'.join(lines)
         self.lines = (line for line in lines)
 
     def __enter__(self):
@@ -63,7 +176,7 @@ class FakeOpen(object):
         pass
 
     def read(self):
-        return
+        return self.content
 
     def close(self):
         pass
@@ -87,16 +200,28 @@ def get_invalid_ini(path, *args, **kwargs):
     return FakeOpen(lines)
 
 
+LOGGING_LINES = [
+    # IniParserDefaults
+    '[formatters]', 'keys=generic',
+    '[formatter_generic]', 'class=logging.Formatter',
+    '[handlers]', 'keys=default',
+    '[handler_default]', 'class=handlers.TimedRotatingFileHandler',
+    'args=("",)',
+    '[loggers]', 'keys=root',
+    '[logger_root]', 'level=NOTSET', 'handlers=default'
+]
+
+
 def get_valid_ini(path, *args, **kwargs):
     lines = [
         '[server]', 'hostname=example.com', 'ssh_password=1234',
-        # IniParserDefaults
-        '[formatters]', 'keys=generic',
-        '[formatter_generic]', 'class=logging.Formatter',
-        '[handlers]', 'keys=default',
-        '[handler_default]', 'class=handlers.TimedRotatingFileHandler',
-        'args=("",)',
-        '[loggers]', 'keys=root',
-        '[logger_root]', 'level=NOTSET', 'handlers=default'
-    ]
+    ] + LOGGING_LINES
+    return FakeOpen(lines)
+
+
+def get_invalid_feature_ini(path, *args, **kwargs):
+    lines = [
+        '[server]', 'hostname=example.com', 'ssh_password=1234',
+        '[clients]', 'image_dir=/opt/robottelo/images',
+    ] + LOGGING_LINES
     return FakeOpen(lines)
@@ -5,7 +5,7 @@ import six
 from fauxfactory import gen_integer
 from unittest2 import SkipTest, TestCase
 
-from robottelo import decorators
+from robottelo import cleanup_journal, decorators
 from robozilla import decorators as robozilla_decorators
 from robottelo.config.base import BugzillaSettings
 from robottelo.constants import BZ_CLOSED_STATUSES, BZ_OPEN_STATUSES
@@ -738,6 +738,19 @@ class CacheableTestCase(TestCase):
         self.assertNotIn('foo', decorators.OBJECT_CACHE)
         self.assertEqual(decorators.OBJECT_CACHE, {})
 
+    def test_cached_not_journaled(self):
+        """Cached objects are not journaled for cleanup."""
+        journaled = []
+
+        def make_bar(options):
+            journaled.append(cleanup_journal.is_journaled())
+            return {'id': 43}
+
+        make_bar = decorators.cacheable(make_bar)
+        make_bar(cached=True)
+        make_bar(cached=False)
+        self.assertEqual(journaled, [False, True])
+
 
 class RmBugIsOpenTestCase(TestCase):
     """Tests for :func:`robottelo.decorators.rm_bug_is_open`."""
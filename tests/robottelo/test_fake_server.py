@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""Tests for module ``robottelo.fake_server``."""
+import json
+import os
+import shutil
+import six
+import tempfile
+import unittest2
+
+from robottelo import ssh
+from robottelo.cli.base import CLIReturnCodeError
+from robottelo.cli.factory import make_org
+from robottelo.cli.org import Org
+from robottelo.config import settings
+from robottelo.fake_server import (
+    FakeHammer,
+    UNKNOWN_COMMAND_RETURN_CODE,
+    fake_satellite,
+    parse_hammer_command,
+)
+
+if six.PY2:
+    import mock
+else:
+    from unittest import mock
+
+COMMAND = (
+    u'LANG=en_US.UTF-8 time -p hammer -v -u admin -p "pass word" '
+    u'--output=csv organization list --search="name = org"'
+)
+
+
+class ParseHammerCommandTestCase(unittest2.TestCase):
+    """Tests for :func:`robottelo.fake_server.parse_hammer_command`."""
+
+    def test_parse(self):
+        self.assertEqual(
+            parse_hammer_command(COMMAND),
+            (u'organization list --search=name = org', u'csv')
+        )
+
+    def test_parse_without_output(self):
+        self.assertEqual(
+            parse_hammer_command(
+                u'LANG=C  hammer -v --interactive no organization info'),
+            (u'organization info', None)
+        )
+
+    def test_parse_not_hammer(self):
+        self.assertEqual(parse_hammer_command(u'ls /tmp'), (None, None))
+
+
+class FakeHammerTestCase(unittest2.TestCase):
+    """Tests for :class:`robottelo.fake_server.FakeHammer`."""
+
+    def setUp(self):
+        self.hammer = FakeHammer()
+
+    def test_first_match(self):
+        self.hammer.add(r'organization info', u'info')
+        self.hammer.add(r'organization list', u'json', output_format='json')
+        self.hammer.add(r'organization list', u'csv', output_format='csv')
+        self.hammer.add(r'organization', u'other', return_code=1)
+        self.assertEqual(self.hammer.run(COMMAND), (u'csv', u'', 0))
+        self.assertEqual(
+            self.hammer.run(u'hammer organization delete --id=1'),
+            (u'other', u'', 1)
+        )
+        self.assertEqual(self.hammer.calls, [
+            COMMAND, u'hammer organization delete --id=1'])
+
+    def test_stdout_function(self):
+        self.hammer.add(
+            r'organization info --id=(\d+)',
+            lambda match: u'Id: {0}\n'.format(match.group(1))
+        )
+        self.assertEqual(
+            self.hammer.run(u'hammer organization info --id="5"')[0],
+            u'Id: 5\n'
+        )
+
+    def test_unknown_command(self):
+        self.hammer.add(r'organization info', u'info')
+        for command in (u'hammer host info --id=1', u'ls /tmp'):
+            stdout, stderr, return_code = self.hammer.run(command)
+            self.assertEqual(return_code, UNKNOWN_COMMAND_RETURN_CODE)
+            self.assertIn(command, stderr)
+
+    def test_load(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        path = os.path.join(tmpdir, 'recordings.json')
+        with open(path, 'w') as handler:
+            json.dump([
+                {'command': 'organization create', 'stdout': 'created',
+                 'output_format': 'csv', 'latency': 0.001},
+                {'command': 'organization', 'stderr': 'error',
+                 'return_code': 64},
+            ], handler)
+        self.hammer.load(path)
+        self.assertEqual(
+            self.hammer.run(u'hammer --output=csv organization create'),
+            (u'created', u'', 0)
+        )
+        self.assertEqual(
+            self.hammer.run(u'hammer organization create'),
+            (u'', u'error', 64)
+        )
+
+
+class FakeSatelliteTestCase(unittest2.TestCase):
+    """Tests for :func:`robottelo.fake_server.fake_satellite`."""
+
+    def setUp(self):
+        # other tests may have set it on Base
+        patcher = mock.patch.object(Org, 'command_requires_org', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.hammer = FakeHammer()
+        self.hammer.add(
+            r'organization create',
+            u'Message,Id,Name\nOrganization created,3,org\n',
+            output_format='csv',
+        )
+        self.hammer.add(
+            r'organization info --id=3',
+            u'Id:    3\nName:  org\nLabel: org\nSubnets:\n    subnet1\n'
+        )
+
+    def test_ssh_command(self):
+        with fake_satellite(self.hammer) as server:
+            result = ssh.command(u'hammer organization info --id=3')
+            self.assertEqual(result.return_code, 0)
+            self.assertIn(u'Name:  org', result.stdout)
+            result = ssh.command(u'ls /tmp')
+            self.assertEqual(result.return_code, UNKNOWN_COMMAND_RETURN_CODE)
+            self.assertEqual(server.connections, 2)
+            self.assertEqual(server.commands, 2)
+
+    def test_shared_connection(self):
+        with fake_satellite(self.hammer) as server:
+            with ssh.get_connection() as connection:
+                for _ in range(3):
+                    result = connection.run(u'hammer organization info --id=3')
+                    self.assertEqual(result.return_code, 0)
+            self.assertEqual(server.connections, 1)
+            self.assertEqual(server.commands, 3)
+
+    def test_factory(self):
+        hostname = settings.server.hostname
+        with fake_satellite(self.hammer):
+            self.assertEqual(make_org(), {
+                u'id': u'3',
+                u'name': u'org',
+                u'label': u'org',
+                u'subnets': [u'subnet1'],
+            })
+            with self.assertRaises(CLIReturnCodeError):
+                Org.info({u'id': 4})
+        self.assertEqual(settings.server.hostname, hostname)
@@ -8,6 +8,7 @@ import time
 from fauxfactory import gen_integer, gen_string
 from unittest2 import TestCase
 
+from robottelo.cleanup_journal import is_journaled
 from robottelo.decorators.func_shared.shared import (
     _set_configured,
     set_default_scope,
@@ -160,6 +161,13 @@ def simple_shared_counter_with_exception_not_restored(index=0):
     raise NotRestorableException('error', "I'am not restorable")
 
 
+@shared
+def shared_is_journaled():
+    """Tell whether the entities created by the shared function would be
+    journaled for cleanup"""
+    return is_journaled()
+
+
 class FunctionSharedTestCase(TestCase):
 
     @classmethod
@@ -527,3 +535,9 @@ class FunctionSharedTestCase(TestCase):
             inc_string_2 = basic_shared_counter_string(
                 suffix=suffix, prefix=prefix, counter=counter_value)
             self.assertEqual(inc_string, inc_string_2)
+
+    def test_not_journaled(self):
+        """Test that the entities created by a shared function are not
+        journaled for cleanup as they outlive the test module"""
+        self.assertFalse(shared_is_journaled())
+        self.assertTrue(is_journaled())
@@ -395,6 +395,89 @@ class ParseInfoTestCase(unittest2.TestCase):
             }
         )
 
+    def test_parse_deep_nesting(self):
+        """Can parse nested properties at any depth"""
+        output = [
+            'Content Information:',
+            '    Content View:',
+            '        ID:   10',
+            '        Name: Default Organization View',
+            '    Content Source:',
+            '    Applicable Errata:',
+            '        Counts:',
+            '            Security: 1',
+            '            Bug Fix:  2',
+            '        Total: 3',
+            'Subscription Information:',
+            '    UUID: 1234',
+            '    Registered by Activation Keys:',
+            '     1) ak1',
+            '     2) ak2',
+            '    Registered To: server',
+            'Name: host',
+        ]
+        self.assertEqual(
+            hammer.parse_info(output),
+            {
+                'content-information': {
+                    'content-view': {
+                        'id': '10',
+                        'name': 'Default Organization View',
+                    },
+                    'content-source': '',
+                    'applicable-errata': {
+                        'counts': {'security': '1', 'bug-fix': '2'},
+                        'total': '3',
+                    },
+                },
+                'subscription-information': {
+                    'uuid': '1234',
+                    'registered-by-activation-keys': ['ak1', 'ak2'],
+                    'registered-to': 'server',
+                },
+                'name': 'host',
+            }
+        )
+
+    def test_parse_nested_numbered_lists(self):
+        """Can parse numbered lists inside numbered items"""
+        output = [
+            'Versions:',
+            ' 1) ID:      1',
+            '    Version: 1.0',
+            '    Lifecycle Environments:',
+            '     1) ID:   1',
+            '        Name: Library',
+            '     2) ID:   2',
+            '        Name: Dev',
+            ' 2) ID:      2',
+            '    Version: 2.0',
+            '    Lifecycle Environments:',
+            '',
+            'Label: cv',
+        ]
+        self.assertEqual(
+            hammer.parse_info(output),
+            {
+                'versions': [
+                    {
+                        'id': '1',
+                        'version': '1.0',
+                        'lifecycle-environments': [
+                            {'id': '1', 'name': 'Library'},
+                            {'id': '2', 'name': 'Dev'},
+                        ],
+                    },
+                    {
+                        'id': '2',
+                        'version': '2.0',
+                        'lifecycle-environments': '',
+                    },
+                ],
+                'label': 'cv',
+            }
+        )
+
     def test_parse_json_list(self):
         """Can parse a list in json"""
         self.assertEqual(
@@ -2,11 +2,15 @@
 # (Too many public methods) pylint: disable=R0904
 import six
 import unittest2
+from robottelo.constants import PACKAGE_CACHE_PATH
 from robottelo.helpers import (
     HostInfoError,
+    create_repo,
     escape_search,
+    fetch_packages,
     get_host_info,
     get_server_version,
+    md5_by_url,
     Storage
 )
 
@@ -18,74 +22,67 @@ else:
 
 class GetServerVersionTestCase(unittest2.TestCase):
     """Tests for method ``get_server_version``."""
-    @mock.patch('robottelo.helpers.ssh')
-    def test_return_version(self, ssh):
+    @mock.patch('robottelo.helpers.get_server_facts')
+    def test_return_version(self, get_server_facts):
         """get_server_version returns a proper version.
 
         When the version.rb file is present.
         """
-        ssh.command = mock.MagicMock(return_value=FakeSSHResult(
-            ['"6.1.4"'],
-            0
-        ))
+        get_server_facts.return_value = {
+            'version_rb': '  VERSION = "6.1.4"'}
         self.assertEqual(get_server_version(), '6.1.4')
 
-    @mock.patch('robottelo.helpers.ssh')
-    def test_return_none(self, ssh):
+    @mock.patch('robottelo.helpers.get_server_facts')
+    def test_return_none(self, get_server_facts):
         """get_server_version returns None.
 
         When the versions.rb file is not present.
         """
-        ssh.command = mock.MagicMock(return_value=FakeSSHResult(
-            [],
-            0
-        ))
+        get_server_facts.return_value = {'version_rb': None}
         self.assertEqual(get_server_version(), None)
 
 
 class GetHostInfoTestCase(unittest2.TestCase):
     """Tests for method ``get_host_credentials``."""
 
-    @mock.patch('robottelo.helpers.ssh')
-    def test_fedora_info(self, ssh):
-        ssh.command = mock.MagicMock(return_value=FakeSSHResult(
-            ['Fedora release 20 (Heisenbug)'],
-            0
-        ))
+    @mock.patch('robottelo.helpers.get_server_facts')
+    def test_fedora_info(self, get_server_facts):
+        get_server_facts.return_value = {
+            'os_release': 'Fedora release 20 (Heisenbug)'}
         self.assertTupleEqual(get_host_info(), ('Fedora', 20, None))
+        get_server_facts.assert_called_once_with(None)
 
-    @mock.patch('robottelo.helpers.ssh')
-    def test_rhel_info(self, ssh):
-        ssh.command = mock.MagicMock(return_value=FakeSSHResult(
-            ['Red Hat Enterprise Linux Server release 7.1 (Maipo)'],
-            0
-        ))
+    @mock.patch('robottelo.helpers.get_server_facts')
+    def test_rhel_info(self, get_server_facts):
+        get_server_facts.return_value = {
+            'os_release': 'Red Hat Enterprise Linux Server release 7.1 (Maipo)'
+        }
         self.assertTupleEqual(
-            get_host_info(),
+            get_host_info('client'),
             ('Red Hat Enterprise Linux Server', 7, 1)
         )
+        get_server_facts.assert_called_once_with('client')
 
-    @mock.patch('robottelo.helpers.ssh')
-    def test_cat_fail(self, ssh):
-        ssh.command = mock.MagicMock(
-            return_value=FakeSSHResult([], 1, 'stderr'))
+    @mock.patch('robottelo.helpers.get_server_facts')
+    def test_cat_fail(self, get_server_facts):
+        get_server_facts.return_value = {'os_release': None}
         with self.assertRaises(HostInfoError) as context:
             get_host_info()
         self.assertEqual(
             str(context.exception),
-            'Not able to cat /etc/redhat-release "stderr"'
+            'Not able to read /etc/redhat-release'
         )
 
-    @mock.patch('robottelo.helpers.ssh')
-    def test_release_parse_fail(self, ssh):
-        ssh.command = mock.MagicMock(return_value=FakeSSHResult([''], 0))
+    @mock.patch('robottelo.helpers.get_server_facts')
+    def test_release_parse_fail(self, get_server_facts):
+        get_server_facts.return_value = {'os_release': 'Debian'}
         with self.assertRaises(HostInfoError) as context:
             get_host_info()
         if six.PY2:
             message = context.exception.message
         else:
             message = str(context.exception)
-        self.assertEqual(message, 'Not able to parse release string ""')
+        self.assertEqual(message, 'Not able to parse release string "Debian"')
 
 
 class FakeSSHResult(object):
@@ -133,3 +130,75 @@ class StorageTestCase(unittest2.TestCase):
         self.assertEqual(storage.key, 'value')
         self.assertEqual(storage.another_key, 'another value')
         self.assertEqual(storage.spare_argument, 'one more value')
+
+
+class FetchPackagesTestCase(unittest2.TestCase):
+    """Tests for the package fetch helpers."""
+
+    @mock.patch('robottelo.helpers.ssh')
+    def test_single_command(self, ssh):
+        """All the packages are fetched with a single command and linked
+        from the cache.
+        """
+        ssh.command.return_value = FakeSSHResult([], 0)
+        urls = ['http://example.com/repo/{0}.rpm'.format(name)
+                for name in ('bear', 'camel', 'cat')]
+        fetch_packages(urls, '/repos/zoo', hostname='server')
+        self.assertEqual(ssh.command.call_count, 1)
+        command = ssh.command.call_args[0][0]
+        self.assertIn('xargs -n 2 -P 8', command)
+        self.assertIn('mkdir -p {0}'.format(PACKAGE_CACHE_PATH), command)
+        for url in urls:
+            self.assertIn(url, command)
+            self.assertIn(
+                '/repos/zoo/{0}'.format(url.split('/')[-1]), command)
+        self.assertEqual(command.count('ln -fL {0}/'.format(
+            PACKAGE_CACHE_PATH)), 3)
+        self.assertEqual(ssh.command.call_args[1], {'hostname': 'server'})
+
+    @mock.patch('robottelo.helpers.ssh')
+    def test_urls_quoted(self, ssh):
+        """URLs are quoted in the remote command."""
+        ssh.command.return_value = FakeSSHResult([], 0)
+        fetch_packages(['http://example.com/a b.rpm'], '/repos/zoo')
+        self.assertIn("'http://example.com/a b.rpm'",
+                      ssh.command.call_args[0][0])
+
+    @mock.patch('robottelo.helpers.ssh')
+    def test_md5_by_url(self, ssh):
+        """The checksum of the cached file the cache entry links to is
+        returned.
+        """
+        ssh.command.return_value = FakeSSHResult(
+            ['2b1ab3c5.d41d8cd98f00b204e9800998ecf8427e'], 0)
+        self.assertEqual(
+            md5_by_url('http://example.com/cat.rpm'),
+            'd41d8cd98f00b204e9800998ecf8427e'
+        )
+        self.assertIn('readlink /', ssh.command.call_args[0][0])
+        ssh.command.return_value = FakeSSHResult([], 1)
+        with self.assertRaises(AssertionError):
+            md5_by_url('http://example.com/cat.rpm')
+
+    @mock.patch('robottelo.helpers.ssh')
+    def test_cache_revalidated(self, ssh):
+        """Cached URLs are downloaded again when modified since."""
+        ssh.command.return_value = FakeSSHResult(['entry.d41d8cd9'], 0)
+        md5_by_url('http://example.com/cat.rpm')
+        self.assertIn('curl -sfLR -z "$1"', ssh.command.call_args[0][0])
+
+    @mock.patch('robottelo.helpers.settings')
+    @mock.patch('robottelo.helpers.ssh')
+    def test_create_repo(self, ssh, settings):
+        """Creating a repository runs a fixed number of commands."""
+        settings.server.hostname = 'server'
+        settings.server.port = None
+        ssh.command.return_value = FakeSSHResult([], 0)
+        url = create_repo(
+            'zoo', 'http://example.com/repo', ['bear.rpm', 'cat.rpm'])
+        self.assertEqual(url, 'http://server/pulp/repos/zoo/')
+        self.assertEqual(ssh.command.call_count, 3)
+        self.assertIn(
+            'createrepo --update', ssh.command.call_args_list[-1][0][0])
+        # packages fetched again with the same name update the metadata
+        self.assertIn('%s %T@', ssh.command.call_args_list[-1][0][0])
@@ -3,41 +3,34 @@ import six
 from unittest2 import TestCase
 
 from robottelo import host_info
-from robottelo.ssh import SSHCommandResult
 
 if six.PY2:
     import mock
-    from mock.mock import call
 else:
     from unittest import mock
-    from unittest.mock import call
 
 
 class GetHostOsVersionTestCase(TestCase):
     """Tests for get_host_os_version version"""
 
     def setUp(self):
-        """Mocking ssh"""
-        self._patcher = mock.patch(
-            'robottelo.host_info.ssh.command')
-        self._command = self._patcher.start()
+        """Mocking the server facts"""
+        self._patcher = mock.patch('robottelo.host_info.get_server_facts')
+        self._get_server_facts = self._patcher.start()
 
     def tearDown(self):
         """Stop mock created on setUp method"""
         self._patcher.stop()
 
-    def assert_rhel_version(self, ssh_version, parsed_version):
+    def assert_rhel_version(self, os_release, parsed_version):
         """Encapsulate assertion logic regarding host os parsing
 
-        :param ssh_version: version returned from ssh
+        :param os_release: release read from the server
         :param parsed_version: parsed version
         """
-        self._command.return_value.stdout = [ssh_version]
-        self.assertEqual(
-            parsed_version,
-            host_info.get_host_os_version.__wrapped__()
-        )
-        self._command.assert_called_once_with('cat /etc/redhat-release')
+        self._get_server_facts.return_value = {'os_release': os_release}
+        self.assertEqual(parsed_version, host_info.get_host_os_version())
+        self._get_server_facts.assert_called_once_with()
 
     def test_rhel_major_version_parsing(self):
         """Check if can parse major versions.
@@ -66,150 +59,66 @@ class GetHostOsVersionTestCase(TestCase):
             u'RHEL7.2.1'
         )
 
-    def test_cache(self):
-        """Check get_host_os_version() calls are cached"""
-        self._command.return_value.stdout = [
-            u'Red Hat Enterprise Linux Server release 7.2.1 (Maipo)'
-        ]
-        self.assertEqual(u'RHEL7.2.1', host_info.get_host_os_version())
-        self._command.assert_called_once_with('cat /etc/redhat-release')
-        self._command.return_value.stdout = [
-            u'Doesnt matter because because its cached'
-        ]
-        self.assertEqual(u'RHEL7.2.1', host_info.get_host_os_version())
-        # if called more than once cache didn't worked
-        self._command.assert_called_once_with('cat /etc/redhat-release')
-
     @mock.patch('robottelo.host_info.LOGGER')
-    def test_command_error(self, logger):
-        """Check returns 'Not Available' on error
+    def test_release_not_available(self, logger):
+        """Check returns 'Not Available' when the release couldn't be read
         """
-        cmd = SSHCommandResult(
-            stdout=[],
-            stderr=u'bash: generate: command not found\n',
-            return_code=127, output_format=None
-        )
-        self._command.return_value = cmd
-
-        os_version = host_info.get_host_os_version.__wrapped__()
-        self.assertEqual('Not Available', os_version)
-        self._command.assert_called_once_with('cat /etc/redhat-release')
+        self.assert_rhel_version(None, 'Not Available')
         logger.warning.assert_called_once_with(
-            u'Host version not available: %r' % cmd)
+            u'Host version not available: None')
 
     @mock.patch('robottelo.host_info.LOGGER')
-    def test_command_parsing_error(self, logger):
+    def test_release_parsing_error(self, logger):
         """Test return not available on Fedora machines
         It can be changed to handle other OS if needed
         """
-        cmd = SSHCommandResult(
-            stdout=[u'Fedora release 23 (Twenty Three)'],
-            return_code=0
-        )
-        self._command.return_value = cmd
-        os_version = host_info.get_host_os_version.__wrapped__()
-        self.assertEqual('Not Available', os_version)
-        self._command.assert_called_once_with('cat /etc/redhat-release')
+        self.assert_rhel_version(
+            u'Fedora release 23 (Twenty Three)', 'Not Available')
         logger.warning.assert_called_once_with(
-            u'Host version not available: %r' % cmd
+            u'Host version not available: %r'
+            % u'Fedora release 23 (Twenty Three)'
         )
 
 
 class GetHostSatVersionTestCase(TestCase):
     """Tests for get_host_sat_version version"""
 
-    SSH_RESULT_ERROR = SSHCommandResult(
-        stdout=[],
-        stderr=(
-            u'grep: /usr/share/foreman/lib/satellite/version.rb: No such '
-            u'file or directory'
-        ),
-        return_code=127,
-        output_format=None
-    )
-
     def setUp(self):
-        """Mocking ssh"""
-        self._patcher = mock.patch(
-            'robottelo.host_info.ssh.command')
-        self._command = self._patcher.start()
+        """Mocking the server facts"""
+        self._patcher = mock.patch('robottelo.host_info.get_server_facts')
+        self._get_server_facts = self._patcher.start()
 
     def tearDown(self):
         """Stop mock created on setUp method"""
         self._patcher.stop()
 
-    def assert_sat_version(self, ssh_version, parsed_version):
+    def assert_sat_version(self, satellite, version_rb, parsed_version):
         """Encapsulate assertion logic regarding host sat parsing
 
-        :param ssh_version: version returned from ssh
+        :param satellite: version of the satellite package
+        :param version_rb: VERSION line of the version.rb file
         :param parsed_version: parsed version
         """
-        self._command.return_value.stdout = [ssh_version]
-        self.assertEqual(
-            parsed_version,
-            host_info.get_host_sat_version.__wrapped__()
-        )
-        self._command.assert_called_once_with(
-            host_info._SAT_6_2_VERSION_COMMAND
-        )
+        self._get_server_facts.return_value = {
+            'satellite': satellite, 'version_rb': version_rb}
+        self.assertEqual(parsed_version, host_info.get_host_sat_version())
+        self._get_server_facts.assert_called_once_with()
 
     def test_sat_6_dot_2(self):
         """Check if can parse major 6.2.x versions"""
-        self.assert_sat_version(
-            u'satellite-6.2.0-21.1.el7sat.noarch',
-            u'6.2'
-        )
+        self.assert_sat_version(u'6.2.0', None, u'6.2')
 
     def test_sat_6_dot_1(self):
-        """Check if can parse major 6.2.x versions"""
-        ssh_result_success = mock.Mock()
-        ssh_result_success.return_code = 0
-        ssh_result_success.stdout = [u'  VERSION = "6.1.8"']
-
-        self._command.side_effect = (self.SSH_RESULT_ERROR, ssh_result_success)
-        sat_version = host_info.get_host_sat_version.__wrapped__()
-
-        self.assertEqual(u"6.1", sat_version)
-        calls = [
-            call(host_info._SAT_6_2_VERSION_COMMAND),
-            call(host_info._SAT_6_1_VERSION_COMMAND)
-        ]
-        self._command.assert_has_calls(calls)
-
-    def test_cache(self):
-        """Check get_host_sat_version() calls are cached"""
-        self._command.return_value.stdout = [
-            u'  SATELLITE_SHORT_VERSION = "6.2"'
-        ]
-        self.assertEqual(u'6.2', host_info.get_host_sat_version())
-        self._command.assert_called_once_with(
-            host_info._SAT_6_2_VERSION_COMMAND
-        )
-        self._command.return_value.stdout = [
-            u'Doesnt matter because because its cached'
-        ]
-        self.assertEqual(u'6.2', host_info.get_host_sat_version())
-        # if called more than once cache didn't worked
-        self._command.assert_called_once_with(
-            host_info._SAT_6_2_VERSION_COMMAND
-        )
+        """Check if can parse major 6.1.x versions"""
+        self.assert_sat_version(None, u'  VERSION = "6.1.8"', u'6.1')
 
     @mock.patch('robottelo.host_info.LOGGER')
-    def test_command_error(self, logger):
-        """Check returns 'Not Available' on error
+    def test_not_available(self, logger):
+        """Check returns 'Not Available' on upstream servers
         """
-        self._command.return_value = self.SSH_RESULT_ERROR
-
-        sat_version = host_info.get_host_sat_version.__wrapped__()
-        self.assertEqual('Not Available', sat_version)
-        calls = [
-            call(host_info._SAT_6_2_VERSION_COMMAND),
-            call(host_info._SAT_6_1_VERSION_COMMAND)
-        ]
-        self._command.assert_has_calls(calls)
+        self.assert_sat_version(None, None, 'Not Available')
         logger.warning.assert_called_once_with(
-            u'Host Satellite version not available: %r' % self.SSH_RESULT_ERROR
-        )
+            u'Host Satellite version not available: None')
 
 
 class SatVersionDependentValuesTestCase(TestCase):
@@ -0,0 +1,190 @@
+"""Tests for module ``robottelo.log``."""
+import io
+import os
+import shutil
+import six
+import subprocess
+import tempfile
+import unittest2
+
+from robottelo.log import get_log_size, LogCapture, LogFile
+
+if six.PY2:
+    import mock
+else:
+    from unittest import mock
+
+
+class FakeSSH(object):
+    """Run the commands and downloads on the local host."""
+
+    def __init__(self):
+        self.downloads = []
+
+    def command(self, cmd, hostname=None, output_format=None):
+        process = subprocess.Popen(
+            cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        stdout, stderr = process.communicate()
+        return mock.Mock(
+            stdout=stdout.decode('utf-8'),
+            stderr=stderr.decode('utf-8'),
+            return_code=process.returncode,
+        )
+
+    def download_file_range(self, remote_file, local_file, offset=0,
+                            length=None, hostname=None):
+        self.downloads.append((offset, length))
+        with io.open(remote_file, 'rb') as remote:
+            remote.seek(offset)
+            data = remote.read(length)
+        local_file.write(data)
+        return len(data)
+
+
+class LogFileTestCase(unittest2.TestCase):
+    """Tests for class ``LogFile``."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.remote_path = os.path.join(self.tmpdir, 'production.log')
+        self.write(u'[I] started\n[E] failed\n')
+        self.ssh = FakeSSH()
+        for target, new in (('robottelo.log.ssh', self.ssh),
+                            ('tempfile.tempdir', self.tmpdir)):
+            patcher = mock.patch(target, new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def write(self, text, mode='ab'):
+        with io.open(self.remote_path, mode) as log:
+            log.write(text.encode('utf-8'))
+
+    def test_whole_file(self):
+        log = LogFile(self.remote_path, r'\[E\]')
+        self.assertEqual(log.data, [u'[I] started\n', u'[E] failed\n'])
+        self.assertEqual(log.filter(), [u'[E] failed\n'])
+        self.assertEqual(log.grep(), [u'[E] failed\n'])
+
+    def test_close(self):
+        with LogFile(self.remote_path) as log:
+            self.assertEqual(len(log.data), 2)
+            local_path = log.local_path
+            self.assertEqual(os.path.dirname(local_path), self.tmpdir)
+            self.assertTrue(os.path.exists(local_path))
+        self.assertFalse(os.path.exists(local_path))
+        # downloaded again when read after close
+        self.assertEqual(len(log.data), 2)
+        log.close()
+
+    def test_missing_file(self):
+        with self.assertRaises(IOError):
+            LogFile(os.path.join(self.tmpdir, 'missing.log'))
+
+    def test_offset(self):
+        offset = get_log_size(self.remote_path)
+        self.write(u'[E] new failure\n')
+        log = LogFile(self.remote_path, r'\[E\]', offset=offset)
+        self.assertEqual(log.data, [u'[E] new failure\n'])
+        self.assertEqual(log.grep(), [u'[E] new failure\n'])
+        self.assertEqual(self.ssh.downloads, [(offset, 16)])
+
+    def test_follow_and_refresh(self):
+        log = LogFile.follow(self.remote_path, r'\[E\]')
+        self.assertEqual(log.filter(), [])
+        self.assertEqual(log.grep(), [])
+        self.write(u'[E] first\n[I] info\n[E] sec')
+        log.refresh()
+        self.assertEqual(log.filter(), [u'[E] first\n', u'[E] sec'])
+        self.write(u'ond\n[E] third\n')
+        log.refresh()
+        self.assertEqual(
+            log.filter(), [u'[E] first\n', u'[E] second\n', u'[E] third\n'])
+        self.assertEqual(log.grep(), log.filter())
+        # only new bytes are downloaded
+        offsets = [offset for offset, _ in self.ssh.downloads]
+        self.assertEqual(offsets, sorted(set(offsets)))
+
+    def test_filter_cached(self):
+        log = LogFile(self.remote_path, r'\[E\]')
+        log.filter()
+        with mock.patch.object(log, '_lines', return_value=iter(())) as lines:
+            self.assertEqual(log.filter(), [u'[E] failed\n'])
+            lines.assert_called_once_with(
+                len(u'[I] started\n[E] failed\n'))
+
+    def test_rotated(self):
+        log = LogFile(self.remote_path, r'\[E\]')
+        self.assertEqual(log.filter(), [u'[E] failed\n'])
+        self.write(u'[E] rotated\n', mode='wb')
+        log.refresh()
+        self.assertEqual(log.data, [u'[E] rotated\n'])
+        self.assertEqual(log.filter(), [u'[E] rotated\n'])
+
+
+class LogCaptureTestCase(unittest2.TestCase):
+    """Tests for class ``LogCapture``."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.paths = [
+            os.path.join(self.tmpdir, name)
+            for name in ('production.log', 'error.log', 'missing.log')
+        ]
+        self.write(self.paths[0], u'before\n')
+        self.write(self.paths[1], u'before\n')
+        self.ssh = FakeSSH()
+        for target, new in (('robottelo.log.ssh', self.ssh),
+                            ('tempfile.tempdir', self.tmpdir)):
+            patcher = mock.patch(target, new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.capture = LogCapture(self.paths)
+
+    def write(self, path, text, mode='ab'):
+        with io.open(path, mode) as log:
+            log.write(text.encode('utf-8'))
+
+    def test_mark(self):
+        with mock.patch.object(
+                self.ssh, 'command', wraps=self.ssh.command) as command:
+            offsets = self.capture.mark()
+            self.assertEqual(command.call_count, 1)
+        self.assertEqual(offsets, {self.paths[0]: 7, self.paths[1]: 7})
+
+    def test_diff(self):
+        self.capture.mark()
+        self.write(self.paths[1], u'error\n')
+        self.write(self.paths[0], u'request\n')
+        self.write(self.paths[2], u'created\n')
+        with mock.patch.object(
+                self.ssh, 'command', wraps=self.ssh.command) as command:
+            logs = self.capture.diff()
+            self.assertEqual(command.call_count, 1)
+        self.assertEqual(list(logs.items()), [
+            (self.paths[0], u'request\n'),
+            (self.paths[1], u'error\n'),
+            (self.paths[2], u'created\n'),
+        ])
+
+    def test_diff_nothing_logged(self):
+        self.capture.mark()
+        self.assertEqual(self.capture.diff(), {})
+
+    def test_diff_rotated(self):
+        self.capture.mark()
+        self.write(self.paths[0], u'new\n', mode='wb')
+        self.assertEqual(self.capture.diff(), {self.paths[0]: u'new\n'})
+
+    def test_diff_max_bytes(self):
+        self.capture.max_bytes = 5
+        self.capture.mark()
+        self.write(self.paths[0], u'first\nlast\n')
+        self.assertEqual(self.capture.diff(), {self.paths[0]: u'last\n'})
+
+    def test_log_file(self):
+        self.capture.mark()
+        self.write(self.paths[0], u'request\n')
+        log = self.capture.log_file(self.paths[0])
+        self.assertEqual(log.data, [u'request\n'])
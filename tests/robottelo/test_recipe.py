@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""Tests for module ``robottelo.recipe``."""
+import six
+import threading
+import time
+import unittest2
+
+from robottelo.recipe import Recipe, RecipeError
+from robottelo.tasks import current_task_timeout, task_timeout
+
+if six.PY2:
+    import mock
+else:
+    from unittest import mock
+
+
+class RecipeTestCase(unittest2.TestCase):
+    """Tests for :class:`robottelo.recipe.Recipe`."""
+
+    def test_results_passed_to_required_steps(self):
+        recipe = Recipe('test')
+        recipe.add('org', lambda: 1)
+        recipe.add('lce', lambda org: org + 10, requires=('org',))
+        recipe.add('cv', lambda org: org + 20, requires=('org',))
+        recipe.add(
+            'ak', lambda lce, cv: (lce, cv), requires=('lce', 'cv'))
+        results = recipe.run()
+        self.assertEqual(results, {'org': 1, 'lce': 11, 'cv': 21,
+                                   'ak': (11, 21)})
+        self.assertEqual(results.timeline[0].name, 'org')
+        self.assertEqual(results.timeline[-1].name, 'ak')
+
+    def test_independent_steps_run_concurrently(self):
+        barrier = threading.Event()
+        recipe = Recipe('test')
+        # would time out when run serially
+        recipe.add('first', lambda: barrier.wait(5))
+        recipe.add('second', barrier.set)
+        results = recipe.run(max_workers=2)
+        self.assertTrue(results['first'])
+
+    def test_provided_steps_not_run(self):
+        calls = []
+        recipe = Recipe('test')
+        recipe.add('org', lambda: calls.append('org'))
+        recipe.add('lce', lambda org: org, requires=('org',))
+        results = recipe.run(provided={'org': 5, 'other': 1})
+        self.assertEqual(calls, [])
+        self.assertEqual(results, {'org': 5, 'lce': 5})
+        self.assertEqual(results.timeline[-1].status, 'provided')
+
+    def test_none_provided_values_ignored(self):
+        recipe = Recipe('test')
+        recipe.add('org', lambda: 1)
+        self.assertEqual(recipe.run(provided={'org': None}), {'org': 1})
+
+    def test_step_run_once(self):
+        calls = []
+        recipe = Recipe('test')
+        recipe.add('org', lambda: calls.append('org') or 1)
+        recipe.add('lce', lambda org: org, requires=('org',))
+        recipe.add('cv', lambda org: org, requires=('org',))
+        recipe.run()
+        self.assertEqual(calls, ['org'])
+
+    def test_failure_stops_dependent_steps(self):
+        calls = []
+
+        def fail():
+            raise ValueError('boom')
+
+        recipe = Recipe('test')
+        recipe.add('org', fail)
+        recipe.add('lce', calls.append, requires=('org',))
+        with self.assertRaisesRegex(ValueError, 'boom'):
+            recipe.run()
+        self.assertEqual(calls, [])
+
+    def test_failure_cancels_other_steps(self):
+        started = threading.Event()
+        calls = []
+
+        def sync():
+            started.set()
+            time.sleep(0.2)
+            calls.append('sync')
+
+        def fail():
+            started.wait(30)
+            raise ValueError('boom')
+
+        recipe = Recipe('test')
+        recipe.add('sync', sync)
+        recipe.add('org', fail)
+        recipe.add('lce', lambda: calls.append('lce'))
+        recipe.add('cv', lambda: calls.append('cv'))
+        # the queued steps are cancelled, the running sync is waited for
+        with mock.patch('robottelo.recipe.LOGGER') as logger:
+            with self.assertRaisesRegex(ValueError, 'boom'):
+                recipe.run(max_workers=2)
+        self.assertEqual(calls, ['sync'])
+        timeline = logger.debug.call_args[0][2]
+        self.assertRegex(timeline, r'sync .*s  done')
+        self.assertRegex(timeline, r'org .*s  failed')
+        self.assertRegex(timeline, r'lce +cancelled')
+        self.assertNotIn('running', timeline)
+
+    def test_failure_of_running_step_recorded(self):
+        started = threading.Event()
+
+        def fail_later():
+            started.set()
+            time.sleep(0.1)
+            raise RuntimeError('later')
+
+        def fail():
+            started.wait(30)
+            raise ValueError('boom')
+
+        recipe = Recipe('test')
+        recipe.add('sync', fail_later)
+        recipe.add('org', fail)
+        with mock.patch('robottelo.recipe.LOGGER') as logger:
+            with self.assertRaisesRegex(ValueError, 'boom'):
+                recipe.run(max_workers=2)
+        self.assertRegex(logger.debug.call_args[0][2], r'sync .*s  failed')
+        logger.warning.assert_called_once_with(
+            mock.ANY, 'test', 'sync', mock.ANY)
+
+    def test_steps_using_same_class_serialized(self):
+        class Command(object):
+            pass
+
+        active = []
+        overlaps = []
+
+        def step():
+            active.append(1)
+            overlaps.append(len(active))
+            time.sleep(0.05)
+            active.pop()
+
+        recipe = Recipe('test')
+        for name in ('first', 'second', 'third'):
+            recipe.add(name, step, uses=(Command,))
+        recipe.run(max_workers=3)
+        self.assertEqual(overlaps, [1, 1, 1])
+
+    def test_task_timeout(self):
+        recipe = Recipe('test')
+        recipe.add('sync', current_task_timeout)
+        with task_timeout(3600):
+            self.assertEqual(recipe.run()['sync'], 3600)
+
+    def test_invalid_steps(self):
+        recipe = Recipe('test')
+        recipe.add('org', lambda: 1)
+        with self.assertRaises(RecipeError):
+            recipe.add('org', lambda: 1)
+        with self.assertRaises(RecipeError):
+            recipe.add('lce', lambda org: 1, requires=('organization',))
+
+    def test_format_timeline(self):
+        recipe = Recipe('test')
+        recipe.add('org', lambda: 1)
+        recipe.add('lce', lambda org: 1, requires=('org',))
+        timeline = recipe.run(provided={'org': 1}).format_timeline()
+        self.assertIn('lce', timeline)
+        self.assertIn('org', timeline)
+        self.assertIn('provided', timeline)
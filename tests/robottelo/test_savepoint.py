@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Tests for module ``robottelo.savepoint``."""
+import json
+import os
+import six
+import unittest2
+
+from robottelo import savepoint
+from robottelo.decorators.func_shared.shared import _set_configured
+from robottelo.ssh import SSHCommandResult
+
+if six.PY2:
+    import mock
+else:
+    from unittest import mock
+
+# do not read the shared function settings
+_set_configured(True)
+
+
+class SavepointTestCase(unittest2.TestCase):
+    """Tests for :mod:`robottelo.savepoint`."""
+
+    def setUp(self):
+        patcher = mock.patch('robottelo.savepoint.settings')
+        self.settings = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.settings.savepoint.directory = '/savepoints'
+        self.settings.savepoint.backup_command = 'backup {path}'
+        self.settings.savepoint.restore_command = 'restore {path}'
+        self.settings.savepoint.timeout = 60
+        patcher = mock.patch('robottelo.savepoint.ssh')
+        self.ssh = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch(
+            'robottelo.savepoint.savepoints_enabled', return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch(
+            'robottelo.savepoint.get_shared_storage', return_value=None)
+        self.get_shared_storage = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.dict('os.environ')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        os.environ.pop(savepoint.RESTORED_SAVEPOINT_ENV, None)
+        self.metadata = {
+            'backup': '/savepoints/org/backup-1',
+            'result': {'organization-id': '1'},
+            'created': '2018-01-01T00:00:00',
+        }
+
+    def commands(self):
+        return [call[0][0] for call in self.ssh.command.call_args_list]
+
+    def test_savepoint_path(self):
+        self.assertEqual(savepoint.savepoint_path('org'), '/savepoints/org')
+        self.assertEqual(savepoint.savepoint_path('/backup'), '/backup')
+
+    def test_get_missing_savepoint(self):
+        self.ssh.command.return_value = SSHCommandResult(return_code=1)
+        self.assertIsNone(savepoint.get_savepoint('org'))
+
+    def test_create_savepoint(self):
+        self.ssh.command.side_effect = [
+            SSHCommandResult(),
+            SSHCommandResult(),
+            SSHCommandResult(stdout=['/savepoints/org/backup-1']),
+        ]
+        metadata = savepoint.create_savepoint('org', {'organization-id': '1'})
+        self.assertEqual(metadata['backup'], '/savepoints/org/backup-1')
+        self.assertEqual(self.commands()[1], 'backup /savepoints/org')
+        uploaded, path = self.ssh.upload_file.call_args[0]
+        self.assertEqual(path, '/savepoints/org/robottelo.json')
+        self.assertEqual(
+            json.loads(uploaded.read().decode('utf-8'))['result'],
+            {'organization-id': '1'}
+        )
+
+    def test_paths_quoted(self):
+        self.settings.savepoint.directory = '/save points'
+        self.ssh.command.side_effect = [
+            SSHCommandResult(),
+            SSHCommandResult(),
+            SSHCommandResult(stdout=[]),
+        ]
+        savepoint.create_savepoint('org; reboot')
+        self.assertEqual(
+            self.commands(),
+            [
+                "rm -rf '/save points/org; reboot' && "
+                "mkdir -p '/save points/org; reboot' && "
+                "chmod 0777 '/save points/org; reboot'",
+                "backup '/save points/org; reboot'",
+                "find '/save points/org; reboot' -mindepth 1 -maxdepth 1 "
+                "-type d | sort | tail -n 1",
+            ]
+        )
+
+    def test_restore_savepoint(self):
+        self.ssh.command.side_effect = [
+            SSHCommandResult(stdout=[json.dumps(self.metadata)]),
+            SSHCommandResult(),
+        ]
+        self.assertEqual(
+            savepoint.restore_savepoint('org'), {'organization-id': '1'})
+        self.assertEqual(
+            self.commands()[1], 'restore /savepoints/org/backup-1')
+
+    def test_restore_failure(self):
+        self.ssh.command.side_effect = [
+            SSHCommandResult(stdout=[json.dumps(self.metadata)]),
+            SSHCommandResult(stderr=['failed'], return_code=1),
+        ]
+        with self.assertRaises(savepoint.SavepointError):
+            savepoint.restore_savepoint('org')
+
+    def test_restore_session_savepoint(self):
+        self.settings.savepoint.restore = 'org'
+        with mock.patch('robottelo.savepoint.get_savepoint',
+                        return_value=self.metadata), \
+                mock.patch('robottelo.savepoint.restore_savepoint') as restore:
+            self.assertEqual(savepoint.restore_session_savepoint(), 'org')
+        restore.assert_called_once_with('org')
+        self.assertEqual(os.environ[savepoint.RESTORED_SAVEPOINT_ENV], 'org')
+
+    def test_restore_session_savepoint_missing(self):
+        self.settings.savepoint.restore = 'org'
+        with mock.patch('robottelo.savepoint.get_savepoint',
+                        return_value=None), \
+                mock.patch('robottelo.savepoint.restore_savepoint') as restore:
+            self.assertIsNone(savepoint.restore_session_savepoint())
+        restore.assert_not_called()
+        self.assertNotIn(savepoint.RESTORED_SAVEPOINT_ENV, os.environ)
+
+    def test_decorator_returns_restored_result(self):
+        os.environ[savepoint.RESTORED_SAVEPOINT_ENV] = 'org'
+        build = mock.Mock(__name__='build')
+        fixture = savepoint.savepoint('org')(build)
+        with mock.patch('robottelo.savepoint.get_savepoint',
+                        return_value=self.metadata), \
+                mock.patch('robottelo.savepoint.restore_savepoint') as restore:
+            self.assertEqual(fixture(), {'organization-id': '1'})
+        build.assert_not_called()
+        restore.assert_not_called()
+
+    def test_decorator_never_restores(self):
+        """Savepoints not restored when the session started are built, a
+        restore would delete the entities created since.
+        """
+        os.environ[savepoint.RESTORED_SAVEPOINT_ENV] = 'other'
+        build = mock.Mock(__name__='build', return_value={'id': 1})
+        fixture = savepoint.savepoint('org')(build)
+        with mock.patch('robottelo.savepoint.get_savepoint',
+                        return_value=self.metadata), \
+                mock.patch(
+                    'robottelo.savepoint.restore_savepoint') as restore, \
+                mock.patch('robottelo.savepoint.create_savepoint') as create:
+            self.assertEqual(fixture(), {'id': 1})
+        restore.assert_not_called()
+        create.assert_not_called()
+
+    def test_decorator_shared_lock(self):
+        storage = mock.MagicMock()
+        self.get_shared_storage.return_value = storage
+        build = mock.Mock(__name__='build', return_value={'id': 1})
+        fixture = savepoint.savepoint('org')(build)
+        with mock.patch('robottelo.savepoint.get_savepoint',
+                        return_value=None), \
+                mock.patch('robottelo.savepoint.create_savepoint'):
+            fixture()
+        storage.lock.assert_called_once_with(
+            savepoint.get_shared_key(savepoint._LOCK_KEY))
+
+    def test_decorator_builds_and_saves(self):
+        build = mock.Mock(__name__='build', return_value={'id': 1})
+        fixture = savepoint.savepoint('org')(build)
+        with mock.patch('robottelo.savepoint.get_savepoint',
+                        return_value=None), \
+                mock.patch('robottelo.savepoint.create_savepoint') as create:
+            self.assertEqual(fixture(), {'id': 1})
+        create.assert_called_once_with('org', {'id': 1})
+
+    def test_decorator_disabled(self):
+        build = mock.Mock(__name__='build', return_value={'id': 1})
+        fixture = savepoint.savepoint('org')(build)
+        with mock.patch('robottelo.savepoint.savepoints_enabled',
+                        return_value=False):
+            self.assertEqual(fixture(), {'id': 1})
+        self.ssh.command.assert_not_called()
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Tests for module ``robottelo.server_facts``."""
+import importlib
+import six
+import unittest2
+
+from fauxfactory import gen_string
+
+from robottelo import server_facts
+from robottelo.decorators.func_shared.shared import _set_configured
+from robottelo.ssh import SSHCommandResult
+
+if six.PY2:
+    import mock
+else:
+    from unittest import mock
+
+# do not read the shared function settings
+_set_configured(True)
+
+# the module, robottelo.decorators.func_shared.shared is the decorator
+shared_module = importlib.import_module(
+    'robottelo.decorators.func_shared.shared')
+
+GATHERED = u'\n'.join((
+    u'hostname=sat.example.com',
+    u'os_release=Red Hat Enterprise Linux Server release 7.5 (Maipo)',
+    u'satellite=6.4.0',
+    u'version_rb=',
+    u'plugin=tfm-rubygem-katello 3.7.0',
+    u'plugin=tfm-rubygem-foreman_remote_execution 1.5.6',
+    u'service=httpd',
+    u'service=foreman-tasks',
+    u'service=httpd',
+    u'',
+))
+
+
+class ServerFactsTestCase(unittest2.TestCase):
+    """Tests for :mod:`robottelo.server_facts`."""
+
+    def setUp(self):
+        patcher = mock.patch('robottelo.server_facts.ssh')
+        self.ssh = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.ssh.command.return_value = SSHCommandResult(stdout=GATHERED)
+        patcher = mock.patch('robottelo.server_facts.settings')
+        self.settings = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.settings.server.hostname = 'sat.example.com'
+        patcher = mock.patch.object(shared_module, 'ENABLED', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        server_facts.clear_server_facts()
+        self.addCleanup(server_facts.clear_server_facts)
+
+    def test_parse(self):
+        facts = server_facts.parse_server_facts(GATHERED.split(u'\n'))
+        self.assertEqual(facts, {
+            'hostname': u'sat.example.com',
+            'os_release': (
+                u'Red Hat Enterprise Linux Server release 7.5 (Maipo)'),
+            'satellite': u'6.4.0',
+            'version_rb': None,
+            'plugins': {
+                u'tfm-rubygem-katello': u'3.7.0',
+                u'tfm-rubygem-foreman_remote_execution': u'1.5.6',
+            },
+            'services': [u'httpd', u'foreman-tasks'],
+        })
+
+    def test_single_command(self):
+        facts = server_facts.gather_server_facts('sat.example.com')
+        self.assertEqual(facts['satellite'], u'6.4.0')
+        self.ssh.command.assert_called_once_with(
+            server_facts._GATHER_FACTS_COMMAND,
+            hostname='sat.example.com',
+            output_format='plain',
+        )
+
+    def test_snapshot_in_memory(self):
+        facts = server_facts.get_server_facts()
+        self.assertIs(server_facts.get_server_facts(), facts)
+        self.assertIs(server_facts.get_server_facts('sat.example.com'), facts)
+        self.assertEqual(self.ssh.command.call_count, 1)
+        self.ssh.command.assert_called_once_with(
+            server_facts._GATHER_FACTS_COMMAND,
+            hostname='sat.example.com',
+            output_format='plain',
+        )
+
+    def test_snapshot_per_server(self):
+        server_facts.get_server_facts()
+        server_facts.get_server_facts('capsule.example.com')
+        self.assertEqual(
+            [call[1]['hostname'] for call in self.ssh.command.call_args_list],
+            ['sat.example.com', 'capsule.example.com']
+        )
+
+    def test_snapshot_expired(self):
+        with mock.patch('robottelo.server_facts.time') as time:
+            time.time.return_value = 1000
+            server_facts.get_server_facts()
+            time.time.return_value += server_facts.SERVER_FACTS_TTL
+            server_facts.get_server_facts()
+        self.assertEqual(self.ssh.command.call_count, 2)
+
+    def test_refresh(self):
+        server_facts.get_server_facts()
+        server_facts.get_server_facts(refresh=True)
+        self.assertEqual(self.ssh.command.call_count, 2)
+
+    def test_snapshot_shared(self):
+        """A snapshot gathered by a process is used by the other ones."""
+        with mock.patch.object(shared_module, 'ENABLED', True), \
+                mock.patch.object(
+                    shared_module, 'NAMESPACE_SCOPE', gen_string('alpha')):
+            facts = server_facts.get_server_facts()
+            # as if in a new process
+            server_facts.clear_server_facts()
+            self.assertEqual(server_facts.get_server_facts(), facts)
+        self.assertEqual(self.ssh.command.call_count, 1)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""Tests for module ``robottelo.system_facts``."""
+import io
+import json
+import re
+import unittest2
+
+from robottelo.system_facts import (
+    GENERATED_FACTS,
+    SystemFacts,
+    generate_system_facts,
+    generate_system_facts_batch,
+    iter_system_facts_json,
+    write_system_facts_ndjson,
+)
+
+UUID_RE = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$')
+
+
+class GenerateSystemFactsBatchTestCase(unittest2.TestCase):
+    """Tests for :func:`robottelo.system_facts.generate_system_facts_batch`.
+    """
+
+    def test_same_facts(self):
+        facts = generate_system_facts_batch(3)[0]
+        self.assertEqual(set(facts), set(generate_system_facts()))
+        self.assertEqual(facts[u'dmi.system.version'], u'RHEL')
+        self.assertEqual(facts[u'network.hostname'],
+                         facts[u'uname.nodename'])
+        self.assertEqual(facts[u'network.ipaddr'],
+                         facts[u'net.interface.eth1.ipaddr'])
+        self.assertEqual(facts[u'virt.uuid'], facts[u'dmi.system.uuid'])
+        self.assertRegex(facts[u'dmi.system.uuid'], UUID_RE)
+        self.assertRegex(facts[u'network.hostname'],
+                         r'^[a-z]{10}\.example\.net$')
+        self.assertRegex(facts[u'net.interface.eth1.ipaddr'],
+                         r'^10(\.\d{1,3}){3}$')
+        self.assertRegex(facts[u'dmi.bios.relase_date'],
+                         r'^\d{2}/\d{2}/\d{4}$')
+        mac = facts[u'net.interface.eth1.hwaddr']
+        self.assertRegex(mac, r'^([0-9a-f]{2}:){5}[0-9a-f]{2}$')
+        # unicast
+        self.assertFalse(int(mac[:2], 16) & 1)
+
+    def test_unique_values(self):
+        batch = generate_system_facts_batch(500)
+        for key in (u'network.hostname', u'net.interface.eth1.hwaddr',
+                    u'net.interface.eth1.ipaddr', u'dmi.system.uuid'):
+            self.assertEqual(
+                len({facts[key] for facts in batch}), 500, key)
+
+    def test_names(self):
+        names = [u'host1.example.com', u'host2.example.com']
+        batch = generate_system_facts_batch(2, names)
+        self.assertEqual(
+            [facts[u'uname.nodename'] for facts in batch], names)
+        with self.assertRaises(ValueError):
+            generate_system_facts_batch(3, names)
+
+    def test_copy_on_write(self):
+        first, second = generate_system_facts_batch(2)
+        first[u'uname.sysname'] = u'Darwin'
+        del first[u'uname.version']
+        self.assertEqual(second[u'uname.sysname'], u'Linux')
+        self.assertIn(u'uname.version', second)
+        self.assertNotIn(u'uname.version', first)
+        self.assertEqual(len(first), len(second) - 1)
+        self.assertEqual(first.to_dict()[u'uname.sysname'], u'Darwin')
+        self.assertEqual(json.loads(first.to_json()), first.to_dict())
+
+
+class SystemFactsJSONTestCase(unittest2.TestCase):
+    """Tests for the JSON of the generated system facts."""
+
+    def test_to_json(self):
+        facts = generate_system_facts_batch(1)[0]
+        self.assertEqual(json.loads(facts.to_json()), facts.to_dict())
+        facts[u'network.hostname'] = u'host.example.com'
+        self.assertEqual(json.loads(facts.to_json()), facts.to_dict())
+        self.assertEqual(
+            json.loads(SystemFacts({u'a': 1}, {u'b': 2}).to_json()),
+            {u'a': 1, u'b': 2}
+        )
+
+    def test_iter(self):
+        lines = list(iter_system_facts_json(25, batch_size=10))
+        self.assertEqual(len(lines), 25)
+        self.assertTrue(all(line.endswith(u'\n') for line in lines))
+        facts = [json.loads(line) for line in lines]
+        self.assertTrue(GENERATED_FACTS.issubset(facts[0]))
+        # unique across the batches
+        self.assertEqual(
+            len({item[u'net.interface.eth1.ipaddr'] for item in facts}), 25)
+
+    def test_write(self):
+        stream = io.StringIO()
+        names = [u'host{0}.example.com'.format(index) for index in range(3)]
+        self.assertEqual(
+            write_system_facts_ndjson(stream, 3, names, batch_size=2), 3)
+        self.assertEqual(
+            [json.loads(line)[u'network.hostname']
+             for line in stream.getvalue().splitlines()],
+            names
+        )
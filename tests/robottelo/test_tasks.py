@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""Tests for module ``robottelo.tasks``."""
+import six
+import threading
+import unittest2
+
+from nailgun import entity_mixins
+from robottelo.tasks import (
+    api_task_states,
+    cli_task_states,
+    current_task_timeout,
+    run_task,
+    task_timeout,
+    TaskFailedError,
+    TaskTimeoutError,
+    TaskTracker,
+)
+
+if six.PY2:
+    import mock
+else:
+    from unittest import mock
+
+
+class TaskTrackerTestCase(unittest2.TestCase):
+    """Tests for :class:`robottelo.tasks.TaskTracker`."""
+
+    def setUp(self):
+        self.states = mock.Mock()
+        self.tracker = TaskTracker(
+            self.states, poll_rate=0.01, max_poll_rate=0.01)
+
+    def test_poll_resolves_finished_tasks(self):
+        self.states.return_value = {
+            'a': ('stopped', 'success'),
+            'b': ('running', 'pending'),
+            'c': ('stopped', 'error'),
+        }
+        self.tracker._thread = mock.Mock()  # poll manually
+        futures = [self.tracker.track(task_id) for task_id in 'abc']
+        self.assertEqual(self.tracker.poll(), 2)
+        self.states.assert_called_once_with(mock.ANY)
+        self.assertEqual(sorted(self.states.call_args[0][0]), ['a', 'b', 'c'])
+        self.assertEqual(
+            futures[0].result(),
+            {'id': 'a', 'state': 'stopped', 'result': 'success'}
+        )
+        self.assertFalse(futures[1].done())
+        self.assertIsInstance(futures[2].exception(), TaskFailedError)
+
+    def test_paused_task_failed(self):
+        self.states.return_value = {'a': ('paused', 'error')}
+        self.tracker._thread = mock.Mock()
+        future = self.tracker.track('a')
+        self.assertEqual(self.tracker.poll(), 1)
+        error = future.exception()
+        self.assertIsInstance(error, TaskFailedError)
+        self.assertEqual(error.state, 'paused')
+        self.assertEqual(str(error), 'Task a paused with result error')
+
+    def test_timeout(self):
+        self.states.return_value = {'a': ('running', 'pending')}
+        self.tracker._thread = mock.Mock()
+        future = self.tracker.track('a', timeout=-1)
+        self.tracker.poll()
+        error = future.exception()
+        self.assertIsInstance(error, TaskTimeoutError)
+        self.assertEqual(error.state, 'running')
+
+    def test_poll_error_retried(self):
+        self.states.side_effect = [
+            ValueError(), {'a': ('stopped', 'success')}]
+        self.assertEqual(
+            self.tracker.wait(['a']),
+            [{'id': 'a', 'state': 'stopped', 'result': 'success'}]
+        )
+        self.assertEqual(self.states.call_count, 2)
+
+    def test_wait_raises_failure(self):
+        self.states.return_value = {
+            'a': ('stopped', 'success'),
+            'b': ('stopped', 'warning'),
+        }
+        with self.assertRaises(TaskFailedError) as context:
+            self.tracker.wait(['a', 'b'])
+        self.assertEqual(context.exception.task_id, 'b')
+
+    def test_same_task_tracked_twice(self):
+        self.states.return_value = {'a': ('stopped', 'success')}
+        self.tracker._thread = mock.Mock()
+        first = self.tracker.track('a')
+        second = self.tracker.track('a')
+        self.tracker.poll()
+        self.assertEqual(first.result(), second.result())
+        self.assertEqual(self.states.call_args[0][0], ['a'])
+
+    @unittest2.skipIf(six.PY2, 'asyncio is not available')
+    def test_wait_async(self):
+        import asyncio
+        self.states.return_value = {'a': ('stopped', 'success')}
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        asyncio.set_event_loop(loop)
+        self.addCleanup(asyncio.set_event_loop, None)
+        results = loop.run_until_complete(self.tracker.wait_async(['a']))
+        self.assertEqual(results[0]['id'], 'a')
+
+
+class TaskStatesTestCase(unittest2.TestCase):
+    """Tests for the task states lookup functions."""
+
+    @mock.patch('robottelo.tasks.entities.ForemanTask')
+    def test_api_single_search(self, foreman_task):
+        foreman_task.return_value.search_json.return_value = {'results': [
+            {'id': 'a', 'state': 'stopped', 'result': 'success'},
+        ]}
+        self.assertEqual(
+            api_task_states(['a', 'b']), {'a': ('stopped', 'success')})
+        foreman_task.return_value.search_json.assert_called_once_with(
+            query={'search': 'id = a or id = b', 'per_page': 2})
+
+    @mock.patch('robottelo.tasks.TASK_SEARCH_CHUNK_SIZE', 2)
+    @mock.patch('robottelo.tasks.entities.ForemanTask')
+    def test_api_search_chunks(self, foreman_task):
+        foreman_task.return_value.search_json.side_effect = [
+            {'results': [
+                {'id': 'a', 'state': 'stopped', 'result': 'success'},
+                {'id': 'b', 'state': 'running', 'result': 'pending'},
+            ]},
+            {'results': [
+                {'id': 'c', 'state': 'paused', 'result': 'error'},
+            ]},
+        ]
+        self.assertEqual(
+            api_task_states(['a', 'b', 'c']),
+            {
+                'a': ('stopped', 'success'),
+                'b': ('running', 'pending'),
+                'c': ('paused', 'error'),
+            }
+        )
+        self.assertEqual(
+            foreman_task.return_value.search_json.call_args_list,
+            [
+                mock.call(query={'search': 'id = a or id = b',
+                                 'per_page': 2}),
+                mock.call(query={'search': 'id = c', 'per_page': 1}),
+            ]
+        )
+
+    @mock.patch('robottelo.tasks.TASK_SEARCH_CHUNK_SIZE', 2)
+    def test_cli_search_chunks(self):
+        with mock.patch('robottelo.cli.task.Task.list') as task_list:
+            task_list.side_effect = [
+                [{'id': 'a', 'state': 'stopped', 'result': 'success'}],
+                [{'id': 'c', 'state': 'stopped', 'result': 'warning'}],
+            ]
+            self.assertEqual(
+                cli_task_states(['a', 'b', 'c']),
+                {
+                    'a': ('stopped', 'success'),
+                    'c': ('stopped', 'warning'),
+                }
+            )
+        self.assertEqual(
+            [call[0][0] for call in task_list.call_args_list],
+            [
+                {'search': 'id = a or id = b', 'per-page': 2},
+                {'search': 'id = c', 'per-page': 1},
+            ]
+        )
+
+
+class TaskTimeoutTestCase(unittest2.TestCase):
+    """Tests for :func:`robottelo.tasks.task_timeout`."""
+
+    def test_default(self):
+        self.assertEqual(current_task_timeout(), entity_mixins.TASK_TIMEOUT)
+
+    def test_nested(self):
+        with task_timeout(10):
+            with task_timeout(20):
+                self.assertEqual(current_task_timeout(), 20)
+            self.assertEqual(current_task_timeout(), 10)
+        self.assertEqual(current_task_timeout(), entity_mixins.TASK_TIMEOUT)
+
+    def test_per_thread(self):
+        seen = []
+        with task_timeout(10):
+            thread = threading.Thread(
+                target=lambda: seen.append(current_task_timeout()))
+            thread.start()
+            thread.join()
+            self.assertEqual(current_task_timeout(), 10)
+        self.assertEqual(seen, [entity_mixins.TASK_TIMEOUT])
+        self.assertNotEqual(entity_mixins.TASK_TIMEOUT, 10)
+
+
+@mock.patch('robottelo.tasks.entities.ForemanTask')
+@mock.patch('robottelo.tasks.api_tracker')
+class RunTaskTestCase(unittest2.TestCase):
+    """Tests for :func:`robottelo.tasks.run_task`."""
+
+    def test_wait_for_task(self, api_tracker, foreman_task):
+        sync = mock.Mock(return_value={
+            'id': 'a', 'state': 'planned', 'pending': True})
+        with task_timeout(1500):
+            result = run_task(sync, data={'foo': 'bar'})
+        sync.assert_called_once_with(synchronous=False, data={'foo': 'bar'})
+        api_tracker.wait.assert_called_once_with(['a'], timeout=1500)
+        foreman_task.assert_called_once_with(id='a')
+        self.assertIs(result, foreman_task.return_value.read_json.return_value)
+
+    def test_explicit_timeout(self, api_tracker, foreman_task):
+        sync = mock.Mock(return_value={
+            'id': 'a', 'state': 'planned', 'pending': True})
+        with task_timeout(1500):
+            run_task(sync, timeout=20)
+        api_tracker.wait.assert_called_once_with(['a'], timeout=20)
+
+    def test_no_task(self, api_tracker, foreman_task):
+        method = mock.Mock(return_value={'id': 1, 'name': 'foo'})
+        self.assertEqual(run_task(method), {'id': 1, 'name': 'foo'})
+        api_tracker.wait.assert_not_called()
+
+    def test_nailgun_compatible_errors(self, api_tracker, foreman_task):
+        self.assertIsInstance(
+            TaskFailedError('a', 'error'), entity_mixins.TaskFailedError)
+        self.assertIsInstance(
+            TaskTimeoutError('a', 'running'),
+            entity_mixins.TaskTimedOutError
+        )
@@ -1,6 +1,11 @@
 """Unit tests for :mod:`robottelo.ui.locators`."""
 import unittest2
 from robottelo.ui.locators.model import Locator, LocatorDict, By
+from robottelo.ui.locators.registry import (
+    CompiledLocator,
+    LocatorRegistry,
+    UnknownLocatorError,
+)
 
 
 class LocatorTestCase(unittest2.TestCase):
@@ -193,3 +198,90 @@ class LocatorTestCase(unittest2.TestCase):
         self.assertEqual(first.second[1], '//foo/bar/blaz')
         self.assertEqual(first['second.naz'][1], '//second/naz')
         self.assertEqual(first['second.zaz'][1], '//zaz')
+
+
+class LocatorRegistryTestCase(unittest2.TestCase):
+    def setUp(self):
+        self.locators = LocatorRegistry({
+            "menu.home": (By.XPATH, '//nav//home'),
+            "menu.item": Locator.XPATH("//a[contains(., '%s')]"),
+            "tab.packages": (By.XPATH, '//packages'),
+            "tab.packages.installed": (By.ID, 'installed'),
+        })
+
+    def test_different_access(self):
+        expected = (By.XPATH, '//nav//home')
+        self.assertEqual(self.locators['menu.home'], expected)
+        self.assertEqual(self.locators.menu.home, expected)
+        self.assertEqual(self.locators['menu'].home, expected)
+        self.assertEqual(self.locators['menu']['home'], expected)
+        self.assertEqual(self.locators.menu['home'], expected)
+        self.assertIs(self.locators.menu.home, self.locators['menu.home'])
+
+    def test_compiled_locator_is_tuple(self):
+        locator = self.locators['menu.home']
+        self.assertIsInstance(locator, tuple)
+        strategy, value = locator
+        self.assertEqual(strategy, locator._strategy)
+        self.assertEqual(value, locator._value)
+
+    def test_unknown_locator_raises(self):
+        with self.assertRaises(UnknownLocatorError):
+            self.locators['menu.hoem']
+        with self.assertRaises(UnknownLocatorError):
+            self.locators.menu.hoem
+        with self.assertRaises(KeyError):
+            self.locators.foo
+        self.assertNotIn('foo', self.locators)
+        self.assertIsNone(self.locators.get('foo'))
+
+    def test_read_only(self):
+        with self.assertRaises(TypeError):
+            self.locators['menu.contact'] = (By.XPATH, '//contact')
+        with self.assertRaises(TypeError):
+            self.locators.menu = (By.XPATH, '//contact')
+
+    def test_cached_interpolation(self):
+        hosts = self.locators.menu.item % 'Hosts'
+        self.assertEqual(hosts._value, "//a[contains(., 'Hosts')]")
+        self.assertIsInstance(hosts, CompiledLocator)
+        self.assertIs(hosts, self.locators.menu.item % 'Hosts')
+
+    def test_cached_interpolation_typed(self):
+        self.assertEqual(
+            (self.locators.menu.item % 1)._value, "//a[contains(., '1')]")
+        self.assertEqual(
+            (self.locators.menu.item % 1.0)._value, "//a[contains(., '1.0')]")
+        self.assertEqual(
+            (self.locators.menu.item % True)._value,
+            "//a[contains(., 'True')]"
+        )
+
+    def test_cached_interpolation_typed_tuple(self):
+        locator = CompiledLocator('xpath', '//a[%s][%s]')
+        self.assertEqual((locator % (1, 2))._value, '//a[1][2]')
+        self.assertEqual((locator % (1.0, 2))._value, '//a[1.0][2]')
+        self.assertEqual((locator % (True, 2))._value, '//a[True][2]')
+        self.assertIs(locator % (1.0, 2), locator % (1.0, 2))
+
+    def test_locator_with_children(self):
+        packages = self.locators.tab.packages
+        self.assertEqual(packages, (By.XPATH, '//packages'))
+        self.assertEqual(packages[1], '//packages')
+        self.assertEqual(packages.installed, (By.ID, 'installed'))
+        self.assertEqual(packages['installed'], (By.ID, 'installed'))
+        self.assertIn('installed', packages)
+
+    def test_mapping_interface(self):
+        self.assertEqual(len(self.locators), 4)
+        self.assertEqual(
+            sorted(self.locators),
+            [
+                'menu.home',
+                'menu.item',
+                'tab.packages',
+                'tab.packages.installed',
+            ]
+        )
+        self.assertEqual(dir(self.locators), ['menu', 'tab'])
+        self.assertEqual(dir(self.locators.menu), ['home', 'item'])
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import six
+import unittest2
+
+from robottelo.ui.base import Base, ELEMENTS_STATE_JS, PAGE_IDLE_WAIT_JS
+from robottelo.ui.locators import By, common_locators
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+if six.PY2:
+    import mock
+else:
+    from unittest import mock
+
+
+class WaitForAjaxTestCase(unittest2.TestCase):
+    def setUp(self):
+        self.browser = mock.Mock()
+        self.browser.robottelo_script_timeout = 0
+        self.base = Base(self.browser)
+
+    def test_idle_page_single_round_trip(self):
+        self.browser.execute_async_script.return_value = True
+        self.base.wait_for_ajax(timeout=10)
+        self.browser.execute_async_script.assert_called_once_with(
+            PAGE_IDLE_WAIT_JS, 10000, mock.ANY)
+        self.browser.execute_script.assert_not_called()
+
+    def test_script_timeout_set_once(self):
+        self.browser.execute_async_script.return_value = True
+        self.base.wait_for_ajax(timeout=10)
+        self.base.wait_for_ajax(timeout=10)
+        self.base.wait_for_ajax(timeout=5)
+        self.browser.set_script_timeout.assert_called_once_with(15)
+
+    def test_busy_page_raises_timeout(self):
+        self.browser.execute_async_script.return_value = False
+        with self.assertRaises(TimeoutException):
+            self.base.wait_for_ajax(timeout=1)
+
+    def test_fallback_to_polling(self):
+        self.browser.execute_async_script.side_effect = WebDriverException(
+            'document unloaded while waiting for result')
+        self.browser.execute_script.return_value = 0
+        self.base.wait_for_ajax(timeout=1)
+        self.browser.execute_script.assert_has_calls([
+            mock.call('return jQuery.active'),
+        ])
+
+
+class FindElementsStateTestCase(unittest2.TestCase):
+    def setUp(self):
+        self.browser = mock.Mock()
+        self.base = Base(self.browser)
+        self.base.wait_for_ajax = mock.Mock()
+        self.visible = {
+            'element': mock.sentinel.visible,
+            'displayed': True,
+            'text': 'foo',
+        }
+        self.hidden = {
+            'element': mock.sentinel.hidden,
+            'displayed': False,
+            'text': 'bar',
+        }
+
+    def test_xpath_single_round_trip(self):
+        self.browser.execute_script.return_value = [self.visible, self.hidden]
+        states = self.base.find_elements_state(
+            (By.XPATH, '//td'), attributes=('class',))
+        self.assertEqual(states, [self.visible])
+        self.browser.execute_script.assert_called_once_with(
+            ELEMENTS_STATE_JS, By.XPATH, '//td', ['class'], None)
+        self.browser.find_elements.assert_not_called()
+
+    def test_other_strategy_uses_located_elements(self):
+        self.browser.find_elements.return_value = [mock.sentinel.element]
+        self.browser.execute_script.return_value = [self.visible]
+        states = self.base.find_elements_state((By.ID, 'foo'))
+        self.assertEqual(states, [self.visible])
+        self.browser.execute_script.assert_called_once_with(
+            ELEMENTS_STATE_JS, By.ID, 'foo', [], [mock.sentinel.element])
+
+    def test_find_elements(self):
+        self.browser.execute_script.return_value = [self.visible, self.hidden]
+        self.assertEqual(
+            self.base.find_elements((By.XPATH, '//td')),
+            [mock.sentinel.visible]
+        )
+
+    def test_find_elements_text(self):
+        self.browser.execute_script.return_value = [self.visible, self.hidden]
+        self.assertEqual(
+            self.base.find_elements_text((By.XPATH, '//td')), ['foo'])
+
+    def test_find_elements_timeout(self):
+        self.base.wait_for_ajax.side_effect = TimeoutException()
+        self.assertIsNone(self.base.find_elements((By.XPATH, '//td')))
+        self.assertEqual(self.base.find_elements_text((By.XPATH, '//td')), [])
+
+    def test_select_deselect_entity_uses_listed_options(self):
+        self.browser.execute_script.return_value = [self.visible]
+        self.base.click = mock.Mock()
+        self.base.wait_until_element = mock.Mock(return_value=None)
+        self.base.select_deselect_entity(
+            'os', common_locators['entity_select'], ['foo', 'baz'])
+        self.base.click.assert_has_calls([
+            mock.call(mock.sentinel.visible),
+            mock.call(common_locators['entity_checkbox'] % 'baz'),
+        ])
+        self.assertEqual(self.base.wait_until_element.call_count, 1)
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import six
+import unittest2
+
+from robottelo.ui.org import Org
+from robottelo.ui.session import (
+    BrowserPool,
+    PAGE_NAMES,
+    PooledBrowser,
+    RESET_BROWSER_JS,
+    Session,
+    SESSION_COOKIE,
+    SessionPage,
+)
+
+if six.PY2:
+    import mock
+else:
+    from unittest import mock
+
+
+class SessionPagesTestCase(unittest2.TestCase):
+    def setUp(self):
+        self.session = Session(mock.Mock())
+        self.session.browser = mock.sentinel.browser
+
+    def test_page_created_on_first_access(self):
+        with mock.patch('robottelo.ui.session.import_string') as importer:
+            self.assertNotIn('_pages', vars(self.session))
+            page = self.session.org
+            importer.assert_called_once_with('robottelo.ui.org.Org')
+            importer.return_value.assert_called_once_with(
+                mock.sentinel.browser)
+            self.assertIs(page, self.session.org)
+            self.assertEqual(importer.call_count, 1)
+
+    def test_page_class(self):
+        self.assertIsInstance(self.session.org, Org)
+        self.assertIs(self.session.org.browser, mock.sentinel.browser)
+
+    def test_nav_alias(self):
+        self.assertIs(self.session.nav, self.session.navigator)
+
+    def test_pages_per_session(self):
+        other = Session(mock.Mock())
+        other.browser = mock.sentinel.other_browser
+        self.assertIsNot(self.session.org, other.org)
+        self.assertIs(other.org.browser, mock.sentinel.other_browser)
+
+    def test_page_names(self):
+        self.assertIn('activationkey', PAGE_NAMES)
+        self.assertIn('nav', PAGE_NAMES)
+        self.assertIn('usergroup', PAGE_NAMES)
+
+    def test_session_page_on_test_object(self):
+        test_page = SessionPage(self.session, 'org')
+        self.assertNotIn('_pages', vars(self.session))
+        self.assertIs(test_page.browser, mock.sentinel.browser)
+        self.assertIs(test_page.create.__self__, self.session.org)
+
+
+class BrowserPoolTestCase(unittest2.TestCase):
+    def setUp(self):
+        self.pool = BrowserPool()
+        patcher = mock.patch('robottelo.ui.session.settings')
+        self.settings = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.settings.browser = 'selenium'
+        self.settings.browser_pool = True
+        self.settings.browser_pool_size = 2
+        self.webdriver = mock.Mock(title='Overview')
+
+    def test_enabled(self):
+        self.assertTrue(self.pool.enabled)
+        self.settings.browser = 'saucelabs'
+        self.assertFalse(self.pool.enabled)
+        self.settings.browser = 'docker'
+        self.settings.browser_pool = False
+        self.assertFalse(self.pool.enabled)
+
+    def test_acquire_empty(self):
+        self.assertIsNone(self.pool.acquire('admin', 'changeme'))
+
+    def test_acquire_released_browser(self):
+        pooled = PooledBrowser(self.webdriver, 'admin', 'changeme')
+        self.pool.release(pooled)
+        self.assertIsNone(self.pool.acquire('other', 'changeme'))
+        self.assertIs(self.pool.acquire('admin', 'changeme'), pooled)
+        self.webdriver.execute_script.assert_called_once_with(
+            RESET_BROWSER_JS, SESSION_COOKIE)
+        self.webdriver.get.assert_called_once_with(
+            self.settings.server.get_url())
+        self.assertIsNone(self.pool.acquire('admin', 'changeme'))
+
+    def test_acquire_logged_out_browser(self):
+        self.webdriver.title = 'Login'
+        self.pool.release(PooledBrowser(self.webdriver, 'admin', 'changeme'))
+        self.assertIsNone(self.pool.acquire('admin', 'changeme'))
+        self.webdriver.quit.assert_called_once_with()
+
+    def test_release_above_size(self):
+        browsers = [mock.Mock(title='Overview') for _ in range(3)]
+        for webdriver in browsers:
+            self.pool.release(PooledBrowser(webdriver, 'admin', 'changeme'))
+        browsers[0].quit.assert_called_once_with()
+        browsers[1].quit.assert_not_called()
+        browsers[2].quit.assert_not_called()
+
+    def test_discard_keeps_container_warm(self):
+        docker_browser = mock.Mock()
+        self.pool.discard(PooledBrowser(
+            self.webdriver, 'admin', 'changeme', docker_browser))
+        self.webdriver.quit.assert_not_called()
+        self.assertIs(self.pool.docker_browser('test'), docker_browser)
+        docker_browser.reset_webdriver.assert_called_once_with()
+
+    def test_close(self):
+        docker_browser = mock.Mock()
+        self.pool.release(PooledBrowser(self.webdriver, 'admin', 'changeme'))
+        self.pool.discard(PooledBrowser(
+            mock.Mock(), 'admin', 'changeme', docker_browser))
+        self.pool.close()
+        self.webdriver.quit.assert_called_once_with()
+        docker_browser.stop.assert_called_once_with()
+        self.assertIsNone(self.pool.acquire('admin', 'changeme'))
+
+
+class PooledSessionTestCase(unittest2.TestCase):
+    def setUp(self):
+        patcher = mock.patch('robottelo.ui.session.browser_pool')
+        self.pool = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pool.enabled = True
+        self.test = mock.Mock(foreman_user='admin', foreman_password='pass')
+        self.session = Session(self.test)
+        self.session.login = mock.Mock()
+
+    def test_reuse_pooled_browser(self):
+        pooled = PooledBrowser(mock.Mock(), 'admin', 'pass')
+        self.pool.acquire.return_value = pooled
+        with self.session:
+            self.pool.acquire.assert_called_once_with('admin', 'pass')
+            self.assertIs(self.session.browser, pooled.webdriver)
+        self.session.login.login.assert_not_called()
+        self.session.login.logout.assert_not_called()
+        self.pool.release.assert_called_once_with(pooled)
+
+    def test_failed_test_discards_browser(self):
+        pooled = PooledBrowser(mock.Mock(), 'admin', 'pass')
+        self.pool.acquire.return_value = pooled
+        self.session.take_screenshot = mock.Mock()
+        with self.assertRaises(ValueError):
+            with self.session:
+                raise ValueError()
+        self.session.take_screenshot.assert_called_once_with()
+        self.pool.discard.assert_called_once_with(pooled)
+        self.pool.release.assert_not_called()